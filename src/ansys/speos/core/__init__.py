@@ -25,6 +25,9 @@
 It gathers functionaties and tools of these APIs.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 try:
     import importlib.metadata as importlib_metadata
 except ModuleNotFoundError:  # pragma: no cover
@@ -34,18 +37,56 @@ except ModuleNotFoundError:  # pragma: no cover
 __version__ = importlib_metadata.version("ansys-speos-core")
 
 
-from ansys.speos.core.body import Body
-import ansys.speos.core.bsdf as bsdf
-from ansys.speos.core.face import Face
-from ansys.speos.core.geo_ref import GeoRef
-from ansys.speos.core.intensity import Intensity
 from ansys.speos.core.logger import LOG, Logger
-from ansys.speos.core.lxp import LightPathFinder, RayPath
-from ansys.speos.core.opt_prop import OptProp
-from ansys.speos.core.part import Part
-from ansys.speos.core.project import Project
-import ansys.speos.core.sensor as sensor
-import ansys.speos.core.simulation as simulation
-import ansys.speos.core.source as source
-from ansys.speos.core.spectrum import Spectrum
-from ansys.speos.core.speos import Speos
+
+# Features are loaded on first access (PEP 562), importing the package stays cheap
+# for processes that only need a few of them.
+_LAZY_ATTRIBUTES = {
+    "Body": ("ansys.speos.core.body", "Body"),
+    "bsdf": ("ansys.speos.core.bsdf", None),
+    "Face": ("ansys.speos.core.face", "Face"),
+    "GeoRef": ("ansys.speos.core.geo_ref", "GeoRef"),
+    "Intensity": ("ansys.speos.core.intensity", "Intensity"),
+    "LightPathFinder": ("ansys.speos.core.lxp", "LightPathFinder"),
+    "RayPath": ("ansys.speos.core.lxp", "RayPath"),
+    "OptProp": ("ansys.speos.core.opt_prop", "OptProp"),
+    "Part": ("ansys.speos.core.part", "Part"),
+    "Project": ("ansys.speos.core.project", "Project"),
+    "sensor": ("ansys.speos.core.sensor", None),
+    "simulation": ("ansys.speos.core.simulation", None),
+    "source": ("ansys.speos.core.source", None),
+    "Spectrum": ("ansys.speos.core.spectrum", "Spectrum"),
+    "Speos": ("ansys.speos.core.speos", "Speos"),
+}
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ansys.speos.core.body import Body
+    import ansys.speos.core.bsdf as bsdf
+    from ansys.speos.core.face import Face
+    from ansys.speos.core.geo_ref import GeoRef
+    from ansys.speos.core.intensity import Intensity
+    from ansys.speos.core.lxp import LightPathFinder, RayPath
+    from ansys.speos.core.opt_prop import OptProp
+    from ansys.speos.core.part import Part
+    from ansys.speos.core.project import Project
+    import ansys.speos.core.sensor as sensor
+    import ansys.speos.core.simulation as simulation
+    import ansys.speos.core.source as source
+    from ansys.speos.core.spectrum import Spectrum
+    from ansys.speos.core.speos import Speos
+
+
+def __getattr__(name: str):
+    """Import the module of a public attribute on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    module = importlib.import_module(module_name)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the attributes of the package, including the ones not loaded yet."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
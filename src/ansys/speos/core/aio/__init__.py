@@ -0,0 +1,39 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""PySpeos aio module gathers asyncio counterparts of the kernel stubs and long running actions.
+
+It is built on ``grpc.aio`` so that many Speos sessions, loads and jobs can be driven from one
+event loop.
+"""
+
+from ansys.speos.core.aio.client import (
+    AsyncSpeosClient,
+    default_docker_aio_channel,
+    default_local_aio_channel,
+)
+from ansys.speos.core.aio.crud import AsyncCrudItem, AsyncCrudStub
+from ansys.speos.core.aio.face import AsyncFaceLink, AsyncFaceStub
+from ansys.speos.core.aio.job import AsyncJobLink, AsyncJobStub
+from ansys.speos.core.aio.project import open_project
+from ansys.speos.core.aio.scene import AsyncSceneLink, AsyncSceneStub
+from ansys.speos.core.aio.simulation import compute_CPU, compute_GPU
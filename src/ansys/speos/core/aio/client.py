@@ -0,0 +1,369 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides an asyncio wrapped abstraction of the gRPC proto API definition and stubs."""
+
+import asyncio
+import os
+from pathlib import Path
+import tempfile
+from typing import Optional, Union
+
+from ansys.api.speos.intensity.v1 import intensity_pb2, intensity_pb2_grpc
+from ansys.api.speos.part.v1 import body_pb2, body_pb2_grpc, part_pb2, part_pb2_grpc
+from ansys.api.speos.sensor.v1 import sensor_pb2, sensor_pb2_grpc
+from ansys.api.speos.simulation.v1 import simulation_template_pb2, simulation_template_pb2_grpc
+from ansys.api.speos.sop.v1 import sop_pb2, sop_pb2_grpc
+from ansys.api.speos.source.v1 import source_pb2, source_pb2_grpc
+from ansys.api.speos.spectrum.v1 import spectrum_pb2, spectrum_pb2_grpc
+from ansys.api.speos.vop.v1 import vop_pb2, vop_pb2_grpc
+
+try:
+    from ansys.api.speos.server_info.v1 import server_info_pb2, server_info_pb2_grpc
+
+    SERVER_INFO_API = True
+except ModuleNotFoundError:
+    SERVER_INFO_API = False
+
+import grpc
+
+from ansys.speos.core.aio.crud import AsyncCrudStub
+from ansys.speos.core.aio.face import AsyncFaceStub
+from ansys.speos.core.aio.job import AsyncJobStub
+from ansys.speos.core.aio.scene import AsyncSceneStub
+from ansys.speos.core.generic.constants import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    MAX_CLIENT_MESSAGE_SIZE,
+)
+from ansys.speos.core.generic.version_checker import server_version_checker
+from ansys.speos.core.kernel.grpc.transport_options import (
+    InsecureOptions,
+    TransportMode,
+    TransportOptions,
+    UDSOptions,
+    WNUAOptions,
+    aio_channel_target,
+)
+
+
+async def wait_until_healthy(channel: grpc.aio.Channel, timeout: float):
+    """
+    Wait until an asyncio channel is healthy before returning.
+
+    Parameters
+    ----------
+    channel : grpc.aio.Channel
+        Channel to wait until established and healthy.
+    timeout : float
+        Timeout in seconds.
+
+    Raises
+    ------
+    TimeoutError
+        Raised when the total elapsed time exceeds ``timeout``.
+    """
+    try:
+        await asyncio.wait_for(channel.channel_ready(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        target_str = aio_channel_target(channel)
+        raise TimeoutError(
+            f"Channel health check to target '{target_str}' timed out after {timeout} seconds."
+        )
+
+
+def default_docker_aio_channel(
+    host: Optional[str] = DEFAULT_HOST,
+    port: Union[str, int] = DEFAULT_PORT,
+    message_size: int = MAX_CLIENT_MESSAGE_SIZE,
+) -> grpc.aio.Channel:
+    """Create default asyncio transport options for docker on CI.
+
+    The channel is bound to the running event loop: create it from a coroutine.
+    """
+    return TransportOptions(
+        mode=TransportMode.INSECURE,
+        options=InsecureOptions(host=host, port=port, allow_remote_host=True),
+    ).create_aio_channel(grpc_options=[("grpc.max_receive_message_length", message_size)])
+
+
+def default_local_aio_channel(
+    port: Union[str, int] = DEFAULT_PORT, message_size: int = MAX_CLIENT_MESSAGE_SIZE
+) -> grpc.aio.Channel:
+    """Create default asyncio transport options, WNUA on Windows, UDS on Linux.
+
+    The channel is bound to the running event loop: create it from a coroutine.
+    """
+    if os.name == "nt":
+        transport = TransportOptions(
+            mode=TransportMode.WNUA, options=WNUAOptions(host=DEFAULT_HOST, port=port)
+        )
+    else:
+        sock_file = Path(tempfile.gettempdir()) / f"speosrpc_sock_{port}"
+        transport = TransportOptions(
+            mode=TransportMode.UDS, options=UDSOptions(uds_fullpath=str(sock_file))
+        )
+    return transport.create_aio_channel(
+        grpc_options=[("grpc.max_receive_message_length", message_size)]
+    )
+
+
+class AsyncSpeosClient:
+    """
+    Wraps a speos ``grpc.aio`` connection.
+
+    This client mirrors :class:`ansys.speos.core.kernel.client.SpeosClient` for asyncio: every
+    database method returns a stub whose requests are coroutines, so that many Speos sessions and
+    jobs can be driven from one event loop.
+
+    Parameters
+    ----------
+    channel : grpc.aio.Channel, optional
+        Asyncio gRPC channel for server communication.
+        By default, ``None``, means that ``default_local_aio_channel()`` is used.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from ansys.speos.core.aio import AsyncSpeosClient
+    >>> async def main():
+    ...     async with await AsyncSpeosClient().connect() as client:
+    ...         return await client.scenes().list()
+    >>> asyncio.run(main())
+    """
+
+    def __init__(self, channel: Optional[grpc.aio.Channel] = None):
+        """Initialize the ``AsyncSpeosClient`` object."""
+        self._closed = False
+        if channel:
+            self._channel = channel
+        else:
+            self._channel = default_local_aio_channel()
+
+        # Initialise databases
+        self._faceDB = None
+        self._bodyDB = None
+        self._partDB = None
+        self._sopTemplateDB = None
+        self._vopTemplateDB = None
+        self._spectrumDB = None
+        self._intensityTemplateDB = None
+        self._sourceTemplateDB = None
+        self._sensorTemplateDB = None
+        self._simulationTemplateDB = None
+        self._sceneDB = None
+        self._jobDB = None
+
+    async def connect(self, timeout: Optional[int] = 60) -> "AsyncSpeosClient":
+        """Wait until the channel is healthy and retrieve the server version.
+
+        Parameters
+        ----------
+        timeout : int, optional
+            Timeout in seconds to achieve the connection.
+            By default, 60 seconds.
+
+        Returns
+        -------
+        ansys.speos.core.aio.client.AsyncSpeosClient
+            The connected client.
+        """
+        await wait_until_healthy(self._channel, timeout)
+        if SERVER_INFO_API:
+            try:
+                resp = await server_info_pb2_grpc.ServerInfoStub(channel=self._channel).GetVersion(
+                    server_info_pb2.GetVersion_Request()
+                )
+                server_version_checker.set_version(resp.version)
+            except grpc.RpcError:
+                pass
+        return self
+
+    async def __aenter__(self) -> "AsyncSpeosClient":
+        """Enter the asynchronous context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the channel when leaving the asynchronous context."""
+        await self.close()
+
+    @property
+    def channel(self) -> grpc.aio.Channel:
+        """The asyncio gRPC channel of this client."""
+        return self._channel
+
+    def target(self) -> str:
+        """Get the target of the channel."""
+        if self._closed:
+            return ""
+        return aio_channel_target(self._channel)
+
+    def faces(self) -> AsyncFaceStub:
+        """Get face database access."""
+        self.__closed_error()
+        if self._faceDB is None:
+            self._faceDB = AsyncFaceStub(self._channel)
+        return self._faceDB
+
+    def bodies(self) -> AsyncCrudStub:
+        """Get body database access."""
+        self.__closed_error()
+        if self._bodyDB is None:
+            self._bodyDB = AsyncCrudStub(
+                body_pb2_grpc.BodiesManagerStub(self._channel), body_pb2, "body"
+            )
+        return self._bodyDB
+
+    def parts(self) -> AsyncCrudStub:
+        """Get part database access."""
+        self.__closed_error()
+        if self._partDB is None:
+            self._partDB = AsyncCrudStub(
+                part_pb2_grpc.PartsManagerStub(self._channel), part_pb2, "part"
+            )
+        return self._partDB
+
+    def sop_templates(self) -> AsyncCrudStub:
+        """Get sop template database access."""
+        self.__closed_error()
+        if self._sopTemplateDB is None:
+            self._sopTemplateDB = AsyncCrudStub(
+                sop_pb2_grpc.SOPTemplatesManagerStub(self._channel), sop_pb2, "sop_template"
+            )
+        return self._sopTemplateDB
+
+    def vop_templates(self) -> AsyncCrudStub:
+        """Get vop template database access."""
+        self.__closed_error()
+        if self._vopTemplateDB is None:
+            self._vopTemplateDB = AsyncCrudStub(
+                vop_pb2_grpc.VOPTemplatesManagerStub(self._channel), vop_pb2, "vop_template"
+            )
+        return self._vopTemplateDB
+
+    def spectrums(self) -> AsyncCrudStub:
+        """Get spectrum database access."""
+        self.__closed_error()
+        if self._spectrumDB is None:
+            self._spectrumDB = AsyncCrudStub(
+                spectrum_pb2_grpc.SpectrumsManagerStub(self._channel), spectrum_pb2, "spectrum"
+            )
+        return self._spectrumDB
+
+    def intensity_templates(self) -> AsyncCrudStub:
+        """Get intensity template database access."""
+        self.__closed_error()
+        if self._intensityTemplateDB is None:
+            self._intensityTemplateDB = AsyncCrudStub(
+                intensity_pb2_grpc.IntensityTemplatesManagerStub(self._channel),
+                intensity_pb2,
+                "intensity_template",
+            )
+        return self._intensityTemplateDB
+
+    def source_templates(self) -> AsyncCrudStub:
+        """Get source template database access."""
+        self.__closed_error()
+        if self._sourceTemplateDB is None:
+            self._sourceTemplateDB = AsyncCrudStub(
+                source_pb2_grpc.SourceTemplatesManagerStub(self._channel),
+                source_pb2,
+                "source_template",
+            )
+        return self._sourceTemplateDB
+
+    def sensor_templates(self) -> AsyncCrudStub:
+        """Get sensor template database access."""
+        self.__closed_error()
+        if self._sensorTemplateDB is None:
+            self._sensorTemplateDB = AsyncCrudStub(
+                sensor_pb2_grpc.SensorTemplatesManagerStub(self._channel),
+                sensor_pb2,
+                "sensor_template",
+            )
+        return self._sensorTemplateDB
+
+    def simulation_templates(self) -> AsyncCrudStub:
+        """Get simulation template database access."""
+        self.__closed_error()
+        if self._simulationTemplateDB is None:
+            self._simulationTemplateDB = AsyncCrudStub(
+                simulation_template_pb2_grpc.SimulationTemplatesManagerStub(self._channel),
+                simulation_template_pb2,
+                "simulation_template",
+            )
+        return self._simulationTemplateDB
+
+    def scenes(self) -> AsyncSceneStub:
+        """Get scene database access."""
+        self.__closed_error()
+        if self._sceneDB is None:
+            self._sceneDB = AsyncSceneStub(self._channel)
+        return self._sceneDB
+
+    def jobs(self) -> AsyncJobStub:
+        """Get job database access."""
+        self.__closed_error()
+        if self._jobDB is None:
+            self._jobDB = AsyncJobStub(self._channel)
+        return self._jobDB
+
+    def __closed_error(self):
+        """Check if closed."""
+        if self._closed:
+            raise ConnectionAbortedError()
+
+    def __repr__(self) -> str:
+        """Represent the client as a string."""
+        lines = []
+        lines.append(f"Ansys Speos asyncio client ({hex(id(self))})")
+        lines.append(f"  Target:     {self.target()}")
+        lines.append("  Connection: Closed" if self._closed else "  Connection: Open")
+        return "\n".join(lines)
+
+    async def close(self) -> bool:
+        """Close the channel.
+
+        Contrary to :meth:`ansys.speos.core.kernel.client.SpeosClient.close`, the server is never
+        stopped: the asyncio client is meant to share servers started elsewhere.
+
+        Returns
+        -------
+        bool
+            Information if the channel was closed.
+        """
+        await self._channel.close()
+        self._faceDB = None
+        self._bodyDB = None
+        self._partDB = None
+        self._sopTemplateDB = None
+        self._vopTemplateDB = None
+        self._spectrumDB = None
+        self._intensityTemplateDB = None
+        self._sourceTemplateDB = None
+        self._sensorTemplateDB = None
+        self._simulationTemplateDB = None
+        self._sceneDB = None
+        self._jobDB = None
+        self._closed = True
+        return self._closed
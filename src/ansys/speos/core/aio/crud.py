@@ -0,0 +1,175 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides asyncio counterparts of :mod:`ansys.speos.core.kernel.crud`."""
+
+from typing import List
+
+
+class AsyncCrudStub:
+    """Wraps a speos ``grpc.aio`` CRUD connection.
+
+    This class is used as base class for all asyncio Speos databases interactions.
+    Contrary to :class:`ansys.speos.core.kernel.crud.CrudStub`, it can be used directly for the
+    databases without specific actions (templates, bodies, parts, ...).
+
+    Parameters
+    ----------
+    stub :
+        gRPC manager stub created on a ``grpc.aio.Channel``.
+    messages : module, optional
+        Protobuf module containing the ``Create_Request``, ``Read_Request``... messages.
+        By default, ``None``, means only the raw requests methods can be used.
+    field : str, optional
+        Name of the datamodel field in the requests and responses, for example ``"sop_template"``.
+        By default, ``None``.
+    """
+
+    def __init__(self, stub, messages=None, field: str = None):
+        self._stubMngr = stub
+        self._messages = messages
+        self._field = field
+
+    def _link(self, key: str) -> "AsyncCrudItem":
+        return AsyncCrudItem(self, key)
+
+    def _check_ref(self, ref: "AsyncCrudItem") -> None:
+        if not ref.stub == self:
+            raise ValueError("Link is not on current database. Key=" + ref.key)
+
+    async def create(self, message) -> "AsyncCrudItem":
+        """Create a new entry.
+
+        Parameters
+        ----------
+        message :
+            Datamodel for the new entry.
+
+        Returns
+        -------
+        ansys.speos.core.aio.crud.AsyncCrudItem
+            Link object created.
+        """
+        resp = await self._stubMngr.Create(self._messages.Create_Request(**{self._field: message}))
+        return self._link(resp.guid)
+
+    async def read(self, ref: "AsyncCrudItem"):
+        """Get an existing entry.
+
+        Parameters
+        ----------
+        ref : ansys.speos.core.aio.crud.AsyncCrudItem
+            Link object to read.
+
+        Returns
+        -------
+        Datamodel of the entry.
+        """
+        self._check_ref(ref)
+        resp = await self._stubMngr.Read(self._messages.Read_Request(guid=ref.key))
+        return getattr(resp, self._field)
+
+    async def update(self, ref: "AsyncCrudItem", data) -> None:
+        """Change an existing entry.
+
+        Parameters
+        ----------
+        ref : ansys.speos.core.aio.crud.AsyncCrudItem
+            Link object to update.
+        data :
+            New datamodel for the entry.
+        """
+        self._check_ref(ref)
+        await self._stubMngr.Update(
+            self._messages.Update_Request(guid=ref.key, **{self._field: data})
+        )
+
+    async def delete(self, ref: "AsyncCrudItem") -> None:
+        """Remove an existing entry.
+
+        Parameters
+        ----------
+        ref : ansys.speos.core.aio.crud.AsyncCrudItem
+            Link object to delete.
+        """
+        self._check_ref(ref)
+        await self._stubMngr.Delete(self._messages.Delete_Request(guid=ref.key))
+
+    async def list(self) -> List["AsyncCrudItem"]:
+        """List existing entries.
+
+        Returns
+        -------
+        List[ansys.speos.core.aio.crud.AsyncCrudItem]
+            Link objects.
+        """
+        resp = await self._stubMngr.List(self._messages.List_Request())
+        return [self._link(guid) for guid in resp.guids]
+
+
+class AsyncCrudItem:
+    """Item of an asyncio database.
+
+    Parameters
+    ----------
+    db : ansys.speos.core.aio.crud.AsyncCrudStub
+        Database to link to.
+    key : str
+        Key (also named guid) of the item in the database.
+    """
+
+    def __init__(self, db: AsyncCrudStub, key: str):
+        self._stub = db
+        self._key = key
+
+    @property
+    def stub(self) -> AsyncCrudStub:
+        """The database."""
+        return self._stub
+
+    @property
+    def key(self) -> str:
+        """The guid in database."""
+        return self._key
+
+    async def get(self):
+        """Get the datamodel from database.
+
+        Returns
+        -------
+        Datamodel of the item.
+        """
+        return await self._stub.read(self)
+
+    async def set(self, data) -> None:
+        """Change datamodel in database.
+
+        Parameters
+        ----------
+        data :
+            New datamodel.
+        """
+        await self._stub.update(self, data)
+
+    async def delete(self) -> None:
+        """Remove datamodel from database."""
+        await self._stub.delete(self)
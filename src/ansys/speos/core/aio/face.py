@@ -0,0 +1,199 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides asyncio counterparts of :mod:`ansys.speos.core.kernel.face`."""
+
+from typing import List
+
+from ansys.api.speos.part.v1 import (
+    face_pb2 as messages,
+    face_pb2_grpc as service,
+)
+from grpc import RpcError
+
+from ansys.speos.core.aio.crud import AsyncCrudItem, AsyncCrudStub
+from ansys.speos.core.kernel.face import FaceStub, ProtoFace
+
+
+class AsyncFaceLink(AsyncCrudItem):
+    """Link object for face in asyncio database.
+
+    Parameters
+    ----------
+    db : ansys.speos.core.aio.face.AsyncFaceStub
+        Database to link to.
+    key : str
+        Key of the face in the database.
+    """
+
+
+class AsyncFaceStub(AsyncCrudStub):
+    """
+    Asyncio database interactions for face.
+
+    Faces are transferred with the streaming ``Upload`` and ``Download`` actions, using the same
+    chunking as :class:`ansys.speos.core.kernel.face.FaceStub`.
+
+    Parameters
+    ----------
+    channel : grpc.aio.Channel
+        Channel to use for the stub.
+    """
+
+    def __init__(self, channel):
+        super().__init__(
+            stub=service.FacesManagerStub(channel=channel), messages=messages, field="face"
+        )
+        self._actions_stub = service.FaceActionsStub(channel=channel)
+        self._is_batch_available = None
+
+    def _link(self, key: str) -> AsyncFaceLink:
+        return AsyncFaceLink(self, key)
+
+    async def _check_if_batch_available(self) -> bool:
+        if self._is_batch_available is None:
+            try:
+                async for reserve_faces_res in self._actions_stub.ReserveFaces(
+                    FaceStub._reserve_face_iterator([ProtoFace(name="tmp")])
+                ):
+                    await self._link(reserve_faces_res.guids[0]).delete()
+                self._is_batch_available = True
+            except RpcError:
+                self._is_batch_available = False
+        return self._is_batch_available
+
+    async def _download(self, request: messages.Download_Request) -> List[ProtoFace]:
+        chunks = [chunk async for chunk in self._actions_stub.Download(request)]
+        return FaceStub._chunks_to_faces(chunks)
+
+    async def create(self, message: ProtoFace) -> AsyncFaceLink:
+        """Create a new entry.
+
+        Parameters
+        ----------
+        message : face.Face
+            Datamodel for the new entry.
+
+        Returns
+        -------
+        ansys.speos.core.aio.face.AsyncFaceLink
+            Link object created.
+        """
+        resp = await self._stubMngr.Create(messages.Create_Request(face=ProtoFace(name="tmp")))
+        await self._actions_stub.Upload(
+            FaceStub._faces_to_chunks(
+                guids=[resp.guid], message_list=[message], nb_items=128 * 1024
+            )
+        )
+        return self._link(resp.guid)
+
+    async def create_batch(self, message_list: List[ProtoFace]) -> List[AsyncFaceLink]:
+        """Create new entries.
+
+        Parameters
+        ----------
+        message_list : List[face.Face]
+            List of datamodels for the new entries.
+
+        Returns
+        -------
+        List[ansys.speos.core.aio.face.AsyncFaceLink]
+            List of link objects created.
+        """
+        if not await self._check_if_batch_available():
+            raise NotImplementedError("Please use a Speos Version of 2025 R2 SP0 or higher.")
+
+        guids = []
+        async for res in self._actions_stub.ReserveFaces(
+            FaceStub._reserve_face_iterator(message_list)
+        ):
+            guids.extend(res.guids)
+
+        await self._actions_stub.Upload(
+            FaceStub._faces_to_chunks(guids=guids, message_list=message_list, nb_items=128 * 1024)
+        )
+        return [self._link(guid) for guid in guids]
+
+    async def read(self, ref: AsyncFaceLink) -> ProtoFace:
+        """Get an existing entry.
+
+        Parameters
+        ----------
+        ref : ansys.speos.core.aio.face.AsyncFaceLink
+            Link object to read.
+
+        Returns
+        -------
+        face.Face
+            Datamodel of the entry.
+        """
+        self._check_ref(ref)
+        return (await self._download(messages.Download_Request(guid=ref.key)))[0]
+
+    async def read_batch(self, refs: List[AsyncFaceLink]) -> List[ProtoFace]:
+        """Get existing entries.
+
+        Parameters
+        ----------
+        refs : List[ansys.speos.core.aio.face.AsyncFaceLink]
+            List of link objects to read.
+
+        Returns
+        -------
+        List[face.Face]
+            Datamodels of the entries.
+        """
+        if not await self._check_if_batch_available():
+            raise NotImplementedError("Please use a Speos Version of 2025 R2 SP0 or higher.")
+        for ref in refs:
+            self._check_ref(ref)
+        return await self._download(messages.Download_Request(guids=[ref.key for ref in refs]))
+
+    async def update(self, ref: AsyncFaceLink, data: ProtoFace) -> None:
+        """Change an existing entry.
+
+        Parameters
+        ----------
+        ref : ansys.speos.core.aio.face.AsyncFaceLink
+            Link object to update.
+        data : face.Face
+            New datamodel for the entry.
+        """
+        await self.update_batch(refs=[ref], data=[data])
+
+    async def update_batch(self, refs: List[AsyncFaceLink], data: List[ProtoFace]) -> None:
+        """Change existing entries.
+
+        Parameters
+        ----------
+        refs : List[ansys.speos.core.aio.face.AsyncFaceLink]
+            Link objects to update.
+        data : List[face.Face]
+            New datamodels for the entries.
+        """
+        for ref in refs:
+            self._check_ref(ref)
+        await self._actions_stub.Upload(
+            FaceStub._faces_to_chunks(
+                guids=[ref.key for ref in refs], message_list=data, nb_items=128 * 1024
+            )
+        )
@@ -0,0 +1,189 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides asyncio counterparts of :mod:`ansys.speos.core.kernel.job`."""
+
+import asyncio
+from typing import AsyncIterator
+
+from ansys.api.speos.job.v2 import job_pb2 as messages, job_pb2_grpc as service
+from ansys.api.speos.results.v1.ray_path_pb2 import RayPath
+
+from ansys.speos.core.aio.crud import AsyncCrudItem, AsyncCrudStub
+from ansys.speos.core.kernel.job import ProtoJob
+from ansys.speos.core.kernel.ray_path import RayPathArrays
+
+
+class AsyncJobLink(AsyncCrudItem):
+    """Link object for job in asyncio database.
+
+    Parameters
+    ----------
+    db : ansys.speos.core.aio.job.AsyncJobStub
+        Database to link to.
+    key : str
+        Key of the job in the database.
+    """
+
+    def __init__(self, db, key: str):
+        super().__init__(db, key)
+        self._actions_stub = db._actions_stub
+
+    # Actions
+    async def get_state(self) -> messages.GetState_Response:
+        """
+        Retrieve job state.
+
+        Returns
+        -------
+        ansys.api.speos.job.v2.job_pb2.GetState_Response
+            State of the job.
+        """
+        return await self._actions_stub.GetState(messages.GetState_Request(guid=self.key))
+
+    async def start(self) -> None:
+        """Start the job."""
+        await self._actions_stub.Start(messages.Start_Request(guid=self.key))
+
+    async def stop(self) -> None:
+        """Stop the job."""
+        await self._actions_stub.Stop(messages.Stop_Request(guid=self.key))
+
+    async def get_error(self) -> messages.GetError_Response:
+        """
+        Retrieve job error.
+
+        Returns
+        -------
+        ansys.api.speos.job.v2.job_pb2.GetError_Response
+            Error of the job.
+        """
+        return await self._actions_stub.GetError(messages.GetError_Request(guid=self.key))
+
+    async def get_results(self) -> messages.GetResults_Response:
+        """
+        Retrieve job results.
+
+        Returns
+        -------
+        ansys.api.speos.job.v2.job_pb2.GetResults_Response
+            Results of the job.
+        """
+        return await self._actions_stub.GetResults(messages.GetResults_Request(guid=self.key))
+
+    async def get_progress_status(self) -> messages.GetProgressStatus_Response:
+        """
+        Retrieve job progress.
+
+        Returns
+        -------
+        ansys.api.speos.job.v2.job_pb2.GetProgressStatus_Response
+            Progress status of the job.
+        """
+        return await self._actions_stub.GetProgressStatus(
+            messages.GetProgressStatus_Request(guid=self.key)
+        )
+
+    async def get_ray_paths(self) -> AsyncIterator[RayPath]:
+        """Retrieve ray paths.
+
+        Available for interactive simulation.
+
+        Returns
+        -------
+        AsyncIterator[ansys.api.speos.results.v1.ray_path_pb2.RayPath]
+            Ray paths generated by the interactive simulation.
+        """
+        async for rp in self._actions_stub.GetRayPaths(messages.GetRayPaths_Request(guid=self.key)):
+            yield rp
+
+    async def get_ray_path_arrays(self) -> RayPathArrays:
+        """Retrieve ray paths gathered in NumPy arrays.
+
+        Available for interactive simulation.
+
+        Returns
+        -------
+        ansys.speos.core.kernel.ray_path.RayPathArrays
+            Ray paths generated by the interactive simulation.
+        """
+        arrays = RayPathArrays()
+        async for rp in self.get_ray_paths():
+            arrays.append(rp)
+        return arrays
+
+    async def save_file(self, file_path) -> None:
+        """
+        Save job results to a SPEOS file.
+
+        Parameters
+        ----------
+        file_path : str | Path
+            Path to the file where results will be saved.
+        """
+        await self._actions_stub.SaveFile(
+            messages.SaveFile_Request(guid=self.key, file_uri=str(file_path))
+        )
+
+    async def wait_until_done(self, polling_interval: float = 5.0) -> messages.GetState_Response:
+        """Wait, without blocking the event loop, until the job is finished, stopped or in error.
+
+        Parameters
+        ----------
+        polling_interval : float, optional
+            Time in seconds between two state requests.
+            By default, ``5.0``.
+
+        Returns
+        -------
+        ansys.api.speos.job.v2.job_pb2.GetState_Response
+            Last state of the job.
+        """
+        job_state_res = await self.get_state()
+        while job_state_res.state not in (
+            ProtoJob.State.FINISHED,
+            ProtoJob.State.STOPPED,
+            ProtoJob.State.IN_ERROR,
+        ):
+            await asyncio.sleep(polling_interval)
+            job_state_res = await self.get_state()
+        return job_state_res
+
+
+class AsyncJobStub(AsyncCrudStub):
+    """
+    Asyncio database interactions for job.
+
+    Parameters
+    ----------
+    channel : grpc.aio.Channel
+        Channel to use for the stub.
+    """
+
+    def __init__(self, channel):
+        super().__init__(
+            stub=service.JobsManagerStub(channel=channel), messages=messages, field="job"
+        )
+        self._actions_stub = service.JobActionsStub(channel=channel)
+
+    def _link(self, key: str) -> AsyncJobLink:
+        return AsyncJobLink(self, key)
@@ -0,0 +1,79 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides asyncio loading of :class:`ansys.speos.core.project.Project`."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Optional, Union
+
+from ansys.speos.core.aio.client import AsyncSpeosClient
+from ansys.speos.core.aio.scene import AsyncSceneLink
+from ansys.speos.core.component import LightBoxFileInstance
+from ansys.speos.core.kernel.client import SpeosClient
+from ansys.speos.core.project import Project
+from ansys.speos.core.speos import Speos
+
+
+async def open_project(
+    speos: Union[Speos, SpeosClient],
+    client: AsyncSpeosClient,
+    path: Union[str, Path, LightBoxFileInstance],
+    context: Optional[str] = None,
+) -> Project:
+    """Load a project from a speos file without blocking the event loop.
+
+    The server side parsing of the file, which is the expensive part of loading, is awaited through
+    ``client``. The python features are then filled in a worker thread through ``speos``.
+
+    Parameters
+    ----------
+    speos : Union[ansys.speos.core.speos.Speos, ansys.speos.core.kernel.client.SpeosClient]
+        Speos session used by the returned project.
+    client : ansys.speos.core.aio.client.AsyncSpeosClient
+        Asyncio client connected to the same server as ``speos``.
+    path : Union[str, Path, ansys.speos.core.component.LightBoxFileInstance]
+        The project will be loaded from this speos file or lightbox instance.
+    context : Optional[str]
+        For internal use only.
+
+    Returns
+    -------
+    ansys.speos.core.project.Project
+        Loaded project.
+    """
+    project = await asyncio.to_thread(Project, speos)
+    scene_link = AsyncSceneLink(client.scenes(), project.scene_link.key)
+    match path:
+        case str() | Path():
+            await scene_link.load_file(file_uri=str(path))
+        case LightBoxFileInstance():
+            await scene_link.load_file(file_uri=str(path.file), password=path.password)
+            scene_data = await scene_link.get()
+            if not (scene_data.sources or scene_data.part_guid != "" or scene_data.materials):
+                return project
+        case _:
+            raise TypeError(f"Unsupported path type: {type(path)}")
+    await asyncio.to_thread(project._fill_features, context)
+    return project
@@ -0,0 +1,206 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides asyncio counterparts of :mod:`ansys.speos.core.kernel.scene`."""
+
+from pathlib import Path
+from typing import AsyncIterator
+
+from ansys.api.speos.results.v1.ray_path_pb2 import RayPath
+from ansys.api.speos.scene.v2 import (
+    scene_pb2 as messages,
+    scene_pb2_grpc as service,
+)
+
+from ansys.speos.core.aio.crud import AsyncCrudItem, AsyncCrudStub
+from ansys.speos.core.kernel.ray_path import RayPathArrays
+from ansys.speos.core.kernel.scene import ProtoScene
+
+
+class AsyncSceneLink(AsyncCrudItem):
+    """
+    Link object for a scene in asyncio database.
+
+    Parameters
+    ----------
+    db : ansys.speos.core.aio.scene.AsyncSceneStub
+        Database to link to.
+    key : str
+        Key of the scene in the database.
+    """
+
+    def __init__(self, db, key: str):
+        super().__init__(db, key)
+        self._actions_stub = db._actions_stub
+
+    # Actions
+    async def load_file(self, file_uri: Path | str, password: str | None = None) -> None:
+        """
+        Load speos file to fill the scene.
+
+        Parameters
+        ----------
+        file_uri : Path | str
+            File to be loaded.
+        password : str | None, optional
+            Password needed to open the speos lightbox file.
+        """
+        await self._actions_stub.LoadFile(
+            messages.LoadFile_Request(guid=self.key, file_uri=str(file_uri), password=password)
+        )
+
+    async def save_file(
+        self, file_uri: Path | str, password: str | None = None, black_boxed: bool = False
+    ) -> None:
+        """
+        Save the scene into SpeosLightBox file.
+
+        Parameters
+        ----------
+        file_uri: Path | str
+            File to be saved.
+        password: str | None, optional
+            Password needed to save the speos lightbox file.
+        black_boxed: bool, optional
+            If ``True``, the speos light box file will be black boxed.
+        """
+        await self._actions_stub.SaveFile(
+            messages.SaveFile_Request(
+                guid=self.key, file_uri=str(file_uri), password=password, is_black_boxed=black_boxed
+            )
+        )
+
+    async def get_source_ray_paths(
+        self,
+        source_path: str,
+        rays_nb: int = 100,
+        raw_data: bool = True,
+        display_data: bool = False,
+    ) -> AsyncIterator[RayPath]:
+        """
+        Retrieve source ray paths.
+
+        Parameters
+        ----------
+        source_path : str
+            Path to the source in the Scene : "<source name>" for a specific source in the current
+            scene, or "<sub-scene name>/<source name>" for a specific source in a specific sub
+            scene.
+        rays_nb : int, optional
+            Number of rays generated by the source.
+            By default, ``100``.
+        raw_data: bool, optional
+            If ``True``, get the wavelengths in response stream.
+        display_data: bool, optional
+            If ``True``, get the colors (RGB24 format) in response stream.
+
+        Returns
+        -------
+        AsyncIterator[ansys.api.speos.results.v1.ray_path_pb2.RayPath]
+            Ray paths generated by the source.
+        """
+        async for rp in self._actions_stub.GetSourceRayPaths(
+            messages.GetSourceRayPaths_Request(
+                guid=self.key,
+                source_path=source_path,
+                rays_nb=rays_nb,
+                raw_data=raw_data,
+                display_data=display_data,
+            )
+        ):
+            yield rp
+
+    async def get_source_ray_path_arrays(
+        self,
+        source_path: str,
+        rays_nb: int = 100,
+        raw_data: bool = True,
+        display_data: bool = False,
+    ) -> RayPathArrays:
+        """
+        Retrieve source ray paths gathered in NumPy arrays.
+
+        Parameters
+        ----------
+        source_path : str
+            Path to the source in the Scene : "<source name>" for a specific source in the current
+            scene, or "<sub-scene name>/<source name>" for a specific source in a specific sub
+            scene.
+        rays_nb : int, optional
+            Number of rays generated by the source.
+            By default, ``100``.
+        raw_data: bool, optional
+            If ``True``, get the wavelengths in response stream.
+        display_data: bool, optional
+            If ``True``, get the colors (RGB24 format) in response stream.
+
+        Returns
+        -------
+        ansys.speos.core.kernel.ray_path.RayPathArrays
+            Ray paths generated by the source.
+        """
+        arrays = RayPathArrays(capacity=rays_nb)
+        async for rp in self.get_source_ray_paths(
+            source_path=source_path,
+            rays_nb=rays_nb,
+            raw_data=raw_data,
+            display_data=display_data,
+        ):
+            arrays.append(rp)
+        return arrays
+
+
+class AsyncSceneStub(AsyncCrudStub):
+    """
+    Asyncio database interactions for scenes.
+
+    Parameters
+    ----------
+    channel : grpc.aio.Channel
+        Channel to use for the stub.
+    """
+
+    def __init__(self, channel):
+        super().__init__(
+            stub=service.ScenesManagerStub(channel=channel), messages=messages, field="scene"
+        )
+        self._actions_stub = service.SceneActionsStub(channel=channel)
+
+    def _link(self, key: str) -> AsyncSceneLink:
+        return AsyncSceneLink(self, key)
+
+    async def create(self, message: ProtoScene = None) -> AsyncSceneLink:
+        """Create a new entry.
+
+        Parameters
+        ----------
+        message : scene.Scene, optional.
+            Datamodel for the new entry.
+
+        Returns
+        -------
+        ansys.speos.core.aio.scene.AsyncSceneLink
+            Link object created.
+        """
+        if message is None:
+            message = ProtoScene()
+        return await super().create(message)
@@ -0,0 +1,156 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides asyncio computation of :class:`ansys.speos.core.simulation.BaseSimulation`."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import List, Optional
+import weakref
+
+from ansys.api.speos.job.v2 import job_pb2
+
+from ansys.speos.core.aio.client import AsyncSpeosClient
+from ansys.speos.core.aio.job import AsyncJobLink
+from ansys.speos.core.generic.version_checker import server_version_checker
+from ansys.speos.core.kernel.job import JobLink, ProtoJob
+from ansys.speos.core.kernel.proto_message_utils import protobuf_message_to_str
+from ansys.speos.core.logger import LOG
+from ansys.speos.core.simulation import BaseSimulation
+
+_commit_locks = weakref.WeakKeyDictionary()
+"""One lock per project: commits read-modify-write the whole scene."""
+
+
+def _commit_lock(simulation: BaseSimulation) -> asyncio.Lock:
+    lock = _commit_locks.get(simulation._project)
+    if lock is None:
+        lock = _commit_locks[simulation._project] = asyncio.Lock()
+    return lock
+
+
+async def _run_job(
+    simulation: BaseSimulation, client: AsyncSpeosClient, polling_interval: float
+) -> List[job_pb2.Result]:
+    jobs = client.jobs()
+    if simulation.job_link is not None:
+        job_link = AsyncJobLink(jobs, simulation.job_link.key)
+        job_state_res = await job_link.get_state()
+        if job_state_res.state != ProtoJob.State.QUEUED:
+            await job_link.delete()
+            simulation.job_link = None
+
+    async with _commit_lock(simulation):
+        await asyncio.to_thread(simulation.commit)
+
+    # Save or Update the job
+    if simulation.job_link is None:
+        job_link = await jobs.create(message=simulation._job)
+    else:
+        job_link = AsyncJobLink(jobs, simulation.job_link.key)
+        if await job_link.get() != simulation._job:
+            await job_link.set(data=simulation._job)  # Update only if job data has changed
+    simulation.job_link = JobLink(simulation._project.client.jobs(), job_link.key)
+
+    simulation.job_link._timestamp_start = time.time()
+    await job_link.start()
+
+    job_state_res = await job_link.wait_until_done(polling_interval=polling_interval)
+    if job_state_res.state == ProtoJob.State.IN_ERROR:
+        LOG.error(protobuf_message_to_str(await job_link.get_error()))
+
+    if not server_version_checker.is_version_supported(2026, 1, 0) and simulation.job_link._is_uds:
+        # Reuse the workaround of the synchronous link for uds GetResults in server < 26R1.
+        return list(simulation.job_link.get_results().results)
+    return list((await job_link.get_results()).results)
+
+
+async def compute_CPU(
+    simulation: BaseSimulation,
+    client: AsyncSpeosClient,
+    threads_number: Optional[int] = None,
+    polling_interval: float = 5.0,
+) -> List[job_pb2.Result]:
+    """Compute the simulation on CPU without blocking the event loop.
+
+    Asyncio counterpart of :meth:`ansys.speos.core.simulation.BaseSimulation.compute_CPU`.
+
+    Parameters
+    ----------
+    simulation : ansys.speos.core.simulation.BaseSimulation
+        Simulation feature to compute.
+    client : ansys.speos.core.aio.client.AsyncSpeosClient
+        Asyncio client connected to the same server as the simulation project.
+    threads_number : int, optional
+        The number of threads used.
+        By default, ``None``, means the number of processor available.
+    polling_interval : float, optional
+        Time in seconds between two job state requests.
+        By default, ``5.0``.
+
+    Returns
+    -------
+    List[ansys.api.speos.job.v2.job_pb2.Result]
+        List of simulation results.
+    """
+    simulation._check_job()
+    simulation._job.job_type = ProtoJob.Type.CPU
+
+    if threads_number is not None:
+        simulation._simulation_template.metadata["SimulationSetting::OPTThreadNumber"] = (
+            "int::" + str(threads_number)
+        )
+
+    simulation.result_list = await _run_job(simulation, client, polling_interval)
+    return simulation.result_list
+
+
+async def compute_GPU(
+    simulation: BaseSimulation,
+    client: AsyncSpeosClient,
+    polling_interval: float = 5.0,
+) -> List[job_pb2.Result]:
+    """Compute the simulation on GPU without blocking the event loop.
+
+    Asyncio counterpart of :meth:`ansys.speos.core.simulation.BaseSimulation.compute_GPU`.
+
+    Parameters
+    ----------
+    simulation : ansys.speos.core.simulation.BaseSimulation
+        Simulation feature to compute.
+    client : ansys.speos.core.aio.client.AsyncSpeosClient
+        Asyncio client connected to the same server as the simulation project.
+    polling_interval : float, optional
+        Time in seconds between two job state requests.
+        By default, ``5.0``.
+
+    Returns
+    -------
+    List[ansys.api.speos.job.v2.job_pb2.Result]
+        List of simulation results.
+    """
+    simulation._check_job()
+    simulation._job.job_type = ProtoJob.Type.GPU
+    simulation.result_list = await _run_job(simulation, client, polling_interval)
+    return simulation.result_list
@@ -24,13 +24,17 @@
 
 from __future__ import annotations
 
+import math
 import re
-from typing import List, Mapping, Optional, Union
+from typing import List, Mapping, Optional, Tuple, Union
+
+import numpy as np
 
 from ansys.speos.core import proto_message_utils
 import ansys.speos.core.face as face
+from ansys.speos.core.generic import mesh_methods
 import ansys.speos.core.generic.general_methods as general_methods
-from ansys.speos.core.generic.visualization_methods import _VisualData
+from ansys.speos.core.generic.visualization_methods import _fingerprint, _VisualData
 from ansys.speos.core.geo_ref import GeoRef
 from ansys.speos.core.kernel.body import ProtoBody
 from ansys.speos.core.kernel.client import SpeosClient
@@ -74,7 +78,7 @@ class Body:
         self._parent_part = parent_part
         self._name = name
         self.body_link = None
-        self._visual_data = _VisualData() if general_methods._GRAPHICS_AVAILABLE else None
+        self._visual_data = _VisualData() if general_methods._graphics_available() else None
         """Link object for the body in database."""
 
         if metadata is None:
@@ -85,6 +89,10 @@ class Body:
 
         self._geom_features = []
 
+        # Simplified meshes by level of detail, valid for the face revisions of _lod_key
+        self._lod_key = None
+        self._lod_meshes = {}
+
     @property
     def visual_data(self) -> _VisualData:
         """Property containing irradiance sensor visualization data.
@@ -97,8 +105,10 @@ class Body:
         """
         import numpy as np
 
-        if self._visual_data.updated is True:
+        fingerprint = _fingerprint(*((id(f), f._revision) for f in self._geom_features))
+        if self._visual_data.updated and self._visual_data.fingerprint == fingerprint:
             return self._visual_data
+        self._visual_data = _VisualData()
         for feature_face in self._geom_features:
             vertices = np.array(feature_face._face.vertices).reshape(-1, 3)
             facets = np.array(feature_face._face.facets).reshape(-1, 3)
@@ -107,6 +117,7 @@ class Body:
             facets = np.hstack((temp, facets))
             self._visual_data.add_data_mesh(vertices, facets)
         self._visual_data.updated = True
+        self._visual_data.fingerprint = fingerprint
         return self._visual_data
 
     @property
@@ -171,6 +182,66 @@ class Body:
         """
         return [f for f in self._geom_features if isinstance(f, face.Face)]
 
+    def check_mesh(self, tolerance: float = 0.0) -> mesh_methods.MeshReport:
+        """Check the local mesh of all body faces, for instance before committing it.
+
+        Faces are gathered into one mesh, vertices with the same coordinates being merged, so that
+        ``closed`` tells whether the body encloses a volume. Triangle indices of the report refer
+        to the faces triangles one after the other.
+
+        Parameters
+        ----------
+        tolerance : float
+            Largest area of a triangle considered as degenerate.
+            By default, ``0.0``.
+
+        Returns
+        -------
+        ansys.speos.core.generic.mesh_methods.MeshReport
+            Bounds, area, degenerate and duplicate triangles, open edges and missing normals.
+        """
+        meshes = [f._mesh_arrays() for f in self.faces]
+        return mesh_methods.check_mesh(*mesh_methods.merge_meshes(meshes), tolerance=tolerance)
+
+    def _lod_mesh(self, level: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the local mesh of all body faces at a level of detail.
+
+        Level ``l`` has at most ``4 ** l`` times fewer triangles than the faces. Meshes are cached
+        until the mesh of a face is edited, saved or reset.
+
+        Parameters
+        ----------
+        level : int
+            Level of detail, ``0`` being the full resolution mesh.
+            By default, ``0``.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Vertices with shape ``(n, 3)`` and facets with shape ``(m, 3)``.
+        """
+        lod_key = tuple((f, f._revision) for f in self.faces)
+        if lod_key != self._lod_key:
+            self._lod_key = lod_key
+            self._lod_meshes = {}
+        if level not in self._lod_meshes:
+            if level == 0:
+                meshes = [f._mesh_arrays()[:2] for f in self.faces]
+                offsets = np.cumsum([0] + [len(v) for v, _ in meshes])
+                self._lod_meshes[0] = (
+                    np.concatenate([v for v, _ in meshes] + [np.empty((0, 3))]),
+                    np.concatenate(
+                        [f + offset for (_, f), offset in zip(meshes, offsets)]
+                        + [np.empty((0, 3), dtype=np.int64)]
+                    ),
+                )
+            else:
+                vertices, facets = self._lod_mesh(0)
+                self._lod_meshes[level] = mesh_methods.decimate(
+                    vertices, facets, math.ceil(len(facets) / 4**level)
+                )
+        return self._lod_meshes[level]
+
     def _to_dict(self) -> dict:
         out_dict = ""
 
@@ -198,33 +269,24 @@ class Body:
     def commit(self) -> Body:
         """Save feature: send the local data to the speos server database.
 
+        Faces are sent with batch requests, then the body is written once.
+
         Returns
         -------
         ansys.speos.core.body.Body
             Body feature.
         """
-        if general_methods._GRAPHICS_AVAILABLE:
-            self._visual_data.updated = False
-
-        # Commit faces contained in this body
-        for g in self._geom_features:
-            g.commit()
+        part._commit_tree(self._speos_client, self)
+        return self
 
+    def _save(self) -> None:
+        """Save the body only, its faces being already saved."""
         # Save or Update the body (depending on if it was already saved before)
         if self.body_link is None:
             self.body_link = self._speos_client.bodies().create(message=self._body)
         elif self.body_link.get() != self._body:
             self.body_link.set(data=self._body)  # Only Update if data has changed
 
-        # Update the parent part
-        if self._parent_part is not None:
-            if self.body_link.key not in self._parent_part._part.body_guids:
-                self._parent_part._part.body_guids.append(self.body_link.key)
-                if self._parent_part.part_link is not None:
-                    self._parent_part.part_link.set(data=self._parent_part._part)
-
-        return self
-
     def reset(self) -> Body:
         """Reset feature: override local data by the one from the speos server database.
 
@@ -26,8 +26,10 @@ from __future__ import annotations
 
 from collections import Counter, UserDict
 from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+import threading
+from typing import Dict, List, Optional, Tuple, Union
 import warnings
 
 import ansys.api.speos.bsdf.v1.anisotropic_bsdf_pb2 as anisotropic_bsdf__v1__pb2
@@ -42,8 +44,26 @@ import numpy as np
 from typing_extensions import override
 
 import ansys.speos.core
+from ansys.speos.core.kernel.grpc.stats import channel_target
 from ansys.speos.core.speos import Speos
 
+_BSDF_LOCKS: Dict[Tuple[str, str], threading.RLock] = {}
+_BSDF_LOCKS_GUARD = threading.Lock()
+
+
+def _bsdf_lock(channel: grpc.Channel, namespace) -> threading.RLock:
+    """Return the lock of the bsdf held by a bsdf service on the server targeted by a channel.
+
+    The AnisotropicBsdf and SpectralBsdf services each keep a single bsdf per server, which
+    ``Load`` and ``Import`` replace and ``Export``, ``Save`` and the interpolation enhancement
+    methods read. A sequence of such calls must not interleave with another one sent to the same
+    service of the same server, from any channel or client. The lock is reentrant, so that
+    ``save`` can hold it while calling ``commit``.
+    """
+    key = (namespace.__name__, channel_target(channel))
+    with _BSDF_LOCKS_GUARD:
+        return _BSDF_LOCKS.setdefault(key, threading.RLock())
+
 
 class BaseBSDF:
     """Super class for all BSDF datamodels.
@@ -73,6 +93,11 @@ class BaseBSDF:
         self.__namespace = namespace
         self.__interpolation_settings = None
 
+    @property
+    def _server_lock(self) -> threading.RLock:
+        """Lock of the bsdf held by the service of this object on the server."""
+        return _bsdf_lock(self.client.channel, self.__namespace)
+
     @property
     def has_transmission(self) -> bool:
         """Contains the BSDF Transmission data.
@@ -221,6 +246,25 @@ class BaseBSDF:
             r_angle = []
         return r_angle, t_angle
 
+    def pack(self, reflection: bool = True) -> Union[None, PackedBxdf]:
+        """Pack the reflection or transmission data points into arrays.
+
+        Parameters
+        ----------
+        reflection : bool
+            True to pack the reflection data, False for the transmission data.
+            By default, ``True``.
+
+        Returns
+        -------
+        Union[None, ansys.speos.core.bsdf.PackedBxdf]
+            Packed data, None if there is no such data.
+        """
+        datapoints = self.brdf if reflection else self.btdf
+        if not datapoints:
+            return None
+        return PackedBxdf(datapoints=[d for d in datapoints if d.bxdf is not None])
+
     @property
     def interpolation_settings(self) -> Union[None, InterpolationEnhancement]:
         """Interpolation enhancement settings of the bsdf file.
@@ -254,10 +298,11 @@ class BaseBSDF:
         ansys.speos.core.bsdf.InterpolationEnhancement
             automatic interpolation settings with index_1 = 1 and index_2 = 1 by default.
         """
-        self._stub.Import(self._grpcbsdf)
-        self.__interpolation_settings = InterpolationEnhancement(
-            bsdf=self, bsdf_namespace=self.__namespace, index_1=index_1, index_2=index_2
-        )
+        with self._server_lock:
+            self._stub.Import(self._grpcbsdf)
+            self.__interpolation_settings = InterpolationEnhancement(
+                bsdf=self, bsdf_namespace=self.__namespace, index_1=index_1, index_2=index_2
+            )
         return self.__interpolation_settings
 
 
@@ -405,8 +450,9 @@ class InterpolationEnhancement:
     @index1.setter
     def index1(self, value: float) -> None:
         self.__cones_data.refractive_index_1 = value
-        self._bsdf._stub.Import(self._bsdf._grpcbsdf)
-        self._bsdf._stub.SetSpecularInterpolationEnhancementData(self.__cones_data)
+        with self._bsdf._server_lock:
+            self._bsdf._stub.Import(self._bsdf._grpcbsdf)
+            self._bsdf._stub.SetSpecularInterpolationEnhancementData(self.__cones_data)
 
     @property
     def index2(self) -> Union[float, None]:
@@ -427,8 +473,9 @@ class InterpolationEnhancement:
     @index2.setter
     def index2(self, value: Union[float, int]) -> None:
         self.__cones_data.refractive_index_2 = value
-        self._bsdf._stub.Import(self._bsdf._grpcbsdf)
-        self._bsdf._stub.SetSpecularInterpolationEnhancementData(self.__cones_data)
+        with self._bsdf._server_lock:
+            self._bsdf._stub.Import(self._bsdf._grpcbsdf)
+            self._bsdf._stub.SetSpecularInterpolationEnhancementData(self.__cones_data)
 
     @property
     def get_reflection_interpolation_settings(self) -> Union[None, _InterpolationSettings]:
@@ -524,72 +571,77 @@ class InterpolationEnhancement:
             raise ValueError("BSDF has no reflection data")
         if not is_brdf and not self._bsdf.has_transmission:
             raise ValueError("BSDF has no transmission data")
-        if isinstance(self._bsdf, AnisotropicBSDF):
-            self._bsdf._stub.Import(self._bsdf._grpcbsdf)
-            if is_brdf:
-                for iso_sample_key_index, iso_sample_key in enumerate(settings.keys()):
-                    for incident_key_index, incident_key in enumerate(
-                        settings[iso_sample_key].keys()
-                    ):
-                        self.__cones_data.reflection.anisotropic_samples[
-                            iso_sample_key_index
-                        ].incidence_samples[incident_key_index].cone_half_angle = settings[
-                            iso_sample_key
-                        ][incident_key]["half_angle"]
-                        self.__cones_data.reflection.anisotropic_samples[
-                            iso_sample_key_index
-                        ].incidence_samples[incident_key_index].cone_height = settings[
-                            iso_sample_key
-                        ][incident_key]["height"]
-                self._bsdf._stub.SetSpecularInterpolationEnhancementData(self.__cones_data)
-            else:
-                for iso_sample_key_index, iso_sample_key in enumerate(settings.keys()):
-                    for incident_key_index, incident_key in enumerate(
-                        settings[iso_sample_key].keys()
-                    ):
-                        self.__cones_data.transmission.anisotropic_samples[
-                            iso_sample_key_index
-                        ].incidence_samples[incident_key_index].cone_half_angle = settings[
-                            iso_sample_key
-                        ][incident_key]["half_angle"]
-                        self.__cones_data.transmission.anisotropic_samples[
-                            iso_sample_key_index
-                        ].incidence_samples[incident_key_index].cone_height = settings[
-                            iso_sample_key
-                        ][incident_key]["height"]
-                self._bsdf._stub.SetSpecularInterpolationEnhancementData(self.__cones_data)
-        elif isinstance(self._bsdf, SpectralBRDF):
-            self._bsdf._stub.Import(self._bsdf._grpcbsdf)
-            if is_brdf:
-                for wl_sample_key_index, wl_sample_key in enumerate(settings.keys()):
-                    for incident_key_index, incident_key in enumerate(
-                        settings[wl_sample_key].keys()
-                    ):
-                        self.__cones_data.wavelength_incidence_samples[
-                            (wl_sample_key_index + 1) * incident_key_index
-                        ].reflection.cone_half_angle = settings[wl_sample_key][incident_key][
-                            "half_angle"
-                        ]
-                        self.__cones_data.wavelength_incidence_samples[
-                            (wl_sample_key_index + 1) * incident_key_index
-                        ].reflection.cone_height = settings[wl_sample_key][incident_key]["height"]
-                self._bsdf._stub.SetSpecularInterpolationEnhancementData(self.__cones_data)
+        with self._bsdf._server_lock:
+            if isinstance(self._bsdf, AnisotropicBSDF):
+                self._bsdf._stub.Import(self._bsdf._grpcbsdf)
+                if is_brdf:
+                    for iso_sample_key_index, iso_sample_key in enumerate(settings.keys()):
+                        for incident_key_index, incident_key in enumerate(
+                            settings[iso_sample_key].keys()
+                        ):
+                            self.__cones_data.reflection.anisotropic_samples[
+                                iso_sample_key_index
+                            ].incidence_samples[incident_key_index].cone_half_angle = settings[
+                                iso_sample_key
+                            ][incident_key]["half_angle"]
+                            self.__cones_data.reflection.anisotropic_samples[
+                                iso_sample_key_index
+                            ].incidence_samples[incident_key_index].cone_height = settings[
+                                iso_sample_key
+                            ][incident_key]["height"]
+                    self._bsdf._stub.SetSpecularInterpolationEnhancementData(self.__cones_data)
+                else:
+                    for iso_sample_key_index, iso_sample_key in enumerate(settings.keys()):
+                        for incident_key_index, incident_key in enumerate(
+                            settings[iso_sample_key].keys()
+                        ):
+                            self.__cones_data.transmission.anisotropic_samples[
+                                iso_sample_key_index
+                            ].incidence_samples[incident_key_index].cone_half_angle = settings[
+                                iso_sample_key
+                            ][incident_key]["half_angle"]
+                            self.__cones_data.transmission.anisotropic_samples[
+                                iso_sample_key_index
+                            ].incidence_samples[incident_key_index].cone_height = settings[
+                                iso_sample_key
+                            ][incident_key]["height"]
+                    self._bsdf._stub.SetSpecularInterpolationEnhancementData(self.__cones_data)
+            elif isinstance(self._bsdf, SpectralBRDF):
+                self._bsdf._stub.Import(self._bsdf._grpcbsdf)
+                if is_brdf:
+                    for wl_sample_key_index, wl_sample_key in enumerate(settings.keys()):
+                        for incident_key_index, incident_key in enumerate(
+                            settings[wl_sample_key].keys()
+                        ):
+                            self.__cones_data.wavelength_incidence_samples[
+                                (wl_sample_key_index + 1) * incident_key_index
+                            ].reflection.cone_half_angle = settings[wl_sample_key][incident_key][
+                                "half_angle"
+                            ]
+                            self.__cones_data.wavelength_incidence_samples[
+                                (wl_sample_key_index + 1) * incident_key_index
+                            ].reflection.cone_height = settings[wl_sample_key][incident_key][
+                                "height"
+                            ]
+                    self._bsdf._stub.SetSpecularInterpolationEnhancementData(self.__cones_data)
+                else:
+                    for wl_sample_key_index, wl_sample_key in enumerate(settings.keys()):
+                        for incident_key_index, incident_key in enumerate(
+                            settings[wl_sample_key].keys()
+                        ):
+                            self.__cones_data.wavelength_incidence_samples[
+                                (wl_sample_key_index + 1) * incident_key_index
+                            ].transmission.cone_half_angle = settings[wl_sample_key][incident_key][
+                                "half_angle"
+                            ]
+                            self.__cones_data.wavelength_incidence_samples[
+                                (wl_sample_key_index + 1) * incident_key_index
+                            ].transmission.cone_height = settings[wl_sample_key][incident_key][
+                                "height"
+                            ]
+                    self._bsdf._stub.SetSpecularInterpolationEnhancementData(self.__cones_data)
             else:
-                for wl_sample_key_index, wl_sample_key in enumerate(settings.keys()):
-                    for incident_key_index, incident_key in enumerate(
-                        settings[wl_sample_key].keys()
-                    ):
-                        self.__cones_data.wavelength_incidence_samples[
-                            (wl_sample_key_index + 1) * incident_key_index
-                        ].transmission.cone_half_angle = settings[wl_sample_key][incident_key][
-                            "half_angle"
-                        ]
-                        self.__cones_data.wavelength_incidence_samples[
-                            (wl_sample_key_index + 1) * incident_key_index
-                        ].transmission.cone_height = settings[wl_sample_key][incident_key]["height"]
-                self._bsdf._stub.SetSpecularInterpolationEnhancementData(self.__cones_data)
-        else:
-            raise ValueError("only anisotropic bsdf and spectral brdf are supported")
+                raise ValueError("only anisotropic bsdf and spectral brdf are supported")
 
     @property
     def get_transmission_interpolation_settings(self) -> Union[None, _InterpolationSettings]:
@@ -689,21 +741,22 @@ class AnisotropicBSDF(BaseBSDF):
         self._spectrum_anisotropy = [0.0, 0.0]
         if file_path:
             file_path = Path(file_path)
-            self._grpcbsdf = self._import_file(file_path)
+            with self._server_lock:
+                self._grpcbsdf = self._import_file(file_path)
+                try:
+                    self._stub.GetSpecularInterpolationEnhancementData(Empty())
+                    self._BaseBSDF__interpolation_settings = InterpolationEnhancement(
+                        bsdf=self,
+                        bsdf_namespace=anisotropic_bsdf__v1__pb2,
+                        index_1=None,
+                        index_2=None,
+                    )
+                except grpc.RpcError:
+                    self.__interpolation_settings = None
             self._brdf, self._btdf = self._extract_bsdf()
             self._has_transmission = bool(self._btdf)
             self._has_reflection = bool(self._brdf)
             self._reflection_spectrum, self._transmission_spectrum = self._extract_spectrum()
-            try:
-                self._stub.GetSpecularInterpolationEnhancementData(Empty())
-                self._BaseBSDF__interpolation_settings = InterpolationEnhancement(
-                    bsdf=self,
-                    bsdf_namespace=anisotropic_bsdf__v1__pb2,
-                    index_1=None,
-                    index_2=None,
-                )
-            except grpc.RpcError:
-                self.__interpolation_settings = None
         else:
             self._transmission_spectrum, self._reflection_spectrum = None, None
 
@@ -742,8 +795,9 @@ class AnisotropicBSDF(BaseBSDF):
     def _import_file(self, filepath):
         file_name = anisotropic_bsdf__v1__pb2.FileName()
         file_name.file_name = str(filepath)
-        self._stub.Load(file_name)
-        return self._stub.Export(Empty())
+        with self._server_lock:
+            self._stub.Load(file_name)
+            return self._stub.Export(Empty())
 
     def _extract_bsdf(self) -> Tuple[Collection[BxdfDatapoint], Collection[BxdfDatapoint]]:
         if not self._grpcbsdf:
@@ -754,30 +808,26 @@ class AnisotropicBSDF(BaseBSDF):
             self._grpcbsdf.anisotropy_vector.y,
             self._grpcbsdf.anisotropy_vector.z,
         ]
-        brdf = []
-        btdf = []
-        for ani_bsdf_data in self._grpcbsdf.reflection.anisotropic_samples:
-            anisotropic_angle = ani_bsdf_data.anisotropic_sample
-            for bsdf_data in ani_bsdf_data.incidence_samples:
-                incident_angle = bsdf_data.incidence_sample
-                thetas = np.array(bsdf_data.theta_samples)
-                phis = np.array(bsdf_data.phi_samples)
-                bsdf = np.array(bsdf_data.bsdf_cos_theta).reshape((len(thetas), len(phis)))
-                tis = bsdf_data.integral
-                brdf.append(
-                    BxdfDatapoint(True, incident_angle, thetas, phis, bsdf, tis, anisotropic_angle)
-                )
-        for ani_bsdf_data in self._grpcbsdf.transmission.anisotropic_samples:
-            anisotropic_angle = ani_bsdf_data.anisotropic_sample
-            for bsdf_data in ani_bsdf_data.incidence_samples:
-                incident_angle = bsdf_data.incidence_sample
-                thetas = np.array(bsdf_data.theta_samples)
-                phis = np.array(bsdf_data.phi_samples)
-                bsdf = np.array(bsdf_data.bsdf_cos_theta).reshape((len(thetas), len(phis)))
-                tis = bsdf_data.integral
-                btdf.append(
-                    BxdfDatapoint(False, incident_angle, thetas, phis, bsdf, tis, anisotropic_angle)
-                )
+        brdf = [
+            _read_diagram(
+                diagram=bsdf_data,
+                is_brdf=True,
+                incident_angle=bsdf_data.incidence_sample,
+                anisotropy=ani_bsdf_data.anisotropic_sample,
+            )
+            for ani_bsdf_data in self._grpcbsdf.reflection.anisotropic_samples
+            for bsdf_data in ani_bsdf_data.incidence_samples
+        ]
+        btdf = [
+            _read_diagram(
+                diagram=bsdf_data,
+                is_brdf=False,
+                incident_angle=bsdf_data.incidence_sample,
+                anisotropy=ani_bsdf_data.anisotropic_sample,
+            )
+            for ani_bsdf_data in self._grpcbsdf.transmission.anisotropic_samples
+            for bsdf_data in ani_bsdf_data.incidence_samples
+        ]
         return brdf, btdf
 
     def _extract_spectrum(self) -> Tuple[np.ndarray, np.ndarray]:
@@ -789,13 +839,7 @@ class AnisotropicBSDF(BaseBSDF):
         if self.has_transmission:
             self.spectrum_incidence[1] = self._grpcbsdf.transmission.spectrum_incidence
             self.spectrum_anisotropy[1] = self._grpcbsdf.transmission.spectrum_anisotropy
-        refl_s = np.array([[], []])
-        trans_s = np.array([[], []])
-        for value in self._grpcbsdf.reflection.spectrum:
-            refl_s = np.append(refl_s, [[value.wavelength], [value.coefficient]], axis=1)
-        for value in self._grpcbsdf.transmission.spectrum:
-            trans_s = np.append(trans_s, [[value.wavelength], [value.coefficient]], axis=1)
-        return refl_s, trans_s
+        return _spectra(self._grpcbsdf)
 
     @property
     def anisotropic_angles(self) -> List[List[float]]:
@@ -948,46 +992,43 @@ class AnisotropicBSDF(BaseBSDF):
         if self.has_reflection and self.brdf is not None:
             bsdf.reflection.spectrum_incidence = self.spectrum_incidence[0]
             bsdf.reflection.spectrum_anisotropy = self.spectrum_anisotropy[0]
-            for w in range(len(self.reflection_spectrum[0])):
+            for wavelength, coefficient in zip(*self.reflection_spectrum):
                 pair = bsdf.reflection.spectrum.add()
-                pair.wavelength = self.reflection_spectrum[0][w]
-                pair.coefficient = self.reflection_spectrum[1][w]
-            for ani in self.anisotropic_angles[0]:
+                pair.wavelength = wavelength
+                pair.coefficient = coefficient
+            # one pass grouping, anisotropy angles are kept in order of appearance
+            for ani, datapoints in _group_by_anisotropy(self.brdf).items():
                 slice = bsdf.reflection.anisotropic_samples.add()
                 slice.anisotropic_sample = ani
-                for brdf in self.brdf:
-                    if brdf.anisotropy == ani and brdf.bxdf is not None:
+                for brdf in datapoints:
+                    if brdf.bxdf is not None:
                         incidence_diag = slice.incidence_samples.add()
                         incidence_diag.incidence_sample = brdf.incident_angle
-                        # intensity diagrams
-                        incidence_diag.phi_samples[:] = list(brdf.phi_values)
-                        incidence_diag.theta_samples[:] = list(brdf.theta_values)
-                        incidence_diag.bsdf_cos_theta[:] = brdf.bxdf.flatten().tolist()
+                        _write_diagram(diagram=incidence_diag, datapoint=brdf, with_tis=False)
         if self.has_transmission and self.btdf is not None:
             bsdf.transmission.spectrum_incidence = self.spectrum_incidence[1]
             bsdf.transmission.spectrum_anisotropy = self.spectrum_anisotropy[1]
-            for w in range(len(self.transmission_spectrum[0])):
+            for wavelength, coefficient in zip(*self.transmission_spectrum):
                 pair = bsdf.transmission.spectrum.add()
-                pair.wavelength = self.transmission_spectrum[0][w]
-                pair.coefficient = self.transmission_spectrum[1][w]
-            for ani in self.anisotropic_angles[1]:
+                pair.wavelength = wavelength
+                pair.coefficient = coefficient
+            # one pass grouping, anisotropy angles are kept in order of appearance
+            for ani, datapoints in _group_by_anisotropy(self.btdf).items():
                 slice = bsdf.transmission.anisotropic_samples.add()
                 slice.anisotropic_sample = ani
-                for btdf in self.btdf:
-                    if btdf.anisotropy == ani and btdf.bxdf is not None:
+                for btdf in datapoints:
+                    if btdf.bxdf is not None:
                         incidence_diag = slice.incidence_samples.add()
                         incidence_diag.incidence_sample = btdf.incident_angle
-                        # intensity diagrams
-                        incidence_diag.phi_samples[:] = list(btdf.phi_values)
-                        incidence_diag.theta_samples[:] = list(btdf.theta_values)
-                        incidence_diag.bsdf_cos_theta[:] = btdf.bxdf.flatten().tolist()
-        self._stub.Import(bsdf)
-        self._grpcbsdf = bsdf
-        if self._BaseBSDF__interpolation_settings is not None:
-            self._stub.SetSpecularInterpolationEnhancementData(
-                self._BaseBSDF__interpolation_settings.  # ty : ignore
-                _InterpolationEnhancement__cones_data
-            )
+                        _write_diagram(diagram=incidence_diag, datapoint=btdf, with_tis=False)
+        with self._server_lock:
+            self._stub.Import(bsdf)
+            self._grpcbsdf = bsdf
+            if self._BaseBSDF__interpolation_settings is not None:
+                self._stub.SetSpecularInterpolationEnhancementData(
+                    self._BaseBSDF__interpolation_settings.  # ty : ignore
+                    _InterpolationEnhancement__cones_data
+                )
 
     def save(self, file_path: Union[Path, str], commit: bool = True) -> Path:
         """Save a Speos anistropic bsdf.
@@ -1006,15 +1047,16 @@ class AnisotropicBSDF(BaseBSDF):
         """
         file_path = Path(file_path)
         file_name = anisotropic_bsdf__v1__pb2.FileName()
-        if commit:
-            self.commit()
-        else:
-            self._stub.Import(self._grpcbsdf)
         if file_path.suffix == ".anisotropicbsdf":
             file_name.file_name = str(file_path)
         else:
             file_name.file_name = str(file_path.parent / (file_path.name + ".anisotropicbsdf"))
-        self._stub.Save(file_name)
+        with self._server_lock:
+            if commit:
+                self.commit()
+            else:
+                self._stub.Import(self._grpcbsdf)
+            self._stub.Save(file_name)
         return Path(file_name.file_name)
 
 
@@ -1041,20 +1083,21 @@ class SpectralBRDF(BaseBSDF):
         self._spectrum_anisotropy = [0.0, 0.0]
         if file_path:
             file_path = Path(file_path)
-            self._grpcbsdf = self._import_file(file_path)
+            with self._server_lock:
+                self._grpcbsdf = self._import_file(file_path)
+                try:
+                    self._stub.GetSpecularInterpolationEnhancementData(Empty())
+                    self._BaseBSDF__interpolation_settings = InterpolationEnhancement(
+                        bsdf=self,
+                        bsdf_namespace=spectral_bsdf__v1__pb2,
+                        index_1=None,
+                        index_2=None,
+                    )
+                except grpc.RpcError:
+                    self.__interpolation_settings = None
             self.brdf, self.btdf = self._extract_bsdf()
             self._has_transmission = bool(self._btdf)
             self._has_reflection = bool(self._brdf)
-            try:
-                self._stub.GetSpecularInterpolationEnhancementData(Empty())
-                self._BaseBSDF__interpolation_settings = InterpolationEnhancement(
-                    bsdf=self,
-                    bsdf_namespace=spectral_bsdf__v1__pb2,
-                    index_1=None,
-                    index_2=None,
-                )
-            except grpc.RpcError:
-                self.__interpolation_settings = None
         else:
             self._transmission_spectrum, self._reflection_spectrum = None, None
 
@@ -1111,8 +1154,9 @@ class SpectralBRDF(BaseBSDF):
     def _import_file(self, filepath):
         file_name = spectral_bsdf__v1__pb2.FileName()
         file_name.file_name = str(filepath)
-        self._stub.Load(file_name)
-        return self._stub.Export(Empty())
+        with self._server_lock:
+            self._stub.Load(file_name)
+            return self._stub.Export(Empty())
 
     def _extract_bsdf(
         self,
@@ -1122,34 +1166,27 @@ class SpectralBRDF(BaseBSDF):
         self.description = self._grpcbsdf.description
         brdf = []
         btdf = []
+        incidences = list(self._grpcbsdf.incidence_samples)
+        wavelengths = list(self._grpcbsdf.wavelength_samples)
         for i, spectral_bsdf_data in enumerate(self._grpcbsdf.wavelength_incidence_samples):
-            anisotropic_angle = 0
-            incident_angle = self._grpcbsdf.incidence_samples[
-                i % len(self._grpcbsdf.incidence_samples)
-            ]
-            wl = self._grpcbsdf.wavelength_samples[int(i / len(self._grpcbsdf.incidence_samples))]
+            incident_angle = incidences[i % len(incidences)]
+            wl = wavelengths[i // len(incidences)]
             if spectral_bsdf_data.HasField("reflection"):
-                thetas = np.array(spectral_bsdf_data.reflection.theta_samples)
-                phis = np.array(spectral_bsdf_data.reflection.phi_samples)
-                bsdf = np.array(spectral_bsdf_data.reflection.bsdf_cos_theta).reshape(
-                    (len(thetas), len(phis))
-                )
-                tis = spectral_bsdf_data.reflection.integral
                 brdf.append(
-                    BxdfDatapoint(
-                        True, incident_angle, thetas, phis, bsdf, tis, anisotropic_angle, wl
+                    _read_diagram(
+                        diagram=spectral_bsdf_data.reflection,
+                        is_brdf=True,
+                        incident_angle=incident_angle,
+                        wavelength=wl,
                     )
                 )
             if spectral_bsdf_data.HasField("transmission"):
-                thetas = np.array(spectral_bsdf_data.transmission.theta_samples)
-                phis = np.array(spectral_bsdf_data.transmission.phi_samples)
-                bsdf = np.array(spectral_bsdf_data.transmission.bsdf_cos_theta).reshape(
-                    (len(thetas), len(phis))
-                )
-                tis = spectral_bsdf_data.transmission.integral
                 btdf.append(
-                    BxdfDatapoint(
-                        False, incident_angle, thetas, phis, bsdf, tis, anisotropic_angle, wl
+                    _read_diagram(
+                        diagram=spectral_bsdf_data.transmission,
+                        is_brdf=False,
+                        incident_angle=incident_angle,
+                        wavelength=wl,
                     )
                 )
         if not brdf:
@@ -1267,14 +1304,8 @@ class SpectralBRDF(BaseBSDF):
                     inc.append(brdf.incident_angle)
                     wl.append(brdf.wavelength)
                     iw = spectral_bsdf.wavelength_incidence_samples.add()
-                    iw.reflection.integral = brdf.tis
-                    iw.reflection.phi_samples[:] = list(brdf.phi_values)
-                    iw.reflection.theta_samples[:] = list(brdf.theta_values)
-                    iw.reflection.bsdf_cos_theta[:] = brdf.bxdf.flatten().tolist()
-                    iw.transmission.integral = btdf.tis
-                    iw.transmission.phi_samples[:] = list(btdf.phi_values)
-                    iw.transmission.theta_samples[:] = list(btdf.theta_values)
-                    iw.transmission.bsdf_cos_theta[:] = btdf.bxdf.flatten().tolist()
+                    _write_diagram(diagram=iw.reflection, datapoint=brdf)
+                    _write_diagram(diagram=iw.transmission, datapoint=btdf)
             case True, False:
                 for brdf in self.brdf:  # ty : ignore
                     if brdf.bxdf is None:
@@ -1285,10 +1316,7 @@ class SpectralBRDF(BaseBSDF):
                     inc.append(brdf.incident_angle)
                     wl.append(brdf.wavelength)
                     iw = spectral_bsdf.wavelength_incidence_samples.add()
-                    iw.reflection.integral = brdf.tis
-                    iw.reflection.phi_samples[:] = list(brdf.phi_values)
-                    iw.reflection.theta_samples[:] = list(brdf.theta_values)
-                    iw.reflection.bsdf_cos_theta[:] = brdf.bxdf.flatten().tolist()
+                    _write_diagram(diagram=iw.reflection, datapoint=brdf)
             case False, True:
                 for btdf in self.btdf:  # ty : ignore
                     if btdf.bxdf is None:
@@ -1299,23 +1327,21 @@ class SpectralBRDF(BaseBSDF):
                     inc.append(btdf.incident_angle)
                     wl.append(btdf.wavelength)
                     iw = spectral_bsdf.wavelength_incidence_samples.add()
-                    iw.transmission.integral = btdf.tis
-                    iw.transmission.phi_samples[:] = list(btdf.phi_values)
-                    iw.transmission.theta_samples[:] = list(btdf.theta_values)
-                    iw.transmission.bsdf_cos_theta[:] = btdf.bxdf.flatten().tolist()
+                    _write_diagram(diagram=iw.transmission, datapoint=btdf)
         inc = list(set(inc))
         wl = list(set(wl))
         inc.sort()
         wl.sort()
         spectral_bsdf.incidence_samples[:] = inc
         spectral_bsdf.wavelength_samples[:] = wl
-        self._stub.Import(spectral_bsdf)
-        self._grpcbsdf = spectral_bsdf
-        if self._BaseBSDF__interpolation_settings is not None:
-            self._stub.SetSpecularInterpolationEnhancementData(
-                self._BaseBSDF__interpolation_settings.  # ty : ignore
-                _InterpolationEnhancement__cones_data
-            )
+        with self._server_lock:
+            self._stub.Import(spectral_bsdf)
+            self._grpcbsdf = spectral_bsdf
+            if self._BaseBSDF__interpolation_settings is not None:
+                self._stub.SetSpecularInterpolationEnhancementData(
+                    self._BaseBSDF__interpolation_settings.  # ty : ignore
+                    _InterpolationEnhancement__cones_data
+                )
 
     def save(self, file_path: Union[Path, str], commit: bool = True) -> Path:
         """Save a Speos anistropic bsdf.
@@ -1334,15 +1360,16 @@ class SpectralBRDF(BaseBSDF):
         """
         file_path = Path(file_path)
         file_name = spectral_bsdf__v1__pb2.FileName()
-        if commit:
-            self.commit()
-        else:
-            self._stub.Import(self._grpcbsdf)
         if file_path.suffix == ".brdf":
             file_name.file_name = str(file_path)
         else:
             file_name.file_name = str(file_path.parent / (file_path.name + ".brdf"))
-        self._stub.Save(file_name)
+        with self._server_lock:
+            if commit:
+                self.commit()
+            else:
+                self._stub.Import(self._grpcbsdf)
+            self._stub.Save(file_name)
         return Path(file_name.file_name)
 
 
@@ -1365,8 +1392,24 @@ class BxdfDatapoint:
         Anisotropy angle in radian
     wavelength : float
         Wavelength in nm
+
+    Notes
+    -----
+    Theta and phi samples are stored as float arrays, shared between the data points unpacked from
+    a same :class:`ansys.speos.core.bsdf.PackedBxdf`.
     """
 
+    __slots__ = (
+        "_is_brdf",
+        "_incident_angle",
+        "_anisotropy",
+        "_theta_values",
+        "_phi_values",
+        "_bxdf",
+        "tis",
+        "wavelength",
+    )
+
     def __init__(
         self,
         is_brdf: bool,
@@ -1379,8 +1422,8 @@ class BxdfDatapoint:
         wavelength: float = 555,
     ):
         # data_reset
-        self._theta_values = []
-        self._phi_values = []
+        self._theta_values = np.empty(0)
+        self._phi_values = np.empty(0)
         self._bxdf = None
         # define data
         self.is_brdf = is_brdf
@@ -1392,6 +1435,42 @@ class BxdfDatapoint:
         self.tis = tis
         self.wavelength = wavelength
 
+    @classmethod
+    def _from_arrays(
+        cls,
+        is_brdf: bool,
+        incident_angle: float,
+        theta_values: np.ndarray,
+        phi_values: np.ndarray,
+        bxdf: np.ndarray,
+        tis: float,
+        anisotropy: float,
+        wavelength: float,
+    ) -> BxdfDatapoint:
+        """Create a data point without validation, for data coming from the server."""
+        datapoint = cls.__new__(cls)
+        datapoint._is_brdf = is_brdf
+        datapoint._incident_angle = incident_angle
+        datapoint._anisotropy = anisotropy
+        datapoint._theta_values = theta_values
+        datapoint._phi_values = phi_values
+        datapoint._bxdf = bxdf
+        datapoint.tis = tis
+        datapoint.wavelength = wavelength
+        return datapoint
+
+    def integrate(self) -> float:
+        """Compute the total integrated scattering of the bxdf data.
+
+        Returns
+        -------
+        float
+            Total integrated scattering, see ``ansys.speos.core.bsdf.PackedBxdf.integrate``.
+        """
+        if self.bxdf is None:
+            raise ValueError("No bxdf data to integrate")
+        return float(PackedBxdf([self]).integrate()[0])
+
     def get(self, key=""):
         """Retrieve any information from the BxdfDatapoint object.
 
@@ -1465,9 +1544,9 @@ class BxdfDatapoint:
             bxdf = np.array(value)
             if any((bxdf < 0).flatten()):
                 raise ValueError("bxdf data has to be positive")
-            if np.shape(bxdf) == (len(self.theta_values), len(self.phi_values)):
+            if np.shape(bxdf) == (len(self._theta_values), len(self._phi_values)):
                 self._bxdf = bxdf
-            elif np.shape(bxdf) == (len(self.phi_values), len(self.theta_values)):
+            elif np.shape(bxdf) == (len(self._phi_values), len(self._theta_values)):
                 self._bxdf = bxdf.transpose()
             else:
                 raise ValueError("bxdf data has incorrect dimensions")
@@ -1552,23 +1631,24 @@ class BxdfDatapoint:
         List[float]
             List of bxdf theta values.
         """
-        return self._theta_values
+        return self._theta_values.tolist()
 
     @theta_values.setter
     def theta_values(self, value: Collection[float]):
+        thetas = np.array(value, dtype=np.float64).ravel()
         if not self.is_brdf:
-            if all([np.pi / 2 <= theta <= np.pi for theta in value]):
-                self._theta_values = [_ for _ in value]
+            if np.all((np.pi / 2 <= thetas) & (thetas <= np.pi)):
+                self._theta_values = thetas
                 if self.bxdf is not None:
-                    if np.shape(self.bxdf) != (len(self.theta_values), len(self.phi_values)):
+                    if np.shape(self.bxdf) != (len(self._theta_values), len(self._phi_values)):
                         self.bxdf = None
             else:
                 raise ValueError("Theta values for Transmission need to be between [pi/2, pi]")
         else:
-            if all([0 <= theta <= np.pi / 2 for theta in value]):
-                self._theta_values = [_ for _ in value]
+            if np.all((0 <= thetas) & (thetas <= np.pi / 2)):
+                self._theta_values = thetas
                 if self.bxdf is not None:
-                    if np.shape(self.bxdf) != (len(self.theta_values), len(self.phi_values)):
+                    if np.shape(self.bxdf) != (len(self._theta_values), len(self._phi_values)):
                         self.bxdf = None
             else:
                 raise ValueError("Theta values for Reflection need to be between [0, pi/2]")
@@ -1588,19 +1668,364 @@ class BxdfDatapoint:
             List of bxdf phi values.
 
         """
-        return self._phi_values
+        return self._phi_values.tolist()
 
     @phi_values.setter
     def phi_values(self, value: Collection[float]):
-        if all([0 <= phi <= 2 * np.pi for phi in value]):
-            self._phi_values = [_ for _ in value]
+        phis = np.array(value, dtype=np.float64).ravel()
+        if np.all((0 <= phis) & (phis <= 2 * np.pi)):
+            self._phi_values = phis
             if self.bxdf is not None:
-                if np.shape(self.bxdf) != (len(self.theta_values), len(self.phi_values)):
+                if np.shape(self.bxdf) != (len(self._theta_values), len(self._phi_values)):
                     self.bxdf = None
         else:
             raise ValueError("Phi values need to be between [0, 2pi]")
 
 
+def _same_samples(samples: np.ndarray, other: np.ndarray) -> bool:
+    """Check if two data points have the same theta or phi samples."""
+    return samples is other or np.array_equal(samples, other)
+
+
+class PackedBxdf:
+    """Packed array storage of a list of BxDF data points.
+
+    When all data points share the same theta and phi samples, the bxdf matrices are stored in a
+    single ``(n, theta, phi)`` array. Otherwise, each data point keeps its own samples and matrix
+    (ragged storage).
+
+    Parameters
+    ----------
+    datapoints : Collection[ansys.speos.core.bsdf.BxdfDatapoint]
+        Data points to pack, all of them need bxdf data.
+    """
+
+    def __init__(self, datapoints: Collection[BxdfDatapoint]):
+        datapoints = list(datapoints)
+        if any(datapoint.bxdf is None for datapoint in datapoints):
+            raise ValueError("All data points need bxdf data to be packed")
+        self.is_brdf = np.array([datapoint.is_brdf for datapoint in datapoints], dtype=bool)
+        """Type of each data point, True for reflection."""
+        self.anisotropy = np.array([datapoint.anisotropy for datapoint in datapoints], dtype=float)
+        """Anisotropy angle of each data point, in radian."""
+        self.wavelength = np.array([datapoint.wavelength for datapoint in datapoints], dtype=float)
+        """Wavelength of each data point, in nm."""
+        self.incident_angle = np.array(
+            [datapoint.incident_angle for datapoint in datapoints], dtype=float
+        )
+        """Incident angle of each data point, in radian."""
+        self.tis = np.array([datapoint.tis for datapoint in datapoints], dtype=float)
+        """Total integrated scattering of each data point."""
+
+        self.is_regular = len(datapoints) != 0 and all(
+            _same_samples(datapoint._theta_values, datapoints[0]._theta_values)
+            and _same_samples(datapoint._phi_values, datapoints[0]._phi_values)
+            for datapoint in datapoints
+        )
+        """True when all data points share the same theta and phi samples."""
+        if self.is_regular:
+            self.theta_values = np.array(datapoints[0]._theta_values, dtype=float)
+            self.phi_values = np.array(datapoints[0]._phi_values, dtype=float)
+            self.values = np.stack([datapoint.bxdf for datapoint in datapoints]).astype(float)
+        else:
+            self.theta_values = [np.array(d._theta_values, dtype=float) for d in datapoints]
+            self.phi_values = [np.array(d._phi_values, dtype=float) for d in datapoints]
+            self.values = [np.asarray(d.bxdf, dtype=float) for d in datapoints]
+
+    def __len__(self) -> int:
+        """Return the number of data points."""
+        return len(self.incident_angle)
+
+    def tensor(self) -> np.ndarray:
+        """Bxdf data as a 4-D tensor.
+
+        Data points are ordered by anisotropy, wavelength and incident angle, and grouped by
+        (anisotropy, wavelength) couple.
+
+        Returns
+        -------
+        np.ndarray
+            Bxdf data of shape (anisotropy or wavelength, incidence, theta, phi).
+        """
+        return self._grid()[2]
+
+    def _grid(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the group axis values, the incidence axis values and the 4-D tensor."""
+        if not self.is_regular:
+            raise ValueError("Data points with different theta or phi samples can not be stacked")
+        order = np.lexsort((self.incident_angle, self.wavelength, self.anisotropy))
+        groups = np.unique(np.stack((self.anisotropy, self.wavelength), axis=1), axis=0)
+        if len(self) % len(groups) != 0:
+            raise ValueError("All anisotropy or wavelength need the same number of incidences")
+        nb_incidences = len(self) // len(groups)
+        tensor = self.values[order].reshape(
+            (len(groups), nb_incidences, len(self.theta_values), len(self.phi_values))
+        )
+        incidences = self.incident_angle[order].reshape((len(groups), nb_incidences))
+        if not np.all(incidences == incidences[0]):
+            raise ValueError("All anisotropy or wavelength need the same incident angles")
+        if len(np.unique(groups[:, 0])) == len(groups):
+            group_values = groups[:, 0]
+        elif len(np.unique(groups[:, 1])) == len(groups):
+            group_values = groups[:, 1]
+        else:
+            raise ValueError("Data points can not vary in both anisotropy and wavelength")
+        return group_values, incidences[0], tensor
+
+    def evaluate(
+        self,
+        incident_angle: Union[float, Collection[float]],
+        theta: Union[float, Collection[float]],
+        phi: Union[float, Collection[float]],
+        group: Union[None, float, Collection[float]] = None,
+    ) -> np.ndarray:
+        """Interpolate the bxdf data for a batch of directions.
+
+        The interpolation is linear along each axis: bilinear in (theta, phi) within a data
+        point, then along the incident angles, then along the anisotropy or wavelength axis.
+        Phi is wrapped modulo 2π, other values outside of the sampled ranges are clamped to the
+        closest sample.
+
+        Parameters
+        ----------
+        incident_angle : Union[float, Collection[float]]
+            Incident angles, in radian.
+        theta : Union[float, Collection[float]]
+            Theta angles of the scattered directions, in radian.
+        phi : Union[float, Collection[float]]
+            Phi angles of the scattered directions, in radian.
+        group : Union[None, float, Collection[float]]
+            Anisotropy angles in radian, or wavelengths in nm, depending on which of them varies
+            between data points. Can be omitted when all data points share both.
+            By default, ``None``.
+
+        Returns
+        -------
+        np.ndarray
+            Interpolated bxdf values, broadcast to the shape of the inputs.
+        """
+        group_values, incidences, tensor = self._grid()
+        if group is None:
+            if len(group_values) != 1:
+                raise ValueError("group is needed for data with several anisotropy or wavelength")
+            group = group_values[0]
+        return _interpolate(
+            axes=(group_values, incidences, self.theta_values, self.phi_values),
+            values=tensor,
+            points=(group, incident_angle, theta, phi),
+            periods=(None, None, None, 2 * np.pi),
+        )
+
+    def integrate(self) -> np.ndarray:
+        """Compute the total integrated scattering of each data point.
+
+        The bxdf data, which includes the cosine factor, is integrated over the hemisphere with
+        the trapezoidal rule on the theta and phi samples.
+
+        Returns
+        -------
+        np.ndarray
+            Total integrated scattering of each data point.
+        """
+        if self.is_regular:
+            theta_weights = _trapezoid_weights(self.theta_values) * np.abs(
+                np.sin(self.theta_values)
+            )
+            phi_weights = _trapezoid_weights(self.phi_values)
+            return np.einsum("ntp,t,p->n", self.values, theta_weights, phi_weights)
+        return np.array(
+            [
+                _trapezoid_weights(thetas)
+                * np.abs(np.sin(thetas))
+                @ values
+                @ (_trapezoid_weights(phis))
+                for thetas, phis, values in zip(self.theta_values, self.phi_values, self.values)
+            ],
+            dtype=float,
+        ).reshape(-1)
+
+    def check_integral(self, rtol: float = 0.01) -> np.ndarray:
+        """Compare the computed total integrated scattering with the stored one.
+
+        Parameters
+        ----------
+        rtol : float
+            Relative tolerance. By default, ``0.01``.
+
+        Returns
+        -------
+        np.ndarray
+            Mask of the data points whose stored ``tis`` matches the computed one.
+        """
+        return np.isclose(self.integrate(), self.tis, rtol=rtol, atol=0.0)
+
+    def to_datapoints(self) -> List[BxdfDatapoint]:
+        """Unpack to a list of data points.
+
+        Returns
+        -------
+        List[ansys.speos.core.bsdf.BxdfDatapoint]
+            Data points, sharing their bxdf data with this object.
+        """
+        return [
+            BxdfDatapoint._from_arrays(
+                is_brdf=bool(self.is_brdf[i]),
+                incident_angle=float(self.incident_angle[i]),
+                theta_values=self.theta_values if self.is_regular else self.theta_values[i],
+                phi_values=self.phi_values if self.is_regular else self.phi_values[i],
+                bxdf=self.values[i],
+                tis=float(self.tis[i]),
+                anisotropy=float(self.anisotropy[i]),
+                wavelength=float(self.wavelength[i]),
+            )
+            for i in range(len(self))
+        ]
+
+
+def _trapezoid_weights(samples: np.ndarray) -> np.ndarray:
+    """Return the weights of the trapezoidal rule for the given samples."""
+    weights = np.zeros(len(samples))
+    steps = np.diff(samples) / 2
+    weights[:-1] += steps
+    weights[1:] += steps
+    return weights
+
+
+def _interpolate(
+    axes: Tuple[np.ndarray, ...],
+    values: np.ndarray,
+    points: Tuple,
+    periods: Optional[Tuple[Optional[float], ...]] = None,
+) -> np.ndarray:
+    """Multilinear interpolation on a regular grid, clamped to the grid bounds.
+
+    Parameters
+    ----------
+    axes : Tuple[np.ndarray, ...]
+        Sorted sample values of each axis of the grid.
+    values : np.ndarray
+        Values on the grid, one dimension per axis.
+    points : Tuple
+        Coordinates of the points along each axis, broadcastable together.
+    periods : Optional[Tuple[Optional[float], ...]]
+        Period of each axis, ``None`` for an axis clamped to its bounds. Points along a periodic
+        axis are wrapped, the last sample being interpolated with the first one across the seam.
+        By default, ``None``, no periodic axis.
+
+    Returns
+    -------
+    np.ndarray
+        Interpolated values, of the broadcast shape of the points.
+    """
+    points = np.broadcast_arrays(*[np.asarray(point, dtype=float) for point in points])
+    shape = points[0].shape
+    if periods is None:
+        periods = (None,) * len(axes)
+    lower = []
+    upper = []
+    weights = []
+    for axis, point, period in zip(axes, points, periods):
+        point = point.reshape(-1)
+        if len(axis) == 1:
+            index = np.zeros(len(point), dtype=np.intp)
+            lower.append(index)
+            upper.append(index)
+            weights.append(np.zeros(len(point)))
+            continue
+        if period is None:
+            point = np.clip(point, axis[0], axis[-1])
+            index = np.clip(np.searchsorted(axis, point, side="right") - 1, 0, len(axis) - 2)
+            next_index = index + 1
+            next_sample = axis[next_index]
+        else:
+            point = axis[0] + np.mod(point - axis[0], period)
+            index = np.searchsorted(axis, point, side="right") - 1
+            seam = index == len(axis) - 1
+            next_index = np.where(seam, 0, index + 1)
+            next_sample = np.where(seam, axis[0] + period, axis[next_index])
+        lower.append(index)
+        upper.append(next_index)
+        weights.append((point - axis[index]) / (next_sample - axis[index]))
+
+    # Gather the 2^d corners from the flattened grid
+    strides = np.cumprod((values.shape[1:] + (1,))[::-1])[::-1]
+    flat_values = values.reshape(-1)
+    result = np.zeros(points[0].size)
+    for corner in range(2 ** len(axes)):
+        uppers = [(corner >> dim) & 1 for dim in range(len(axes))]
+        if any(is_upper and len(axis) == 1 for is_upper, axis in zip(uppers, axes)):
+            continue
+        corner_weight = np.ones(len(result))
+        flat_index = 0
+        for is_upper, low, high, weight, stride in zip(uppers, lower, upper, weights, strides):
+            corner_weight *= weight if is_upper else 1 - weight
+            flat_index = flat_index + (high if is_upper else low) * stride
+        result += corner_weight * np.take(flat_values, flat_index)
+    return result.reshape(shape)
+
+
+def _read_diagram(
+    diagram, is_brdf: bool, incident_angle: float, anisotropy: float = 0, wavelength: float = 555
+) -> BxdfDatapoint:
+    """Read a bxdf diagram protobuf message into a data point."""
+    thetas = np.fromiter(diagram.theta_samples, dtype=np.float64, count=len(diagram.theta_samples))
+    phis = np.fromiter(diagram.phi_samples, dtype=np.float64, count=len(diagram.phi_samples))
+    bxdf = np.fromiter(
+        diagram.bsdf_cos_theta, dtype=np.float64, count=len(diagram.bsdf_cos_theta)
+    ).reshape((len(thetas), len(phis)))
+    return BxdfDatapoint._from_arrays(
+        is_brdf=is_brdf,
+        incident_angle=incident_angle,
+        theta_values=thetas,
+        phi_values=phis,
+        bxdf=bxdf,
+        tis=diagram.integral,
+        anisotropy=anisotropy,
+        wavelength=wavelength,
+    )
+
+
+def _varint(value: int) -> bytes:
+    """Encode a non negative integer as a protobuf varint."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _packed_doubles(diagram, field: str, values: np.ndarray) -> bytes:
+    """Encode values as the packed wire format of a repeated double field of a message."""
+    number = diagram.DESCRIPTOR.fields_by_name[field].number
+    data = np.ascontiguousarray(values, dtype="<f8").tobytes()
+    return _varint(number << 3 | 2) + _varint(len(data)) + data
+
+
+def _write_diagram(diagram, datapoint: BxdfDatapoint, with_tis: bool = True) -> None:
+    """Write a data point into a bxdf diagram protobuf message.
+
+    The samples are merged as packed buffers, which avoids converting each value to a Python float.
+    """
+    if with_tis:
+        diagram.integral = datapoint.tis
+    for field in ("phi_samples", "theta_samples", "bsdf_cos_theta"):
+        diagram.ClearField(field)
+    diagram.MergeFromString(
+        _packed_doubles(diagram, "phi_samples", datapoint._phi_values)
+        + _packed_doubles(diagram, "theta_samples", datapoint._theta_values)
+        + _packed_doubles(diagram, "bsdf_cos_theta", np.ravel(datapoint.bxdf))
+    )
+
+
+def _group_by_anisotropy(datapoints: Collection[BxdfDatapoint]) -> dict:
+    """Group data points by anisotropy angle, in order of appearance."""
+    groups = {}
+    for datapoint in datapoints:
+        groups.setdefault(datapoint.anisotropy, []).append(datapoint)
+    return groups
+
+
 def create_bsdf180(
     speos: ansys.speos.core.Speos,
     bsdf180_file_path: Union[str, Path],
@@ -1657,12 +2082,19 @@ def create_spectral_brdf(
     spectral_bsdf_file_path: Union[str, Path],
     wavelength_list: List[float],
     anisotropic_bsdf_file_list: List[Union[Path, str]],
+    max_workers: Optional[int] = None,
+    local_parsing: bool = False,
 ) -> Path:
     """Create a brdf from multiple bsdf.
 
     This function allows to create BRDF from multiple bsdf files
     allowed files: *.anisotropicbsdf
 
+    By default, the files are read and assembled by the Speos server.
+    When ``max_workers`` is given or ``local_parsing`` is True, the files are read concurrently
+    on a pool of threads, assembled in memory and sent with a single import,
+    see ``ansys.speos.core.bsdf.SpectralBRDF``.
+
     Parameters
     ----------
     speos : ansys.speos.core.Speos
@@ -1673,20 +2105,23 @@ def create_spectral_brdf(
         List of wavelength
     anisotropic_bsdf_file_list :  List[Union[pathlib.Path, str]]
         List of bsdf file locations
+    max_workers : Optional[int]
+        Number of threads parsing the files locally, when assembling on client side.
+        By default, ``None``, which assembles on server side unless ``local_parsing`` is True.
+    local_parsing : bool
+        Parse the text anisotropicbsdf files locally instead of loading them with the Speos server.
+        Implies client side assembly. By default, ``False``.
 
     Returns
     -------
     pathlib.Path
         Location of created BRDF
     """
-    stub = bsdf_creation__v1__pb2_grpc.BsdfCreationServiceStub(speos.client.channel)
-    spectral_request = bsdf_creation__v1__pb2.SpectralBsdfInputData()
     spectral_bsdf_file_path = Path(spectral_bsdf_file_path)
     if spectral_bsdf_file_path.suffix != ".brdf":
         spectral_bsdf_file_path = spectral_bsdf_file_path.parent / (
             spectral_bsdf_file_path.name + ".brdf"
         )
-    spectral_request.output_file_name = str(spectral_bsdf_file_path)
     if len(wavelength_list) == len(anisotropic_bsdf_file_list):
         for bsdf_loc in anisotropic_bsdf_file_list:
             bsdf_loc = Path(bsdf_loc)
@@ -1694,6 +2129,26 @@ def create_spectral_brdf(
                 raise TypeError("Filetype not support please use only anisotropicbsdf files.")
     else:
         raise RuntimeError("The Number BSDF file and wavelength needs to be identical")
+    if max_workers is not None or local_parsing:
+        inputs = _read_anisotropic_bsdf_files(
+            speos, anisotropic_bsdf_file_list, max_workers, local_parsing
+        )
+        spectral_brdf = SpectralBRDF(speos)
+        spectral_brdf.description = inputs[0].description
+        brdf = []
+        btdf = []
+        for wl, data in zip(wavelength_list, inputs):
+            brdf.extend(_read_isotropic_samples(data.reflection, True, wavelength=float(wl)))
+            btdf.extend(_read_isotropic_samples(data.transmission, False, wavelength=float(wl)))
+        if brdf:
+            spectral_brdf.brdf = brdf
+        if btdf:
+            spectral_brdf.btdf = btdf
+        return spectral_brdf.save(spectral_bsdf_file_path)
+
+    stub = bsdf_creation__v1__pb2_grpc.BsdfCreationServiceStub(speos.client.channel)
+    spectral_request = bsdf_creation__v1__pb2.SpectralBsdfInputData()
+    spectral_request.output_file_name = str(spectral_bsdf_file_path)
     for wl, file in zip(wavelength_list, anisotropic_bsdf_file_list):
         tmp = spectral_request.input_anisotropic_samples.add()
         tmp.wavelength = float(wl)
@@ -1708,9 +2163,17 @@ def create_anisotropic_bsdf(
     anisotropy_list: List[float],
     anisotropic_bsdf_file_list: List[Union[Path, str]],
     fix_disparity: bool = False,
+    max_workers: Optional[int] = None,
+    local_parsing: bool = False,
 ) -> Path:
     """Create an anisotropic bsdf from anisotropic bsdf files.
 
+    By default, the files are read and assembled by the Speos server.
+    When ``max_workers`` is given or ``local_parsing`` is True, the files are read, assembled in
+    memory and sent with a single import, see ``ansys.speos.core.bsdf.AnisotropicBSDF``.
+    Files parsed locally are read concurrently on a pool of threads. Files loaded by the Speos
+    server are read one after the other, as the server holds a single loaded anisotropic bsdf.
+
     Parameters
     ----------
     speos : ansys.speos.core.Speos
@@ -1722,8 +2185,14 @@ def create_anisotropic_bsdf(
     anisotropic_bsdf_file_list : List[Union[pathlib.Path, str]]
         list of bsdf file locations
     fix_disparity : bool
-        Fixes normalization disparity between BSDF,
+        Fixes normalization disparity between BSDF, only available with server side assembly.
         By default: ``False``
+    max_workers : Optional[int]
+        Number of threads parsing the files locally, when assembling on client side.
+        By default, ``None``, which assembles on server side unless ``local_parsing`` is True.
+    local_parsing : bool
+        Parse the text anisotropicbsdf files locally instead of loading them with the Speos server.
+        Implies client side assembly. By default, ``False``.
 
     Notes
     -----
@@ -1734,14 +2203,11 @@ def create_anisotropic_bsdf(
     pathlib.Path
         Location of created Anisotropic BSDF files
     """
-    stub = bsdf_creation__v1__pb2_grpc.BsdfCreationServiceStub(speos.client.channel)
-    ani_request = bsdf_creation__v1__pb2.AnisotropicBsdfInputData()
     anisotropic_bsdf_file_path = Path(anisotropic_bsdf_file_path)
     if anisotropic_bsdf_file_path.suffix != ".anisotropicbsdf":
         anisotropic_bsdf_file_path = anisotropic_bsdf_file_path.parent / (
             anisotropic_bsdf_file_path.name + ".anisotropicbsdf"
         )
-    ani_request.output_file_name = str(anisotropic_bsdf_file_path)
     if len(anisotropy_list) == len(anisotropic_bsdf_file_list):
         for bsdf_loc in anisotropic_bsdf_file_list:
             bsdf_loc = Path(bsdf_loc)
@@ -1749,6 +2215,44 @@ def create_anisotropic_bsdf(
                 raise TypeError("Filetype not support please use only anisotropicbsdf files.")
     else:
         raise RuntimeError("The Number BSDF file and wavelength needs to be identical")
+    if max_workers is not None or local_parsing:
+        if fix_disparity:
+            raise ValueError("fix_disparity is only available with server side assembly")
+        if any(not 0 <= ani <= 2 * np.pi for ani in anisotropy_list):
+            raise ValueError("Anisotropy angle needs to be between [0, 2*pi]")
+        inputs = _read_anisotropic_bsdf_files(
+            speos, anisotropic_bsdf_file_list, max_workers, local_parsing
+        )
+        ani_bsdf = AnisotropicBSDF(speos)
+        ani_bsdf.description = inputs[0].description
+        ani_bsdf.anisotropy_vector = [
+            inputs[0].anisotropy_vector.x,
+            inputs[0].anisotropy_vector.y,
+            inputs[0].anisotropy_vector.z,
+        ]
+        brdf = []
+        btdf = []
+        for ani, data in zip(anisotropy_list, inputs):
+            brdf.extend(_read_isotropic_samples(data.reflection, True, anisotropy=ani))
+            btdf.extend(_read_isotropic_samples(data.transmission, False, anisotropy=ani))
+        if brdf:
+            ani_bsdf.brdf = brdf
+        if btdf:
+            ani_bsdf.btdf = btdf
+        ani_bsdf._reflection_spectrum, ani_bsdf._transmission_spectrum = _spectra(inputs[0])
+        ani_bsdf._spectrum_incidence = [
+            inputs[0].reflection.spectrum_incidence,
+            inputs[0].transmission.spectrum_incidence,
+        ]
+        ani_bsdf._spectrum_anisotropy = [
+            inputs[0].reflection.spectrum_anisotropy,
+            inputs[0].transmission.spectrum_anisotropy,
+        ]
+        return ani_bsdf.save(anisotropic_bsdf_file_path)
+
+    stub = bsdf_creation__v1__pb2_grpc.BsdfCreationServiceStub(speos.client.channel)
+    ani_request = bsdf_creation__v1__pb2.AnisotropicBsdfInputData()
+    ani_request.output_file_name = str(anisotropic_bsdf_file_path)
     for ani, file in zip(anisotropy_list, anisotropic_bsdf_file_list):
         temp = ani_request.input_anisotropic_bsdf_samples.add()
         temp.anisotropic_angle = ani
@@ -1757,3 +2261,144 @@ def create_anisotropic_bsdf(
     ani_request.output_file_name = str(anisotropic_bsdf_file_path)
     stub.BuildAnisotropicBsdf(ani_request)
     return anisotropic_bsdf_file_path
+
+
+def _spectra(data) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the reflection and transmission spectra of anisotropic bsdf data, as 2xN arrays."""
+    return tuple(
+        np.array(
+            [[value.wavelength, value.coefficient] for value in side.spectrum], dtype=np.float64
+        )
+        .reshape((-1, 2))
+        .T
+        for side in (data.reflection, data.transmission)
+    )
+
+
+def _read_isotropic_samples(
+    side, is_brdf: bool, anisotropy: float = 0, wavelength: float = 555
+) -> List[BxdfDatapoint]:
+    """Read the data points of an isotropic anisotropic bsdf reflection or transmission.
+
+    An isotropic bsdf has a single anisotropy sample, or the same one at 0 and 2*pi.
+    """
+    if len(side.anisotropic_samples) == 0:
+        return []
+    angles = np.mod([ani.anisotropic_sample for ani in side.anisotropic_samples], 2 * np.pi)
+    if not np.allclose(angles, angles[0]):
+        raise ValueError("The bsdf files to assemble need to be isotropic")
+    return [
+        _read_diagram(
+            diagram=incidence_sample,
+            is_brdf=is_brdf,
+            incident_angle=incidence_sample.incidence_sample,
+            anisotropy=anisotropy,
+            wavelength=wavelength,
+        )
+        for incidence_sample in side.anisotropic_samples[0].incidence_samples
+    ]
+
+
+def _read_anisotropic_bsdf_files(
+    speos: Speos,
+    file_list: List[Union[Path, str]],
+    max_workers: Optional[int],
+    local_parsing: bool,
+) -> list:
+    """Read anisotropic bsdf files, each distinct file is read once.
+
+    Files parsed locally are read concurrently on a pool of ``max_workers`` threads. Files loaded
+    by the Speos server are read one after the other: the server holds a single loaded anisotropic
+    bsdf, so each load and export pair is serialized with the other bsdf calls to that server.
+    """
+    files = list(dict.fromkeys(str(Path(file)) for file in file_list))
+    if local_parsing:
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers or len(files), len(files)))
+        ) as pool:
+            data = dict(zip(files, pool.map(_parse_anisotropic_bsdf_file, files)))
+    else:
+        stub = anisotropic_bsdf__v1__pb2_grpc.AnisotropicBsdfServiceStub(speos.client.channel)
+        data = {}
+        with _bsdf_lock(speos.client.channel, anisotropic_bsdf__v1__pb2):
+            for file in files:
+                stub.Load(anisotropic_bsdf__v1__pb2.FileName(file_name=file))
+                data[file] = stub.Export(Empty())
+    return [data[str(Path(file))] for file in file_list]
+
+
+def _parse_anisotropic_bsdf_file(file_path: Union[Path, str]):
+    """Parse a text anisotropicbsdf file into anisotropic bsdf data, without Speos server.
+
+    Angles are converted from degree to radian. The file does not store the total integrated
+    scattering of the diagrams, it is computed with ``PackedBxdf.integrate`` quadrature.
+    """
+    lines = iter(Path(file_path).read_text(encoding="latin-1").splitlines())
+
+    def floats() -> np.ndarray:
+        return np.array(next(lines).split(), dtype=float)
+
+    if not next(lines).startswith("OPTIS - Anisotropic BSDF surface file"):
+        raise ValueError("{} is not an anisotropic bsdf file".format(file_path))
+    if next(lines).strip() != "0":
+        raise ValueError("Only text anisotropic bsdf files can be parsed locally")
+    data = anisotropic_bsdf__v1__pb2.AnisotropicBsdfData()
+    data.description = next(lines)
+    # measurement description: number of characters, then the text
+    nb_chars = int(next(lines))
+    read_chars = len(next(lines))
+    while read_chars < nb_chars:
+        read_chars += len(next(lines)) + 1
+    data.anisotropy_vector.x, data.anisotropy_vector.y, data.anisotropy_vector.z = floats()
+    has_reflection, has_transmission = floats().astype(bool)
+    next(lines)  # data type
+    sides = [
+        side
+        for side, present in (
+            (data.reflection, has_reflection),
+            (data.transmission, has_transmission),
+        )
+        if present
+    ]
+
+    # anisotropy angles, then incidence angles of each anisotropy angle
+    angles = []
+    for _ in sides:
+        nb_anisotropy = int(next(lines))
+        anisotropies = floats()[:nb_anisotropy]
+        side_angles = []
+        for ani in anisotropies:
+            nb_incidence = int(next(lines))
+            side_angles.append((ani, floats()[:nb_incidence]))
+        angles.append(side_angles)
+
+    for side in sides:
+        side.spectrum_incidence, side.spectrum_anisotropy = np.radians(floats())
+        next(lines)  # spectrum description
+        for _ in range(int(next(lines))):
+            pair = side.spectrum.add()
+            pair.wavelength, pair.coefficient = floats()
+
+    for side, side_angles in zip(sides, angles):
+        for ani, incidences in side_angles:
+            ani_sample = side.anisotropic_samples.add()
+            ani_sample.anisotropic_sample = np.radians(ani)
+            for incidence in incidences:
+                nb_theta, nb_phi = (int(value) for value in next(lines).split())
+                phis = np.radians(floats())
+                table = np.array(
+                    " ".join(next(lines) for _ in range(nb_theta)).split(), dtype=float
+                ).reshape((nb_theta, nb_phi + 1))
+                thetas = np.radians(table[:, 0])
+                values = table[:, 1:]
+                incidence_sample = ani_sample.incidence_samples.add()
+                incidence_sample.incidence_sample = np.radians(incidence)
+                incidence_sample.theta_samples[:] = thetas.tolist()
+                incidence_sample.phi_samples[:] = phis.tolist()
+                incidence_sample.bsdf_cos_theta[:] = values.ravel().tolist()
+                incidence_sample.integral = (
+                    _trapezoid_weights(thetas) * np.abs(np.sin(thetas)) @ values
+                ) @ _trapezoid_weights(phis)
+    if next(lines, "End of file").strip() != "End of file":
+        raise ValueError("Unexpected data after the bsdf tables of {}".format(file_path))
+    return data
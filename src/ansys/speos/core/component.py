@@ -28,7 +28,7 @@ from difflib import SequenceMatcher
 import os
 from pathlib import Path
 import tempfile
-from typing import List, Mapping, Optional, Tuple, Union
+from typing import TYPE_CHECKING, List, Mapping, Optional, Tuple, Union
 import uuid
 
 import numpy as np
@@ -44,10 +44,13 @@ from ansys.speos.core.generic.parameters import (
     RayFileSourceParameters,
     SurfaceSourceParameters,
 )
-from ansys.speos.core.generic.visualization_methods import _VisualArrow, _VisualData, local2absolute
+from ansys.speos.core.generic.visualization_methods import (
+    _fingerprint,
+    _VisualData,
+    transform_points,
+)
 from ansys.speos.core.ground_plane import GroundPlane
-from ansys.speos.core.kernel import ProtoScene
-import ansys.speos.core.project as project
+from ansys.speos.core.kernel import BodyLink, FaceLink, ProtoScene
 import ansys.speos.core.proto_message_utils as proto_message_utils
 from ansys.speos.core.source import (
     SourceDisplay,
@@ -56,6 +59,10 @@ from ansys.speos.core.source import (
     SourceSurface,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ansys.speos.core.kernel import SpeosClient
+    import ansys.speos.core.project as project
+
 
 class LightBoxFileInstance:
     """Represent a LightBox file containing geometries and sources.
@@ -90,6 +97,57 @@ class LightBoxFileInstance:
         self.axis_system = ORIGIN if axis_system is None else axis_system
 
 
+def _read_body_meshes(
+    speos_client: SpeosClient, body_guids: List[str]
+) -> Tuple[np.ndarray, List[Tuple[slice, np.ndarray]]]:
+    """Read the meshes of bodies as arrays, with a single request for all face buffers.
+
+    Parameters
+    ----------
+    speos_client : ansys.speos.core.kernel.client.SpeosClient
+        The Speos instance client.
+    body_guids : List[str]
+        Guids of the bodies to read.
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, List[Tuple[slice, numpy.ndarray]]]
+        Vertices of all bodies, with shape ``(n, 3)``, and for each body the slice of its own
+        vertices along with its facets in pyvista format ``[3, i, j, k]`` (indices relative to
+        the body slice).
+    """
+    bodies_data = [
+        b_link.get() for b_link in speos_client.get_items(keys=body_guids, item_type=BodyLink)
+    ]
+    f_links = speos_client.get_items(
+        keys=[guid for b_data in bodies_data for guid in b_data.face_guids], item_type=FaceLink
+    )
+    face_db = speos_client.faces()
+    if face_db._is_batch_available and len(f_links) != 0:
+        faces_data = face_db.read_batch(refs=f_links)
+    else:
+        faces_data = [f_link.get() for f_link in f_links]
+
+    vertices = []
+    body_meshes = []
+    faces_iter = iter(faces_data)
+    nb_vertices = 0
+    for b_data in bodies_data:
+        body_start = nb_vertices
+        facets = []
+        for f_data in (next(faces_iter) for _ in b_data.face_guids):
+            f_vertices = np.fromiter(f_data.vertices, dtype=np.float64, count=len(f_data.vertices))
+            f_facets = np.fromiter(f_data.facets, dtype=np.int64, count=len(f_data.facets))
+            vertices.append(f_vertices.reshape(-1, 3))
+            facets.append(f_facets.reshape(-1, 3) + (nb_vertices - body_start))
+            nb_vertices += vertices[-1].shape[0]
+        facets = np.concatenate(facets) if facets else np.empty((0, 3), dtype=np.int64)
+        facets = np.hstack((np.full((facets.shape[0], 1), 3, dtype=np.int64), facets))
+        body_meshes.append((slice(body_start, nb_vertices), facets))
+    vertices = np.concatenate(vertices) if vertices else np.empty((0, 3))
+    return vertices, body_meshes
+
+
 class LightBox:
     """Represent the Speos LightBox component feature.
 
@@ -117,12 +175,14 @@ ansys.speos.core.kernel.scene.ProtoScene.SceneInstance, optional
         parent_project: project.Project,
         instance: Optional[Union[LightBoxFileInstance, ProtoScene.SceneInstance]] = None,
     ):
+        import ansys.speos.core.project as project
+
         self._name = name
         self._unique_id = None
         self._parent_project = parent_project
         self._scene_instance = ProtoScene.SceneInstance(name=self._name)
         self._is_black = False
-        self._visual_data = [] if general_methods._GRAPHICS_AVAILABLE else None
+        self._visual_data = [] if general_methods._graphics_available() else None
 
         match instance:
             case None:
@@ -169,10 +229,13 @@ ansys.speos.core.kernel.scene.ProtoScene.SceneInstance, optional
             Visualization payload containing mesh and ray data in absolute coordinates.
 
         """
-        if len(self._visual_data) != 0 and all(data.updated is True for data in self._visual_data):
+        fingerprint = self._visual_fingerprint()
+        if len(self._visual_data) != 0 and all(
+            data.updated is True and data.fingerprint == fingerprint for data in self._visual_data
+        ):
             return self._visual_data
         else:
-            self._visual_data = [] if general_methods._GRAPHICS_AVAILABLE else None
+            self._visual_data = [] if general_methods._graphics_available() else None
 
             # Trajectory data.
             if self.trajectory_file_uri != "":
@@ -212,54 +275,70 @@ ansys.speos.core.kernel.scene.ProtoScene.SceneInstance, optional
                     self._visual_data[-1].add_data_polyline(points=trajectory_points)
                     self._visual_data[-1].updated = True
 
-            feature_pos_info = self.get(key="axis_system")
-            for visual_body in self.get(key="bodys"):
+            scene_instance = self._resolved_scene_instance()
+            axis_system = np.asarray(scene_instance.axis_system, dtype=float)
+            scene_link = self._parent_project.client[scene_instance.scene_guid]
+            scene_data = scene_link.get() if scene_link is not None else ProtoScene()
+
+            body_meshes = []
+            if scene_data.part_guid != "":
+                part_data = self._parent_project.client[scene_data.part_guid].get()
+                vertices, body_meshes = _read_body_meshes(
+                    speos_client=self._parent_project.client, body_guids=part_data.body_guids
+                )
+                transform_points(vertices, axis_system, out=vertices)
+            for vertex_range, facets in body_meshes:
                 self._visual_data.append(_VisualData())
-                for visual_face in visual_body["faces"]:
-                    vertices = np.array(visual_face["vertices"]).reshape(-1, 3)
-                    vertices = np.array(
-                        [local2absolute(vertice, feature_pos_info) for vertice in vertices]
-                    )
-                    facets = np.array(visual_face["facets"]).reshape(-1, 3)
-                    temp = np.full(facets.shape[0], 3)
-                    temp = np.vstack(temp)
-                    facets = np.hstack((temp, facets))
+                if len(facets) != 0:
                     self._visual_data[-1].add_data_mesh(
-                        vertices=vertices,
-                        facets=facets,
+                        vertices=vertices[vertex_range], facets=facets
                     )
-                self._visual_data[-1].coordinates.origin = np.array(feature_pos_info[:3])
-                self._visual_data[-1].coordinates.x_axis = np.array(feature_pos_info[3:6])
-                self._visual_data[-1].coordinates.y_axis = np.array(feature_pos_info[6:9])
-                self._visual_data[-1].coordinates.z_axis = np.array(feature_pos_info[9:12])
-                self._visual_data[-1].updated = True
-
-            for visual_source in self.get(key="sources"):
-                source_name = visual_source["name"]
-                self._visual_data.append(_VisualData(ray=True))
+                self._set_coordinates(self._visual_data[-1], axis_system)
 
-                for ray_path in self._parent_project.client[
-                    self.get(key="scene_guid")
-                ].get_source_ray_paths(
-                    source_path=source_name, rays_nb=100, raw_data=True, display_data=True
-                ):
-                    self._visual_data[-1].add_data_line(
-                        _VisualArrow(
-                            line_vertices=[
-                                local2absolute(ray_path.impacts_coordinates, feature_pos_info),
-                                ray_path.last_direction,
-                            ],
-                            color=tuple(ray_path.colors.values),
-                            arrow=False,
-                        )
-                    )
-                self._visual_data[-1].coordinates.origin = np.array(feature_pos_info[:3])
-                self._visual_data[-1].coordinates.x_axis = np.array(feature_pos_info[3:6])
-                self._visual_data[-1].coordinates.y_axis = np.array(feature_pos_info[6:9])
-                self._visual_data[-1].coordinates.z_axis = np.array(feature_pos_info[9:12])
-                self._visual_data[-1].updated = True
+            for visual_source in scene_data.sources:
+                self._visual_data.append(_VisualData(ray=True))
+                ray_paths = scene_link.get_source_ray_path_arrays(
+                    source_path=visual_source.name, rays_nb=100, raw_data=True, display_data=True
+                )
+                impacts = ray_paths.impacts
+                transform_points(impacts, axis_system, out=impacts)
+                self._visual_data[-1].add_data_rays(ray_paths)
+                self._set_coordinates(self._visual_data[-1], axis_system)
+            for data in self._visual_data:
+                data.fingerprint = fingerprint
             return self._visual_data
 
+    def _visual_fingerprint(self) -> str:
+        """Fingerprint of the LightBox placement, the visual data being also cleared on commit."""
+        return _fingerprint(self.trajectory_file_uri, self._resolved_scene_instance())
+
+    @staticmethod
+    def _set_coordinates(visual_data: _VisualData, axis_system: np.ndarray) -> None:
+        """Place the coordinate system of a visual data item on the LightBox axis system."""
+        visual_data.coordinates.origin = axis_system[:3]
+        visual_data.coordinates.x_axis = axis_system[3:6]
+        visual_data.coordinates.y_axis = axis_system[6:9]
+        visual_data.coordinates.z_axis = axis_system[9:12]
+        visual_data.updated = True
+
+    def _resolved_scene_instance(self) -> ProtoScene.SceneInstance:
+        """Get the scene instance as stored in the parent scene, or the local one if not committed.
+
+        Returns
+        -------
+        ansys.speos.core.kernel.scene.ProtoScene.SceneInstance
+            Scene instance describing the LightBox.
+        """
+        if self._parent_project.scene_link and self._unique_id is not None:
+            parent_scene_data = self._parent_project.scene_link.get()
+            scene_inst = next(
+                (x for x in parent_scene_data.scenes if x.metadata["UniqueId"] == self._unique_id),
+                None,
+            )
+            if scene_inst is not None:
+                return scene_inst
+        return self._scene_instance
+
     @property
     def source_paths(self) -> List[str]:
         """Get source paths for sources included in the LightBox.
@@ -552,7 +631,7 @@ ansys.speos.core.kernel.scene.ProtoScene.SceneInstance, optional
         ansys.speos.core.component.LightBox
             Updated LightBox feature.
         """
-        if general_methods._GRAPHICS_AVAILABLE:
+        if general_methods._graphics_available():
             for item in self._visual_data:
                 item.updated = False
 
@@ -632,28 +711,10 @@ ansys.speos.core.kernel.scene.ProtoScene.SceneInstance, optional
         dict
             Flattened dictionary with resolved GUID references and properties.
         """
-        out_dict = {}
-
         # SceneInstance (= scene guid + scene properties)
-        if self._parent_project.scene_link and self._unique_id is not None:
-            parent_scene_data = self._parent_project.scene_link.get()
-            scene_inst = next(
-                (x for x in parent_scene_data.scenes if x.metadata["UniqueId"] == self._unique_id),
-                None,
-            )
-            if scene_inst is not None:
-                out_dict = proto_message_utils._replace_guids(
-                    speos_client=self._parent_project.client, message=scene_inst
-                )
-            else:
-                out_dict = proto_message_utils._replace_guids(
-                    speos_client=self._parent_project.client,
-                    message=self._scene_instance,
-                )
-        else:
-            out_dict = proto_message_utils._replace_guids(
-                speos_client=self._parent_project.client, message=self._scene_instance
-            )
+        out_dict = proto_message_utils._replace_guids(
+            speos_client=self._parent_project.client, message=self._resolved_scene_instance()
+        )
         proto_message_utils._replace_properties(json_dict=out_dict)
 
         return out_dict
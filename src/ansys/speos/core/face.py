@@ -24,10 +24,13 @@
 
 from __future__ import annotations
 
-from typing import List, Mapping, Optional, Union
+from typing import List, Mapping, Optional, Tuple, Union
+
+import numpy as np
 
 from ansys.speos.core import proto_message_utils
 import ansys.speos.core.body as body
+from ansys.speos.core.generic import mesh_methods
 from ansys.speos.core.generic.parameters import MeshData
 from ansys.speos.core.geo_ref import GeoRef
 from ansys.speos.core.kernel.client import SpeosClient
@@ -72,6 +75,8 @@ class Face:
         self._name = name
         self.face_link = None
         """Link object for the face in database."""
+        # Incremented each time the face mesh is edited, saved or reset, to refresh derived data
+        self._revision = 0
         if metadata is None:
             metadata = {}
 
@@ -122,6 +127,7 @@ class Face:
             if not isinstance(v, (int, float)):
                 raise TypeError("vertices elements must be int or float.")
         self._face.vertices[:] = list(values)
+        self._revision += 1
 
     @property
     def facets(self) -> List[int]:
@@ -163,6 +169,7 @@ class Face:
                 if max_idx >= num_vertices or min(values) < 0:
                     raise ValueError("facets contain index out of range relative to vertices.")
         self._face.facets[:] = list(values)
+        self._revision += 1
 
     @property
     def normals(self) -> List[float]:
@@ -237,6 +244,45 @@ class Face:
             [ProtoFace.MeshData(name=i.name, data=i.data) for i in value]
         )
 
+    def _mesh_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get vertices, facets and normals of the local data as arrays of shape ``(-1, 3)``."""
+        face_data = self._face
+        vertices = np.fromiter(face_data.vertices, dtype=np.float64, count=len(face_data.vertices))
+        facets = np.fromiter(face_data.facets, dtype=np.int64, count=len(face_data.facets))
+        normals = np.fromiter(face_data.normals, dtype=np.float64, count=len(face_data.normals))
+        return vertices.reshape(-1, 3), facets.reshape(-1, 3), normals.reshape(-1, 3)
+
+    def compute_normals(self) -> Face:
+        """Set the face normals from its triangles.
+
+        The normal at a vertex is the average of the normals of the triangles using it, weighted
+        by their areas.
+
+        Returns
+        -------
+        ansys.speos.core.face.Face
+            Face feature.
+        """
+        vertices, facets, _ = self._mesh_arrays()
+        self._face.normals[:] = mesh_methods.vertex_normals(vertices, facets).ravel().tolist()
+        return self
+
+    def check_mesh(self, tolerance: float = 0.0) -> mesh_methods.MeshReport:
+        """Check the local face mesh, for instance before committing it.
+
+        Parameters
+        ----------
+        tolerance : float
+            Largest area of a triangle considered as degenerate.
+            By default, ``0.0``.
+
+        Returns
+        -------
+        ansys.speos.core.generic.mesh_methods.MeshReport
+            Bounds, area, degenerate and duplicate triangles, open edges and missing normals.
+        """
+        return mesh_methods.check_mesh(*self._mesh_arrays(), tolerance=tolerance)
+
     def _to_dict(self) -> dict:
         out_dict = ""
 
@@ -272,8 +318,10 @@ class Face:
         # Save or Update the face (depending on if it was already saved before)
         if self.face_link is None:
             self.face_link = self._speos_client.faces().create(message=self._face)
+            self._revision += 1
         elif self.face_link.get() != self._face:
             self.face_link.set(data=self._face)  # Only Update if data has changed
+            self._revision += 1
 
         # Update the parent body
         if self._parent_body is not None:
@@ -295,6 +343,7 @@ class Face:
         # Reset face
         if self.face_link is not None:
             self._face = self.face_link.get()
+            self._revision += 1
 
         return self
 
@@ -324,3 +373,46 @@ class Face:
                 self._parent_body._geom_features.remove(self)
 
         return self
+
+
+def _save_faces(speos_client: SpeosClient, faces: List[Face]) -> None:
+    """Save faces in database with batch requests when the server supports them.
+
+    New faces are created, and already saved faces are updated only if their data has changed.
+    Parent bodies are not updated.
+
+    Parameters
+    ----------
+    speos_client : ansys.speos.core.kernel.client.SpeosClient
+        The Speos instance client.
+    faces : List[ansys.speos.core.face.Face]
+        Face features to save.
+    """
+    face_db = speos_client.faces()
+    saved = [f for f in faces if f.face_link is not None]
+    if saved:
+        if face_db._is_batch_available:
+            db_data = face_db.read_batch(refs=[f.face_link for f in saved])
+        else:
+            db_data = [f.face_link.get() for f in saved]
+        # Only update if data has changed
+        changed = [f for f, data in zip(saved, db_data) if data != f._face]
+        if changed and face_db._is_batch_available:
+            face_db.update_batch(
+                refs=[f.face_link for f in changed], data=[f._face for f in changed]
+            )
+        else:
+            for f in changed:
+                f.face_link.set(data=f._face)
+        for f in changed:
+            f._revision += 1
+
+    new = [f for f in faces if f.face_link is None]
+    if new:
+        if face_db._is_batch_available:
+            links = face_db.create_batch(message_list=[f._face for f in new])
+        else:
+            links = [face_db.create(message=f._face) for f in new]
+        for f, link in zip(new, links):
+            f.face_link = link
+            f._revision += 1
@@ -51,7 +51,7 @@ class FileTransfer:
     ) -> None:
         self._speos_client = speos_client
         self._file_transfer_service_stub = file_transfer__v1__pb2_grpc.FileTransferServiceStub(
-            channel=speos_client.channel
+            channel=speos_client.bulk_channel()
         )
         self._is_gte_26r1 = server_version_checker.is_version_supported(2026, 1, 0)
 
@@ -29,6 +29,7 @@ from __future__ import annotations
 
 from collections.abc import Collection
 from functools import lru_cache, wraps
+import importlib.util
 import os
 from pathlib import Path
 from typing import List, Optional, Tuple, Union, cast
@@ -85,6 +86,20 @@ def deprecate_kwargs(old_arguments: dict, removed_version="0.3.0"):
     return decorator
 
 
+def _graphics_available() -> bool:
+    """Tell if the graphics dependencies are installed, without importing them."""
+    global _GRAPHICS_AVAILABLE
+    if _GRAPHICS_AVAILABLE is None:
+        try:
+            _GRAPHICS_AVAILABLE = all(
+                importlib.util.find_spec(name) is not None
+                for name in ("ansys.tools.visualization_interface", "pyvista")
+            )
+        except ImportError:  # pragma: no cover
+            _GRAPHICS_AVAILABLE = False
+    return _GRAPHICS_AVAILABLE
+
+
 @lru_cache
 def run_if_graphics_required(warning=False):
     """Check if graphics are available."""
@@ -125,47 +140,53 @@ def graphics_required(method):
     return wrapper
 
 
-def magnitude_vector(vector: Collection[float]) -> float:
+def magnitude_vector(vector: Union[Collection[float], np.ndarray]) -> Union[float, np.ndarray]:
     """Compute the magnitude (length) of a 2D or 3D vector using NumPy.
 
     Parameters
     ----------
-    vector: List[float]
-        A 2D or 3D vector as a list [x, y] or [x, y, z].
+    vector: Union[List[float], numpy.ndarray]
+        A 2D or 3D vector as a list [x, y] or [x, y, z], or an array of N vectors of shape
+        ``(N, 2)`` or ``(N, 3)``.
 
     Returns
     -------
-    float
-        The magnitude (length) of the vector.
+    Union[float, numpy.ndarray]
+        The magnitude (length) of the vector, or an array of the N magnitudes.
     """
-    vector_np = np.array(vector, dtype=float)
+    vector_np = np.asarray(vector, dtype=float)
+    if vector_np.ndim == 2:
+        if vector_np.shape[1] not in (2, 3):
+            raise ValueError("Input vectors must be either 2D or 3D")
+        return np.sqrt(np.einsum("ij,ij->i", vector_np, vector_np))
     if vector_np.size not in (2, 3):
         raise ValueError("Input vector must be either 2D or 3D")
     return float(np.linalg.norm(vector_np))
 
 
-def normalize_vector(vector: Collection[float]) -> List[float]:
+def normalize_vector(
+    vector: Union[Collection[float], np.ndarray],
+) -> Union[List[float], np.ndarray]:
     """
     Normalize a 2D or 3D vector to have a length of 1 using NumPy.
 
     Parameters
     ----------
-    vector: List[float]
-        A vector as a list [x, y] for 2D or [x, y, z] for 3D.
+    vector: Union[List[float], numpy.ndarray]
+        A vector as a list [x, y] for 2D or [x, y, z] for 3D, or an array of N vectors of shape
+        ``(N, 2)`` or ``(N, 3)``.
 
     Returns
     -------
-    List[float]
-        The normalized vector.
+    Union[List[float], numpy.ndarray]
+        The normalized vector, or an array of the N normalized vectors.
     """
-    vector_np = np.array(vector, dtype=float)
-    if vector_np.size not in (2, 3):
-        raise ValueError("Input vector must be either 2D or 3D")
-
+    vector_np = np.asarray(vector, dtype=float)
     magnitude = magnitude_vector(vector_np)
-    if magnitude == 0:
+    if np.any(magnitude == 0):
         raise ValueError("Cannot normalize the zero vector")
-
+    if vector_np.ndim == 2:
+        return vector_np / magnitude[:, None]
     return cast(List[float], (vector_np / magnitude).tolist())
 
 
@@ -258,26 +279,99 @@ def retrieve_speos_install_dir(
     return path
 
 
-def wavelength_to_rgb(wavelength: float, gamma: float = 0.8) -> Tuple[int, int, int, int]:
+WAVELENGTH_RGB_RESOLUTION = 0.1
+"""Resolution in nm of the lookup table used by :func:`wavelength_to_rgb` on arrays."""
+
+_WAVELENGTH_RGB_RANGE = (380.0, 750.0)
+
+
+def _wavelength_to_rgb_array(wavelengths: np.ndarray, gamma: float) -> np.ndarray:
+    """Convert wavelengths to RGBA colors, with the formulas of :func:`wavelength_to_rgb`."""
+    wl = np.asarray(wavelengths, dtype=float)
+    conditions = [
+        (380 <= wl) & (wl <= 440),
+        (440 <= wl) & (wl <= 490),
+        (490 <= wl) & (wl <= 510),
+        (510 <= wl) & (wl <= 580),
+        (580 <= wl) & (wl <= 645),
+        (645 <= wl) & (wl <= 750),
+    ]
+    attenuation_blue = 0.3 + 0.7 * (wl - 380) / (440 - 380)
+    attenuation_red = 0.3 + 0.7 * (750 - wl) / (750 - 645)
+
+    def power(value):
+        return np.clip(value, 0.0, None) ** gamma
+
+    r = np.select(
+        conditions,
+        [
+            power(-(wl - 440) / (440 - 380) * attenuation_blue),
+            0.0,
+            0.0,
+            power((wl - 510) / (580 - 510)),
+            1.0,
+            power(attenuation_red),
+        ],
+    )
+    g = np.select(
+        conditions,
+        [0.0, power((wl - 440) / (490 - 440)), 1.0, 1.0, power(-(wl - 645) / (645 - 580)), 0.0],
+    )
+    b = np.select(
+        conditions,
+        [power(attenuation_blue), 1.0, power(-(wl - 510) / (510 - 490)), 0.0, 0.0, 0.0],
+    )
+    rgba = np.full(wl.shape + (4,), 255, dtype=np.uint8)
+    for channel, value in enumerate((r, g, b)):
+        rgba[..., channel] = value * 255
+    return rgba
+
+
+@lru_cache
+def _wavelength_to_rgb_table(gamma: float) -> np.ndarray:
+    """Precompute the RGBA colors of the visible range, every 0.1 nm."""
+    start, stop = _WAVELENGTH_RGB_RANGE
+    nb_values = int(round((stop - start) / WAVELENGTH_RGB_RESOLUTION)) + 1
+    table = _wavelength_to_rgb_array(np.linspace(start, stop, nb_values), gamma)
+    table.flags.writeable = False
+    return table
+
+
+def wavelength_to_rgb(
+    wavelength: Union[float, Collection[float], np.ndarray], gamma: float = 0.8
+) -> Union[Tuple[int, int, int, int], np.ndarray]:
     """Convert a given wavelength of light to an approximate RGB color value.
 
     The wavelength must be given in nanometers in the range from 380 nm to 750 nm.
     Based on the code from http://www.physics.sfasu.edu/astro/color/spectra.html
 
+    Arrays of wavelengths are converted at once, through a lookup table with a resolution of
+    :data:`WAVELENGTH_RGB_RESOLUTION`.
+
     Parameters
     ----------
-    wavelength : float
-        Wavelength in nanometer between 380-750 nm
+    wavelength : Union[float, List[float], numpy.ndarray]
+        Wavelength in nanometer between 380-750 nm, or N wavelengths.
     gamma : float
         Gamma value.
         By default : ``0.8``
 
     Returns
     -------
-    Tuple[int, int, int, int]
+    Union[Tuple[int, int, int, int], numpy.ndarray]
         A tuple representing the RGBA color value, where each component is an integer in the range
-        0-255.
+        0-255. For N wavelengths, an array of shape ``(N, 4)`` and type ``uint8``.
     """
+    if np.ndim(wavelength) > 0:
+        wl = np.asarray(wavelength, dtype=float)
+        start, stop = _WAVELENGTH_RGB_RANGE
+        indices = np.rint((wl - start) / WAVELENGTH_RGB_RESOLUTION)
+        visible = (start <= wl) & (wl <= stop)
+        table = _wavelength_to_rgb_table(float(gamma))
+        rgba = table[np.where(visible, indices, 0).astype(np.intp)]
+        rgba[~visible, :3] = 0
+        return rgba
+
     wavelength = float(wavelength)
     if 380 <= wavelength <= 440:
         attenuation = 0.3 + 0.7 * (wavelength - 380) / (440 - 380)
@@ -0,0 +1,571 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides vectorized analysis of triangle meshes.
+
+Meshes are given as ``vertices`` with shape ``(n, 3)`` and ``facets`` with shape ``(m, 3)``
+holding, for each triangle, the indices of its three vertices.
+"""
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+
+@dataclass
+class MeshReport:
+    """Result of a mesh check, see ``ansys.speos.core.face.Face.check_mesh``."""
+
+    nb_vertices: int
+    """Number of vertices."""
+    nb_triangles: int
+    """Number of triangles."""
+    bounds: np.ndarray
+    """Bounding box ``[[xmin, ymin, zmin], [xmax, ymax, zmax]]``."""
+    area: float
+    """Surface area."""
+    degenerate_triangles: np.ndarray
+    """Indices of the triangles with repeated vertices or without area."""
+    duplicate_triangles: np.ndarray
+    """Indices of the triangles using the same vertices as a previous one."""
+    nb_open_edges: int
+    """Number of edges belonging to a single triangle."""
+    nb_non_manifold_edges: int
+    """Number of edges shared by more than two triangles."""
+    missing_normals: bool
+    """Whether the mesh has no normal per vertex."""
+
+    @property
+    def closed(self) -> bool:
+        """Whether the mesh encloses a volume: every edge is shared by exactly two triangles."""
+        return (
+            self.nb_triangles != 0 and self.nb_open_edges == 0 and self.nb_non_manifold_edges == 0
+        )
+
+    @property
+    def valid(self) -> bool:
+        """Whether the mesh has normals and neither degenerate nor duplicate triangles."""
+        return (
+            not self.missing_normals
+            and len(self.degenerate_triangles) == 0
+            and len(self.duplicate_triangles) == 0
+        )
+
+
+def triangle_normals(
+    vertices: np.ndarray, facets: np.ndarray, normalize: bool = True
+) -> np.ndarray:
+    """Compute the normal of each triangle, following the order of its vertices.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Vertices with shape ``(n, 3)``.
+    facets : np.ndarray
+        Triangles with shape ``(m, 3)``.
+    normalize : bool
+        Whether to return unit normals. Otherwise, the length of each normal is twice the area of
+        its triangle.
+        By default, ``True``.
+
+    Returns
+    -------
+    np.ndarray
+        Normals with shape ``(m, 3)``, zero for triangles without area.
+    """
+    origins = vertices[facets[:, 0]]
+    edges_1 = vertices[facets[:, 1]] - origins
+    edges_2 = vertices[facets[:, 2]] - origins
+    normals = np.empty_like(edges_1)
+    for axis in range(3):
+        next_axis, last_axis = (axis + 1) % 3, (axis + 2) % 3
+        normals[:, axis] = (
+            edges_1[:, next_axis] * edges_2[:, last_axis]
+            - edges_1[:, last_axis] * edges_2[:, next_axis]
+        )
+    if normalize:
+        lengths = _lengths(normals)[:, np.newaxis]
+        np.divide(normals, lengths, out=normals, where=lengths != 0)
+    return normals
+
+
+def _lengths(vectors: np.ndarray) -> np.ndarray:
+    """Compute the length of each row vector."""
+    return np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
+
+
+def vertex_normals(vertices: np.ndarray, facets: np.ndarray) -> np.ndarray:
+    """Compute unit normals at vertices, averaging the normals of the triangles around them.
+
+    The triangle normals are weighted by the triangle areas.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Vertices with shape ``(n, 3)``.
+    facets : np.ndarray
+        Triangles with shape ``(m, 3)``.
+
+    Returns
+    -------
+    np.ndarray
+        Normals with shape ``(n, 3)``, zero for vertices used by no triangle with area.
+    """
+    weighted = np.ascontiguousarray(triangle_normals(vertices, facets, normalize=False).T)
+    corners = np.ascontiguousarray(facets.T)
+    normals = np.zeros((len(vertices), 3))
+    for axis in range(3):
+        for corner in corners:
+            normals[:, axis] += np.bincount(corner, weights=weighted[axis], minlength=len(vertices))
+    lengths = _lengths(normals)[:, np.newaxis]
+    np.divide(normals, lengths, out=normals, where=lengths != 0)
+    return normals
+
+
+def bounding_box(vertices: np.ndarray) -> np.ndarray:
+    """Compute the axis aligned bounding box of vertices.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Vertices with shape ``(n, 3)``, ``n`` greater than zero.
+
+    Returns
+    -------
+    np.ndarray
+        ``[[xmin, ymin, zmin], [xmax, ymax, zmax]]``.
+    """
+    return np.stack((vertices.min(axis=0), vertices.max(axis=0)))
+
+
+def surface_area(vertices: np.ndarray, facets: np.ndarray) -> float:
+    """Compute the total area of triangles.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Vertices with shape ``(n, 3)``.
+    facets : np.ndarray
+        Triangles with shape ``(m, 3)``.
+
+    Returns
+    -------
+    float
+        Sum of the triangle areas.
+    """
+    return float(_lengths(triangle_normals(vertices, facets, normalize=False)).sum() / 2.0)
+
+
+def degenerate_triangles(
+    vertices: np.ndarray, facets: np.ndarray, tolerance: float = 0.0
+) -> np.ndarray:
+    """Find triangles using a vertex twice, or whose area is not above a tolerance.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Vertices with shape ``(n, 3)``.
+    facets : np.ndarray
+        Triangles with shape ``(m, 3)``.
+    tolerance : float
+        Largest area of a degenerate triangle.
+        By default, ``0.0``.
+
+    Returns
+    -------
+    np.ndarray
+        Indices of the degenerate triangles.
+    """
+    areas = _lengths(triangle_normals(vertices, facets, normalize=False)) / 2.0
+    return _degenerate(facets, areas, tolerance)
+
+
+def _degenerate(facets: np.ndarray, areas: np.ndarray, tolerance: float) -> np.ndarray:
+    """Find degenerate triangles from their areas."""
+    repeated = (
+        (facets[:, 0] == facets[:, 1])
+        | (facets[:, 1] == facets[:, 2])
+        | (facets[:, 0] == facets[:, 2])
+    )
+    return np.flatnonzero(repeated | (areas <= tolerance))
+
+
+def _repeated(keys: np.ndarray) -> np.ndarray:
+    """Find the indices of the keys appearing more than once."""
+    sorted_keys = np.sort(keys)
+    repeated_keys = sorted_keys[1:][sorted_keys[1:] == sorted_keys[:-1]]
+    if len(repeated_keys) == 0:
+        return np.empty(0, dtype=np.int64)
+    return np.flatnonzero(np.isin(keys, repeated_keys))
+
+
+def duplicate_triangles(facets: np.ndarray) -> np.ndarray:
+    """Find triangles using the same three vertices as a previous triangle, in any order.
+
+    Triangles are hashed into one integer each, and only the triangles sharing a hash are
+    compared.
+
+    Parameters
+    ----------
+    facets : np.ndarray
+        Triangles with shape ``(m, 3)``.
+
+    Returns
+    -------
+    np.ndarray
+        Indices of the duplicates, the first occurrence of each triangle not being included.
+    """
+    if len(facets) == 0:
+        return np.empty(0, dtype=np.int64)
+    facets = facets.astype(np.uint64)
+    lowest = np.minimum(np.minimum(facets[:, 0], facets[:, 1]), facets[:, 2])
+    highest = np.maximum(np.maximum(facets[:, 0], facets[:, 1]), facets[:, 2])
+    middle = facets[:, 0] + facets[:, 1] + facets[:, 2] - lowest - highest
+    # Exact key when it fits in 64 bits, otherwise a hash wrapping around
+    nb_values = np.uint64(int(highest.max()) + 1)
+    keys = (lowest * nb_values + middle) * nb_values + highest
+    candidates = _repeated(keys)
+    if len(candidates) == 0:
+        return candidates
+    rows = np.stack((lowest[candidates], middle[candidates], highest[candidates]), axis=1)
+    _, first, inverse = np.unique(rows, axis=0, return_index=True, return_inverse=True)
+    return candidates[first[inverse.ravel()] != np.arange(len(candidates))]
+
+
+def edge_incidences(facets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Count the triangles sharing each edge, whatever the edge direction.
+
+    Parameters
+    ----------
+    facets : np.ndarray
+        Triangles with shape ``(m, 3)``.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Edges with shape ``(k, 2)``, lowest vertex index first, and number of triangles using each
+        of them.
+    """
+    if len(facets) == 0:
+        return np.empty((0, 2), dtype=np.int64), np.empty(0, dtype=np.int64)
+    facets = facets.astype(np.int64)
+    nb_values = int(facets.max()) + 1
+    keys = np.concatenate(
+        [
+            np.minimum(facets[:, a], facets[:, b]) * nb_values
+            + np.maximum(facets[:, a], facets[:, b])
+            for a, b in ((0, 1), (1, 2), (2, 0))
+        ]
+    )
+    keys, counts = np.unique(keys, return_counts=True)
+    return np.stack((keys // nb_values, keys % nb_values), axis=1), counts
+
+
+def weld_vertices(vertices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge vertices having exactly the same coordinates.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Vertices with shape ``(n, 3)``.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Distinct vertices, and for each input vertex the index of its distinct vertex.
+    """
+    if len(vertices) == 0:
+        return vertices, np.empty(0, dtype=np.int64)
+    order = np.lexsort(vertices.T[::-1])
+    sorted_vertices = vertices[order]
+    new_vertex = np.concatenate(
+        ([True], np.any(sorted_vertices[1:] != sorted_vertices[:-1], axis=1))
+    )
+    inverse = np.empty(len(vertices), dtype=np.int64)
+    inverse[order] = np.cumsum(new_vertex) - 1
+    return sorted_vertices[new_vertex], inverse
+
+
+def check_mesh(
+    vertices: np.ndarray, facets: np.ndarray, normals: np.ndarray, tolerance: float = 0.0
+) -> MeshReport:
+    """Check a triangle mesh.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Vertices with shape ``(n, 3)``.
+    facets : np.ndarray
+        Triangles with shape ``(m, 3)``.
+    normals : np.ndarray
+        Normals with shape ``(n, 3)``, or empty if the mesh has none.
+    tolerance : float
+        Largest area of a degenerate triangle.
+        By default, ``0.0``.
+
+    Returns
+    -------
+    ansys.speos.core.generic.mesh_methods.MeshReport
+        Report of the mesh.
+    """
+    areas = _lengths(triangle_normals(vertices, facets, normalize=False)) / 2.0
+    _, counts = edge_incidences(facets)
+    return MeshReport(
+        nb_vertices=len(vertices),
+        nb_triangles=len(facets),
+        bounds=bounding_box(vertices) if len(vertices) != 0 else np.zeros((2, 3)),
+        area=float(areas.sum()),
+        degenerate_triangles=_degenerate(facets, areas, tolerance),
+        duplicate_triangles=duplicate_triangles(facets),
+        nb_open_edges=int(np.count_nonzero(counts == 1)),
+        nb_non_manifold_edges=int(np.count_nonzero(counts > 2)),
+        missing_normals=len(vertices) == 0 or len(normals) != len(vertices),
+    )
+
+
+def merge_meshes(
+    meshes: List[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Gather meshes into one, welding the vertices they share.
+
+    Parameters
+    ----------
+    meshes : List[Tuple[np.ndarray, np.ndarray, np.ndarray]]
+        Vertices, facets and normals of each mesh.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Vertices, facets and normals of the merged mesh. Normals are empty if one mesh has none,
+        otherwise the normal of a welded vertex is the one of its first occurrence.
+    """
+    if not meshes:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64), np.empty((0, 3))
+    offsets = np.cumsum([0] + [len(v) for v, _, _ in meshes])
+    vertices = np.concatenate([v for v, _, _ in meshes])
+    facets = np.concatenate([f + offset for (_, f, _), offset in zip(meshes, offsets)])
+    welded, inverse = weld_vertices(vertices)
+    normals = np.empty((0, 3))
+    if all(len(n) == len(v) for v, _, n in meshes):
+        normals = np.empty_like(welded)
+        normals[inverse[::-1]] = np.concatenate([n for _, _, n in meshes])[::-1]
+    return welded, inverse[facets], normals
+
+
+def ray_triangle_intersections(
+    origins: np.ndarray, directions: np.ndarray, triangles: np.ndarray
+) -> np.ndarray:
+    """Intersect rays with triangles, pair by pair (Moller-Trumbore algorithm).
+
+    Parameters
+    ----------
+    origins : np.ndarray
+        Origins of the rays with shape ``(k, 3)``.
+    directions : np.ndarray
+        Directions of the rays with shape ``(k, 3)``.
+    triangles : np.ndarray
+        Corners of the triangles with shape ``(k, 3, 3)``.
+
+    Returns
+    -------
+    np.ndarray
+        For each pair, ``t`` such that ``origin + t * direction`` is the intersection point, or
+        ``inf`` if the ray does not cross the triangle ahead of its origin.
+    """
+    edges_1 = triangles[:, 1] - triangles[:, 0]
+    edges_2 = triangles[:, 2] - triangles[:, 0]
+    p = np.cross(directions, edges_2)
+    determinants = np.einsum("ij,ij->i", edges_1, p)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inverses = 1.0 / determinants
+        s = origins - triangles[:, 0]
+        u = np.einsum("ij,ij->i", s, p) * inverses
+        q = np.cross(s, edges_1)
+        v = np.einsum("ij,ij->i", directions, q) * inverses
+        t = np.einsum("ij,ij->i", edges_2, q) * inverses
+        hit = (determinants != 0) & (u >= 0) & (v >= 0) & (u + v <= 1) & (t >= 0)
+    return np.where(hit, t, np.inf)
+
+
+def point_triangle_distances(points: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    """Compute the distance between points and triangles, pair by pair.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        Points with shape ``(k, 3)``.
+    triangles : np.ndarray
+        Corners of the triangles with shape ``(k, 3, 3)``.
+
+    Returns
+    -------
+    np.ndarray
+        Distance of each point to the closest point of its triangle.
+    """
+    corners = [triangles[:, i] for i in range(3)]
+    normals = np.cross(corners[1] - corners[0], corners[2] - corners[0])
+    # Inside when the point is on the inner side of the three edges, seen along the normal
+    inside = np.ones(len(points), dtype=bool)
+    for i in range(3):
+        a, b = corners[i], corners[(i + 1) % 3]
+        inside &= np.einsum("ij,ij->i", np.cross(b - a, points - a), normals) >= 0
+    lengths = _lengths(normals)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plane_distances = np.abs(np.einsum("ij,ij->i", points - corners[0], normals)) / lengths
+    # Outside (or degenerate triangle): closest point is on an edge
+    edge_distances = np.full(len(points), np.inf)
+    for i in range(3):
+        a, b = corners[i], corners[(i + 1) % 3]
+        segments = b - a
+        squared = np.einsum("ij,ij->i", segments, segments)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = np.clip(np.einsum("ij,ij->i", points - a, segments) / squared, 0.0, 1.0)
+        ratios = np.nan_to_num(ratios)
+        closest = a + ratios[:, np.newaxis] * segments
+        edge_distances = np.minimum(edge_distances, _lengths(points - closest))
+    return np.where(inside & (lengths != 0), plane_distances, edge_distances)
+
+
+def cluster_vertices(
+    vertices: np.ndarray, facets: np.ndarray, cell_size: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Simplify a mesh by merging the vertices lying in the same cell of a regular grid.
+
+    Each cell keeps one vertex at the mean position of its vertices. Triangles collapsed by the
+    merge and duplicated triangles are removed.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Vertices with shape ``(n, 3)``.
+    facets : np.ndarray
+        Triangles with shape ``(m, 3)``.
+    cell_size : float
+        Size of the grid cells.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Vertices and facets of the simplified mesh.
+    """
+    if len(vertices) == 0 or len(facets) == 0:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+    lower = vertices.min(axis=0)
+    # At most 2**20 cells along each axis so that the cell index fits in 64 bits
+    cell_size = max(cell_size, float((vertices.max(axis=0) - lower).max()) / 2**20, 1e-300)
+    cells = ((vertices - lower) / cell_size).astype(np.int64)
+    dims = cells.max(axis=0) + 1
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    _, clusters = np.unique(keys, return_inverse=True)
+
+    facets = clusters[facets]
+    kept = (facets[:, 0] != facets[:, 1]) & (facets[:, 1] != facets[:, 2])
+    kept &= facets[:, 2] != facets[:, 0]
+    facets = facets[kept]
+    facets = np.delete(facets, duplicate_triangles(facets), axis=0)
+
+    # Only the clusters still used by a triangle are kept
+    counts = np.bincount(clusters)
+    used = np.zeros(len(counts), dtype=bool)
+    used[facets.ravel()] = True
+    new_index = np.cumsum(used) - 1
+    centers = np.stack(
+        [np.bincount(clusters, weights=vertices[:, i]) / counts for i in range(3)], axis=1
+    )
+    return centers[used], new_index[facets]
+
+
+def decimate(
+    vertices: np.ndarray, facets: np.ndarray, max_triangles: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Simplify a mesh by vertex clustering until it has at most ``max_triangles`` triangles.
+
+    The first grid is sized from the mesh area, then it is coarsened until the budget is met.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Vertices with shape ``(n, 3)``.
+    facets : np.ndarray
+        Triangles with shape ``(m, 3)``.
+    max_triangles : int
+        Largest number of triangles of the simplified mesh.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Vertices and facets of the simplified mesh, the input ones if already within budget.
+    """
+    if len(facets) <= max_triangles:
+        return vertices, facets
+    if max_triangles <= 0:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+    # A cell of a surface mesh holds about one vertex, for about two triangles
+    extent = float(np.ptp(vertices, axis=0).max())
+    cell_size = max(np.sqrt(2.0 * surface_area(vertices, facets) / max_triangles), extent * 1e-6)
+    while True:
+        simplified = cluster_vertices(vertices, facets, cell_size)
+        nb_triangles = len(simplified[1])
+        if nb_triangles <= max_triangles or cell_size > extent:
+            return simplified
+        cell_size *= max(np.sqrt(nb_triangles / max_triangles), 1.1)
+
+
+def select_lod_levels(
+    nb_triangles: np.ndarray, sizes: np.ndarray, max_triangles: int, ratio: float = 4.0
+) -> np.ndarray:
+    """Select the level of detail of meshes sharing a triangle budget.
+
+    Each mesh gets a share of the budget proportional to its screen area when the whole scene is
+    in view, that is to the square of its size. Level ``l`` of a mesh has ``ratio ** l`` times
+    fewer triangles than the mesh.
+
+    Parameters
+    ----------
+    nb_triangles : np.ndarray
+        Number of triangles of each mesh at full resolution.
+    sizes : np.ndarray
+        Size of each mesh, like the diagonal of its bounding box.
+    max_triangles : int
+        Budget of triangles for all meshes.
+    ratio : float
+        Triangle reduction from one level to the next.
+        By default, ``4.0``.
+
+    Returns
+    -------
+    np.ndarray
+        Level of each mesh, ``0`` being full resolution.
+    """
+    nb_triangles = np.asarray(nb_triangles, dtype=np.float64)
+    sizes = np.asarray(sizes, dtype=np.float64)
+    if nb_triangles.sum() <= max_triangles:
+        return np.zeros(len(nb_triangles), dtype=np.int64)
+    weights = sizes**2
+    if weights.sum() > 0:
+        budgets = max_triangles * weights / weights.sum()
+    else:
+        budgets = np.full(len(sizes), max_triangles / max(len(sizes), 1))
+    with np.errstate(divide="ignore"):
+        levels = np.ceil(np.log(nb_triangles / np.maximum(budgets, 1.0)) / np.log(ratio))
+    return np.maximum(levels, 0).astype(np.int64)
@@ -0,0 +1,188 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides a bounding volume hierarchy over axis aligned boxes."""
+
+from typing import Tuple
+
+import numpy as np
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """Insert two zero bits between each of the 21 lowest bits of the values."""
+    values = values.astype(np.uint64) & np.uint64(0x1FFFFF)
+    for shift, mask in (
+        (32, 0x1F00000000FFFF),
+        (16, 0x1F0000FF0000FF),
+        (8, 0x100F00F00F00F00F),
+        (4, 0x10C30C30C30C30C3),
+        (2, 0x1249249249249249),
+    ):
+        values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+    return values
+
+
+def _morton_codes(points: np.ndarray) -> np.ndarray:
+    """Compute the Morton code of points, which orders them along a space filling curve."""
+    lower = points.min(axis=0)
+    extent = points.max(axis=0) - lower
+    extent[extent == 0] = 1.0
+    cells = ((points - lower) / extent * 0x1FFFFF).astype(np.uint64)
+    return (
+        (_spread_bits(cells[:, 0]) << np.uint64(2))
+        | (_spread_bits(cells[:, 1]) << np.uint64(1))
+        | _spread_bits(cells[:, 2])
+    )
+
+
+class AABBTree:
+    """Bounding volume hierarchy over axis aligned bounding boxes.
+
+    The boxes are sorted along a Morton curve and grouped by ``leaf_size`` in leaves, then the
+    leaves are the bottom of a complete binary tree. Queries go down the tree one level at a time
+    for all queried items together, so that their cost grows with the logarithm of the number of
+    boxes.
+
+    Parameters
+    ----------
+    lower : np.ndarray
+        Lowest corner of each box, with shape ``(n, 3)``.
+    upper : np.ndarray
+        Highest corner of each box, with shape ``(n, 3)``.
+    leaf_size : int
+        Number of boxes per leaf.
+        By default, ``8``.
+    """
+
+    def __init__(self, lower: np.ndarray, upper: np.ndarray, leaf_size: int = 8) -> None:
+        self._lower = np.asarray(lower, dtype=np.float64).reshape(-1, 3)
+        self._upper = np.asarray(upper, dtype=np.float64).reshape(-1, 3)
+        self._leaf_size = leaf_size
+        nb_boxes = len(self._lower)
+        self._order = np.empty(0, dtype=np.int64)
+        self._levels = []
+        if nb_boxes == 0:
+            return
+        self._order = np.argsort(_morton_codes((self._lower + self._upper) / 2.0), kind="stable")
+
+        # Leaves, padded with empty boxes up to a power of two
+        nb_leaves = -(-nb_boxes // leaf_size)
+        nb_padded = 1 << (nb_leaves - 1).bit_length()
+        starts = np.arange(0, nb_boxes, leaf_size)
+        level_lower = np.full((nb_padded, 3), np.inf)
+        level_upper = np.full((nb_padded, 3), -np.inf)
+        level_lower[:nb_leaves] = np.minimum.reduceat(self._lower[self._order], starts, axis=0)
+        level_upper[:nb_leaves] = np.maximum.reduceat(self._upper[self._order], starts, axis=0)
+        self._levels = [(level_lower, level_upper)]
+        while len(level_lower) > 1:
+            level_lower = level_lower.reshape(-1, 2, 3).min(axis=1)
+            level_upper = level_upper.reshape(-1, 2, 3).max(axis=1)
+            self._levels.insert(0, (level_lower, level_upper))
+
+    def __len__(self) -> int:
+        """Return the number of boxes."""
+        return len(self._lower)
+
+    @property
+    def bounds(self) -> np.ndarray:
+        """Box enclosing all boxes, ``[[xmin, ymin, zmin], [xmax, ymax, zmax]]``."""
+        if not self._levels:
+            return np.array([[np.inf] * 3, [-np.inf] * 3])
+        return np.stack((self._levels[0][0][0], self._levels[0][1][0]))
+
+    def _traverse(self, query_ids: np.ndarray, overlaps) -> Tuple[np.ndarray, np.ndarray]:
+        """Go down the tree keeping the (query, node) pairs accepted by ``overlaps``.
+
+        ``overlaps(query_ids, lower, upper)`` tells which queries overlap which boxes.
+        """
+        if not self._levels:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        nodes = np.zeros(len(query_ids), dtype=np.int64)
+        for depth, (lower, upper) in enumerate(self._levels):
+            if depth != 0:
+                query_ids = np.repeat(query_ids, 2)
+                nodes = (np.repeat(nodes, 2) * 2) + np.tile([0, 1], len(nodes))
+            kept = overlaps(query_ids, lower[nodes], upper[nodes])
+            query_ids, nodes = query_ids[kept], nodes[kept]
+
+        # Boxes of the reached leaves
+        slots = (nodes[:, np.newaxis] * self._leaf_size + np.arange(self._leaf_size)).ravel()
+        query_ids = np.repeat(query_ids, self._leaf_size)
+        valid = slots < len(self._order)
+        query_ids, boxes = query_ids[valid], self._order[slots[valid]]
+        kept = overlaps(query_ids, self._lower[boxes], self._upper[boxes])
+        return query_ids[kept], boxes[kept]
+
+    def query_boxes(self, lower: np.ndarray, upper: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the boxes overlapping query boxes.
+
+        Parameters
+        ----------
+        lower : np.ndarray
+            Lowest corner of each query box, with shape ``(k, 3)``.
+        upper : np.ndarray
+            Highest corner of each query box, with shape ``(k, 3)``.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Index of the query box and index of the box, for each overlapping pair.
+        """
+        lower = np.asarray(lower, dtype=np.float64).reshape(-1, 3)
+        upper = np.asarray(upper, dtype=np.float64).reshape(-1, 3)
+
+        def overlaps(query_ids, box_lower, box_upper):
+            return np.all((lower[query_ids] <= box_upper) & (box_lower <= upper[query_ids]), axis=1)
+
+        return self._traverse(np.arange(len(lower)), overlaps)
+
+    def query_rays(
+        self, origins: np.ndarray, directions: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the boxes crossed by rays, ahead of their origins.
+
+        Parameters
+        ----------
+        origins : np.ndarray
+            Origins of the rays, with shape ``(k, 3)``.
+        directions : np.ndarray
+            Directions of the rays, with shape ``(k, 3)``.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Index of the ray and index of the box, for each crossing pair.
+        """
+        origins = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+        with np.errstate(divide="ignore"):
+            inverses = 1.0 / np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+
+        def overlaps(query_ids, box_lower, box_upper):
+            # Slab test, fmin and fmax ignore the nan of rays parallel to a slab boundary
+            with np.errstate(invalid="ignore"):
+                t_lower = (box_lower - origins[query_ids]) * inverses[query_ids]
+                t_upper = (box_upper - origins[query_ids]) * inverses[query_ids]
+            t_near = np.fmin(t_lower, t_upper).max(axis=1)
+            t_far = np.fmax(t_lower, t_upper).min(axis=1)
+            return (t_near <= t_far) & (t_far >= 0)
+
+        return self._traverse(np.arange(len(origins)), overlaps)
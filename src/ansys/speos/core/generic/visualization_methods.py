@@ -22,19 +22,51 @@
 
 """Provides the ``VisualData`` class."""
 
-from typing import TYPE_CHECKING, List, Tuple, Union, cast
+import hashlib
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple, Union, cast
 
+from google.protobuf.message import Message
 import numpy as np
 
 from ansys.speos.core.generic.general_methods import (
     graphics_required,
     magnitude_vector,
     normalize_vector,
+    wavelength_to_rgb,
 )
 
 if TYPE_CHECKING:  # pragma: no cover
     import pyvista as pv
 
+    from ansys.speos.core.kernel.ray_path import RayPathArrays
+
+
+def _fingerprint(*values: Any) -> str:
+    """Hash the values a visualization is built from.
+
+    Protobuf messages are hashed from their deterministic serialization, other values from their
+    representation.
+
+    Parameters
+    ----------
+    *values : Any
+        Values defining the visualization, like axis systems, dimensions or geometry paths.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest, equal for equal values.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        if isinstance(value, Message):
+            digest.update(type(value).__name__.encode())
+            digest.update(value.SerializeToString(deterministic=True))
+        else:
+            digest.update(repr(value).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
 
 @graphics_required
 class _VisualCoordinateSystem:
@@ -286,6 +318,157 @@ class _VisualArrow:
         return self.__color
 
 
+def _ray_line_set_arrays(
+    impacts: np.ndarray,
+    offsets: np.ndarray,
+    last_directions: np.ndarray,
+    direction_length: Union[float, np.ndarray] = 1.0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the points and the pyvista lines connectivity drawing a set of rays.
+
+    Each ray is a polyline going through its impacts, followed by a segment along its last
+    direction.
+
+    Parameters
+    ----------
+    impacts: numpy.ndarray
+        Impacts of all rays, of shape ``(nb_impacts, 3)``.
+    offsets: numpy.ndarray
+        Start of the impacts of each ray in ``impacts``, of shape ``(nb_rays + 1,)``.
+    last_directions: numpy.ndarray
+        Last direction of each ray, of shape ``(nb_rays, 3)``.
+    direction_length: Union[float, numpy.ndarray]
+        Length of the last direction segments, for all rays or per ray. Rays with a length of
+        ``0`` have no last direction segment.
+        By default, ``1.0``.
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        Points of shape ``(nb_points, 3)``, lines connectivity ``[n0, p0, p1, ..., n1, ...]`` and
+        mask of the rays drawn (rays with less than two points are skipped).
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    impacts = np.asarray(impacts, dtype=np.float64).reshape(-1, 3)
+    nb_impacts = np.diff(offsets)
+    lengths = np.broadcast_to(np.asarray(direction_length, dtype=np.float64), nb_impacts.shape)
+    has_end = (lengths > 0) & (nb_impacts > 0)
+    nb_points = nb_impacts + has_end
+    kept = nb_points >= 2
+
+    ends_from = offsets[1:][kept & has_end] - 1
+    ends = (
+        impacts[ends_from]
+        + lengths[kept & has_end, None]
+        * np.asarray(last_directions, dtype=np.float64).reshape(-1, 3)[kept & has_end]
+    )
+    if not kept.all():
+        impacts = impacts[np.repeat(kept, nb_impacts)]
+    nb_impacts, has_end, nb_points = nb_impacts[kept], has_end[kept], nb_points[kept]
+
+    # Points of a ray: its impacts, then the end of its last direction segment.
+    first_points = np.zeros(len(nb_points), dtype=np.int64)
+    np.cumsum(nb_points[:-1], out=first_points[1:])
+    is_end = np.zeros(len(impacts) + len(ends), dtype=bool)
+    is_end[(first_points + nb_impacts)[has_end]] = True
+    points = np.empty((len(is_end), 3), dtype=np.float64)
+    points[~is_end] = impacts
+    points[is_end] = ends
+
+    lines = np.insert(np.arange(len(points), dtype=np.int64), first_points, nb_points)
+    return points, lines, kept
+
+
+@graphics_required
+class _VisualRays:
+    """Visualization data for a set of rays, drawn as a single line set.
+
+    Each ray is a polyline going through its impacts, followed by a segment along its last
+    direction.
+
+    Notes
+    -----
+    **Do not instantiate this class yourself**.
+    """
+
+    def __init__(
+        self,
+        ray_paths: "RayPathArrays",
+        color: Tuple[float, float, float] = (0.643, 1.0, 0.0),
+    ) -> None:
+        self.__ray_paths = ray_paths
+        self.__color = color
+
+    @property
+    def ray_paths(self) -> "RayPathArrays":
+        """
+        Returns the ray paths drawn.
+
+        Returns
+        -------
+        ansys.speos.core.kernel.ray_path.RayPathArrays
+            The ray paths drawn.
+
+        """
+        return self.__ray_paths
+
+    @property
+    def color(self) -> Tuple[float, float, float]:
+        """
+        Returns the color used for the rays without color information.
+
+        Returns
+        -------
+        Tuple[float, float, float]
+            The default color of the rays.
+
+        """
+        return self.__color
+
+    @property
+    def data(self) -> "pv.PolyData":
+        """
+        Returns the pyvista data of _VisualRays, with last directions of unit length.
+
+        Returns
+        -------
+        pv.PolyData
+            The line set of the rays.
+
+        """
+        return self.line_set()
+
+    def line_set(self, direction_length: float = 1.0) -> "pv.PolyData":
+        """
+        Build the line set of the rays.
+
+        Parameters
+        ----------
+        direction_length: float
+            Length of the last direction segments.
+            By default, ``1.0``.
+
+        Returns
+        -------
+        pv.PolyData
+            One polyline per ray, with the ray colors as ``"colors"`` cell data when streamed or
+            when wavelengths are available.
+        """
+        import pyvista as pv
+
+        ray_paths = self.__ray_paths
+        points, lines, kept = _ray_line_set_arrays(
+            ray_paths.impacts, ray_paths.offsets, ray_paths.last_directions, direction_length
+        )
+        line_set = pv.PolyData(points, lines=lines)
+        colors = ray_paths.colors
+        if colors is None and len(ray_paths) > 0 and not np.isnan(ray_paths.wavelengths).any():
+            colors = wavelength_to_rgb(ray_paths.wavelengths)
+        if colors is not None:
+            line_set.cell_data["colors"] = colors[kept]
+        return line_set
+
+
 @graphics_required
 class _VisualData:
     """Visualization data for the sensor.
@@ -303,17 +486,18 @@ class _VisualData:
         self._data = [] if ray else pv.PolyData()
         self.coordinates = _VisualCoordinateSystem() if coordinate_system else None
         self.updated = False
+        self.fingerprint = None
 
     @property
-    def data(self) -> Union["pv.PolyData", List[_VisualArrow]]:
+    def data(self) -> Union["pv.PolyData", List[Union[_VisualArrow, _VisualRays]]]:
         """
         Returns the pyvista data of _VisualData.
 
         Returns
         -------
-        Union["pv.PolyData", List[_VisualArrow]]
+        Union["pv.PolyData", List[Union[_VisualArrow, _VisualRays]]]
             The data of the surface visualization if surface data,
-            else List[_VisualArrow] containing ray info.
+            else List[Union[_VisualArrow, _VisualRays]] containing ray info.
 
         """
         return self._data
@@ -400,6 +584,21 @@ class _VisualData:
         """
         self._data.append(line)
 
+    def add_data_rays(self, ray_paths: "RayPathArrays") -> None:
+        """
+        Add a set of rays to Visualization data.
+
+        Parameters
+        ----------
+        ray_paths: ansys.speos.core.kernel.ray_path.RayPathArrays
+            Rays gathered in arrays, drawn as a single line set.
+
+        Returns
+        -------
+        None
+        """
+        self._data.append(_VisualRays(ray_paths))
+
     def add_data_mesh(self, vertices: np.ndarray, facets: np.ndarray) -> None:
         """
         Add mesh data to Visualization data.
@@ -424,9 +623,66 @@ class _VisualData:
         self._data = cast("pv.PolyData", self._data).append_polydata(pv.PolyData(vertices, facets))
 
 
+def axis_systems_to_matrix(*axis_systems: Sequence[float]) -> np.ndarray:
+    """Compose axis systems into one homogeneous transformation matrix.
+
+    Parameters
+    ----------
+    *axis_systems : Sequence[float]
+        Axis systems ``[Ox, Oy, Oz, Xx, Xy, Xz, Yx, Yy, Yz, Zx, Zy, Zz]`` of nested instances,
+        from the innermost to the outermost: each one places its local coordinates in the
+        coordinates of the next one.
+
+    Returns
+    -------
+    np.ndarray
+        Matrix with shape ``(4, 4)`` applied to row vectors: ``[x, y, z, 1] @ matrix`` gives the
+        point in the coordinates of the outermost axis system. Identity if no axis system is given.
+    """
+    matrix = np.identity(4)
+    for axis_system in axis_systems:
+        local_matrix = np.identity(4)
+        local_matrix[:3, :3] = np.asarray(axis_system[3:12], dtype=np.float64).reshape(3, 3)
+        local_matrix[3, :3] = axis_system[:3]
+        matrix = matrix @ local_matrix
+    return matrix
+
+
+def transform_points(
+    points: np.ndarray, *axis_systems: Sequence[float], out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Convert points from local coordinates to global coordinates.
+
+    The axis systems are composed first, then all points are transformed with one matrix product.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        Points with shape ``(..., 3)``.
+    *axis_systems : Sequence[float]
+        Axis systems of nested instances, from the innermost to the outermost,
+        see :func:`axis_systems_to_matrix`.
+    out : np.ndarray, optional
+        Array receiving the result, with the shape of ``points``. It can be ``points`` itself to
+        transform them in place.
+        By default, ``None``, which allocates a new array.
+
+    Returns
+    -------
+    np.ndarray
+        Transformed points, ``out`` if given.
+    """
+    matrix = axis_systems_to_matrix(*axis_systems)
+    out = np.matmul(np.asarray(points), matrix[:3, :3], out=out)
+    out += matrix[3, :3]
+    return out
+
+
 def local2absolute(local_vertice: np.ndarray, coordinates) -> np.ndarray:
     """Convert local coordinate to global coordinate.
 
+    To convert many vertices, use :func:`transform_points` instead.
+
     Parameters
     ----------
     coordinates: list
@@ -443,8 +699,4 @@ def local2absolute(local_vertice: np.ndarray, coordinates) -> np.ndarray:
         numpy array includes x, y, z info
 
     """
-    global_origin = np.array(coordinates[:3])
-    global_x = np.array(coordinates[3:6]) * local_vertice[0]
-    global_y = np.array(coordinates[6:9]) * local_vertice[1]
-    global_z = np.array(coordinates[9:]) * local_vertice[2]
-    return global_origin + global_x + global_y + global_z
+    return transform_points(np.asarray(local_vertice, dtype=np.float64), coordinates)
@@ -0,0 +1,276 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides a spatial index over the faces of a project."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+import ansys.speos.core.body as body
+import ansys.speos.core.face as face
+from ansys.speos.core.generic import mesh_methods
+from ansys.speos.core.generic.spatial_index import AABBTree
+from ansys.speos.core.generic.visualization_methods import axis_systems_to_matrix
+import ansys.speos.core.part as part
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ansys.speos.core.project import Project
+
+
+class _FaceEntry:
+    """Triangles of a face in project coordinates, with their bounding volume hierarchy."""
+
+    def __init__(self, face_id: int, feature: face.Face, matrix: np.ndarray) -> None:
+        self.face_id = face_id
+        self.feature = feature
+        self.revision = feature._revision
+        self.matrix = matrix
+        vertices, facets, _ = feature._mesh_arrays()
+        vertices = vertices @ matrix[:3, :3] + matrix[3, :3]
+        self.triangles = vertices[facets]
+        self.tree = AABBTree(self.triangles.min(axis=1), self.triangles.max(axis=1))
+
+    def is_valid(self, feature: face.Face, matrix: np.ndarray) -> bool:
+        """Tell if the entry still describes the face placed with this matrix."""
+        return (
+            feature is self.feature
+            and feature._revision == self.revision
+            and np.array_equal(matrix, self.matrix)
+        )
+
+
+class GeometryIndex:
+    """Spatial index over the committed faces of a project.
+
+    Each face gets an integer id, that gives back the face feature in constant time. The faces are
+    indexed in project coordinates with bounding volume hierarchies, so that box, ray and point
+    queries only test the triangles close to them.
+
+    The index is refreshed by :meth:`update`, which only rebuilds the entries of the faces edited
+    or moved since the previous update. Each placement of a part shared by several sub parts has
+    its own face ids.
+
+    Parameters
+    ----------
+    project : ansys.speos.core.project.Project
+        Project whose root part geometry is indexed.
+    """
+
+    def __init__(self, project: Project) -> None:
+        self._project = project
+        self._entries: Dict[Tuple[str, int], _FaceEntry] = {}
+        self._faces: List[Optional[_FaceEntry]] = []
+        self._tree = AABBTree(np.empty((0, 3)), np.empty((0, 3)))
+        self._tree_face_ids = np.empty(0, dtype=np.int64)
+
+    def update(self) -> GeometryIndex:
+        """Refresh the index with the faces committed in the project.
+
+        Returns
+        -------
+        ansys.speos.core.geometry_index.GeometryIndex
+            Geometry index.
+        """
+        placed = []
+        root_part = self._project.root_part
+        if root_part is not None:
+            self._gather(root_part, np.identity(4), placed)
+
+        entries = {}
+        changed = len(placed) != len(self._entries)
+        for feature, matrix in placed:
+            # Instances of a shared part have the same face keys but their own face features
+            key = (feature.face_link.key, id(feature))
+            entry = self._entries.get(key)
+            if entry is None or not entry.is_valid(feature, matrix):
+                face_id = len(self._faces) if entry is None else entry.face_id
+                entry = _FaceEntry(face_id, feature, matrix)
+                if face_id == len(self._faces):
+                    self._faces.append(entry)
+                else:
+                    self._faces[face_id] = entry
+                changed = True
+            entries[key] = entry
+        for key in self._entries.keys() - entries.keys():
+            self._faces[self._entries[key].face_id] = None
+        self._entries = entries
+
+        if changed:
+            indexed = [e for e in self._entries.values() if len(e.triangles)]
+            bounds = np.array([e.tree.bounds for e in indexed]).reshape(-1, 2, 3)
+            self._tree = AABBTree(bounds[:, 0], bounds[:, 1], leaf_size=4)
+            self._tree_face_ids = np.array([e.face_id for e in indexed], dtype=np.int64)
+        return self
+
+    @staticmethod
+    def _gather(
+        feature: Union[part.Part, part.Part.SubPart, body.Body],
+        matrix: np.ndarray,
+        placed: List[Tuple[face.Face, np.ndarray]],
+    ) -> None:
+        """Collect the committed faces under a feature with their placement matrix."""
+        for child in feature._geom_features:
+            if isinstance(child, face.Face):
+                if child.face_link is not None:
+                    placed.append((child, matrix))
+            elif isinstance(child, part.Part.SubPart):
+                child_matrix = axis_systems_to_matrix(child._part_instance.axis_system) @ matrix
+                GeometryIndex._gather(child, child_matrix, placed)
+            else:
+                GeometryIndex._gather(child, matrix, placed)
+
+    def __len__(self) -> int:
+        """Return the number of indexed faces."""
+        return len(self._entries)
+
+    def face(self, face_id: int) -> face.Face:
+        """Get the face feature from its id.
+
+        Parameters
+        ----------
+        face_id : int
+            Id of the face in the index.
+
+        Returns
+        -------
+        ansys.speos.core.face.Face
+            Face feature.
+        """
+        entry = self._faces[face_id] if 0 <= face_id < len(self._faces) else None
+        if entry is None:
+            raise KeyError(f"No face with id {face_id} in the geometry index")
+        return entry.feature
+
+    def geo_path(self, face_id: int) -> str:
+        """Get the geometry path of a face from its id.
+
+        Parameters
+        ----------
+        face_id : int
+            Id of the face in the index.
+
+        Returns
+        -------
+        str
+            Geometry path of the face, like ``"SubPart/Body/Face"``.
+        """
+        return self.face(face_id).geo_path.metadata["GeoPath"]
+
+    def _candidate_faces(self, query_ids: np.ndarray, tree_ids: np.ndarray):
+        """Group (query, face) pairs found in the top tree by face."""
+        order = np.argsort(tree_ids, kind="stable")
+        query_ids, tree_ids = query_ids[order], tree_ids[order]
+        starts = np.flatnonzero(np.diff(tree_ids, prepend=-1))
+        for start, stop in zip(starts, np.append(starts[1:], len(tree_ids))):
+            entry = self._faces[self._tree_face_ids[tree_ids[start]]]
+            yield entry, query_ids[start:stop]
+
+    def query_box(self, lower: List[float], upper: List[float]) -> List[int]:
+        """Find the faces with triangles whose bounding box overlaps a box.
+
+        Parameters
+        ----------
+        lower : List[float]
+            Lowest corner of the box ``[x, y, z]``.
+        upper : List[float]
+            Highest corner of the box ``[x, y, z]``.
+
+        Returns
+        -------
+        List[int]
+            Ids of the faces found, in increasing order.
+        """
+        lower = np.asarray(lower, dtype=np.float64).reshape(1, 3)
+        upper = np.asarray(upper, dtype=np.float64).reshape(1, 3)
+        found = []
+        for entry, _ in self._candidate_faces(*self._tree.query_boxes(lower, upper)):
+            if len(entry.tree.query_boxes(lower, upper)[0]):
+                found.append(entry.face_id)
+        return sorted(found)
+
+    def intersect_rays(
+        self, origins: np.ndarray, directions: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the first face crossed by rays.
+
+        Parameters
+        ----------
+        origins : np.ndarray
+            Origins of the rays with shape ``(k, 3)``.
+        directions : np.ndarray
+            Directions of the rays with shape ``(k, 3)``.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            For each ray, the id of the first face crossed, or ``-1``, and ``t`` such that
+            ``origin + t * direction`` is the crossing point, or ``inf``.
+        """
+        origins = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+        face_ids = np.full(len(origins), -1, dtype=np.int64)
+        distances = np.full(len(origins), np.inf)
+        for entry, ray_ids in self._candidate_faces(*self._tree.query_rays(origins, directions)):
+            local_rays, triangle_ids = entry.tree.query_rays(origins[ray_ids], directions[ray_ids])
+            ray_ids = ray_ids[local_rays]
+            t = mesh_methods.ray_triangle_intersections(
+                origins[ray_ids], directions[ray_ids], entry.triangles[triangle_ids]
+            )
+            np.minimum.at(distances, ray_ids, t)
+            closest = np.isfinite(t) & (t == distances[ray_ids])
+            face_ids[ray_ids[closest]] = entry.face_id
+        return face_ids, distances
+
+    def locate_points(self, points: np.ndarray, tolerance: float = 1e-6) -> np.ndarray:
+        """Find the faces on which points lie.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            Points with shape ``(k, 3)``.
+        tolerance : float
+            Largest distance between a point and the face it lies on.
+            By default, ``1e-6``.
+
+        Returns
+        -------
+        np.ndarray
+            For each point, the id of the closest face within the tolerance, or ``-1``.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        face_ids = np.full(len(points), -1, dtype=np.int64)
+        distances = np.full(len(points), np.inf)
+        lower, upper = points - tolerance, points + tolerance
+        for entry, point_ids in self._candidate_faces(*self._tree.query_boxes(lower, upper)):
+            local_points, triangle_ids = entry.tree.query_boxes(lower[point_ids], upper[point_ids])
+            point_ids = point_ids[local_points]
+            d = mesh_methods.point_triangle_distances(
+                points[point_ids], entry.triangles[triangle_ids]
+            )
+            d[d > tolerance] = np.inf
+            np.minimum.at(distances, point_ids, d)
+            closest = np.isfinite(d) & (d == distances[point_ids])
+            face_ids[point_ids[closest]] = entry.face_id
+        return face_ids
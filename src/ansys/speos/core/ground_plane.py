@@ -25,12 +25,14 @@
 from __future__ import annotations
 
 from difflib import SequenceMatcher
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from ansys.speos.core.kernel.scene import ProtoScene
-import ansys.speos.core.project as project
 import ansys.speos.core.proto_message_utils as proto_message_utils
 
+if TYPE_CHECKING:  # pragma: no cover
+    import ansys.speos.core.project as project
+
 
 class GroundPlane:
     """Speos feature: ground plane.
@@ -167,6 +169,19 @@ class GroundPlane:
         """
         if key == "":
             return self._to_dict()
+        ground = self._ground
+        if self._project.scene_link and self._committed:
+            ground = self._project.scene_link.get().ground
+        resolved, value = proto_message_utils._resolve_field_path(
+            roots=[
+                proto_message_utils._FieldPathRoot(
+                    descriptor=ProtoScene.GroundPlane.DESCRIPTOR, loader=ground
+                )
+            ],
+            key=key,
+        )
+        if resolved:
+            return value
         info = proto_message_utils._value_finder_key_startswith(dict_var=self._to_dict(), key=key)
         content = list(info)
         if len(content) != 0:
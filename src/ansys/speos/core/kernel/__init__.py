@@ -35,6 +35,7 @@ from ansys.speos.core.kernel.proto_message_utils import (
     protobuf_message_to_dict,
     protobuf_message_to_str,
 )
+from ansys.speos.core.kernel.ray_path import RayPathArrays
 from ansys.speos.core.kernel.scene import ProtoScene, SceneLink
 from ansys.speos.core.kernel.sensor_template import (
     ProtoSensorTemplate,
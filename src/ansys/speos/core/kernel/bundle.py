@@ -0,0 +1,415 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides a binary bundle holding a scene and all the items it references.
+
+A bundle starts with ``BUNDLE_MAGIC`` and the format version, followed by one length prefixed
+record per item and ends with the SHA-256 digest of all the bytes before it. Each record gives the
+kind of the item, its key in the database where it was read and its serialized protobuf message.
+The first record is the root scene.
+"""
+
+import hashlib
+import mmap
+from pathlib import Path
+import struct
+from types import ModuleType
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from google.protobuf.message import Message
+
+from ansys.speos.core.kernel import (
+    body,
+    face,
+    intensity_template,
+    part,
+    scene,
+    sensor_template,
+    simulation_template,
+    sop_template,
+    source_template,
+    spectrum,
+    vop_template,
+)
+from ansys.speos.core.kernel.client import SpeosClient
+from ansys.speos.core.kernel.crud import CrudItem
+
+BUNDLE_MAGIC = b"SPEOSBDL"
+"""First bytes of a bundle file."""
+
+BUNDLE_VERSION = 1
+"""Version of the bundle format written."""
+
+_HEADER = struct.Struct("<8sI")
+_RECORD = struct.Struct("<BHI")
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+
+class _Kind(NamedTuple):
+    module: ModuleType
+    proto: type
+    link: type
+    db_name: str
+
+
+_KINDS = {
+    "scene": _Kind(scene, scene.ProtoScene, scene.SceneLink, "scenes"),
+    "part": _Kind(part, part.ProtoPart, part.PartLink, "parts"),
+    "body": _Kind(body, body.ProtoBody, body.BodyLink, "bodies"),
+    "face": _Kind(face, face.ProtoFace, face.FaceLink, "faces"),
+    "sop_template": _Kind(
+        sop_template, sop_template.ProtoSOPTemplate, sop_template.SOPTemplateLink, "sop_templates"
+    ),
+    "vop_template": _Kind(
+        vop_template, vop_template.ProtoVOPTemplate, vop_template.VOPTemplateLink, "vop_templates"
+    ),
+    "spectrum": _Kind(spectrum, spectrum.ProtoSpectrum, spectrum.SpectrumLink, "spectrums"),
+    "intensity_template": _Kind(
+        intensity_template,
+        intensity_template.ProtoIntensityTemplate,
+        intensity_template.IntensityTemplateLink,
+        "intensity_templates",
+    ),
+    "source_template": _Kind(
+        source_template,
+        source_template.ProtoSourceTemplate,
+        source_template.SourceTemplateLink,
+        "source_templates",
+    ),
+    "sensor_template": _Kind(
+        sensor_template,
+        sensor_template.ProtoSensorTemplate,
+        sensor_template.SensorTemplateLink,
+        "sensor_templates",
+    ),
+    "simulation_template": _Kind(
+        simulation_template,
+        simulation_template.ProtoSimulationTemplate,
+        simulation_template.SimulationTemplateLink,
+        "simulation_templates",
+    ),
+}
+"""Description per kind of item.
+
+The kind is also the name of the message field in read responses, and its index in this
+dictionary is the kind stored in records: new kinds must be appended.
+"""
+
+_KIND_NAMES = list(_KINDS)
+
+_GUID_FIELD_KINDS = {
+    "part_guid": "part",
+    "body_guids": "body",
+    "face_guids": "face",
+    "sop_guid": "sop_template",
+    "sop_guids": "sop_template",
+    "vop_guid": "vop_template",
+    "spectrum_guid": "spectrum",
+    "red_spectrum_guid": "spectrum",
+    "green_spectrum_guid": "spectrum",
+    "blue_spectrum_guid": "spectrum",
+    "intensity_guid": "intensity_template",
+    "source_guid": "source_template",
+    "sensor_guid": "sensor_template",
+    "simulation_guid": "simulation_template",
+    "scene_guid": "scene",
+}
+"""Kind of item referenced per name of message field holding keys."""
+
+BundleItems = Dict[str, Tuple[str, Message]]
+"""Kind and message per key, in insertion order."""
+
+
+def _references(message: Message) -> Iterator[Tuple[Message, str, str]]:
+    """Iterate over the fields referencing other items, in the message and its sub messages.
+
+    Yields
+    ------
+    Tuple[google.protobuf.message.Message, str, str]
+        Message holding the field, field name and kind of the items referenced.
+    """
+    for field, value in message.ListFields():
+        if field.message_type is None:
+            if field.name in _GUID_FIELD_KINDS:
+                yield message, field.name, _GUID_FIELD_KINDS[field.name]
+        elif field.message_type.GetOptions().map_entry:
+            value_field = field.message_type.fields_by_name["value"]
+            if value_field.message_type is not None:
+                for sub_message in value.values():
+                    yield from _references(sub_message)
+        elif isinstance(value, Message):
+            yield from _references(value)
+        else:
+            for sub_message in value:
+                yield from _references(sub_message)
+
+
+def _referenced_keys(message: Message) -> Iterator[Tuple[str, str]]:
+    """Iterate over the kind and key of the items referenced by a message."""
+    for holder, name, kind in _references(message):
+        value = getattr(holder, name)
+        for key in [value] if isinstance(value, str) else value:
+            if key:
+                yield kind, key
+
+
+def collect_items(client: SpeosClient, root: scene.SceneLink) -> BundleItems:
+    """Read a scene and all the items it references, directly or not.
+
+    Faces are read with one batch request when the server supports it.
+
+    Parameters
+    ----------
+    client : ansys.speos.core.kernel.client.SpeosClient
+        Client of the database holding the items.
+    root : ansys.speos.core.kernel.scene.SceneLink
+        Scene to collect.
+
+    Returns
+    -------
+    Dict[str, Tuple[str, google.protobuf.message.Message]]
+        Kind and message per key, the root scene first.
+    """
+    items = {}
+    pending = [("scene", root.key)]
+    while pending:
+        faces = [key for kind, key in pending if kind == "face" and key not in items]
+        others = [(kind, key) for kind, key in pending if kind != "face"]
+        pending = []
+        face_db = client.faces()
+        if faces:
+            links = [face.FaceLink(face_db, key) for key in dict.fromkeys(faces)]
+            if face_db._is_batch_available:
+                messages = face_db.read_batch(refs=links)
+            else:
+                messages = [link.get() for link in links]
+            for link, message in zip(links, messages):
+                items[link.key] = ("face", message)
+        for kind, key in others:
+            if key in items:
+                continue
+            message = _KINDS[kind].link(getattr(client, _KINDS[kind].db_name)(), key).get()
+            items[key] = (kind, message)
+            pending.extend(_referenced_keys(message))
+    return items
+
+
+def _creation_order(items: BundleItems) -> List[str]:
+    """Sort keys so that every item comes after the items it references."""
+    order = []
+    state = {}
+    for start in items:
+        if start in state:
+            continue
+        state[start] = False
+        stack = [(start, iter(_referenced_keys(items[start][1])))]
+        while stack:
+            key, children = stack[-1]
+            for _, child in children:
+                if child in items and child not in state:
+                    state[child] = False
+                    stack.append((child, iter(_referenced_keys(items[child][1]))))
+                    break
+            else:
+                stack.pop()
+                state[key] = True
+                order.append(key)
+    return order
+
+
+def create_items(
+    client: SpeosClient,
+    items: BundleItems,
+    existing: Optional[Mapping[str, CrudItem]] = None,
+) -> Dict[str, CrudItem]:
+    """Create items in a database, the referenced items first.
+
+    Faces are created with one batch request when the server supports it. The messages are
+    modified in place to reference the keys of the created items.
+
+    Parameters
+    ----------
+    client : ansys.speos.core.kernel.client.SpeosClient
+        Client of the database where to create the items.
+    items : Dict[str, Tuple[str, google.protobuf.message.Message]]
+        Kind and message per key, as returned by :func:`collect_items` or :func:`read_bundle`.
+    existing : Mapping[str, ansys.speos.core.kernel.crud.CrudItem], optional
+        Links of existing items to update instead of creating new ones, per key in ``items``.
+        By default, ``None``.
+
+    Returns
+    -------
+    Dict[str, ansys.speos.core.kernel.crud.CrudItem]
+        Link of the created or updated item per key in ``items``.
+    """
+    existing = existing or {}
+    links = dict(existing)
+    face_keys = [k for k, (kind, _) in items.items() if kind == "face" and k not in existing]
+    if face_keys:
+        face_db = client.faces()
+        messages = [items[k][1] for k in face_keys]
+        if face_db._is_batch_available:
+            face_links = face_db.create_batch(message_list=messages)
+        else:
+            face_links = [face_db.create(message=m) for m in messages]
+        links.update(zip(face_keys, face_links))
+
+    for key in _creation_order(items):
+        kind, message = items[key]
+        for holder, name, _ in _references(message):
+            value = getattr(holder, name)
+            if isinstance(value, str):
+                if value in links:
+                    setattr(holder, name, links[value].key)
+            else:
+                value[:] = [links[k].key if k in links else k for k in value]
+        if key in existing:
+            existing[key].set(message)
+        elif key not in links:
+            links[key] = getattr(client, _KINDS[kind].db_name)().create(message=message)
+    return links
+
+
+def item_links(client: SpeosClient, items: BundleItems) -> Dict[str, CrudItem]:
+    """Get links to items stored in a database, for instance the ones read by :func:`collect_items`.
+
+    Parameters
+    ----------
+    client : ansys.speos.core.kernel.client.SpeosClient
+        Client of the database holding the items.
+    items : Dict[str, Tuple[str, google.protobuf.message.Message]]
+        Kind and message per key.
+
+    Returns
+    -------
+    Dict[str, ansys.speos.core.kernel.crud.CrudItem]
+        Link per key.
+    """
+    return {
+        key: _KINDS[kind].link(getattr(client, _KINDS[kind].db_name)(), key)
+        for key, (kind, _) in items.items()
+    }
+
+
+def read_responses(
+    items: BundleItems, links: Mapping[str, CrudItem]
+) -> Dict[str, Tuple[CrudItem, Message]]:
+    """Wrap the messages of items into read responses.
+
+    Parameters
+    ----------
+    items : Dict[str, Tuple[str, google.protobuf.message.Message]]
+        Kind and message per key, as given to :func:`create_items`.
+    links : Mapping[str, ansys.speos.core.kernel.crud.CrudItem]
+        Links returned by :func:`create_items` or :func:`item_links`.
+
+    Returns
+    -------
+    Dict[str, Tuple[ansys.speos.core.kernel.crud.CrudItem, google.protobuf.message.Message]]
+        Link and read response per key of the created items, as expected by
+        ``SpeosClient._preloaded``.
+    """
+    responses = {}
+    for key, (kind, message) in items.items():
+        link = links[key]
+        response = _KINDS[kind].module.messages.Read_Response()
+        getattr(response, kind).CopyFrom(message)
+        responses[link.key] = (link, response)
+    return responses
+
+
+def write_bundle(path: Union[str, Path], items: BundleItems) -> str:
+    """Write items into a bundle file.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        File to write.
+    items : Dict[str, Tuple[str, google.protobuf.message.Message]]
+        Kind and message per key, the root scene first.
+
+    Returns
+    -------
+    str
+        SHA-256 digest of the bundle content, as hexadecimal string.
+    """
+    digest = hashlib.sha256()
+    with Path(path).open("wb") as file:
+
+        def write(data: bytes) -> None:
+            digest.update(data)
+            file.write(data)
+
+        write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION))
+        for key, (kind, message) in items.items():
+            guid = key.encode("utf-8")
+            payload = message.SerializeToString()
+            write(_RECORD.pack(_KIND_NAMES.index(kind), len(guid), len(payload)))
+            write(guid)
+            write(payload)
+        file.write(digest.digest())
+    return digest.hexdigest()
+
+
+def read_bundle(path: Union[str, Path]) -> BundleItems:
+    """Read items from a bundle file.
+
+    The file is memory mapped, so that each message is parsed from the file pages directly.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        File to read.
+
+    Returns
+    -------
+    Dict[str, Tuple[str, google.protobuf.message.Message]]
+        Kind and message per key, the root scene first.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a bundle, or if its content does not match its digest.
+    """
+    with Path(path).open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        with memoryview(buf) as view:
+            if len(view) < _HEADER.size + _DIGEST_SIZE:
+                raise ValueError(f"{path} is not a bundle file")
+            magic, version = _HEADER.unpack_from(view)
+            if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+                raise ValueError(f"{path} is not a bundle file of version {BUNDLE_VERSION}")
+            end = len(view) - _DIGEST_SIZE
+            if hashlib.sha256(view[:end]).digest() != view[end:]:
+                raise ValueError(f"Content of {path} does not match its digest")
+
+            items = {}
+            offset = _HEADER.size
+            while offset < end:
+                kind_index, guid_size, payload_size = _RECORD.unpack_from(view, offset)
+                offset += _RECORD.size
+                key = bytes(view[offset : offset + guid_size]).decode("utf-8")
+                offset += guid_size
+                kind = _KIND_NAMES[kind_index]
+                message = _KINDS[kind].proto.FromString(view[offset : offset + payload_size])
+                items[key] = (kind, message)
+                offset += payload_size
+    return items
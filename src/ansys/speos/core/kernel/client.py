@@ -22,13 +22,16 @@
 
 """Provides a wrapped abstraction of the gRPC proto API definition and stubs."""
 
+from contextlib import contextmanager
+import functools
+import itertools
 import logging
 import os
 from pathlib import Path
 import subprocess  # nosec
 import tempfile
 import time
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Callable, Iterator, List, Mapping, Optional, Tuple, Union
 
 from ansys.api.speos.part.v1 import body_pb2, face_pb2, part_pb2
 
@@ -54,7 +57,9 @@ from ansys.speos.core.generic.constants import (
 )
 from ansys.speos.core.generic.general_methods import retrieve_speos_install_dir
 from ansys.speos.core.kernel.body import BodyLink, BodyStub
+from ansys.speos.core.kernel.crud import CrudItem
 from ansys.speos.core.kernel.face import FaceLink, FaceStub
+from ansys.speos.core.kernel.grpc.stats import GrpcStats, channel_target, intercept_channel
 from ansys.speos.core.kernel.grpc.transport_options import (
     InsecureOptions,
     TransportMode,
@@ -121,7 +126,7 @@ def wait_until_healthy(channel: grpc.Channel, timeout: float):
         except (_InactiveRpcError, grpc.FutureTimeoutError):
             continue
     else:
-        target_str = channel._channel.target().decode()
+        target_str = channel_target(channel)
         raise TimeoutError(
             f"Channel health check to target '{target_str}' timed out after {timeout} seconds."
         )
@@ -131,16 +136,21 @@ def default_docker_channel(
     host: Optional[str] = DEFAULT_HOST,
     port: Union[str, int] = DEFAULT_PORT,
     message_size: int = MAX_CLIENT_MESSAGE_SIZE,
+    grpc_options: Optional[List[tuple]] = None,
 ) -> grpc.Channel:
     """Create default transport options for docker on CI."""
     return TransportOptions(
         mode=TransportMode.INSECURE,
         options=InsecureOptions(host=host, port=port, allow_remote_host=True),
-    ).create_channel(grpc_options=[("grpc.max_receive_message_length", message_size)])
+    ).create_channel(
+        grpc_options=[("grpc.max_receive_message_length", message_size)] + (grpc_options or [])
+    )
 
 
 def default_local_channel(
-    port: Union[str, int] = DEFAULT_PORT, message_size: int = MAX_CLIENT_MESSAGE_SIZE
+    port: Union[str, int] = DEFAULT_PORT,
+    message_size: int = MAX_CLIENT_MESSAGE_SIZE,
+    grpc_options: Optional[List[tuple]] = None,
 ) -> grpc.Channel:
     """Create default transport options, WNUA on Windows, UDS on Linux."""
     if os.name == "nt":
@@ -153,10 +163,14 @@ def default_local_channel(
             mode=TransportMode.UDS, options=UDSOptions(uds_fullpath=str(sock_file))
         )
     return transport.create_channel(
-        grpc_options=[("grpc.max_receive_message_length", message_size)]
+        grpc_options=[("grpc.max_receive_message_length", message_size)] + (grpc_options or [])
     )
 
 
+DEDICATED_CONNECTION_OPTION = ("grpc.use_local_subchannel_pool", 1)
+"""gRPC option giving a channel its own connection instead of sharing one with same target."""
+
+
 class SpeosClient:
     """
     Wraps a speos gRPC connection.
@@ -180,6 +194,36 @@ class SpeosClient:
         The file to output the log, if requested. By default, ``None``.
     speos_install_path : Optional[str, Path]
         location of Speos rpc executable
+    channel_factory : Callable[[], grpc.Channel], optional
+        Function creating a new channel to the same server as ``channel``, used for the
+        additional channels. Channels created should use ``DEDICATED_CONNECTION_OPTION`` so that
+        they do not share their connection.
+        By default, ``None``, a local channel is created when ``channel`` is not given.
+    bulk_channels : int, optional
+        Number of additional channels dedicated to bulk streaming (face Upload/Download and file
+        transfers), used in turn. By default, ``0``, bulk transfers use the main channel.
+    control_channel : bool, optional
+        Whether job control and polling requests get their own channel, so that they are not
+        queued behind bulk transfers. By default, ``False``.
+    collect_stats : bool, optional
+        Whether to record statistics of every gRPC call, see :meth:`stats`.
+        By default, ``False``, no interceptor is installed.
+
+    Examples
+    --------
+    >>> from ansys.speos.core.kernel.client import (
+    ...     DEDICATED_CONNECTION_OPTION,
+    ...     SpeosClient,
+    ...     default_local_channel,
+    ... )
+    >>> client = SpeosClient(
+    ...     channel=default_local_channel(port=50098),
+    ...     channel_factory=lambda: default_local_channel(
+    ...         port=50098, grpc_options=[DEDICATED_CONNECTION_OPTION]
+    ...     ),
+    ...     bulk_channels=2,
+    ...     control_channel=True,
+    ... )
     """
 
     def __init__(
@@ -191,6 +235,10 @@ class SpeosClient:
         logging_level: Optional[int] = logging.INFO,
         logging_file: Optional[Union[Path, str]] = None,
         speos_install_path: Optional[Union[Path, str]] = None,
+        channel_factory: Optional[Callable[[], grpc.Channel]] = None,
+        bulk_channels: int = 0,
+        control_channel: bool = False,
+        collect_stats: bool = False,
     ):
         """Initialize the ``SpeosClient`` object."""
         self._closed = False
@@ -212,9 +260,28 @@ class SpeosClient:
             self._channel = channel
         else:
             self._channel = default_local_channel()
+            if channel_factory is None:
+                channel_factory = functools.partial(
+                    default_local_channel, grpc_options=[DEDICATED_CONNECTION_OPTION]
+                )
+        if (bulk_channels > 0 or control_channel) and channel_factory is None:
+            raise ValueError(
+                "A channel_factory is required to open bulk or control channels "
+                "next to a given channel."
+            )
+        self._stats = GrpcStats() if collect_stats else None
+        self._channel = intercept_channel(self._channel, self._stats)
+        self._bulk_channels = [
+            intercept_channel(channel_factory(), self._stats) for _ in range(bulk_channels)
+        ]
+        self._bulk_counter = itertools.count()
+        self._control_channel = (
+            intercept_channel(channel_factory(), self._stats) if control_channel else self._channel
+        )
 
         # do not finish initialization until channel is healthy
-        wait_until_healthy(self._channel, timeout)
+        for c in self.channels:
+            wait_until_healthy(c, timeout)
 
         try:
             if SERVER_INFO_API:
@@ -249,12 +316,72 @@ class SpeosClient:
         self._sceneDB = None
         self._jobDB = None
         self._maps = None
+        self._preloaded_links = {}
 
     @property
     def channel(self) -> grpc.Channel:
         """The gRPC channel of this client."""
         return self._channel
 
+    @property
+    def control_channel(self) -> grpc.Channel:
+        """The gRPC channel used for job control, the main channel if not dedicated."""
+        return self._control_channel
+
+    @property
+    def channels(self) -> List[grpc.Channel]:
+        """All gRPC channels of this client: main channel, control channel, bulk channels."""
+        channels = [self._channel]
+        if self._control_channel is not self._channel:
+            channels.append(self._control_channel)
+        return channels + self._bulk_channels
+
+    def stats(self, output_format: str = "dict") -> Union[dict, str]:
+        """Get the statistics of the gRPC calls made by this client.
+
+        Parameters
+        ----------
+        output_format : str
+            ``"dict"`` for a dictionary per method, ``"openmetrics"`` for OpenMetrics text or
+            ``"chrome_trace"`` for Chrome trace event JSON.
+            By default, ``"dict"``.
+
+        Returns
+        -------
+        Union[dict, str]
+            Call counts, latency histograms, bytes and chunks sent and received per method.
+
+        Raises
+        ------
+        RuntimeError
+            When the client was created without ``collect_stats``.
+        ValueError
+            When the output format is not supported.
+        """
+        if self._stats is None:
+            raise RuntimeError("gRPC statistics are only collected with collect_stats=True.")
+        match output_format:
+            case "dict":
+                return self._stats.to_dict()
+            case "openmetrics":
+                return self._stats.to_openmetrics()
+            case "chrome_trace":
+                return self._stats.to_chrome_trace()
+            case _:
+                raise ValueError(f"Unsupported statistics format: {output_format}")
+
+    def bulk_channel(self) -> grpc.Channel:
+        """Get a gRPC channel for bulk streaming, bulk channels are handed out in turn.
+
+        Returns
+        -------
+        grpc.Channel
+            Next bulk channel, or the main channel when the client has no bulk channel.
+        """
+        if not self._bulk_channels:
+            return self._channel
+        return self._bulk_channels[next(self._bulk_counter) % len(self._bulk_channels)]
+
     @property
     def log(self) -> PySpeosCustomAdapter:
         """The specific instance logger."""
@@ -275,14 +402,14 @@ class SpeosClient:
         """Get the target of the channel."""
         if self._closed:
             return ""
-        return self._channel._channel.target().decode()
+        return channel_target(self._channel)
 
     def faces(self) -> FaceStub:
         """Get face database access."""
         self.__closed_error()
         # connect to database
         if self._faceDB is None:
-            self._faceDB = FaceStub(self._channel)
+            self._faceDB = FaceStub(self._channel, bulk_channels=self._bulk_channels)
         return self._faceDB
 
     def bodies(self) -> BodyStub:
@@ -370,7 +497,7 @@ class SpeosClient:
         self.__closed_error()
         # connect to database
         if self._jobDB is None:
-            self._jobDB = JobStub(self._channel)
+            self._jobDB = JobStub(self._control_channel)
         return self._jobDB
 
     def maps(self) -> MapStub:
@@ -428,6 +555,10 @@ None]
             Link object corresponding to the key - None if no objects corresponds to the key.
         """
         self.__closed_error()
+        if not key:
+            return None
+        if key in self._preloaded_links:
+            return self._preloaded_links[key]
         for sop in self.sop_templates().list():
             if sop.key == key:
                 return sop
@@ -509,6 +640,9 @@ List[ansys.speos.core.kernel.face.FaceLink]]
             keys.
         """
         self.__closed_error()
+        preloaded = [self._preloaded_links.get(k) for k in keys]
+        if keys and all(isinstance(link, item_type) for link in preloaded):
+            return preloaded
 
         if item_type == SOPTemplateLink:
             return [x for x in self.sop_templates().list() if x.key in keys]
@@ -539,6 +673,32 @@ List[ansys.speos.core.kernel.face.FaceLink]]
             return [FaceLink(self.faces(), key=k) for k in keys if k in guids]
         return []
 
+    @contextmanager
+    def _preloaded(self, items: Mapping[str, Tuple[CrudItem, object]]) -> Iterator[None]:
+        """Answer lookups and reads of known items without requests to the server.
+
+        Inside the context, ``client[key]`` and :meth:`get_items` return the given links and reads
+        of those links return copies of the given read responses. An item changed on server side
+        is read again from the server.
+
+        Parameters
+        ----------
+        items : Mapping[str, Tuple[ansys.speos.core.kernel.crud.CrudItem, object]]
+            Link and read response (for example ``sop_pb2.Read_Response``) per key.
+        """
+        stubs = {id(link.stub): link.stub for link, _ in items.values()}
+        for stub in stubs.values():
+            stub._read_cache = {}
+        for key, (link, response) in items.items():
+            link.stub._read_cache[key] = response
+        self._preloaded_links = {key: link for key, (link, _) in items.items()}
+        try:
+            yield
+        finally:
+            self._preloaded_links = {}
+            for stub in stubs.values():
+                stub._read_cache = None
+
     def __repr__(self) -> str:
         """Represent the client as a string."""
         lines = []
@@ -578,7 +738,8 @@ List[ansys.speos.core.kernel.face.FaceLink]]
             while self.healthy and wait_time < 15:
                 time.sleep(1)
                 wait_time += 1  # takes some seconds to close rpc server
-        self._channel.close()
+        for c in self.channels:
+            c.close()
         self._faceDB = None
         self._bodyDB = None
         self._partDB = None
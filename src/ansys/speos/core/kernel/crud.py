@@ -32,6 +32,21 @@ class CrudStub:
 
     def __init__(self, stub):
         self._stubMngr = stub
+        self._read_cache = None
+
+    def _cached_read(self, guid: str):
+        """Get a copy of a preloaded read response, ``None`` if the entry is not preloaded."""
+        if not self._read_cache or guid not in self._read_cache:
+            return None
+        cached = self._read_cache[guid]
+        response = type(cached)()
+        response.CopyFrom(cached)
+        return response
+
+    def _evict(self, guid: str) -> None:
+        """Forget the preloaded read response of an entry changed on server side."""
+        if self._read_cache:
+            self._read_cache.pop(guid, None)
 
     def create(self, request):
         """Create a new entry."""
@@ -39,14 +54,19 @@ class CrudStub:
 
     def read(self, request):
         """Get an existing entry."""
+        cached = self._cached_read(request.guid)
+        if cached is not None:
+            return cached
         return self._stubMngr.Read(request)
 
     def update(self, request):
         """Change an existing entry."""
+        self._evict(request.guid)
         self._stubMngr.Update(request)
 
     def delete(self, request):
         """Remove an existing entry."""
+        self._evict(request.guid)
         self._stubMngr.Delete(request)
 
     def list(self, request):
@@ -22,6 +22,7 @@
 
 """Provides a wrapped abstraction of the gRPC proto API definition and stubs."""
 
+import itertools
 from typing import Iterator, List
 
 from ansys.api.speos.part.v1 import (
@@ -90,6 +91,9 @@ class FaceStub(CrudStub):
     ----------
     channel : grpc.Channel
         Channel to use for the stub.
+    bulk_channels : List[grpc.Channel], optional
+        Channels used in turn for Upload and Download streams.
+        By default, ``None``, streams go through ``channel``.
 
     Examples
     --------
@@ -102,11 +106,19 @@ class FaceStub(CrudStub):
 
     """
 
-    def __init__(self, channel):
+    def __init__(self, channel, bulk_channels=None):
         super().__init__(stub=service.FacesManagerStub(channel=channel))
         self._actions_stub = service.FaceActionsStub(channel=channel)
+        self._transfer_stubs = [
+            service.FaceActionsStub(channel=c) for c in bulk_channels or []
+        ] or [self._actions_stub]
+        self._transfer_counter = itertools.count()
         self._is_batch_available = self._check_if_batch_available()
 
+    def _transfer_stub(self) -> service.FaceActionsStub:
+        """Get the actions stub carrying the next Upload or Download stream."""
+        return self._transfer_stubs[next(self._transfer_counter) % len(self._transfer_stubs)]
+
     def _check_if_batch_available(self) -> bool:
         try:
             for reserve_faces_res in self._actions_stub.ReserveFaces(
@@ -146,7 +158,7 @@ class FaceStub(CrudStub):
         chunk_iterator = FaceStub._faces_to_chunks(
             guids=guids, message_list=message_list, nb_items=128 * 1024
         )
-        self._actions_stub.Upload(chunk_iterator)
+        self._transfer_stub().Upload(chunk_iterator)
 
         return [FaceLink(self, guid) for guid in guids]
 
@@ -168,7 +180,7 @@ class FaceStub(CrudStub):
         chunk_iterator = FaceStub._faces_to_chunks(
             guids=[resp.guid], message_list=[message], nb_items=128 * 1024
         )
-        self._actions_stub.Upload(chunk_iterator)
+        self._transfer_stub().Upload(chunk_iterator)
         return FaceLink(self, resp.guid)
 
     @min_speos_version(25, 2, 0)
@@ -191,7 +203,10 @@ class FaceStub(CrudStub):
         for ref in refs:
             if not ref.stub == self:
                 raise ValueError("FaceLink is not on current database. Key=" + ref.key)
-        chunks = self._actions_stub.Download(
+        cached = [self._cached_read(ref.key) for ref in refs]
+        if refs and all(c is not None for c in cached):
+            return [c.face for c in cached]
+        chunks = self._transfer_stub().Download(
             request=messages.Download_Request(guids=[ref.key for ref in refs])
         )
         return FaceStub._chunks_to_faces(chunks)
@@ -212,7 +227,10 @@ class FaceStub(CrudStub):
         if not ref.stub == self:
             raise ValueError("FaceLink is not on current database. Key=" + ref.key)
 
-        chunks = self._actions_stub.Download(request=messages.Download_Request(guid=ref.key))
+        cached = self._cached_read(ref.key)
+        if cached is not None:
+            return cached.face
+        chunks = self._transfer_stub().Download(request=messages.Download_Request(guid=ref.key))
         return FaceStub._chunks_to_faces(chunks)[0]
 
     @min_speos_version(25, 2, 0)
@@ -233,11 +251,12 @@ class FaceStub(CrudStub):
         for ref in refs:
             if not ref.stub == self:
                 raise ValueError("FaceLink is not on current database")
+            self._evict(ref.key)
 
         chunk_iterator = FaceStub._faces_to_chunks(
             guids=[ref.key for ref in refs], message_list=data, nb_items=128 * 1024
         )
-        self._actions_stub.Upload(chunk_iterator)
+        self._transfer_stub().Upload(chunk_iterator)
 
     def update(self, ref: FaceLink, data: ProtoFace) -> None:
         """Change an existing entry.
@@ -253,10 +272,11 @@ class FaceStub(CrudStub):
         if not ref.stub == self:
             raise ValueError("FaceLink is not on current database")
 
+        self._evict(ref.key)
         chunk_iterator = FaceStub._faces_to_chunks(
             guids=[ref.key], message_list=[data], nb_items=128 * 1024
         )
-        self._actions_stub.Upload(chunk_iterator)
+        self._transfer_stub().Upload(chunk_iterator)
 
     def delete(self, ref: FaceLink) -> None:
         """Remove an existing entry.
@@ -0,0 +1,430 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Collect statistics about the gRPC calls of a client.
+
+Statistics are gathered by :class:`StatsInterceptor`, a client interceptor which is only installed
+on the channels when requested, so that clients without statistics do not pay any overhead.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import collections
+import json
+import os
+import threading
+import time
+from typing import Iterator, Optional
+
+import grpc
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Upper bounds in seconds of the latency histogram buckets."""
+
+
+def channel_target(channel: grpc.Channel) -> str:
+    """Get the target of a channel, looking through interceptors.
+
+    Parameters
+    ----------
+    channel : grpc.Channel
+        Channel, intercepted or not.
+
+    Returns
+    -------
+    str
+        Target of the channel.
+    """
+    inner = channel._channel
+    while not hasattr(inner, "target"):
+        inner = inner._channel
+    return inner.target().decode()
+
+
+def _message_size(message) -> int:
+    try:
+        return message.ByteSize()
+    except AttributeError:
+        return 0
+
+
+class MethodStats:
+    """Statistics of the calls of one gRPC method."""
+
+    __slots__ = (
+        "calls",
+        "errors",
+        "latency_sum",
+        "latency_buckets",
+        "request_bytes",
+        "response_bytes",
+        "request_chunks",
+        "response_chunks",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.request_chunks = 0
+        self.response_chunks = 0
+
+    def to_dict(self) -> dict:
+        """Convert the statistics to a dictionary.
+
+        Returns
+        -------
+        dict
+            Statistics, the latency histogram is given as non cumulative counts per bucket upper
+            bound in seconds.
+        """
+        bounds = [str(b) for b in LATENCY_BUCKETS] + ["+Inf"]
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "latency_sum": self.latency_sum,
+            "latency_mean": self.latency_sum / self.calls if self.calls else 0.0,
+            "latency_histogram": dict(zip(bounds, self.latency_buckets)),
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "request_chunks": self.request_chunks,
+            "response_chunks": self.response_chunks,
+        }
+
+
+class GrpcStats:
+    """Thread safe store of gRPC call statistics.
+
+    Parameters
+    ----------
+    max_trace_events : int
+        Maximum number of calls kept for the Chrome trace export, the oldest are dropped first.
+        By default, ``100000``.
+    """
+
+    def __init__(self, max_trace_events: int = 100000):
+        self._lock = threading.Lock()
+        self._methods = collections.defaultdict(MethodStats)
+        self._trace = collections.deque(maxlen=max_trace_events)
+
+    def record(
+        self,
+        method: str,
+        start: float,
+        duration: float,
+        request_bytes: int,
+        response_bytes: int,
+        request_chunks: int,
+        response_chunks: int,
+        error: bool,
+    ) -> None:
+        """Record one finished call.
+
+        Parameters
+        ----------
+        method : str
+            Full name of the gRPC method.
+        start : float
+            Start time of the call in seconds since epoch.
+        duration : float
+            Duration of the call in seconds.
+        request_bytes : int
+            Serialized size of the request messages.
+        response_bytes : int
+            Serialized size of the response messages.
+        request_chunks : int
+            Number of request messages.
+        response_chunks : int
+            Number of response messages.
+        error : bool
+            Whether the call ended with an error.
+        """
+        with self._lock:
+            stats = self._methods[method]
+            stats.calls += 1
+            stats.errors += error
+            stats.latency_sum += duration
+            stats.latency_buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            stats.request_chunks += request_chunks
+            stats.response_chunks += response_chunks
+            self._trace.append(
+                (method, start, duration, threading.get_ident(), request_bytes, response_bytes)
+            )
+
+    def reset(self) -> None:
+        """Forget all recorded calls."""
+        with self._lock:
+            self._methods.clear()
+            self._trace.clear()
+
+    def to_dict(self) -> dict:
+        """Get the statistics per method.
+
+        Returns
+        -------
+        dict
+            Dictionary of :meth:`MethodStats.to_dict` per full method name.
+        """
+        with self._lock:
+            return {method: stats.to_dict() for method, stats in sorted(self._methods.items())}
+
+    def to_openmetrics(self, prefix: str = "speos_grpc") -> str:
+        """Export the statistics in OpenMetrics text format.
+
+        Parameters
+        ----------
+        prefix : str
+            Prefix of the metric names.
+            By default, ``"speos_grpc"``.
+
+        Returns
+        -------
+        str
+            OpenMetrics exposition, terminated by ``# EOF``.
+        """
+        with self._lock:
+            methods = sorted(self._methods.items())
+        lines = []
+        counters = [
+            ("calls", "Number of calls."),
+            ("errors", "Number of calls ended with an error."),
+            ("request_bytes", "Serialized size of the request messages."),
+            ("response_bytes", "Serialized size of the response messages."),
+            ("request_chunks", "Number of request messages."),
+            ("response_chunks", "Number of response messages."),
+        ]
+        for name, help_text in counters:
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            for method, stats in methods:
+                lines.append(f'{prefix}_{name}_total{{method="{method}"}} {getattr(stats, name)}')
+        name = f"{prefix}_latency_seconds"
+        lines.append(f"# TYPE {name} histogram")
+        lines.append(f"# HELP {name} Duration of the calls.")
+        for method, stats in methods:
+            cumulated = 0
+            for bound, count in zip(
+                [str(b) for b in LATENCY_BUCKETS] + ["+Inf"], stats.latency_buckets
+            ):
+                cumulated += count
+                lines.append(f'{name}_bucket{{method="{method}",le="{bound}"}} {cumulated}')
+            lines.append(f'{name}_sum{{method="{method}"}} {stats.latency_sum}')
+            lines.append(f'{name}_count{{method="{method}"}} {stats.calls}')
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def to_chrome_trace(self) -> str:
+        """Export the recorded calls in Chrome trace event format.
+
+        The result can be loaded in ``chrome://tracing`` or Perfetto.
+
+        Returns
+        -------
+        str
+            JSON document with one complete event per call.
+        """
+        pid = os.getpid()
+        with self._lock:
+            trace = list(self._trace)
+        events = [
+            {
+                "name": method.rsplit("/", 1)[-1],
+                "cat": method.rsplit("/", 1)[0].lstrip("/"),
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": duration * 1e6,
+                "pid": pid,
+                "tid": tid,
+                "args": {"request_bytes": request_bytes, "response_bytes": response_bytes},
+            }
+            for method, start, duration, tid, request_bytes, response_bytes in trace
+        ]
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+
+
+class _CountedRequests:
+    """Request iterator counting the streamed messages."""
+
+    def __init__(self, requests: Iterator = (), chunks: int = 0, size: int = 0):
+        self._requests = iter(requests)
+        self.chunks = chunks
+        self.bytes = size
+
+    @classmethod
+    def unary(cls, request) -> "_CountedRequests":
+        return cls(chunks=1, size=_message_size(request))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        request = next(self._requests)
+        self.chunks += 1
+        self.bytes += _message_size(request)
+        return request
+
+
+class _CountedResponses:
+    """Response stream recording its call when exhausted, other call methods are forwarded.
+
+    Streams that are cancelled or dropped before being exhausted are recorded when cancelled or
+    garbage collected, with the messages read so far.
+    """
+
+    def __init__(self, call, on_done):
+        self._call = call
+        self._on_done = on_done
+        self.chunks = 0
+        self.bytes = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            response = next(self._call)
+        except StopIteration:
+            self._done(False)
+            raise
+        except grpc.RpcError:
+            self._done(True)
+            raise
+        self.chunks += 1
+        self.bytes += _message_size(response)
+        return response
+
+    def _done(self, error: bool) -> None:
+        if self._on_done is not None:
+            self._on_done(self, error)
+            self._on_done = None
+
+    def cancel(self) -> bool:
+        cancelled = self._call.cancel()
+        self._done(True)
+        return cancelled
+
+    def __del__(self):
+        if self._on_done is not None:
+            # Abandoned stream, grpc cancels the call unless it already terminated.
+            self._done(not self._call.done() or self._call.code() != grpc.StatusCode.OK)
+
+    def __getattr__(self, name):
+        return getattr(self._call, name)
+
+
+class StatsInterceptor(
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+    grpc.StreamUnaryClientInterceptor,
+    grpc.StreamStreamClientInterceptor,
+):
+    """Client interceptor recording every call in a :class:`GrpcStats`.
+
+    Parameters
+    ----------
+    stats : ansys.speos.core.kernel.grpc.stats.GrpcStats
+        Store receiving the records.
+    """
+
+    def __init__(self, stats: GrpcStats):
+        self.stats = stats
+
+    def _unary_response(self, continuation, client_call_details, requests, payload):
+        method = client_call_details.method
+        start, t0 = time.time(), time.perf_counter()
+        future = continuation(client_call_details, payload)
+
+        def done(f):
+            duration = time.perf_counter() - t0
+            error = f.exception() is not None
+            response_bytes = 0 if error else _message_size(f.result())
+            self.stats.record(
+                method, start, duration, requests.bytes, response_bytes, requests.chunks, 1, error
+            )
+
+        future.add_done_callback(done)
+        return future
+
+    def _stream_response(self, continuation, client_call_details, requests, payload):
+        method = client_call_details.method
+        start, t0 = time.time(), time.perf_counter()
+        call = continuation(client_call_details, payload)
+
+        def done(responses, error):
+            self.stats.record(
+                method,
+                start,
+                time.perf_counter() - t0,
+                requests.bytes,
+                responses.bytes,
+                requests.chunks,
+                responses.chunks,
+                error,
+            )
+
+        return _CountedResponses(call, done)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Intercept a unary request with unary response."""
+        requests = _CountedRequests.unary(request)
+        return self._unary_response(continuation, client_call_details, requests, request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """Intercept a unary request with streamed response."""
+        requests = _CountedRequests.unary(request)
+        return self._stream_response(continuation, client_call_details, requests, request)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        """Intercept a streamed request with unary response."""
+        requests = _CountedRequests(request_iterator)
+        return self._unary_response(continuation, client_call_details, requests, requests)
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        """Intercept a streamed request with streamed response."""
+        requests = _CountedRequests(request_iterator)
+        return self._stream_response(continuation, client_call_details, requests, requests)
+
+
+def intercept_channel(channel: grpc.Channel, stats: Optional[GrpcStats]) -> grpc.Channel:
+    """Install a :class:`StatsInterceptor` on a channel.
+
+    Parameters
+    ----------
+    channel : grpc.Channel
+        Channel to intercept.
+    stats : ansys.speos.core.kernel.grpc.stats.GrpcStats, optional
+        Store receiving the records. When ``None``, the channel is returned untouched.
+
+    Returns
+    -------
+    grpc.Channel
+        Intercepted channel.
+    """
+    if stats is None:
+        return channel
+    return grpc.intercept_channel(channel, StatsInterceptor(stats))
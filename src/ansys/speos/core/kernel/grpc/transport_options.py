@@ -28,9 +28,20 @@ different transport modes (UDS, mTLS, Insecure) for the FileTransfer Tool.
 
 from dataclasses import dataclass
 import enum
+import os
 from pathlib import Path
+from typing import List, Optional, Tuple
+import weakref
 
-from ansys.tools.common.cyberchannel import create_channel
+from ansys.tools.common import cyberchannel
+import grpc
+
+from ansys.speos.core.kernel.grpc.stats import GrpcStats, intercept_channel
+
+_IS_WINDOWS = os.name == "nt"
+
+_AIO_TARGETS: "weakref.WeakKeyDictionary[grpc.aio.Channel, str]" = weakref.WeakKeyDictionary()
+"""Target of the asyncio channels created from transport options."""
 
 
 class TransportMode(enum.Enum):
@@ -166,6 +177,100 @@ class TransportOptions:
             **self.options._to_cyberchannel_kwargs(),
         }
 
-    def create_channel(self, grpc_options):
-        """Create a gRPC channel based on the transport options."""
-        return create_channel(**self._to_cyberchannel_kwargs(), grpc_options=grpc_options)
+    def create_channel(self, grpc_options, stats: Optional[GrpcStats] = None):
+        """Create a gRPC channel based on the transport options.
+
+        When ``stats`` is given, every call made through the channel is recorded in it.
+        """
+        channel = cyberchannel.create_channel(
+            **self._to_cyberchannel_kwargs(), grpc_options=grpc_options
+        )
+        return intercept_channel(channel, stats)
+
+    def create_aio_channel(self, grpc_options) -> grpc.aio.Channel:
+        """Create an asyncio gRPC channel based on the transport options.
+
+        The channel targets the same server as :meth:`create_channel` but can be awaited from an
+        event loop, see :mod:`ansys.speos.core.aio`. Its target is given by
+        :func:`aio_channel_target`.
+        """
+        target, credentials, options = self._resolve_channel(grpc_options)
+        if credentials is None:
+            channel = grpc.aio.insecure_channel(target, options=options)
+        else:
+            channel = grpc.aio.secure_channel(target, credentials, options=options)
+        _AIO_TARGETS[channel] = target
+        return channel
+
+    def _resolve_channel(
+        self, grpc_options
+    ) -> Tuple[str, Optional[grpc.ChannelCredentials], List[Tuple[str, object]]]:
+        """Resolve the target, credentials and options of a channel as cyberchannel does."""
+        kwargs = self.options._to_cyberchannel_kwargs()
+        options = list(grpc_options) if grpc_options else []
+        # Default authority needed by some gRPC implementations for local connections,
+        # see https://github.com/grpc/grpc/issues/34305
+        authority = ("grpc.default_authority", "localhost")
+        match self.mode:
+            case TransportMode.UDS:
+                if not cyberchannel.is_uds_supported():
+                    raise RuntimeError(
+                        "Unix Domain Sockets are not supported on this platform or gRPC version."
+                    )
+                if kwargs["uds_fullpath"]:
+                    socket = Path(kwargs["uds_fullpath"])
+                else:
+                    if kwargs["uds_service"] is None:
+                        raise ValueError(
+                            "When using UDS transport mode, 'uds_service' must be provided."
+                        )
+                    service = kwargs["uds_service"]
+                    uds_id = kwargs["uds_id"]
+                    socket = cyberchannel.determine_uds_folder(kwargs["uds_dir"]) / (
+                        f"{service}-{uds_id}.sock" if uds_id else f"{service}.sock"
+                    )
+                socket.parent.mkdir(parents=True, exist_ok=True)
+                return f"unix:{socket}", None, [authority, *options]
+            case TransportMode.WNUA:
+                if not _IS_WINDOWS:
+                    raise ValueError(
+                        "Windows Named User Authentication (WNUA) is only supported on Windows."
+                    )
+                if kwargs["host"] not in cyberchannel.LOOPBACK_HOSTS:
+                    raise ValueError("Remote host connections are not supported with WNUA.")
+                return f"{kwargs['host']}:{kwargs['port']}", None, [authority, *options]
+            case TransportMode.INSECURE:
+                return f"{kwargs['host']}:{kwargs['port']}", None, options
+            case TransportMode.MTLS:
+                certs_dir = Path(
+                    kwargs["certs_dir"] or os.environ.get("ANSYS_GRPC_CERTIFICATES") or "certs"
+                )
+                try:
+                    credentials = grpc.ssl_channel_credentials(
+                        root_certificates=(certs_dir / "ca.crt").read_bytes(),
+                        private_key=(certs_dir / "client.key").read_bytes(),
+                        certificate_chain=(certs_dir / "client.crt").read_bytes(),
+                    )
+                except FileNotFoundError as e:
+                    raise FileNotFoundError(
+                        f"Certificate file not found: {e.filename}. Ensure that the certificates "
+                        f"are present in the '{certs_dir}' folder or set the "
+                        "'ANSYS_GRPC_CERTIFICATES' environment variable."
+                    ) from e
+                return f"{kwargs['host']}:{kwargs['port']}", credentials, options
+
+
+def aio_channel_target(channel: grpc.aio.Channel) -> str:
+    """Get the target of an asyncio channel created by :meth:`TransportOptions.create_aio_channel`.
+
+    Parameters
+    ----------
+    channel : grpc.aio.Channel
+        Asyncio channel.
+
+    Returns
+    -------
+    str
+        Target of the channel, ``"unknown"`` for channels created by other means.
+    """
+    return _AIO_TARGETS.get(channel, "unknown")
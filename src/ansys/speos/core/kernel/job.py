@@ -32,7 +32,9 @@ from ansys.api.speos.results.v1.ray_path_pb2 import RayPath
 
 from ansys.speos.core.generic.version_checker import server_version_checker
 from ansys.speos.core.kernel.crud import CrudItem, CrudStub
+from ansys.speos.core.kernel.grpc.stats import channel_target
 from ansys.speos.core.kernel.proto_message_utils import protobuf_message_to_str
+from ansys.speos.core.kernel.ray_path import RayPathArrays
 
 ProtoJob = messages.Job
 """Job protobuf class : ansys.api.speos.job.v2.job_pb2.Job"""
@@ -40,8 +42,7 @@ ProtoJob.__str__ = lambda self: protobuf_message_to_str(self)
 
 
 def _is_uds_channel(channel):
-    target = channel._channel.target().decode()
-    return target.startswith("unix:")
+    return channel_target(channel).startswith("unix:")
 
 
 def _list_files_newer_than(folder, timestamp):
@@ -186,6 +187,18 @@ class JobLink(CrudItem):
         for rp in self._actions_stub.GetRayPaths(messages.GetRayPaths_Request(guid=self.key)):
             yield rp
 
+    def get_ray_path_arrays(self) -> RayPathArrays:
+        """Retrieve ray paths gathered in NumPy arrays.
+
+        Available for interactive simulation.
+
+        Returns
+        -------
+        ansys.speos.core.kernel.ray_path.RayPathArrays
+            Ray paths generated by the interactive simulation.
+        """
+        return RayPathArrays.from_stream(self.get_ray_paths())
+
     def save_file(self, file_path: str | Path) -> None:
         """
         Save job results to a SPEOS file.
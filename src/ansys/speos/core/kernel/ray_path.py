@@ -0,0 +1,211 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides a columnar storage of the ray paths streamed by the server."""
+
+from typing import Iterable, List, Optional
+
+from ansys.api.speos.results.v1.ray_path_pb2 import RayPath
+import numpy as np
+
+
+class RayPathArrays:
+    """Ray paths gathered in NumPy arrays.
+
+    The impacts of all rays are stored one after the other, ``offsets`` gives where the impacts of
+    each ray start (compressed sparse row layout): the impacts of the ray ``i`` are
+    ``impacts[offsets[i]:offsets[i + 1]]``.
+
+    Received ray paths are staged in flat Python lists, and copied by chunks into preallocated
+    NumPy buffers that grow geometrically. Gathering a stream of ray paths so costs a few array
+    copies instead of Python objects per ray.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Number of rays expected, used to preallocate the buffers.
+        By default, ``0``.
+    """
+
+    _CHUNK_SIZE = 4096
+    """Number of rays staged before being copied into the buffers."""
+
+    def __init__(self, capacity: int = 0):
+        capacity = max(int(capacity), 1)
+        self._nb_rays = 0
+        self._nb_impacts = 0
+        self._impacts = np.empty((capacity, 3), dtype=np.float64)
+        self._offsets = np.zeros(capacity + 1, dtype=np.int64)
+        self._last_directions = np.empty((capacity, 3), dtype=np.float64)
+        self._wavelengths = np.empty(capacity, dtype=np.float64)
+        self._colors = np.empty((capacity, 3), dtype=np.uint8)
+        self._has_colors = True
+        self._staged_coordinates: List[float] = []
+        self._staged_nb_coordinates: List[int] = []
+        self._staged_directions: List[float] = []
+        self._staged_wavelengths: List[float] = []
+        self._staged_colors: List[bytes] = []
+
+    @classmethod
+    def from_stream(
+        cls, ray_paths: Iterable[RayPath], capacity: Optional[int] = None
+    ) -> "RayPathArrays":
+        """Gather a stream of ray paths.
+
+        Parameters
+        ----------
+        ray_paths : Iterable[ansys.api.speos.results.v1.ray_path_pb2.RayPath]
+            Ray paths, for example as yielded by
+            :meth:`ansys.speos.core.kernel.job.JobLink.get_ray_paths`.
+        capacity : int, optional
+            Number of rays expected, used to preallocate the buffers.
+            By default, ``None``: buffers grow as rays are received.
+
+        Returns
+        -------
+        ansys.speos.core.kernel.ray_path.RayPathArrays
+            Gathered ray paths.
+        """
+        arrays = cls(capacity=capacity or 0)
+        for ray_path in ray_paths:
+            arrays.append(ray_path)
+        arrays._flush()
+        return arrays
+
+    def append(self, ray_path: RayPath) -> None:
+        """Add a ray path.
+
+        Parameters
+        ----------
+        ray_path : ansys.api.speos.results.v1.ray_path_pb2.RayPath
+            Ray path to add.
+        """
+        coordinates = ray_path.impacts_coordinates
+        if len(coordinates) % 3 != 0:
+            raise ValueError("Impacts coordinates must be given as x, y, z triplets.")
+        self._staged_coordinates.extend(coordinates)
+        self._staged_nb_coordinates.append(len(coordinates))
+        self._staged_directions.extend(ray_path.last_direction)
+        wavelengths = ray_path.wavelengths
+        self._staged_wavelengths.append(wavelengths[0] if wavelengths else np.nan)
+        color = ray_path.colors.values[:3]
+        if len(color) < 3:
+            self._has_colors = False
+            color = bytes(3)
+        self._staged_colors.append(color)
+        if len(self._staged_nb_coordinates) >= self._CHUNK_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        nb_new = len(self._staged_nb_coordinates)
+        if nb_new == 0:
+            return
+        impacts = np.array(self._staged_coordinates, dtype=np.float64).reshape(-1, 3)
+        nb_rays, nb_impacts = self._nb_rays + nb_new, self._nb_impacts + len(impacts)
+        if nb_rays > len(self._wavelengths):
+            capacity = max(nb_rays, 2 * len(self._wavelengths))
+            self._offsets = np.resize(self._offsets, capacity + 1)
+            self._last_directions = np.resize(self._last_directions, (capacity, 3))
+            self._wavelengths = np.resize(self._wavelengths, capacity)
+            self._colors = np.resize(self._colors, (capacity, 3))
+        if nb_impacts > len(self._impacts):
+            self._impacts = np.resize(self._impacts, (max(nb_impacts, 2 * len(self._impacts)), 3))
+
+        self._impacts[self._nb_impacts : nb_impacts] = impacts
+        np.cumsum(
+            np.array(self._staged_nb_coordinates, dtype=np.int64) // 3,
+            out=self._offsets[self._nb_rays + 1 : nb_rays + 1],
+        )
+        self._offsets[self._nb_rays + 1 : nb_rays + 1] += self._nb_impacts
+        self._last_directions[self._nb_rays : nb_rays] = np.reshape(
+            self._staged_directions, (-1, 3)
+        )
+        self._wavelengths[self._nb_rays : nb_rays] = self._staged_wavelengths
+        self._colors[self._nb_rays : nb_rays] = np.frombuffer(
+            b"".join(self._staged_colors), dtype=np.uint8
+        ).reshape(-1, 3)
+        self._nb_rays, self._nb_impacts = nb_rays, nb_impacts
+        for staged in (
+            self._staged_coordinates,
+            self._staged_nb_coordinates,
+            self._staged_directions,
+            self._staged_wavelengths,
+            self._staged_colors,
+        ):
+            staged.clear()
+
+    def __len__(self) -> int:
+        """Return the number of rays."""
+        return self._nb_rays + len(self._staged_nb_coordinates)
+
+    @property
+    def impacts(self) -> np.ndarray:
+        """Impacts of all rays, as an array of shape ``(nb_impacts, 3)``."""
+        self._flush()
+        return self._impacts[: self._nb_impacts]
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Start of the impacts of each ray, as an array of shape ``(nb_rays + 1,)``."""
+        self._flush()
+        return self._offsets[: self._nb_rays + 1]
+
+    @property
+    def nb_impacts(self) -> np.ndarray:
+        """Number of impacts of each ray, as an array of shape ``(nb_rays,)``."""
+        return np.diff(self.offsets)
+
+    @property
+    def last_directions(self) -> np.ndarray:
+        """Last direction of each ray, as an array of shape ``(nb_rays, 3)``."""
+        self._flush()
+        return self._last_directions[: self._nb_rays]
+
+    @property
+    def wavelengths(self) -> np.ndarray:
+        """Wavelength of each ray in nm, ``nan`` when not streamed, shape ``(nb_rays,)``."""
+        self._flush()
+        return self._wavelengths[: self._nb_rays]
+
+    @property
+    def colors(self) -> Optional[np.ndarray]:
+        """RGB color of each ray, shape ``(nb_rays, 3)``, ``None`` when not streamed."""
+        self._flush()
+        if not self._has_colors or self._nb_rays == 0:
+            return None
+        return self._colors[: self._nb_rays]
+
+    def ray_impacts(self, index: int) -> np.ndarray:
+        """Get the impacts of one ray.
+
+        Parameters
+        ----------
+        index : int
+            Index of the ray.
+
+        Returns
+        -------
+        numpy.ndarray
+            Impacts of the ray, as an array of shape ``(nb_impacts, 3)``.
+        """
+        offsets = self.offsets
+        return self.impacts[offsets[index] : offsets[index + 1]]
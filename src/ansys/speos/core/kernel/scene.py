@@ -22,8 +22,9 @@
 
 """Provides a wrapped abstraction of the gRPC proto API definition and stubs."""
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator, List
+from typing import Dict, Iterator, List
 
 from ansys.api.speos.results.v1.ray_path_pb2 import RayPath
 from ansys.api.speos.scene.v2 import (
@@ -33,6 +34,7 @@ from ansys.api.speos.scene.v2 import (
 
 from ansys.speos.core.kernel.crud import CrudItem, CrudStub
 from ansys.speos.core.kernel.proto_message_utils import protobuf_message_to_str
+from ansys.speos.core.kernel.ray_path import RayPathArrays
 from ansys.speos.core.kernel.sop_template import ProtoSOPTemplate, SOPTemplateStub
 
 ProtoScene = messages.Scene
@@ -102,6 +104,31 @@ class SceneLink(CrudItem):
         """Remove datamodel from database."""
         self._stub.delete(self)
 
+    @contextmanager
+    def coalesce_updates(self) -> Iterator["SceneLink"]:
+        """Gather the changes of the scene done in the context into one update.
+
+        Inside the context, :meth:`set` only keeps the new datamodel client side, and :meth:`get`
+        returns the last datamodel set. The last datamodel set is sent to the database when
+        leaving the context, if it differs from the scene last read from the database or sent to
+        it in the context. Scene actions like
+        :meth:`save_file` send the pending changes first, but jobs started in the context see the
+        scene as it was before the context.
+
+        Yields
+        ------
+        ansys.speos.core.kernel.scene.SceneLink
+            This link.
+
+        Examples
+        --------
+        >>> with project.scene_link.coalesce_updates():
+        ...     for sensor in project.sensors:
+        ...         sensor.commit()
+        """
+        with self._stub._coalesce(self):
+            yield self
+
     # Actions
     def load_file(self, file_uri: Path | str, password: str | None = None) -> None:
         """
@@ -115,6 +142,8 @@ class SceneLink(CrudItem):
             Password needed to open the speos lightbox file.
             This is only necessary when the user protects the speos light box with a password.
         """
+        self._stub._evict(self.key)
+        self._stub._pending.pop(self.key, None)
         self._actions_stub.LoadFile(
             messages.LoadFile_Request(guid=self.key, file_uri=str(file_uri), password=password)
         )
@@ -135,6 +164,7 @@ class SceneLink(CrudItem):
         black_boxed: bool, optional
             If ``True``, the speos light box file will be black boxed.
         """
+        self._stub._flush(self.key)
         self._actions_stub.SaveFile(
             messages.SaveFile_Request(
                 guid=self.key, file_uri=str(file_uri), password=password, is_black_boxed=black_boxed
@@ -170,6 +200,7 @@ class SceneLink(CrudItem):
         Iterator[ansys.api.speos.results.v1.ray_path_pb2.RayPath]
             Ray paths generated by the source.
         """
+        self._stub._flush(self.key)
         for rp in self._actions_stub.GetSourceRayPaths(
             messages.GetSourceRayPaths_Request(
                 guid=self.key,
@@ -181,6 +212,45 @@ class SceneLink(CrudItem):
         ):
             yield rp
 
+    def get_source_ray_path_arrays(
+        self,
+        source_path: str,
+        rays_nb: int = 100,
+        raw_data: bool = True,
+        display_data: bool = False,
+    ) -> RayPathArrays:
+        """
+        Retrieve source ray paths gathered in NumPy arrays.
+
+        Parameters
+        ----------
+        source_path : str
+            Path to the source in the Scene : "<source name>" for a specific source in the current
+            scene, or "<sub-scene name>/<source name>" for a specific source in a specific sub
+            scene.
+        rays_nb : int, optional
+            Number of rays generated by the source.
+            By default, ``100``.
+        raw_data: bool, optional
+            If ``True``, get the wavelengths in response stream.
+        display_data: bool, optional
+            If ``True``, get the colors (RGB24 format) in response stream.
+
+        Returns
+        -------
+        ansys.speos.core.kernel.ray_path.RayPathArrays
+            Ray paths generated by the source.
+        """
+        return RayPathArrays.from_stream(
+            self.get_source_ray_paths(
+                source_path=source_path,
+                rays_nb=rays_nb,
+                raw_data=raw_data,
+                display_data=display_data,
+            ),
+            capacity=rays_nb,
+        )
+
 
 class SceneStub(CrudStub):
     """
@@ -205,6 +275,14 @@ class SceneStub(CrudStub):
     def __init__(self, channel):
         super().__init__(stub=service.ScenesManagerStub(channel=channel))
         self._actions_stub = service.SceneActionsStub(channel=channel)
+        self._synced: Dict[str, bytes] = {}
+        """Serialized scene last read from or written to the database, per key of coalesced scenes.
+
+        Other clients can change the scene in database, so it is only trusted within a context.
+        """
+        self._pending: Dict[str, ProtoScene] = {}
+        """Scene set but not yet sent to the database, per key of coalesced scenes."""
+        self._coalescing: Dict[str, int] = {}
         self._is_texture_available = self._check_if_texture_available(channel=channel)
 
     def _check_if_texture_available(self, channel) -> bool:
@@ -272,12 +350,21 @@ class SceneStub(CrudStub):
         """
         if not ref.stub == self:
             raise ValueError("SceneLink is not on current database")
+        if ref.key in self._pending:
+            scene = ProtoScene()
+            scene.CopyFrom(self._pending[ref.key])
+            return scene
         resp = CrudStub.read(self, messages.Read_Request(guid=ref.key))
+        if ref.key in self._coalescing:
+            self._synced[ref.key] = SceneStub._serialize(resp.scene)
         return resp.scene
 
     def update(self, ref: SceneLink, data: ProtoScene):
         """Change an existing entry.
 
+        The update is postponed while the scene changes are coalesced, see
+        :meth:`SceneLink.coalesce_updates`.
+
         Parameters
         ----------
         ref : ansys.speos.core.kernel.scene.SceneLink
@@ -287,8 +374,45 @@ class SceneStub(CrudStub):
         """
         if not ref.stub == self:
             raise ValueError("SceneLink is not on current database")
+        if ref.key in self._coalescing:
+            pending = self._pending.setdefault(ref.key, ProtoScene())
+            pending.CopyFrom(data)
+            return
         CrudStub.update(self, messages.Update_Request(guid=ref.key, scene=data))
 
+    @contextmanager
+    def _coalesce(self, ref: SceneLink) -> Iterator[None]:
+        """Postpone the updates of a scene until the outermost context is left."""
+        self._coalescing[ref.key] = self._coalescing.get(ref.key, 0) + 1
+        try:
+            yield
+        finally:
+            self._coalescing[ref.key] -= 1
+            if self._coalescing[ref.key] == 0:
+                try:
+                    self._flush(ref.key)
+                finally:
+                    del self._coalescing[ref.key]
+                    self._synced.pop(ref.key, None)
+
+    def _flush(self, key: str) -> None:
+        """Send the pending changes of a coalesced scene, unless the database already holds them."""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        serialized = SceneStub._serialize(pending)
+        if self._synced.get(key) != serialized:
+            CrudStub.update(self, messages.Update_Request(guid=key, scene=pending))
+            self._synced[key] = serialized
+
+    def _evict(self, guid: str) -> None:
+        super()._evict(guid)
+        self._synced.pop(guid, None)
+
+    @staticmethod
+    def _serialize(data: ProtoScene) -> bytes:
+        return data.SerializeToString(deterministic=True)
+
     def delete(self, ref: SceneLink) -> None:
         """Remove an existing entry.
 
@@ -299,6 +423,7 @@ class SceneStub(CrudStub):
         """
         if not ref.stub == self:
             raise ValueError("SceneLink is not on current database")
+        self._pending.pop(ref.key, None)
         CrudStub.delete(self, messages.Delete_Request(guid=ref.key))
 
     def list(self) -> List[SceneLink]:
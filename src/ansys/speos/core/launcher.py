@@ -22,17 +22,23 @@
 
 """Module to start Speos RPC Server."""
 
+from contextlib import contextmanager
 import os
 from pathlib import Path
+import queue
 import subprocess  # nosec B404
 import tempfile
-from typing import Optional, Union
+import threading
+import time
+from typing import Iterator, List, Optional, Tuple, Union
 import warnings
 
 from ansys.tools.common.path import get_available_ansys_installations
+import grpc
 
 from ansys.speos.core import LOG as LOGGER
 from ansys.speos.core.generic.constants import (
+    DEFAULT_HOST,
     DEFAULT_PORT,
     DEFAULT_VERSION,
     MAX_CLIENT_MESSAGE_SIZE,
@@ -40,7 +46,11 @@ from ansys.speos.core.generic.constants import (
     MIN_SUPPORTED_VERSION,
 )
 from ansys.speos.core.generic.general_methods import retrieve_speos_install_dir
-from ansys.speos.core.kernel.client import default_local_channel
+from ansys.speos.core.kernel.client import (
+    SpeosClient,
+    default_docker_channel,
+    default_local_channel,
+)
 from ansys.speos.core.speos import Speos
 
 try:
@@ -258,6 +268,52 @@ def launch_local_speos_rpc_server(
             except (ValueError, TypeError):
                 raise ValueError(f"The '{name}' value is not a valid integer.")
 
+    _, speos_rpc_path, logfile = _start_local_speos_rpc_server(
+        version=version,
+        port=port,
+        server_message_size=server_message_size,
+        logfile_loc=logfile_loc,
+        speos_rpc_path=speos_rpc_path,
+        use_insecure=use_insecure,
+    )
+    return Speos(
+        channel=default_local_channel(port=port, message_size=client_message_size),
+        logging_level=log_level,
+        logging_file=logfile,
+        speos_install_path=speos_rpc_path,
+    )
+
+
+def _start_local_speos_rpc_server(
+    version: Optional[Union[str, int]],
+    port: Union[str, int],
+    server_message_size: int,
+    logfile_loc: Optional[str],
+    speos_rpc_path: Optional[Union[Path, str]],
+    use_insecure: bool,
+) -> Tuple[subprocess.Popen, Path, Path]:
+    """Start a Speos RPC server process without waiting for it to be healthy.
+
+    Parameters
+    ----------
+    version : Optional[Union[str, int]]
+        Requested Ansys version, *None* for automatic discovery.
+    port : Union[str, int]
+        Port number where the server is running.
+    server_message_size : int
+        Maximum message length value accepted by the Speos RPC server.
+    logfile_loc : Optional[str]
+        Location for the logfile to be created in.
+    speos_rpc_path : Optional[Union[str, Path]]
+        Explicit path to the Speos RPC executable or its parent directory.
+    use_insecure : bool
+        Whether to use insecure transport mode for the Speos RPC server.
+
+    Returns
+    -------
+    Tuple[subprocess.Popen, Path, Path]
+        Server process, resolved installation directory and server log file.
+    """
     # --- resolve installation path ----------------------------------------
     speos_rpc_path = _resolve_speos_rpc_version_path(version, speos_rpc_path)
 
@@ -294,10 +350,360 @@ def launch_local_speos_rpc_server(
     out, _ = tempfile.mkstemp(suffix="speos_out.txt", dir=logfile_loc)
     err, _ = tempfile.mkstemp(suffix="speos_err.txt", dir=logfile_loc)
 
-    subprocess.Popen(command, stdout=out, stderr=err)  # nosec B603
-    return Speos(
-        channel=default_local_channel(port=port, message_size=client_message_size),
-        logging_level=log_level,
-        logging_file=logfile,
-        speos_install_path=speos_rpc_path,
-    )
+    process = subprocess.Popen(command, stdout=out, stderr=err)  # nosec B603
+    return process, speos_rpc_path, logfile
+
+
+def _clear_databases(client: SpeosClient) -> None:
+    """Delete every item stored on the server, dependent items first."""
+    for stub in (
+        client.jobs(),
+        client.scenes(),
+        client.simulation_templates(),
+        client.sensor_templates(),
+        client.source_templates(),
+        client.intensity_templates(),
+        client.spectrums(),
+        client.sop_templates(),
+        client.vop_templates(),
+        client.parts(),
+        client.bodies(),
+        client.faces(),
+    ):
+        for link in stub.list():
+            link.delete()
+
+
+class _PooledServer:
+    """Book-keeping of one server process owned by :class:`SpeosServerPool`."""
+
+    def __init__(self, port: int):
+        self.port = port
+        self.process: Optional[subprocess.Popen] = None
+        self.speos: Optional[Speos] = None
+        self.logfile: Optional[Path] = None
+        self.spawn_time: Optional[float] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+
+class SpeosServerPool:
+    """Pool of warm Speos RPC servers started locally on consecutive ports.
+
+    Starting a Speos RPC server takes seconds, leasing a session from the pool only takes the time
+    needed to check its health. Server state is reset between leases by clearing all its databases,
+    and a server whose process died is started again before being handed out.
+
+    .. warning::
+
+        Do not execute this class with untrusted function argument or environment
+        variables.
+        See the :ref:`security guide<ref_security_consideration>` for details.
+
+    Parameters
+    ----------
+    size : int
+        Number of servers kept running.
+        By default, ``2``.
+    version : Union[str, int], optional
+        The Speos server version to run, in the 3 digits format, such as "261".
+        If unspecified, resolved as in :func:`launch_local_speos_rpc_server`.
+    start_port : Union[str, int], optional
+        Port of the first server, the following ones use the next ports.
+        By default, ``ansys.speos.core.kernel.client.DEFAULT_PORT``.
+    server_message_size : int
+        Maximum message length value accepted by the Speos RPC servers.
+        By default, value stored in environment variable SPEOS_MAX_MESSAGE_LENGTH or 268 435 456.
+    client_message_size : int
+        Maximum message size of the session channels.
+        By default, ``MAX_CLIENT_MESSAGE_SIZE``.
+    logfile_loc : str, optional
+        Directory where one log sub directory per server port is created.
+        When *None*, defaults to the system temp directory.
+    log_level : int
+        The logging level to be applied to the sessions.
+        By default, ``logging.WARNING`` = 20.
+    speos_rpc_path : Optional[Union[str, Path]]
+        Explicit path to the Speos RPC executable or its parent directory.
+        When *None* or empty the function performs automatic discovery.
+    use_insecure : bool
+        Whether to use insecure transport mode for the Speos RPC servers.
+        By default, ``False``.
+    timeout : int
+        Timeout in seconds for a server to become healthy.
+        By default, ``60``.
+
+    Examples
+    --------
+    >>> from ansys.speos.core.launcher import SpeosServerPool
+    >>> with SpeosServerPool(size=4) as pool:
+    ...     with pool.session() as speos:
+    ...         p = Project(speos=speos, path="my_file.speos")
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        version: Optional[Union[str, int]] = None,
+        start_port: Union[str, int] = DEFAULT_PORT,
+        server_message_size: int = MAX_SERVER_MESSAGE_LENGTH,
+        client_message_size: int = MAX_CLIENT_MESSAGE_SIZE,
+        logfile_loc: Optional[str] = None,
+        log_level: int = 20,
+        speos_rpc_path: Optional[Union[Path, str]] = None,
+        use_insecure: bool = False,
+        timeout: int = 60,
+    ):
+        if int(size) < 1:
+            raise ValueError("The pool size must be at least 1.")
+        for name, value in [
+            ("version", version),
+            ("start_port", start_port),
+            ("server_message_size", server_message_size),
+            ("client_message_size", client_message_size),
+        ]:
+            if value is not None:
+                try:
+                    int(value)
+                except (ValueError, TypeError):
+                    raise ValueError(f"The '{name}' value is not a valid integer.")
+
+        self._version = version
+        self._server_message_size = server_message_size
+        self._client_message_size = client_message_size
+        self._log_root = (
+            Path(logfile_loc) if logfile_loc else Path(tempfile.gettempdir()) / ".ansys"
+        )
+        self._log_level = log_level
+        self._speos_rpc_path = _resolve_speos_rpc_version_path(version, speos_rpc_path)
+        self._use_insecure = use_insecure
+        self._timeout = timeout
+
+        self._servers = [_PooledServer(int(start_port) + i) for i in range(int(size))]
+        self._idle = queue.Queue()
+        self._leased = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._startup_times = []
+        self._lease_wait_times = []
+        self._reset_times = []
+        self._recycle_count = 0
+
+        try:
+            for server in self._servers:
+                self._spawn(server)
+            for server in self._servers:
+                self._connect(server)
+                self._idle.put(server)
+        except Exception:
+            self.close()
+            raise
+
+    def _spawn(self, server: _PooledServer) -> None:
+        server.speos = None
+        log_dir = self._log_root / f"speos_rpc_{server.port}"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        server.process, _, server.logfile = _start_local_speos_rpc_server(
+            version=self._version,
+            port=server.port,
+            server_message_size=self._server_message_size,
+            logfile_loc=str(log_dir),
+            speos_rpc_path=self._speos_rpc_path,
+            use_insecure=self._use_insecure,
+        )
+        server.spawn_time = time.perf_counter()
+
+    def _connect(self, server: _PooledServer) -> None:
+        if self._use_insecure:
+            channel = default_docker_channel(
+                host=DEFAULT_HOST, port=server.port, message_size=self._client_message_size
+            )
+        else:
+            channel = default_local_channel(
+                port=server.port, message_size=self._client_message_size
+            )
+        # No speos_install_path: closing a leased session must not stop the pooled server.
+        server.speos = Speos(
+            channel=channel,
+            timeout=self._timeout,
+            logging_level=self._log_level,
+            logging_file=server.logfile,
+        )
+        if server.spawn_time is not None:
+            # Only the first connection after a spawn measures the server startup.
+            with self._lock:
+                self._startup_times.append(time.perf_counter() - server.spawn_time)
+            server.spawn_time = None
+
+    def _stop(self, server: _PooledServer) -> None:
+        if server.speos is not None and not server.speos.client._closed:
+            # Only closes the channels: pooled sessions have no install path to stop the server.
+            server.speos.close()
+        server.speos = None
+        if server.alive:
+            server.process.terminate()
+            try:
+                server.process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                server.process.kill()
+        server.process = None
+
+    def _recycle(self, server: _PooledServer) -> None:
+        LOGGER.warning(f"Speos RPC server on port {server.port} is not responding, restarting it.")
+        self._stop(server)
+        self._spawn(server)
+        self._connect(server)
+        self._recycle_count += 1
+
+    def _ensure_ready(self, server: _PooledServer) -> None:
+        if not server.alive:
+            self._recycle(server)
+        elif server.speos is None or server.speos.client._closed:
+            # Session closed by its previous user, the server itself is still warm.
+            self._connect(server)
+        elif not server.speos.client.healthy:
+            self._recycle(server)
+
+    @property
+    def size(self) -> int:
+        """Number of servers in the pool."""
+        return len(self._servers)
+
+    @property
+    def ports(self) -> List[int]:
+        """Ports of the pooled servers."""
+        return [server.port for server in self._servers]
+
+    def lease(self, timeout: Optional[float] = None) -> Speos:
+        """Take a session on an idle server of the pool.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time in seconds to wait for an idle server.
+            By default, ``None``, waits until one is released.
+
+        Returns
+        -------
+        ansys.speos.core.speos.Speos
+            Session connected to a server with empty databases.
+
+        Raises
+        ------
+        TimeoutError
+            When no server was released within ``timeout``.
+        """
+        if self._closed:
+            raise ConnectionAbortedError("The Speos server pool is closed.")
+        t_start = time.perf_counter()
+        try:
+            server = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No idle Speos RPC server within {timeout} seconds.")
+        try:
+            self._ensure_ready(server)
+        except Exception:
+            self._idle.put(server)
+            raise
+        with self._lock:
+            self._leased[id(server.speos)] = server
+            self._lease_wait_times.append(time.perf_counter() - t_start)
+        return server.speos
+
+    def release(self, speos: Speos) -> None:
+        """Give a leased session back to the pool.
+
+        The server databases are cleared so that the next lease starts from an empty state,
+        reconnecting first when the session was closed. A server that cannot be cleared is
+        restarted.
+
+        Parameters
+        ----------
+        speos : ansys.speos.core.speos.Speos
+            Session returned by :meth:`lease`.
+        """
+        with self._lock:
+            server = self._leased.pop(id(speos), None)
+        if server is None:
+            raise ValueError("This Speos session was not leased from this pool.")
+        if self._closed:
+            self._stop(server)
+            return
+        t_start = time.perf_counter()
+        try:
+            if server.alive:
+                if server.speos is None or server.speos.client._closed:
+                    # Session closed by its user, the server still holds its data.
+                    self._connect(server)
+                _clear_databases(server.speos.client)
+                with self._lock:
+                    self._reset_times.append(time.perf_counter() - t_start)
+        except (grpc.RpcError, TimeoutError):
+            # Next lease restarts it, the server is not usable as is.
+            self._stop(server)
+        self._idle.put(server)
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[Speos]:
+        """Lease a session for the duration of a ``with`` block.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time in seconds to wait for an idle server.
+            By default, ``None``, waits until one is released.
+
+        Yields
+        ------
+        ansys.speos.core.speos.Speos
+            Session connected to a server with empty databases.
+        """
+        speos = self.lease(timeout=timeout)
+        try:
+            yield speos
+        finally:
+            self.release(speos)
+
+    def metrics(self) -> dict:
+        """Get latency metrics of the pool.
+
+        Returns
+        -------
+        dict
+            Number of servers, idle servers and recycled servers, with count, mean and max
+            in seconds of server startups, lease waits and database resets.
+        """
+
+        def summary(values: List[float]) -> dict:
+            return {
+                "count": len(values),
+                "mean": sum(values) / len(values) if values else 0.0,
+                "max": max(values, default=0.0),
+            }
+
+        with self._lock:
+            return {
+                "size": self.size,
+                "idle": self._idle.qsize(),
+                "recycled": self._recycle_count,
+                "startup": summary(self._startup_times),
+                "lease_wait": summary(self._lease_wait_times),
+                "reset": summary(self._reset_times),
+            }
+
+    def close(self) -> None:
+        """Stop all servers of the pool."""
+        self._closed = True
+        for server in self._servers:
+            self._stop(server)
+
+    def __enter__(self) -> "SpeosServerPool":
+        """Enter the pool context."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop all servers when leaving the pool context."""
+        self.close()
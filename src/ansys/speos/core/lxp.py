@@ -28,23 +28,22 @@ LPF files contain a set of simulated rays with all their intersections and prope
 
 from __future__ import annotations
 
+from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Sequence, Tuple, Union
 
 import ansys.api.speos.lpf.v2.lpf_file_reader_pb2 as lpf_file_reader__v2__pb2
 import ansys.api.speos.lpf.v2.lpf_file_reader_pb2_grpc as lpf_file_reader__v2__pb2_grpc
+import numpy as np
 
 from ansys.speos.core.generic.general_methods import graphics_required, wavelength_to_rgb
+from ansys.speos.core.generic.visualization_methods import _ray_line_set_arrays
 from ansys.speos.core.project import Project, Speos
 
 if TYPE_CHECKING:  # pragma: no cover
     from ansys.tools.visualization_interface import Plotter
-try:
-    from ansys.speos.core.generic.general_methods import run_if_graphics_required
 
-    run_if_graphics_required(warning=True)
-except ImportError as err:  # pragma: no cover
-    raise err
+    from ansys.speos.core.geometry_index import GeometryIndex
 
 ERROR_IDS = [7, 8, 9, 10, 11, 12, 13, 14, 15]
 """Intersection types indicating an error state."""
@@ -52,10 +51,410 @@ ERROR_IDS = [7, 8, 9, 10, 11, 12, 13, 14, 15]
 NO_ERROR_IDS = [0, 1, 2, 3, 4, 5, 6, 16, -7, -6, -5, -5, -4, -3, -2, -1]
 """Intersection types indicating a correct ray state."""
 
+SAMPLING_MODES = ["first", "random", "wavelength", "face", "status"]
+"""Ways to select the rays shown by :meth:`LightPathFinder.preview`.
+
+- ``"first"``: rays in file order.
+- ``"random"``: uniformly drawn rays.
+- ``"wavelength"``: rays stratified by 10 nm wavelength bands.
+- ``"face"``: rays stratified by the face of their last impact.
+- ``"status"``: rays stratified by their last intersection type, so that rare states like errors
+  are shown.
+"""
+
+WAVELENGTH_BAND = 10.0
+"""Width in nm of the wavelength bands used by the ``"wavelength"`` sampling."""
+
+
+def _stratified_order(strata: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Order items so that any prefix draws evenly from each stratum.
+
+    Items are shuffled within their stratum, then taken round-robin: the first item of each
+    stratum, then the second one, and so on. Strata are visited in random order in each round.
+
+    Parameters
+    ----------
+    strata : numpy.ndarray
+        Stratum of each item.
+    rng : numpy.random.Generator
+        Random generator.
+
+    Returns
+    -------
+    numpy.ndarray
+        Indices of the items, in sampling order.
+    """
+    shuffled = rng.permutation(len(strata))
+    by_stratum = shuffled[np.argsort(strata[shuffled], kind="stable")]
+    sorted_strata = strata[by_stratum]
+    starts = np.flatnonzero(np.r_[True, sorted_strata[1:] != sorted_strata[:-1]])
+    sizes = np.diff(np.r_[starts, len(strata)])
+    rank = np.arange(len(strata)) - np.repeat(starts, sizes)
+    stratum_order = np.repeat(rng.permutation(len(starts)), sizes)
+    return by_stratum[np.lexsort((stratum_order, rank))]
+
+
+def _sample_rays(
+    rays: List[RayPath],
+    nb_ray: int,
+    sampling: str = "first",
+    max_primitives: Optional[int] = None,
+    max_ray_length: float = 50.0,
+    seed: Optional[int] = None,
+) -> List[int]:
+    """Select the rays to preview.
+
+    Parameters
+    ----------
+    rays : List[ansys.speos.core.lxp.RayPath]
+        Candidate rays.
+    nb_ray : int
+        Maximum number of rays selected.
+    sampling : str
+        One of :data:`SAMPLING_MODES`.
+        By default, ``"first"``.
+    max_primitives : Optional[int]
+        Maximum number of line segments of the selected rays, ``None`` for no limit.
+        By default, ``None``.
+    max_ray_length : float
+        Length of last ray, a last segment is only drawn when it is positive.
+        By default, ``50.0``.
+    seed : Optional[int]
+        Seed of the random generator.
+        By default, ``None``.
+
+    Returns
+    -------
+    List[int]
+        Indices of the selected rays, in increasing order.
+    """
+    if sampling not in SAMPLING_MODES:
+        raise ValueError(f"Unknown sampling {sampling!r}, expected one of {SAMPLING_MODES}.")
+    columns, indices = _ray_columns(rays)
+    nb_rays = len(rays)
+    rng = np.random.default_rng(seed)
+    if sampling == "first":
+        order = np.arange(nb_rays)
+    elif sampling == "random":
+        order = rng.permutation(nb_rays)
+    else:
+        if sampling == "wavelength":
+            strata = np.floor(columns.wavelengths[indices] / WAVELENGTH_BAND)
+        elif sampling == "face":
+            strata = columns.last_values(columns.face_ids, columns.face_offsets, indices, -1)
+        else:
+            strata = columns.last_values(
+                columns.intersection_types, columns.type_offsets, indices, 0
+            )
+        order = _stratified_order(strata, rng)
+    order = order[: max(nb_ray, 0)]
+
+    if max_primitives is not None:
+        last_types = columns.last_values(
+            columns.intersection_types, columns.type_offsets, indices[order], 0
+        )
+        nb_segments = np.maximum(columns.nb_impacts[indices[order]] - 1, 0) + (
+            (max_ray_length > 0) & ~((7 <= last_types) & (last_types <= 15))
+        )
+        order = order[: np.searchsorted(np.cumsum(nb_segments), max_primitives, side="right")]
+    return np.sort(order).tolist()
+
+
+class _RayPathColumns:
+    """Ray paths of an LPF file, stored column by column in typed arrays.
+
+    Per impact values of all rays are stored one after the other, with offsets giving where the
+    values of each ray start (compressed sparse row layout): the impacts of the ray ``i`` are
+    ``impacts[offsets[i]:offsets[i + 1]]``, its face ids are
+    ``face_ids[face_offsets[i]:face_offsets[i + 1]]``, and so on. Id and type columns with as many
+    values as impacts for every ray share the impact ``offsets``. Sensor contributions are stored
+    in the same way, with ``contribution_offsets``.
+
+    Values keep the precision of the LPF messages: impacts and directions are single precision
+    floats, and ids are unsigned 32 bits integers.
+
+    Parameters
+    ----------
+    sensor_contribution : bool
+        Defines if sensor contributions are stored.
+        By default, ``False``.
+    """
+
+    _CHUNK_SIZE = 4096
+    """Number of rays staged in Python lists before being converted to arrays."""
+
+    _STAGED_TYPES = {
+        "nb_impacts": np.int64,
+        "coordinates": np.float32,
+        "nb_body_ids": np.int64,
+        "body_ids": np.uint32,
+        "nb_face_ids": np.int64,
+        "face_ids": np.uint32,
+        "nb_types": np.int64,
+        "intersection_types": np.int8,
+        "wavelengths": np.float64,
+        "last_directions": np.float32,
+        "nb_contributions": np.int64,
+        "sensor_ids": np.uint32,
+        "positions": np.float64,
+    }
+    """Type of the arrays each staged list is converted to."""
+
+    def __init__(self, sensor_contribution: bool = False):
+        self.has_sensor_contributions = sensor_contribution
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.impacts = np.empty((0, 3), dtype=np.float32)
+        self.body_offsets = self.offsets
+        self.body_ids = np.empty(0, dtype=np.uint32)
+        self.face_offsets = self.offsets
+        self.face_ids = np.empty(0, dtype=np.uint32)
+        self.type_offsets = self.offsets
+        self.intersection_types = np.empty(0, dtype=np.int8)
+        self.wavelengths = np.empty(0, dtype=np.float64)
+        self.last_directions = np.empty((0, 3), dtype=np.float32)
+        self.contribution_offsets = np.zeros(1, dtype=np.int64)
+        self.contribution_sensor_ids = np.empty(0, dtype=np.uint32)
+        self.contribution_positions = np.empty((0, 2), dtype=np.float64)
+        self._staged = {name: [] for name in self._STAGED_TYPES}
+        self._chunks = []
+
+    @classmethod
+    def from_stream(
+        cls,
+        raypaths: Iterable[lpf_file_reader__v2__pb2.RayPath],
+        sensor_contribution: bool = False,
+    ) -> _RayPathColumns:
+        """Gather a stream of LPF ray paths.
+
+        Parameters
+        ----------
+        raypaths : Iterable[ansys.api.speos.lpf.v2.lpf_file_reader__v2__pb2.RayPath]
+            Ray paths, as read from an LPF file.
+        sensor_contribution : bool
+            Defines if sensor contributions are stored.
+            By default, ``False``.
+
+        Returns
+        -------
+        ansys.speos.core.lxp._RayPathColumns
+            Gathered ray paths.
+        """
+        columns = cls(sensor_contribution)
+        for raypath in raypaths:
+            direction = raypath.lastDirection
+            contributions = raypath.sensor_contributions if sensor_contribution else ()
+            columns._append(
+                coordinates=[
+                    c for impact in raypath.impacts for c in (impact.x, impact.y, impact.z)
+                ],
+                body_ids=raypath.body_context_ids,
+                face_ids=raypath.unique_face_ids,
+                intersection_types=raypath.interaction_statuses,
+                wavelength=raypath.wavelengths[0],
+                last_direction=(direction.x, direction.y, direction.z),
+                sensor_ids=[sc.sensor_id for sc in contributions],
+                positions=[c for sc in contributions for c in (sc.coordinates.x, sc.coordinates.y)],
+            )
+        columns._flush()
+        return columns
+
+    @classmethod
+    def from_rays(cls, rays: Sequence[RayPath]) -> _RayPathColumns:
+        """Gather ray paths stored in different columns.
+
+        Parameters
+        ----------
+        rays : Sequence[ansys.speos.core.lxp.RayPath]
+            Ray paths.
+
+        Returns
+        -------
+        ansys.speos.core.lxp._RayPathColumns
+            Gathered ray paths.
+        """
+        columns = cls(bool(rays) and all(ray.sensor_contribution is not None for ray in rays))
+        for ray in rays:
+            contributions = ray.sensor_contribution or ()
+            columns._append(
+                coordinates=list(chain.from_iterable(ray.impacts)),
+                body_ids=ray.body_ids,
+                face_ids=ray.face_ids,
+                intersection_types=ray.intersection_type,
+                wavelength=ray.wl,
+                last_direction=ray.last_direction,
+                sensor_ids=[sc["sensor_id"] for sc in contributions],
+                positions=list(chain.from_iterable(sc["position"] for sc in contributions)),
+            )
+        columns._flush()
+        return columns
+
+    def _append(
+        self,
+        coordinates: List[float],
+        body_ids: Sequence[int],
+        face_ids: Sequence[int],
+        intersection_types: Sequence[int],
+        wavelength: float,
+        last_direction: Sequence[float],
+        sensor_ids: List[int],
+        positions: List[float],
+    ) -> None:
+        """Stage a ray path, its impact coordinates and contribution positions are given flat."""
+        staged = self._staged
+        staged["nb_impacts"].append(len(coordinates) // 3)
+        staged["coordinates"].extend(coordinates)
+        staged["nb_body_ids"].append(len(body_ids))
+        staged["body_ids"].extend(body_ids)
+        staged["nb_face_ids"].append(len(face_ids))
+        staged["face_ids"].extend(face_ids)
+        staged["nb_types"].append(len(intersection_types))
+        staged["intersection_types"].extend(intersection_types)
+        staged["wavelengths"].append(wavelength)
+        staged["last_directions"].extend(last_direction)
+        staged["nb_contributions"].append(len(sensor_ids))
+        staged["sensor_ids"].extend(sensor_ids)
+        staged["positions"].extend(positions)
+        if len(staged["wavelengths"]) >= self._CHUNK_SIZE:
+            self._convert_staged()
+
+    def _convert_staged(self) -> None:
+        """Convert the staged ray paths to a chunk of arrays."""
+        if not self._staged["wavelengths"]:
+            return
+        self._chunks.append(
+            {
+                name: np.array(values, dtype=self._STAGED_TYPES[name])
+                for name, values in self._staged.items()
+            }
+        )
+        for values in self._staged.values():
+            values.clear()
+
+    def _flush(self) -> None:
+        """Concatenate all converted chunks, once all ray paths are staged."""
+        self._convert_staged()
+        if not self._chunks:
+            return
+        arrays = {
+            name: np.concatenate([chunk[name] for chunk in self._chunks])
+            for name in self._STAGED_TYPES
+        }
+        self._chunks.clear()
+
+        nb_impacts = arrays["nb_impacts"]
+        self.offsets = np.concatenate(([0], np.cumsum(nb_impacts)))
+        self.impacts = arrays["coordinates"].reshape(-1, 3)
+        self.body_offsets = self._column_offsets(arrays["nb_body_ids"], nb_impacts)
+        self.body_ids = arrays["body_ids"]
+        self.face_offsets = self._column_offsets(arrays["nb_face_ids"], nb_impacts)
+        self.face_ids = arrays["face_ids"]
+        self.type_offsets = self._column_offsets(arrays["nb_types"], nb_impacts)
+        self.intersection_types = arrays["intersection_types"]
+        self.wavelengths = arrays["wavelengths"]
+        self.last_directions = arrays["last_directions"].reshape(-1, 3)
+        self.contribution_offsets = np.concatenate(([0], np.cumsum(arrays["nb_contributions"])))
+        self.contribution_sensor_ids = arrays["sensor_ids"]
+        self.contribution_positions = arrays["positions"].reshape(-1, 2)
+
+    def _column_offsets(self, counts: np.ndarray, nb_impacts: np.ndarray) -> np.ndarray:
+        """Offsets of a per impact column, shared with the impacts when possible."""
+        if np.array_equal(counts, nb_impacts):
+            return self.offsets
+        return np.concatenate(([0], np.cumsum(counts)))
+
+    def __len__(self) -> int:
+        """Return the number of rays."""
+        return len(self.wavelengths)
+
+    @property
+    def nb_impacts(self) -> np.ndarray:
+        """Number of impacts of each ray, as an array of shape ``(nb_rays,)``."""
+        return np.diff(self.offsets)
+
+    def impact_rows(self, indices: np.ndarray) -> np.ndarray:
+        """Get the rows of the impacts of some rays.
+
+        Parameters
+        ----------
+        indices : numpy.ndarray
+            Indices of the rays.
+
+        Returns
+        -------
+        numpy.ndarray
+            Rows of the impacts of the rays, one ray after the other.
+        """
+        starts = self.offsets[indices]
+        counts = self.offsets[indices + 1] - starts
+        return np.arange(counts.sum()) + np.repeat(starts - np.cumsum(counts) + counts, counts)
+
+    @staticmethod
+    def last_values(
+        values: np.ndarray, offsets: np.ndarray, indices: np.ndarray, default: int
+    ) -> np.ndarray:
+        """Get the last value of some rays in a per impact column.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Values of the column, like ``face_ids``.
+        offsets : numpy.ndarray
+            Offsets of the column, like ``face_offsets``.
+        indices : numpy.ndarray
+            Indices of the rays.
+        default : int
+            Value of the rays without value in the column.
+
+        Returns
+        -------
+        numpy.ndarray
+            Last value of each ray.
+        """
+        stops = offsets[indices + 1]
+        has_values = stops > offsets[indices]
+        result = np.full(len(indices), default, dtype=np.int64)
+        result[has_values] = values[stops[has_values] - 1]
+        return result
+
+    @staticmethod
+    def any_value(mask: np.ndarray, offsets: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        """Check which rays have at least one value selected by a mask in a per impact column.
+
+        Parameters
+        ----------
+        mask : numpy.ndarray
+            Boolean mask over all values of the column.
+        offsets : numpy.ndarray
+            Offsets of the column.
+        indices : numpy.ndarray
+            Indices of the rays.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean mask over the rays.
+        """
+        selected = np.concatenate(([0], np.cumsum(mask)))
+        return selected[offsets[indices + 1]] > selected[offsets[indices]]
+
+
+def _ray_columns(rays: Sequence[RayPath]) -> Tuple[_RayPathColumns, np.ndarray]:
+    """Get the columns storing some ray paths, and the index of each ray path in them.
+
+    Ray paths read from a same LPF file share their columns, other ray paths are gathered into new
+    columns.
+    """
+    if rays and all(ray._columns is rays[0]._columns for ray in rays):
+        return rays[0]._columns, np.fromiter((ray._index for ray in rays), np.int64, len(rays))
+    return _RayPathColumns.from_rays(rays), np.arange(len(rays))
+
 
 class RayPath:
     """Framework representing a singular ray path.
 
+    Ray paths only refer to a row of typed arrays: ray paths read from a same LPF file share these
+    arrays, and properties build their lists on access.
+
     Parameters
     ----------
     raypath : ansys.api.speos.lpf.v2.lpf_file_reader__v2__pb2.RayPath
@@ -65,32 +464,27 @@ class RayPath:
         By default ``False``.
     """
 
+    __slots__ = ("_columns", "_index")
+
     def __init__(
         self,
         raypath: lpf_file_reader__v2__pb2.RayPath,
         sensor_contribution: bool = False,
     ):
-        self._nb_impacts = len(raypath.impacts)
-        self._impacts = [[inter.x, inter.y, inter.z] for inter in raypath.impacts]
-        self._wl = raypath.wavelengths[0]
-        self._body_ids = [int(i) for i in raypath.body_context_ids]
-        self._face_ids = [int(i) for i in raypath.unique_face_ids]
-        self._last_direction = [
-            raypath.lastDirection.x,
-            raypath.lastDirection.y,
-            raypath.lastDirection.z,
-        ]
-        self._intersection_type = [int(i) for i in raypath.interaction_statuses]
-        if sensor_contribution:
-            self._sensor_contribution = [
-                {
-                    "sensor_id": sc.sensor_id,
-                    "position": [sc.coordinates.x, sc.coordinates.y],
-                }
-                for sc in raypath.sensor_contributions
-            ]
-        else:
-            self._sensor_contribution = None
+        self._columns = _RayPathColumns.from_stream([raypath], sensor_contribution)
+        self._index = 0
+
+    @classmethod
+    def _from_columns(cls, columns: _RayPathColumns, index: int) -> RayPath:
+        """Create the ray path stored at a row of columns."""
+        raypath = cls.__new__(cls)
+        raypath._columns = columns
+        raypath._index = index
+        return raypath
+
+    def _rows(self, offsets: np.ndarray) -> slice:
+        """Rows of the ray in a column of its columns, given the offsets of the column."""
+        return slice(offsets[self._index], offsets[self._index + 1])
 
     @property
     def nb_impacts(self) -> int:
@@ -101,7 +495,8 @@ class RayPath:
         int
             Number of impacts
         """
-        return self._nb_impacts
+        offsets = self._columns.offsets
+        return int(offsets[self._index + 1] - offsets[self._index])
 
     @property
     def impacts(self) -> List[List[float]]:
@@ -112,7 +507,8 @@ class RayPath:
         List[List[float]]
             list containing the impact coordinates [[x0,y0,z0],[x1,y1,z1],...]
         """
-        return self._impacts
+        columns = self._columns
+        return columns.impacts[self._rows(columns.offsets)].tolist()
 
     @property
     def wl(self) -> float:
@@ -123,7 +519,7 @@ class RayPath:
         float
             Wavelength in nm
         """
-        return self._wl
+        return float(self._columns.wavelengths[self._index])
 
     @property
     def body_ids(self) -> List[int]:
@@ -134,7 +530,8 @@ class RayPath:
         List[int]
             List of body IDs for each impact.
         """
-        return self._body_ids
+        columns = self._columns
+        return columns.body_ids[self._rows(columns.body_offsets)].tolist()
 
     @property
     def face_ids(self) -> List[int]:
@@ -145,7 +542,8 @@ class RayPath:
         List[int]
             List of face IDs for each impact.
         """
-        return self._face_ids
+        columns = self._columns
+        return columns.face_ids[self._rows(columns.face_offsets)].tolist()
 
     @property
     def last_direction(self) -> List[float]:
@@ -156,7 +554,7 @@ class RayPath:
         List[float]
             Last direction of the rays as list[x,y,z].
         """
-        return self._last_direction
+        return self._columns.last_directions[self._index].tolist()
 
     @property
     def intersection_type(self) -> List[int]:
@@ -196,7 +594,8 @@ class RayPath:
         - StatusGaussianReflected = -2
         - StatusSpecularReflected = -1
         """
-        return self._intersection_type
+        columns = self._columns
+        return columns.intersection_types[self._rows(columns.type_offsets)].tolist()
 
     @property
     def sensor_contribution(self) -> Union[None, List[dict]]:
@@ -210,7 +609,17 @@ class RayPath:
             {“sensor_id”: sc.sensor_id,
             “position”: [sc.coordinates.x, sc.coordinates.y]}
         """
-        return self._sensor_contribution
+        columns = self._columns
+        if not columns.has_sensor_contributions:
+            return None
+        rows = self._rows(columns.contribution_offsets)
+        return [
+            {"sensor_id": sensor_id, "position": position}
+            for sensor_id, position in zip(
+                columns.contribution_sensor_ids[rows].tolist(),
+                columns.contribution_positions[rows].tolist(),
+            )
+        ]
 
     def get(self, key=""):
         """Retrieve any information from the RayPath object.
@@ -238,6 +647,207 @@ class RayPath:
         return str(self.get())
 
 
+def _in_region(
+    sensor_ids: np.ndarray,
+    positions: np.ndarray,
+    sensor_id: int,
+    x_range: Tuple[float, float],
+    y_range: Tuple[float, float],
+) -> np.ndarray:
+    """Mask the contributions to a sensor located in a rectangular region, bounds included."""
+    x, y = positions[:, 0], positions[:, 1]
+    return (
+        (sensor_ids == sensor_id)
+        & (x_range[0] <= x)
+        & (x <= x_range[1])
+        & (y_range[0] <= y)
+        & (y <= y_range[1])
+    )
+
+
+class SensorContributions:
+    """Sensor contributions of the ray paths of an LPF file, stored in columns.
+
+    Contribution ``i`` is the ray ``ray_indices[i]`` reaching the sensor ``sensor_ids[i]`` at
+    ``(x[i], y[i])``, contributions are sorted by ray. Queries are vectorized over all
+    contributions.
+
+    Parameters
+    ----------
+    columns : ansys.speos.core.lxp._RayPathColumns
+        Columns of the ray paths.
+    sensor_names : List[str]
+        Names of the sensors, indexed by sensor id.
+    """
+
+    def __init__(self, columns: _RayPathColumns, sensor_names: List[str]):
+        self._columns = columns
+        self.sensor_names = list(sensor_names)
+        """Names of the sensors, indexed by sensor id."""
+        self.ray_indices = np.repeat(np.arange(len(columns)), np.diff(columns.contribution_offsets))
+        """Index of the ray of each contribution."""
+        self.sensor_ids = columns.contribution_sensor_ids
+        """Sensor id of each contribution."""
+        self.x = columns.contribution_positions[:, 0]
+        """X coordinate of each contribution on its sensor."""
+        self.y = columns.contribution_positions[:, 1]
+        """Y coordinate of each contribution on its sensor."""
+
+    def __len__(self) -> int:
+        """Return the number of contributions."""
+        return len(self.sensor_ids)
+
+    def counts(self) -> np.ndarray:
+        """Count the contributions to each sensor.
+
+        Returns
+        -------
+        numpy.ndarray
+            Number of contributions per sensor id.
+        """
+        return np.bincount(self.sensor_ids, minlength=len(self.sensor_names))
+
+    def histogram(
+        self,
+        sensor_id: int,
+        bins: Union[int, Tuple[int, int]] = 10,
+        bounds: Optional[Sequence[Tuple[float, float]]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Count the contributions to a sensor in a grid of pixels.
+
+        Pixels follow :func:`numpy.histogram2d`: the last pixel along each axis includes its
+        upper bound, and contributions out of the grid are not counted.
+
+        Parameters
+        ----------
+        sensor_id : int
+            Id of the sensor.
+        bins : Union[int, Tuple[int, int]]
+            Number of pixels along X and Y, or along both.
+            By default, ``10``.
+        bounds : Optional[Sequence[Tuple[float, float]]]
+            X and Y bounds of the grid, as ``[(x_min, x_max), (y_min, y_max)]``.
+            By default, ``None``, which uses the bounds of the contributions.
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            Number of contributions in each pixel with a shape ``(nb_x, nb_y)``, X edges and Y
+            edges of the pixels.
+        """
+        mask = self.sensor_ids == sensor_id
+        coordinates = (self.x[mask], self.y[mask])
+        nb_pixels = (bins, bins) if np.ndim(bins) == 0 else tuple(bins)
+        if bounds is None:
+            bounds = [(c.min(), c.max()) if len(c) else (0.0, 1.0) for c in coordinates]
+
+        pixels = np.zeros(len(coordinates[0]), dtype=np.int64)
+        inside = np.ones(len(coordinates[0]), dtype=bool)
+        edges = []
+        for values, (low, high), nb in zip(coordinates, bounds, nb_pixels):
+            if low == high:
+                low, high = low - 0.5, high + 0.5
+            edges.append(np.linspace(low, high, nb + 1))
+            inside &= (low <= values) & (values <= high)
+            # Values out of the grid give meaningless pixels, they are masked by inside
+            index = ((values - low) * (nb / (high - low))).astype(np.int64)
+            pixels = pixels * nb + np.minimum(index, nb - 1)
+        counts = np.bincount(pixels[inside], minlength=nb_pixels[0] * nb_pixels[1])
+        return counts.reshape(nb_pixels), edges[0], edges[1]
+
+    def in_region(
+        self, sensor_id: int, x_range: Tuple[float, float], y_range: Tuple[float, float]
+    ) -> np.ndarray:
+        """Find the contributions to a sensor in a rectangular region.
+
+        Parameters
+        ----------
+        sensor_id : int
+            Id of the sensor.
+        x_range : Tuple[float, float]
+            X bounds of the region, included.
+        y_range : Tuple[float, float]
+            Y bounds of the region, included.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean mask over the contributions.
+        """
+        return _in_region(
+            self.sensor_ids, self._columns.contribution_positions, sensor_id, x_range, y_range
+        )
+
+    def select_rays(
+        self, sensor_id: int, x_range: Tuple[float, float], y_range: Tuple[float, float]
+    ) -> np.ndarray:
+        """Find the rays contributing to a sensor in a rectangular region.
+
+        Parameters
+        ----------
+        sensor_id : int
+            Id of the sensor.
+        x_range : Tuple[float, float]
+            X bounds of the region, included.
+        y_range : Tuple[float, float]
+            Y bounds of the region, included.
+
+        Returns
+        -------
+        numpy.ndarray
+            Indices of the rays, sorted, each ray once.
+        """
+        ray_indices = self.ray_indices[self.in_region(sensor_id, x_range, y_range)]
+        # Contributions are sorted by ray: rays contributing several times are consecutive
+        return ray_indices[np.r_[True, ray_indices[1:] != ray_indices[:-1]]]
+
+    def face_sensor_matrix(
+        self, impact: int = -1, contributions: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Count the contributions to each sensor by face.
+
+        Each contribution is attributed to the face of one impact of its ray.
+
+        Parameters
+        ----------
+        impact : int
+            Position of the impact in the ray path, negative values count from the last impact.
+            By default, ``-1``, the last impact of the ray.
+        contributions : Optional[numpy.ndarray]
+            Boolean mask or indices of the contributions counted, for example
+            :meth:`in_region`.
+            By default, ``None``, which counts all contributions.
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray]
+            Face ids, sorted, and the number of contributions with a shape
+            ``(nb_faces, nb_sensors)``. Rays with less impacts than ``impact`` are not counted.
+        """
+        ray_indices, sensor_ids = self.ray_indices, self.sensor_ids
+        if contributions is not None:
+            ray_indices, sensor_ids = ray_indices[contributions], sensor_ids[contributions]
+        offsets = self._columns.face_offsets
+        starts, stops = offsets[ray_indices], offsets[ray_indices + 1]
+        rows = (stops if impact < 0 else starts) + impact
+        valid = (starts <= rows) & (rows < stops)
+        nb_sensors = len(self.sensor_names)
+        if len(sensor_ids):
+            nb_sensors = max(nb_sensors, int(sensor_ids.max()) + 1)
+
+        # (face, sensor) pairs are counted by sorting them as single keys, faster than a
+        # factorization of the face ids
+        keys = self._columns.face_ids[rows[valid]].astype(np.uint64) * nb_sensors
+        keys = np.sort(keys + sensor_ids[valid])
+        key_starts = np.flatnonzero(np.r_[len(keys) > 0, keys[1:] != keys[:-1]])
+        counts = np.diff(np.r_[key_starts, len(keys)])
+        keys = keys[key_starts]
+        faces, face_index = np.unique(keys // nb_sensors, return_inverse=True)
+        matrix = np.zeros((len(faces), nb_sensors), dtype=np.int64)
+        matrix[face_index, (keys % nb_sensors).astype(np.int64)] = counts
+        return faces.astype(np.uint32), matrix
+
+
 class LightPathFinder:
     """Define an interface to read LPF files.
 
@@ -255,7 +865,9 @@ class LightPathFinder:
     def __init__(self, speos: Speos, path: str):
         self.client = speos.client
         """Speos instance client"""
-        self._stub = lpf_file_reader__v2__pb2_grpc.LpfFileReader_MonoStub(self.client.channel)
+        self._stub = lpf_file_reader__v2__pb2_grpc.LpfFileReader_MonoStub(
+            self.client.bulk_channel()
+        )
         self.__open(path)
         self._data = self._stub.GetInformation(
             lpf_file_reader__v2__pb2.GetInformation_Request_Mono()
@@ -266,6 +878,7 @@ class LightPathFinder:
         self._sensor_names = self._data.sensor_names
         self._rays = self.__parse_traces()
         self._filtered_rays = []
+        self._sensor_contributions = None
 
     @property
     def nb_traces(self) -> int:
@@ -287,6 +900,15 @@ class LightPathFinder:
         """List of involved sensor names."""
         return self._sensor_names
 
+    @property
+    def sensor_contributions(self) -> Optional[SensorContributions]:
+        """Sensor contributions of all ray paths, ``None`` if the LPF file has none."""
+        if not self._has_sensor_contributions:
+            return None
+        if self._sensor_contributions is None:
+            self._sensor_contributions = SensorContributions(self._columns, self._sensor_names)
+        return self._sensor_contributions
+
     @property
     def rays(self) -> List[RayPath]:
         """List ray paths within LPF file."""
@@ -303,7 +925,7 @@ class LightPathFinder:
             {
                 k: v.fget(self)
                 for k, v in LightPathFinder.__dict__.items()
-                if isinstance(v, property) and "rays" not in k
+                if isinstance(v, property) and "rays" not in k and k != "sensor_contributions"
             }
         )
 
@@ -327,27 +949,38 @@ class LightPathFinder:
             List[script.RayPath]
 
         """
-        raypaths = []
-        for rp in self._stub.Read(lpf_file_reader__v2__pb2.Read_Request_Mono()):
-            raypaths.append(RayPath(rp, self._has_sensor_contributions))
-        return raypaths
+        self._columns = _RayPathColumns.from_stream(
+            self._stub.Read(lpf_file_reader__v2__pb2.Read_Request_Mono()),
+            self._has_sensor_contributions,
+        )
+        return [RayPath._from_columns(self._columns, i) for i in range(len(self._columns))]
+
+    def __filter(self, ray_mask: Callable[[_RayPathColumns, np.ndarray], np.ndarray], new: bool):
+        """Filter ray paths with a mask computed on their columns.
+
+        Populate filtered_rays property.
+        """
+        rays = self._rays if new else self._filtered_rays
+        columns, indices = _ray_columns(rays)
+        self._filtered_rays = [rays[i] for i in np.flatnonzero(ray_mask(columns, indices))]
 
     def __filter_by_last_intersection_types(self, options: List[int], new=True):
         """Filter ray paths based on last intersection types.
 
         Populate filtered_rays property.
         """
-        if new:
-            self._filtered_rays = []
-            for ray in self._rays:
-                if int(ray.intersection_type[-1]) in options:
-                    self._filtered_rays.append(ray)
-        else:
-            temp_rays = self._filtered_rays
-            self._filtered_rays = []
-            for ray in temp_rays:
-                if int(ray.intersection_type[-1]) in options:
-                    self._filtered_rays.append(ray)
+        self.__filter(
+            lambda columns, indices: (
+                (columns.type_offsets[indices + 1] > columns.type_offsets[indices])
+                & np.isin(
+                    columns.last_values(
+                        columns.intersection_types, columns.type_offsets, indices, 0
+                    ),
+                    options,
+                )
+            ),
+            new,
+        )
 
     def filter_by_face_ids(self, options: List[int], new=True) -> LightPathFinder:
         """Filter ray paths based on face IDs and populates filtered_rays property.
@@ -364,17 +997,12 @@ class LightPathFinder:
         ansys.speos.core.lxp.LightPathFinder
             LightPathFinder Instance.
         """
-        if new:
-            self._filtered_rays = []
-            for ray in self._rays:
-                if any([faceid in options for faceid in ray.face_ids]):
-                    self._filtered_rays.append(ray)
-        else:
-            temp_rays = self._filtered_rays
-            self._filtered_rays = []
-            for ray in temp_rays:
-                if any([faceid in options for faceid in ray.face_ids]):
-                    self._filtered_rays.append(ray)
+        self.__filter(
+            lambda columns, indices: columns.any_value(
+                np.isin(columns.face_ids, options), columns.face_offsets, indices
+            ),
+            new,
+        )
         return self
 
     def filter_by_body_ids(self, options: List[int], new=True) -> LightPathFinder:
@@ -392,17 +1020,55 @@ class LightPathFinder:
         ansys.speos.core.lxp.LightPathFinder
             LightPathFinder Instance.
         """
-        if new:
-            self._filtered_rays = []
-            for ray in self._rays:
-                if any([body_id in options for body_id in ray.body_ids]):
-                    self._filtered_rays.append(ray)
-        else:
-            temp_rays = self._filtered_rays
-            self._filtered_rays = []
-            for ray in temp_rays:
-                if any([body_id in options for body_id in ray.body_ids]):
-                    self._filtered_rays.append(ray)
+        self.__filter(
+            lambda columns, indices: columns.any_value(
+                np.isin(columns.body_ids, options), columns.body_offsets, indices
+            ),
+            new,
+        )
+        return self
+
+    def filter_by_sensor_region(
+        self,
+        sensor_id: int,
+        x_range: Tuple[float, float],
+        y_range: Tuple[float, float],
+        new=True,
+    ) -> LightPathFinder:
+        """Filter ray paths contributing to a sensor region and populates filtered_rays property.
+
+        Parameters
+        ----------
+        sensor_id : int
+            Id of the sensor, index in :attr:`sensor_names`.
+        x_range : Tuple[float, float]
+            X bounds of the region on the sensor, included.
+        y_range : Tuple[float, float]
+            Y bounds of the region on the sensor, included.
+        new : bool
+            Define if a new filter is created or an existing filter is filtered.
+
+        Returns
+        -------
+        ansys.speos.core.lxp.LightPathFinder
+            LightPathFinder Instance.
+        """
+        if not self._has_sensor_contributions:
+            raise ValueError("The LPF file contains no sensor contributions.")
+        self.__filter(
+            lambda columns, indices: columns.any_value(
+                _in_region(
+                    columns.contribution_sensor_ids,
+                    columns.contribution_positions,
+                    sensor_id,
+                    x_range,
+                    y_range,
+                ),
+                columns.contribution_offsets,
+                indices,
+            ),
+            new,
+        )
         return self
 
     def filter_error_rays(self) -> LightPathFinder:
@@ -427,36 +1093,89 @@ class LightPathFinder:
         self.__filter_by_last_intersection_types(options=NO_ERROR_IDS)
         return self
 
+    def locate_impacts(
+        self,
+        geometry_index: GeometryIndex,
+        rays: Optional[List[RayPath]] = None,
+        tolerance: float = 1e-6,
+    ) -> List[List[Optional[str]]]:
+        """Find the project faces on which the ray impacts lie.
+
+        The impacts of all rays are located together in the geometry index of the project, so
+        that they are annotated with the geometry path of the face they hit.
+
+        Parameters
+        ----------
+        geometry_index : ansys.speos.core.geometry_index.GeometryIndex
+            Index of the project geometry,
+            see :attr:`ansys.speos.core.project.Project.geometry_index`.
+        rays : List[ansys.speos.core.lxp.RayPath], optional
+            Ray paths to annotate.
+            By default, ``None``, which annotates all ray paths of the file.
+        tolerance : float
+            Largest distance between an impact and the face it lies on.
+            By default, ``1e-6``.
+
+        Returns
+        -------
+        List[List[Optional[str]]]
+            For each ray path, the geometry path of the face of each impact, or ``None`` if the
+            impact is not on a face of the project.
+        """
+        if rays is None:
+            rays = self._rays
+        columns, indices = _ray_columns(rays)
+        nb_impacts = columns.nb_impacts[indices]
+        impacts = columns.impacts[columns.impact_rows(indices)].astype(float)
+        face_ids = geometry_index.locate_points(impacts, tolerance=tolerance)
+
+        # Each face geometry path is computed once
+        geo_paths = {-1: None}
+        for face_id in np.unique(face_ids):
+            if face_id != -1:
+                geo_paths[face_id] = geometry_index.geo_path(int(face_id))
+        located = [geo_paths[face_id] for face_id in face_ids.tolist()]
+        offsets = np.concatenate(([0], np.cumsum(nb_impacts))).tolist()
+        return [located[start:stop] for start, stop in zip(offsets[:-1], offsets[1:])]
+
     @staticmethod
     @graphics_required
-    def __add_ray_to_pv(plotter: Plotter, ray: RayPath, max_ray_length: float):
-        """Add a ray to pyvista plotter.
+    def __add_rays_to_pv(plotter: Plotter, rays: List[RayPath], max_ray_length: float):
+        """Add rays to pyvista plotter, as a single line set colored by wavelength.
 
         Parameters
         ----------
         plotter : ansys.tools.visualization_interface.plotter.Plotter
             Ansys plotter object to which rays should be added.
-        ray : ansys.speos.core.lxp.RayPath
-            RayPath object which contains ray information to be added.
+        rays : List[ansys.speos.core.lxp.RayPath]
+            RayPath objects which contain ray information to be added.
         max_ray_length : float
             Length of the last ray.
         """
         import pyvista as pv
 
-        temp = ray.impacts.copy()
-        if not 7 <= ray.intersection_type[-1] <= 15:
-            temp.append(
-                [
-                    ray.impacts[-1][0] + max_ray_length * ray.last_direction[0],
-                    ray.impacts[-1][1] + max_ray_length * ray.last_direction[1],
-                    ray.impacts[-1][2] + max_ray_length * ray.last_direction[2],
-                ]
-            )
-        if len(ray.impacts) > 2:
-            mesh = pv.MultipleLines(temp)
-        else:
-            mesh = pv.Line(temp[0], temp[1])
-        plotter.plot(mesh, color=wavelength_to_rgb(ray.wl), line_width=2)
+        columns, indices = _ray_columns(rays)
+        indices = indices[columns.nb_impacts[indices] > 0]
+        if len(indices) == 0:
+            return
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(columns.nb_impacts[indices], out=offsets[1:])
+        impacts = columns.impacts[columns.impact_rows(indices)].astype(float)
+        last_types = columns.last_values(
+            columns.intersection_types, columns.type_offsets, indices, 0
+        )
+        # Rays ending in error have no last direction segment.
+        lengths = np.where((7 <= last_types) & (last_types <= 15), 0.0, max_ray_length)
+        points, lines, kept = _ray_line_set_arrays(
+            impacts, offsets, columns.last_directions[indices].astype(float), lengths
+        )
+        if len(points) == 0:
+            return
+
+        colors = wavelength_to_rgb(columns.wavelengths[indices])
+        mesh = pv.PolyData(points, lines=lines)
+        mesh.cell_data["colors"] = colors[kept]
+        plotter.plot(mesh, scalars="colors", rgb=True, line_width=2)
 
     @graphics_required
     def preview(
@@ -466,9 +1185,14 @@ class LightPathFinder:
         ray_filter: bool = False,
         project: Optional[Project] = None,
         screenshot: Optional[Union[str, Path]] = None,
+        sampling: str = "first",
+        max_primitives: Optional[int] = None,
+        seed: Optional[int] = None,
     ) -> LightPathFinder:
         """Preview LPF file with pyvista.
 
+        Rays are drawn as a single line mesh, colored by wavelength.
+
         Parameters
         ----------
         nb_ray : int
@@ -482,6 +1206,16 @@ class LightPathFinder:
         screenshot : Optional[Union[str, Path]]
             Path to save a screenshot of the plotter. If defined Plotter will only create the
             screenshot
+        sampling : str
+            How the ``nb_ray`` rays are selected, one of :data:`SAMPLING_MODES`:
+            ``"first"``, ``"random"``, ``"wavelength"``, ``"face"`` or ``"status"``.
+            By default, ``"first"``.
+        max_primitives : Optional[int]
+            Maximum number of line segments drawn, ``None`` for no limit.
+            By default, ``None``.
+        seed : Optional[int]
+            Seed of the random sampling, for reproducible previews.
+            By default, ``None``.
 
         Returns
         -------
@@ -504,22 +1238,19 @@ class LightPathFinder:
                 temp_rays = self._rays
         else:
             temp_rays = self._rays
+        selected = _sample_rays(
+            temp_rays,
+            nb_ray,
+            sampling=sampling,
+            max_primitives=max_primitives,
+            max_ray_length=max_ray_length,
+            seed=seed,
+        )
         if not project:
             plotter = Plotter()
-            if nb_ray > len(temp_rays):
-                for ray in temp_rays:
-                    self.__add_ray_to_pv(plotter, ray, max_ray_length)
-            else:
-                for i in range(nb_ray):
-                    self.__add_ray_to_pv(plotter, temp_rays[i], max_ray_length)
         else:
             plotter = project._create_preview(viz_args={"opacity": 0.5})
-            if nb_ray > len(temp_rays):
-                for ray in temp_rays:
-                    self.__add_ray_to_pv(plotter, ray, max_ray_length)
-            else:
-                for i in range(nb_ray):
-                    self.__add_ray_to_pv(plotter, temp_rays[i], max_ray_length)
+        self.__add_rays_to_pv(plotter, [temp_rays[i] for i in selected], max_ray_length)
         if screenshot:
             screenshot = str(screenshot)
             plotter.show(screenshot=screenshot)
@@ -37,7 +37,7 @@ from __future__ import annotations
 
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import List, Mapping, Optional, Union
+from typing import TYPE_CHECKING, List, Mapping, Optional, Union
 import uuid
 
 import ansys.speos.core.body as body
@@ -67,9 +67,11 @@ from ansys.speos.core.kernel.scene import ProtoScene
 from ansys.speos.core.kernel.sop_template import ProtoSOPTemplate
 from ansys.speos.core.kernel.vop_template import ProtoVOPTemplate
 import ansys.speos.core.part as part
-import ansys.speos.core.project as project
 import ansys.speos.core.proto_message_utils as proto_message_utils
 
+if TYPE_CHECKING:  # pragma: no cover
+    import ansys.speos.core.project as project
+
 
 class BaseSop:
     """Base class for Surface Optical Property helpers.
@@ -25,7 +25,7 @@
 from __future__ import annotations
 
 import re
-from typing import List, Mapping, Optional, Union
+from typing import TYPE_CHECKING, List, Mapping, Optional, Union
 import uuid
 
 from ansys.speos.core import proto_message_utils
@@ -34,7 +34,9 @@ import ansys.speos.core.face as face
 from ansys.speos.core.geo_ref import GeoRef
 from ansys.speos.core.kernel.client import SpeosClient
 from ansys.speos.core.kernel.part import ProtoPart
-import ansys.speos.core.project as project
+
+if TYPE_CHECKING:  # pragma: no cover
+    import ansys.speos.core.project as project
 
 
 class Part:
@@ -109,6 +111,13 @@ class Part:
                 geo_paths.insert(0, self._parent_part.geo_path.metadata["GeoPath"])
             return GeoRef.from_native_link("/".join(geo_paths))
 
+        def _instance_axis_systems(self) -> List[List[float]]:
+            """Axis systems placing this sub part, from its own instance up to the root part."""
+            axis_systems = [self._part_instance.axis_system]
+            if isinstance(self._parent_part, Part.SubPart):
+                axis_systems.extend(self._parent_part._instance_axis_systems())
+            return axis_systems
+
         def create_body(
             self,
             name: str,
@@ -300,11 +309,27 @@ class Part:
         def commit(self) -> Part.SubPart:
             """Save feature: send the local data to the speos server database.
 
+            Contained faces are sent with batch requests, then each body and each part is written
+            once, from the deepest ones to this sub part.
+
             Returns
             -------
             ansys.speos.core.part.Part.SubPart
                 SubPart feature.
             """
+            _commit_tree(self._speos_client, self)
+
+            # Look if an element corresponds to the instance
+            if self._parent_part is not None and self._parent_part.part_link is not None:
+                parent_part_data = self._parent_part.part_link.get()
+                if self._set_instance(parent_part_data):
+                    self._parent_part._part = parent_part_data
+                    self._parent_part.part_link.set(data=parent_part_data)  # update parent part
+
+            return self
+
+        def _save(self) -> None:
+            """Save the part only, its bodies and sub parts being already saved."""
             # The _unique_id will help to find correct item in the scene.materials:
             # the list of MaterialInstance
             if self._unique_id is None:
@@ -319,37 +344,30 @@ class Part:
 
             self._part_instance.part_guid = self.part_link.key
 
-            for g in self._geom_features:
-                g.commit()
-
-            # Look if an element corresponds to the instance
-            if self._parent_part is not None and self._parent_part.part_link is not None:
-                update_part = True
-                parent_part_data = self._parent_part.part_link.get()
+        def _set_instance(self, parent_part_data: ProtoPart) -> bool:
+            """Put the part instance in the parent part data.
 
-                part_inst = next(
-                    (
-                        x
-                        for x in parent_part_data.parts
-                        if x.description == "UniqueId_" + self._unique_id
-                    ),
-                    None,
-                )
-                if part_inst is not None:
-                    if part_inst != self._part_instance:
-                        part_inst.CopyFrom(self._part_instance)  # if yes, just replace
-                    else:
-                        update_part = False
-                else:
-                    parent_part_data.parts.append(
-                        self._part_instance
-                    )  # if no, just add it to the list of part instances
-
-                if update_part:
-                    self._parent_part._part = parent_part_data
-                    self._parent_part.part_link.set(data=parent_part_data)  # update parent part
-
-            return self
+            Returns
+            -------
+            bool
+                Whether the parent part data was modified.
+            """
+            part_inst = next(
+                (
+                    x
+                    for x in parent_part_data.parts
+                    if x.description == "UniqueId_" + self._unique_id
+                ),
+                None,
+            )
+            if part_inst is not None:
+                if part_inst == self._part_instance:
+                    return False
+                part_inst.CopyFrom(self._part_instance)  # if yes, just replace
+            else:
+                # if no, just add it to the list of part instances
+                parent_part_data.parts.append(self._part_instance)
+            return True
 
         def reset(self) -> Part.SubPart:
             """Reset feature: override local data by the one from the speos server database.
@@ -625,21 +643,23 @@ class Part:
     def commit(self) -> Part:
         """Save feature: send the local data to the speos server database.
 
+        Contained faces are sent with batch requests, then each body and each part is written
+        once, from the deepest ones to this part.
+
         Returns
         -------
         ansys.speos.core.part.Part
             Part feature.
         """
+        # Retrieve all features to commit them, leaves first
+        _commit_tree(self._project.client, self)
+
         # Save or Update the part (depending on if it was already saved before)
         if self.part_link is None:
             self.part_link = self._project.client.parts().create(message=self._part)
         elif self.part_link.get() != self._part:
             self.part_link.set(data=self._part)  # Only update if data has changed
 
-        # Retrieve all features to commit them
-        for g in self._geom_features:
-            g.commit()
-
         # Update the scene with the part
         if self._project.scene_link:
             scene_data = self._project.scene_link.get()  # retrieve scene data
@@ -761,3 +781,64 @@ class Part:
                 found_features.extend(feats)
 
         return found_features
+
+
+def _commit_tree(speos_client: SpeosClient, root: Union[Part, Part.SubPart, body.Body]) -> None:
+    """Save a geometry tree in database, leaves first.
+
+    The tree is walked once: all faces are saved with batch requests, then each body and each sub
+    part is written once, from the deepest ones to ``root``, after the guids of its children were
+    added to its local data. A root ``Part`` itself is not saved, and a root ``SubPart`` instance is
+    not set in its parent.
+
+    Parameters
+    ----------
+    speos_client : ansys.speos.core.kernel.client.SpeosClient
+        The Speos instance client.
+    root : Union[ansys.speos.core.part.Part, ansys.speos.core.part.Part.SubPart, \
+    ansys.speos.core.body.Body]
+        Root of the tree to save.
+    """
+    faces, bodies, sub_parts = [], [], []
+
+    def gather(feature, depth: int) -> None:
+        if isinstance(feature, face.Face):
+            faces.append(feature)
+            return
+        if isinstance(feature, body.Body):
+            bodies.append(feature)
+        elif isinstance(feature, Part.SubPart):
+            sub_parts.append((depth, feature))
+        for child in feature._geom_features:
+            gather(child, depth + 1)
+
+    gather(root, 0)
+
+    face._save_faces(speos_client, faces)
+    face_guids = {}
+    for f in faces:
+        parent = f._parent_body
+        if parent is None:
+            continue
+        known = face_guids.setdefault(id(parent), set(parent._body.face_guids))
+        if f.face_link.key not in known:
+            known.add(f.face_link.key)
+            parent._body.face_guids.append(f.face_link.key)
+
+    body_guids = {}
+    for b in bodies:
+        b._save()
+        parent = b._parent_part
+        if parent is None:
+            continue
+        known = body_guids.setdefault(id(parent), set(parent._part.body_guids))
+        if b.body_link.key not in known:
+            known.add(b.body_link.key)
+            parent._part.body_guids.append(b.body_link.key)
+            if b is root and parent.part_link is not None:
+                parent.part_link.set(data=parent._part)
+
+    for _, sp in sorted(sub_parts, key=lambda x: x[0], reverse=True):
+        sp._save()
+        if sp is not root and sp._parent_part is not None:
+            sp._set_instance(sp._parent_part._part)
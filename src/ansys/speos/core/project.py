@@ -24,10 +24,12 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 import copy
 from pathlib import Path
 import re
-from typing import TYPE_CHECKING, List, Mapping, Optional, Union
+from typing import TYPE_CHECKING, ContextManager, List, Mapping, Optional, Union
 import uuid
 
 from google.protobuf.internal.containers import RepeatedScalarFieldContainer
@@ -36,6 +38,7 @@ import numpy as np
 import ansys.speos.core.body as body
 from ansys.speos.core.component import LightBox, LightBoxFileInstance
 import ansys.speos.core.face as face
+from ansys.speos.core.generic import mesh_methods
 from ansys.speos.core.generic.general_methods import graphics_required
 from ansys.speos.core.generic.parameters import (
     AmbientCieStandardGeneralSkyParameters,
@@ -62,9 +65,10 @@ from ansys.speos.core.generic.parameters import (
     SurfaceSourceParameters,
     VirtualBSDFSimulationParameters,
 )
-from ansys.speos.core.generic.visualization_methods import local2absolute
+from ansys.speos.core.generic.visualization_methods import _VisualRays, transform_points
+from ansys.speos.core.geometry_index import GeometryIndex
 from ansys.speos.core.ground_plane import GroundPlane
-from ansys.speos.core.kernel import SpeosClient
+from ansys.speos.core.kernel import SpeosClient, bundle
 from ansys.speos.core.kernel.body import BodyLink
 from ansys.speos.core.kernel.face import FaceLink
 from ansys.speos.core.kernel.part import ProtoPart
@@ -105,13 +109,6 @@ from ansys.speos.core.source import (
 )
 from ansys.speos.core.speos import Speos
 
-try:
-    from ansys.speos.core.generic.general_methods import run_if_graphics_required
-
-    run_if_graphics_required(warning=True)
-except ImportError as err:  # pragma: no cover
-    raise err
-
 if TYPE_CHECKING:  # pragma: no cover
     from ansys.tools.visualization_interface import Plotter
     import pyvista as pv
@@ -157,6 +154,7 @@ class Project:
         self.scene_link = self.client.scenes().create()
         """Link object for the scene in database."""
         self._features = []
+        self._geometry_index = None
         match path:
             case None | "":
                 pass
@@ -203,6 +201,22 @@ class Project:
                 return feature
         return None
 
+    @property
+    def geometry_index(self) -> GeometryIndex:
+        """Spatial index over the committed faces of the root part.
+
+        The index is refreshed at each access: only the faces edited or moved since the previous
+        access are indexed again.
+
+        Returns
+        -------
+        ansys.speos.core.geometry_index.GeometryIndex
+            Index answering box, ray and point queries with face ids.
+        """
+        if self._geometry_index is None:
+            self._geometry_index = GeometryIndex(self)
+        return self._geometry_index.update()
+
     @property
     def optical_properties(self) -> List[opt_prop.OptProp]:
         """Property of optical properties inside the project.
@@ -1255,18 +1269,80 @@ class Project:
         ansys.speos.core.project.Project
             Project feature.
         """
-        # Erase the scene
+        # Features deletions are gathered in one scene update
+        scene_updates = nullcontext()
         if self.scene_link is not None:
-            self.scene_link.set(data=ProtoScene())
-
-        # Delete each feature that was created
-        for f in self._features:
-            f.delete()
-            f = None
+            scene_updates = self.scene_link.coalesce_updates()
+        with scene_updates:
+            # Erase the scene
+            if self.scene_link is not None:
+                self.scene_link.set(data=ProtoScene())
+
+            # Delete each feature that was created
+            for f in self._features:
+                f.delete()
+                f = None
         self._features.clear()
 
         return self
 
+    def snapshot(self, path: Union[str, Path]) -> str:
+        """Save the committed state of the project in a bundle file.
+
+        The bundle holds the scene, and all the parts, bodies, faces and templates it references,
+        as serialized protobuf messages. It can be restored with :meth:`restore`, in this session
+        or in another one.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            File to write.
+
+        Returns
+        -------
+        str
+            SHA-256 digest of the bundle content, as hexadecimal string.
+        """
+        return bundle.write_bundle(path, bundle.collect_items(self.client, self.scene_link))
+
+    def restore(self, path: Union[str, Path]) -> Project:
+        """Fill an empty project from a bundle file written by :meth:`snapshot`.
+
+        All items of the bundle are created on server side (faces in one batch request when the
+        server supports it), then features are built from the bundle messages, without reading
+        them back from the server.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Bundle file to read.
+
+        Returns
+        -------
+        ansys.speos.core.project.Project
+            Project feature.
+
+        Raises
+        ------
+        ValueError
+            If the project already has features, or if the file is not a valid bundle.
+        """
+        if self._features:
+            raise ValueError("Restore is only possible in an empty project")
+        items = bundle.read_bundle(path)
+        scene_guid = next(iter(items))
+        scene_data = items[scene_guid][1]
+        if scene_data.part_guid in items:
+            root_part = items[scene_data.part_guid][1]
+            Project._set_unique_ids(scene_data, root_part)
+            root_part.name = "RootPart"
+
+        links = bundle.create_items(self.client, items, existing={scene_guid: self.scene_link})
+        with self.client._preloaded(bundle.read_responses(items, links)):
+            if scene_data.part_guid:
+                self._fill_features()
+        return self
+
     def _to_dict(self) -> dict:
         # Replace all guids by content of objects in the dict
         output_dict = proto_message_utils._replace_guids(
@@ -1393,34 +1469,33 @@ class Project:
                         f_data  # instead of f_feat.reset() - this avoid a useless read in server
                     )
 
-    def _add_unique_ids(self):
-        scene_data = self.scene_link.get()
+    @staticmethod
+    def _set_unique_ids(scene_data: ProtoScene, root_part: ProtoPart) -> tuple[bool, bool]:
+        """Give a unique id to the scene items and root part sub parts missing one.
 
-        root_part_link = self.client[scene_data.part_guid]
-        root_part = root_part_link.get()
+        Returns
+        -------
+        tuple[bool, bool]
+            Whether the scene and whether the root part were modified.
+        """
         update_rp = False
         for sub_part in root_part.parts:
             if sub_part.description.startswith("UniqueId_") is False:
                 sub_part.description = "UniqueId_" + str(uuid.uuid4())
                 update_rp = True
-        if update_rp:
-            root_part_link.set(data=root_part)
 
-        for mat_inst in scene_data.materials:
-            if mat_inst.metadata["UniqueId"] == "":
-                mat_inst.metadata["UniqueId"] = str(uuid.uuid4())
-
-        for src_inst in scene_data.sources:
-            if src_inst.metadata["UniqueId"] == "":
-                src_inst.metadata["UniqueId"] = str(uuid.uuid4())
-
-        for ssr_inst in scene_data.sensors:
-            if ssr_inst.metadata["UniqueId"] == "":
-                ssr_inst.metadata["UniqueId"] = str(uuid.uuid4())
-
-        for scene_inst in scene_data.scenes:
-            if scene_inst.metadata["UniqueId"] == "":
-                scene_inst.metadata["UniqueId"] = str(uuid.uuid4())
+        update_scene = False
+        for instances in (
+            scene_data.materials,
+            scene_data.sources,
+            scene_data.sensors,
+            scene_data.scenes,
+            scene_data.simulations,
+        ):
+            for inst in instances:
+                if inst.metadata["UniqueId"] == "":
+                    inst.metadata["UniqueId"] = str(uuid.uuid4())
+                    update_scene = True
 
         for sim_inst in scene_data.simulations:
             # Bug fix for Multi source blackbox issue
@@ -1428,13 +1503,23 @@ class Project:
             for source in sim_inst.source_paths:
                 if source not in sources:
                     sources.append(source)
-            sim_inst.source_paths[:] = sources
+            if len(sources) != len(sim_inst.source_paths):
+                sim_inst.source_paths[:] = sources
+                update_scene = True
             # end bug fix for multi source blackbox issue to be removed when 261 is no longer
             # supported
-            if sim_inst.metadata["UniqueId"] == "":
-                sim_inst.metadata["UniqueId"] = str(uuid.uuid4())
+        return update_scene, update_rp
 
-        self.scene_link.set(data=scene_data)
+    def _add_unique_ids(self):
+        scene_data = self.scene_link.get()
+
+        root_part_link = self.client[scene_data.part_guid]
+        root_part = root_part_link.get()
+        update_scene, update_rp = Project._set_unique_ids(scene_data, root_part)
+        if update_rp:
+            root_part_link.set(data=root_part)
+        if update_scene:
+            self.scene_link.set(data=scene_data)
 
     def _fill_features(self, context: Optional[str] = None):
         """Fill project features from a scene."""
@@ -1448,8 +1533,9 @@ class Project:
         root_part_feat = None
         if not root_part_feats:
             root_part_feat = self.create_root_part()
-            root_part_data.name = "RootPart"
-            root_part_link.set(root_part_data)
+            if root_part_data.name != "RootPart":
+                root_part_data.name = "RootPart"
+                root_part_link.set(root_part_data)
             self._fill_bodies(body_guids=root_part_data.body_guids, feat_host=root_part_feat)
         else:
             root_part_feat = root_part_feats[0]
@@ -1660,55 +1746,96 @@ class Project:
 
     def __extract_part_mesh_info(
         self,
-        part_data: ProtoPart,
-        part_coordinate_info: RepeatedScalarFieldContainer = None,
+        part_data: Union[part.Part, part.Part.SubPart],
+        part_axis_systems: Optional[List[RepeatedScalarFieldContainer]] = None,
     ) -> pv.PolyData:
         """Extract mesh data info from a part.
 
         Parameters
         ----------
-        speos_client : ansys.speos.core.kernel.client.SpeosClient
-            The Speos instance client.
-        part_data: ansys.api.speos.part.v1.part_pb2.Part
-            Part from scene.
-        part_coordinate_info: RepeatedScalarFieldContainer
-            message contains part coordinate info: origin, x_vector, y_vector, z_vector
+        part_data: Union[ansys.speos.core.part.Part, ansys.speos.core.part.Part.SubPart]
+            Part feature whose bodies are extracted.
+        part_axis_systems: List[RepeatedScalarFieldContainer], optional
+            Axis systems placing the part, from its own instance up to the root part.
+            By default, ``None``, meaning that the part is not moved.
 
         Returns
         -------
         pv.PolyData
             mesh data extracted.
         """
-        part_coordinate = [
-            0.0,
-            0.0,
-            0.0,
-            1.0,
-            0.0,
-            0.0,
-            0.0,
-            1.0,
-            0.0,
-            0.0,
-            0.0,
-            1.0,
-        ]
-        if part_coordinate_info is not None:
-            part_coordinate = part_coordinate_info
         part_mesh_info = None
         for feature in part_data._geom_features:
             if not isinstance(feature, body.Body):
                 continue
             body_visual_data = feature.visual_data.data
-            body_visual_data.points = np.array(
-                [local2absolute(vertice, part_coordinate) for vertice in body_visual_data.points]
-            )
+            if part_axis_systems:
+                # shallow copy: the body keeps its own points in local coordinates
+                body_visual_data = body_visual_data.copy(deep=False)
+                body_visual_data.points = transform_points(
+                    body_visual_data.points, *part_axis_systems
+                )
             if part_mesh_info is None:
                 part_mesh_info = body_visual_data
             else:
                 part_mesh_info = part_mesh_info.append_polydata(body_visual_data)
         return part_mesh_info
 
+    @staticmethod
+    def __extract_lod_mesh_info(
+        placed_bodies: List[tuple[body.Body, List[RepeatedScalarFieldContainer]]],
+        max_triangles: int,
+    ) -> pv.PolyData:
+        """Extract simplified mesh data of bodies sharing a triangle budget.
+
+        The level of detail of each body is selected from its size relative to the scene, and
+        the simplified meshes are cached by the bodies.
+
+        Parameters
+        ----------
+        placed_bodies: List[tuple[ansys.speos.core.body.Body, List[RepeatedScalarFieldContainer]]]
+            Bodies with the axis systems placing them, from their part instance up to the root.
+        max_triangles: int
+            Budget of triangles for all bodies.
+
+        Returns
+        -------
+        pv.PolyData
+            mesh data extracted.
+        """
+        import pyvista as pv
+
+        full_meshes = [b._lod_mesh(0) for b, _ in placed_bodies]
+        sizes = np.zeros(len(placed_bodies))
+        for i, ((vertices, _), (_, axis_systems)) in enumerate(zip(full_meshes, placed_bodies)):
+            if len(vertices):
+                lower, upper = mesh_methods.bounding_box(vertices)
+                corners = np.array(
+                    [
+                        [x, y, z]
+                        for x in (lower[0], upper[0])
+                        for y in (lower[1], upper[1])
+                        for z in (lower[2], upper[2])
+                    ]
+                )
+                sizes[i] = np.linalg.norm(np.ptp(transform_points(corners, *axis_systems), axis=0))
+        levels = mesh_methods.select_lod_levels(
+            [len(facets) for _, facets in full_meshes], sizes, max_triangles
+        )
+
+        all_vertices, all_faces, nb_vertices = [], [], 0
+        for (b, axis_systems), level in zip(placed_bodies, levels.tolist()):
+            vertices, facets = b._lod_mesh(level)
+            all_vertices.append(transform_points(vertices, *axis_systems))
+            faces = np.empty((len(facets), 4), dtype=np.int64)
+            faces[:, 0] = 3
+            faces[:, 1:] = facets + nb_vertices
+            all_faces.append(faces.ravel())
+            nb_vertices += len(vertices)
+        if nb_vertices == 0:
+            return pv.PolyData()
+        return pv.PolyData(np.concatenate(all_vertices), np.concatenate(all_faces))
+
     def _create_speos_feature_preview(
         self,
         plotter: Plotter,
@@ -1765,12 +1892,18 @@ class Project:
             return plotter
 
         ray_path_scale_factor = 0.2
+        visual_data = speos_feature.visual_data
 
         match speos_feature:
             case LightBox():
-                for data in speos_feature.visual_data:
+                for data in visual_data:
                     if isinstance(data.data, list):
                         for visual_ray in data.data:
+                            if isinstance(visual_ray, _VisualRays):
+                                self._plot_visual_rays(
+                                    plotter, visual_ray, ray_path_scale_factor * scene_seize
+                                )
+                                continue
                             tmp = visual_ray._VisualArrow__data
                             visual_ray._VisualArrow__data.points[1] = (
                                 ray_path_scale_factor
@@ -1789,7 +1922,12 @@ class Project:
                             opacity=0.5,
                         )
             case SourceRayFile() | SourceLuminaire() | SourceSurface():
-                for visual_ray in speos_feature.visual_data.data:
+                for visual_ray in visual_data.data:
+                    if isinstance(visual_ray, _VisualRays):
+                        self._plot_visual_rays(
+                            plotter, visual_ray, ray_path_scale_factor * scene_seize
+                        )
+                        continue
                     display_ray = visual_ray.data.copy(deep=True)
                     display_ray.points[1] = (
                         ray_path_scale_factor
@@ -1800,7 +1938,7 @@ class Project:
                     plotter.plot(display_ray, color=visual_ray.color)
             case _:
                 plotter.plot(
-                    speos_feature.visual_data.data,
+                    visual_data.data,
                     show_edges=True,
                     line_width=2,
                     edge_color="red",
@@ -1809,9 +1947,9 @@ class Project:
                 )
 
         visual_coordinate_data = (
-            speos_feature.visual_data.coordinates
-            if not isinstance(speos_feature.visual_data, list)
-            else speos_feature.visual_data[0].coordinates
+            visual_data.coordinates
+            if not isinstance(visual_data, list)
+            else visual_data[0].coordinates
         )
         if visual_coordinate_data is not None:
             display_coordinates = copy.deepcopy(visual_coordinate_data)
@@ -1843,8 +1981,64 @@ class Project:
                     plotter.plot(display_coordinates.z_axis, color="blue")
         return plotter
 
+    @staticmethod
+    def _plot_visual_rays(
+        plotter: Plotter, visual_rays: _VisualRays, direction_length: float
+    ) -> None:
+        """Add a set of rays to pyvista plotter object, as a single line set.
+
+        Parameters
+        ----------
+        plotter: Plotter
+            ansys.tools.visualization_interface.Plotter
+        visual_rays: ansys.speos.core.generic.visualization_methods._VisualRays
+            Rays to add.
+        direction_length: float
+            Length of the last direction segments.
+        """
+        line_set = visual_rays.line_set(direction_length=direction_length)
+        if "colors" in line_set.cell_data:
+            plotter.plot(line_set, scalars="colors", rgb=True)
+        else:
+            plotter.plot(line_set, color=visual_rays.color)
+
+    def _preloaded_feature_reads(self) -> ContextManager[None]:
+        """Read the scene and the feature templates once, for all feature data lookups.
+
+        Returns
+        -------
+        ContextManager[None]
+            Context in which reads of the scene, of the feature templates and of the items they
+            reference are answered without requests to the server.
+        """
+        items = {self.scene_link.key: ("scene", self.scene_link.get())}
+        templates = {}
+        for feature in self._features:
+            for kind in ("sensor_template", "source_template"):
+                link = getattr(feature, kind + "_link", None)
+                if link is not None:
+                    templates[link.key] = (kind, link)
+        with ThreadPoolExecutor() as executor:
+            messages = executor.map(lambda kind_link: kind_link[1].get(), templates.values())
+            for (key, (kind, _)), message in zip(templates.items(), messages):
+                items[key] = (kind, message)
+            # Items referenced by the templates, like spectrums
+            referenced = {
+                key: (kind, None)
+                for template_key in templates
+                for kind, key in bundle._referenced_keys(items[template_key][1])
+                if key not in items
+            }
+            links = bundle.item_links(self.client, referenced)
+            messages = executor.map(lambda link: link.get(), links.values())
+            for (key, (kind, _)), message in zip(referenced.items(), messages):
+                items[key] = (kind, message)
+        return self.client._preloaded(
+            bundle.read_responses(items, bundle.item_links(self.client, items))
+        )
+
     @graphics_required
-    def _create_preview(self, viz_args=None) -> Plotter:
+    def _create_preview(self, viz_args=None, max_triangles: Optional[int] = None) -> Plotter:
         """Create preview pyvista plotter object.
 
         Parameters
@@ -1855,6 +2049,9 @@ class Project:
             - {'style': 'wireframe'},
             - {'style': 'surface', 'color':'white'},
             - {'opacity': 0.7, 'color':'white', 'show_edges': False},
+        max_triangles : int, optional
+            Budget of triangles for the cad bodies, which are simplified to meet it.
+            By default, ``None``, meaning that bodies are shown at full resolution.
         """
         from ansys.tools.visualization_interface import Plotter
         import pyvista as pv
@@ -1880,23 +2077,30 @@ class Project:
         if self.scene_link.get().part_guid != "":
             _preview_mesh = pv.PolyData()
             root_part = self.find(name="", feature_type=part.Part)[0]
-
-            # Add mesh of bodies directly contained in root part
-            part_mesh_data = self.__extract_part_mesh_info(part_data=root_part)
-            if part_mesh_data is not None:
-                _preview_mesh = _preview_mesh.append_polydata(part_mesh_data)
-
-            # Add mesh of bodies contained in sub-part
             subparts = find_all_subparts(root_part)
-            for subpart in subparts:
-                subpart_axis = subpart._part_instance.axis_system
-                part_mesh_data = self.__extract_part_mesh_info(
-                    part_data=subpart,
-                    part_coordinate_info=subpart_axis,
-                )
+
+            if max_triangles is not None:
+                # Simplified mesh of all bodies, sharing the triangle budget
+                placed_bodies = [(b, []) for b in root_part.bodies]
+                for subpart in subparts:
+                    axis_systems = subpart._instance_axis_systems()
+                    placed_bodies.extend((b, axis_systems) for b in subpart.bodies)
+                _preview_mesh = self.__extract_lod_mesh_info(placed_bodies, max_triangles)
+            else:
+                # Add mesh of bodies directly contained in root part
+                part_mesh_data = self.__extract_part_mesh_info(part_data=root_part)
                 if part_mesh_data is not None:
                     _preview_mesh = _preview_mesh.append_polydata(part_mesh_data)
 
+                # Add mesh of bodies contained in sub-part
+                for subpart in subparts:
+                    part_mesh_data = self.__extract_part_mesh_info(
+                        part_data=subpart,
+                        part_axis_systems=subpart._instance_axis_systems(),
+                    )
+                    if part_mesh_data is not None:
+                        _preview_mesh = _preview_mesh.append_polydata(part_mesh_data)
+
             if _preview_mesh.n_points != 0 and _preview_mesh.n_cells != 0:
                 p.plot(_preview_mesh, **viz_args)
 
@@ -1906,10 +2110,15 @@ class Project:
         scene_y_seize = scene_bounds[3] - scene_bounds[2]
         scene_z_seize = scene_bounds[5] - scene_bounds[4]
         scene_max = max(scene_x_seize, scene_y_seize, scene_z_seize)
-        for feature in self._features:
-            p = self._create_speos_feature_preview(
-                plotter=p, speos_feature=feature, scene_seize=scene_max
-            )
+        with self._preloaded_feature_reads():
+            # Visual data are built concurrently, and only for the features whose data changed
+            visualized = [f for f in self._features if hasattr(type(f), "visual_data")]
+            with ThreadPoolExecutor() as executor:
+                list(executor.map(lambda feature: feature.visual_data, visualized))
+            for feature in self._features:
+                p = self._create_speos_feature_preview(
+                    plotter=p, speos_feature=feature, scene_seize=scene_max
+                )
         return p
 
     @graphics_required
@@ -1917,6 +2126,7 @@ class Project:
         self,
         viz_args=None,
         screenshot: Optional[Union[str, Path]] = None,
+        max_triangles: Optional[int] = None,
     ) -> None:
         """Preview cad bodies inside the project's scene.
 
@@ -1933,11 +2143,17 @@ class Project:
             Path to save a screenshot of the plotter. If defined Plotter will only create the
             screenshot
 
+        max_triangles : int, optional
+            Budget of triangles for the cad bodies. Bodies are simplified by vertex clustering,
+            large bodies keeping more details than small ones. Simplified meshes are reused by
+            next previews until the body faces change.
+            By default, ``None``, meaning that bodies are shown at full resolution.
+
         """
         if viz_args is None:
             viz_args = {"opacity": 1}
         if screenshot is not None:
             screenshot = Path(screenshot)
 
-        p = self._create_preview(viz_args=viz_args)
+        p = self._create_preview(viz_args=viz_args, max_triangles=max_triangles)
         p.show(screenshot=screenshot)
@@ -22,12 +22,20 @@
 
 """Module with method to process Protobuf messages."""
 
+from functools import lru_cache
 import json
-from typing import Iterator, List
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
 
+from google.protobuf.descriptor import Descriptor, FieldDescriptor
 from google.protobuf.message import Message
 
-from ansys.speos.core.kernel import SpeosClient, protobuf_message_to_dict
+from ansys.speos.core.kernel import (
+    ProtoIntensityTemplate,
+    ProtoSOPTemplate,
+    ProtoSpectrum,
+    SpeosClient,
+    protobuf_message_to_dict,
+)
 
 
 def dict_to_str(dict: dict) -> str:
@@ -258,3 +266,254 @@ def _flatten_dict(dict_var: dict):
             flat_dict.update(_flatten_dict(v))
         flat_dict[k] = v
     return flat_dict
+
+
+# Message types referenced by the "xxx_guid" fields met in sources, sensors and simulations,
+# indexed by guid field name suffix. They are the items _replace_guids expands inline.
+_GUID_TARGETS = {
+    "spectrum_guid": ProtoSpectrum.DESCRIPTOR,
+    "intensity_guid": ProtoIntensityTemplate.DESCRIPTOR,
+    "sop_guid": ProtoSOPTemplate.DESCRIPTOR,
+}
+
+_FieldPath = Tuple[FieldDescriptor, ...]
+
+
+class _FieldPathIndex:
+    """Key to field path index of a protobuf message type.
+
+    Only the fields reachable through singular sub messages are indexed, as the dictionary
+    lookups done by ``get(key)`` do not look into lists.
+
+    Parameters
+    ----------
+    descriptor : google.protobuf.descriptor.Descriptor
+        Descriptor of the message type to index.
+    """
+
+    def __init__(self, descriptor: Descriptor) -> None:
+        self.descriptor = descriptor
+        """Descriptor of the indexed message type."""
+        self.paths = {}
+        """Field paths for each field name."""
+        self.guid_paths = []
+        """Field paths of the "xxx_guid" and "xxx_guids" fields."""
+        self.map_paths = []
+        """Field paths of the map fields."""
+        self._index(descriptor=descriptor, prefix=(), stack=(descriptor,))
+
+    def _index(self, descriptor: Descriptor, prefix: _FieldPath, stack: tuple) -> None:
+        for field in descriptor.fields:
+            path = prefix + (field,)
+            self.paths.setdefault(field.name, []).append(path)
+            if _is_map(field):
+                self.map_paths.append(path)
+            elif field.name.endswith("_guid") or field.name.endswith("_guids"):
+                self.guid_paths.append(path)
+            elif (
+                field.message_type is not None
+                and not _is_repeated(field)
+                and field.message_type not in stack
+            ):
+                self._index(
+                    descriptor=field.message_type,
+                    prefix=path,
+                    stack=stack + (field.message_type,),
+                )
+
+    def names(self) -> set:
+        """Names that can appear as key in the dictionary of such message, guids expanded."""
+        names = set(self.paths.keys())
+        for path in self.guid_paths:
+            names.add(_guid_expanded_key(path[-1]))
+            target = _guid_target_index(path[-1])
+            if target is not None:
+                names.update(_index_names(target.descriptor))
+        return names
+
+
+def _is_repeated(field: FieldDescriptor) -> bool:
+    # ``label`` is deprecated since protobuf 6, ``is_repeated`` does not exist before
+    is_repeated = getattr(field, "is_repeated", None)
+    if is_repeated is not None:
+        return is_repeated
+    return field.label == FieldDescriptor.LABEL_REPEATED
+
+
+def _is_map(field: FieldDescriptor) -> bool:
+    return (
+        _is_repeated(field)
+        and field.message_type is not None
+        and field.message_type.GetOptions().map_entry
+    )
+
+
+def _guid_expanded_key(field: FieldDescriptor) -> str:
+    """Key under which _replace_guid_elt stores the item referenced by a guid field."""
+    key = field.name[: field.name.find("_guid")]
+    return key + "s" if _is_repeated(field) else key
+
+
+@lru_cache(maxsize=None)
+def _field_path_index(descriptor: Descriptor) -> _FieldPathIndex:
+    """Return the field path index of a message type, built once per type."""
+    return _FieldPathIndex(descriptor=descriptor)
+
+
+@lru_cache(maxsize=None)
+def _guid_target_index(field: FieldDescriptor) -> Optional[_FieldPathIndex]:
+    """Return the field path index of the item referenced by a guid field, if known."""
+    for suffix, descriptor in _GUID_TARGETS.items():
+        if field.name.endswith(suffix):
+            return _field_path_index(descriptor)
+    return None
+
+
+@lru_cache(maxsize=None)
+def _index_names(descriptor: Descriptor) -> frozenset:
+    return frozenset(_field_path_index(descriptor).names())
+
+
+def _present_value(message: Message, path: _FieldPath) -> Tuple[bool, Any]:
+    """Follow a field path and tell if the last field appears in the message dictionary."""
+    for field in path[:-1]:
+        if not message.HasField(field.name):
+            return False, None
+        message = getattr(message, field.name)
+    field = path[-1]
+    if not _is_repeated(field) and (
+        field.message_type is not None or field.containing_oneof is not None
+    ):
+        if not message.HasField(field.name):
+            return False, None
+    return True, getattr(message, field.name)
+
+
+class _FieldPathRoot:
+    """Message in which a feature key is looked up.
+
+    Parameters
+    ----------
+    descriptor : google.protobuf.descriptor.Descriptor
+        Descriptor of the message.
+    loader : google.protobuf.message.Message or Callable[[], google.protobuf.message.Message]
+        Message, or function returning the message. A function is called at most once, and only
+        when needed.
+    ignored_guids : tuple of str
+        Guid fields that are not expanded: either ignored, or already given as another root.
+    """
+
+    def __init__(
+        self,
+        descriptor: Descriptor,
+        loader: Union[Message, Callable[[], Message]],
+        ignored_guids: Tuple[str, ...] = (),
+    ) -> None:
+        self.index = _field_path_index(descriptor)
+        self.ignored_guids = ignored_guids
+        if isinstance(loader, Message):
+            self._loader, self._message = None, loader
+        else:
+            self._loader, self._message = loader, None
+
+    @property
+    def message(self) -> Message:
+        """Message, loaded on first access."""
+        if self._message is None:
+            self._message = self._loader()
+        return self._message
+
+    def may_contain(self, key: str) -> bool:
+        """Tell if key can be found in the message or in the items it references."""
+        return key in _index_names(self.index.descriptor)
+
+    def dict_keys(self) -> Iterator[str]:
+        """Yield the keys holding a dictionary value in the message dictionary."""
+        for name, paths in self.index.paths.items():
+            for path in paths:
+                if path[-1].message_type is None or (
+                    _is_repeated(path[-1]) and not _is_map(path[-1])
+                ):
+                    continue
+                if _present_value(message=self.message, path=path)[0]:
+                    yield name
+        for path in self.index.guid_paths:
+            if _is_repeated(path[-1]):
+                continue
+            present, value = _present_value(message=self.message, path=path)
+            if present and value != "":
+                yield _guid_expanded_key(path[-1])
+
+
+def _resolve_field_path(roots: List[_FieldPathRoot], key: str) -> Tuple[bool, Any]:
+    """Find the value of a key directly from protobuf messages.
+
+    This gives the value that the exact key has in the dictionary built by ``_replace_guids``
+    and ``_replace_properties`` on the roots, without building it.
+    Only scalar and repeated scalar values are resolved.
+    Other cases are reported as not resolved: when the key is not found, when it leads to a
+    message, or when it is ambiguous (found several times, possibly in referenced items).
+
+    Parameters
+    ----------
+    roots : List[_FieldPathRoot]
+        Messages to look into.
+    key : str
+        Key to look for.
+
+    Returns
+    -------
+    Tuple[bool, Any]
+        Whether the key was resolved, and its value as it appears in the dictionary.
+    """
+    if key == "" or key.endswith("_properties"):
+        return False, None
+    if not any(key in root.index.paths for root in roots):
+        return False, None
+
+    found = []
+    for root in roots:
+        if not root.may_contain(key):
+            continue
+        message = root.message
+        for path in root.index.guid_paths:
+            field = path[-1]
+            if field.name in root.ignored_guids:
+                continue
+            present, value = _present_value(message=message, path=path)
+            if not present or len(value) == 0:
+                continue
+            if key == _guid_expanded_key(field):
+                return False, None
+            if not _is_repeated(field):
+                target = _guid_target_index(field)
+                if target is None or key in _index_names(target.descriptor):
+                    return False, None
+        for path in root.index.map_paths:
+            present, value = _present_value(message=message, path=path)
+            if present and key in value:
+                return False, None
+        for path in root.index.paths.get(key, ()):
+            if _present_value(message=message, path=path)[0]:
+                found.append((root, path))
+    if len(found) != 1:
+        return False, None
+
+    root, path = found[0]
+    if path[-1].message_type is not None:
+        return False, None
+
+    # "xxx_properties" content is moved by _replace_properties into a "xxx..." dictionary.
+    # When no such dictionary exists, the content is dropped from the feature dictionary.
+    for field in path[:-1]:
+        if field.name.endswith("_properties"):
+            prefix = field.name[: field.name.find("_properties")]
+            if not any(
+                k != field.name and k.startswith(prefix) for r in roots for k in r.dict_keys()
+            ):
+                return False, None
+
+    parent = root.message
+    for field in path[:-1]:
+        parent = getattr(parent, field.name)
+    return True, protobuf_message_to_dict(message=parent)[path[-1].name]
@@ -27,7 +27,7 @@ from __future__ import annotations
 from difflib import SequenceMatcher
 from pathlib import Path
 import tempfile
-from typing import List, Mapping, Optional, Union
+from typing import TYPE_CHECKING, List, Mapping, Optional, Union
 import uuid
 import warnings
 
@@ -78,14 +78,20 @@ from ansys.speos.core.generic.parameters import (
     SpectralParameters,
     WavelengthsRangeParameters,
 )
-from ansys.speos.core.generic.visualization_methods import _VisualData, local2absolute
+from ansys.speos.core.generic.visualization_methods import (
+    _fingerprint,
+    _VisualData,
+    transform_points,
+)
 from ansys.speos.core.geo_ref import GeoRef
 from ansys.speos.core.kernel.scene import ProtoScene
 from ansys.speos.core.kernel.sensor_template import ProtoSensorTemplate
 import ansys.speos.core.part as part
-import ansys.speos.core.project as project
 import ansys.speos.core.proto_message_utils as proto_message_utils
 
+if TYPE_CHECKING:  # pragma: no cover
+    import ansys.speos.core.project as project
+
 
 class BaseSensor:
     """Base class for Sensor.
@@ -127,7 +133,7 @@ class BaseSensor:
         self._project = project
         self._name = name
         self._unique_id = None
-        self._visual_data = _VisualData() if general_methods._GRAPHICS_AVAILABLE else None
+        self._visual_data = _VisualData() if general_methods._graphics_available() else None
         self.sensor_template_link = None
         """Link object for the sensor template in database."""
         if metadata is None:
@@ -1042,6 +1048,39 @@ class BaseSensor:
         proto_message_utils._replace_properties(json_dict=out_dict)
         return out_dict
 
+    def _field_path_roots(self) -> Optional[List[proto_message_utils._FieldPathRoot]]:
+        """Messages read by get(key), in the same way as _to_dict, without expanding them."""
+        ssr_inst = self._sensor_instance
+        if self._project.scene_link and self._unique_id is not None:
+            scene_data = self._project.scene_link.get()
+            ssr_inst = next(
+                (x for x in scene_data.sensors if x.metadata["UniqueId"] == self._unique_id),
+                self._sensor_instance,
+            )
+
+        if ssr_inst.sensor_guid != "":
+            if (
+                self.sensor_template_link is None
+                or self.sensor_template_link.key != ssr_inst.sensor_guid
+            ):
+                return None
+            template_loader = self.sensor_template_link.get
+        elif self.sensor_template_link is None:
+            template_loader = self._sensor_template
+        else:
+            template_loader = self.sensor_template_link.get
+
+        return [
+            proto_message_utils._FieldPathRoot(
+                descriptor=ssr_inst.DESCRIPTOR,
+                loader=ssr_inst,
+                ignored_guids=("sensor_guid",),
+            ),
+            proto_message_utils._FieldPathRoot(
+                descriptor=ProtoSensorTemplate.DESCRIPTOR, loader=template_loader
+            ),
+        ]
+
     def get(self, key: str = "") -> str | dict:
         """Get dictionary corresponding to the project - read only.
 
@@ -1055,6 +1094,11 @@ class BaseSensor:
         """
         if key == "":
             return self._to_dict()
+        roots = self._field_path_roots()
+        if roots is not None:
+            resolved, value = proto_message_utils._resolve_field_path(roots=roots, key=key)
+            if resolved:
+                return value
         info = proto_message_utils._value_finder_key_startswith(dict_var=self._to_dict(), key=key)
         content = list(info)
         if len(content) != 0:
@@ -1066,6 +1110,17 @@ class BaseSensor:
         info = proto_message_utils._flatten_dict(dict_var=self._to_dict())
         print("Used key: {} not found in key list: {}.".format(key, info.keys()))
 
+    def _visual_values(self, *keys: str) -> list:
+        """Get the values of several keys, like :meth:`get`, reading the messages once."""
+        roots = self._field_path_roots()
+        values = []
+        for key in keys:
+            resolved, value = False, None
+            if roots is not None:
+                resolved, value = proto_message_utils._resolve_field_path(roots=roots, key=key)
+            values.append(value if resolved else self.get(key=key))
+        return values
+
     def __str__(self) -> str:
         """Return the string representation of the sensor."""
         out_str = ""
@@ -1093,9 +1148,6 @@ class BaseSensor:
         ansys.speos.core.sensor.BaseSensor
             Sensor feature.
         """
-        if general_methods._GRAPHICS_AVAILABLE:
-            self._visual_data.updated = False
-
         # The _unique_id will help to find the correct item in the scene.sensors:
         # the list of SensorInstance
         if self._unique_id is None:
@@ -2106,6 +2158,18 @@ class SensorCamera(BaseSensor):
         self.axis_system = default_parameters.axis_system
         self.lxp_path_number = default_parameters.lxp_path_number
 
+    def _visual_fingerprint(self) -> str:
+        """Fingerprint of the data the camera visualization is built from."""
+        trajectory_file_uri = ""
+        if self.photometric is not None:
+            trajectory_file_uri = self.photometric.trajectory_file_uri
+        return _fingerprint(
+            *self._visual_values(
+                "axis_system", "width", "height", "focal_length", "imager_distance"
+            ),
+            trajectory_file_uri,
+        )
+
     @property
     def visual_data(self) -> _VisualData:
         """Property containing camera sensor visualization data.
@@ -2116,10 +2180,11 @@ class SensorCamera(BaseSensor):
             Instance of VisualData Class for pyvista.PolyData of feature faces, coordinate_systems.
 
         """
-        if self._visual_data.updated:
+        fingerprint = self._visual_fingerprint()
+        if self._visual_data.updated and self._visual_data.fingerprint == fingerprint:
             return self._visual_data
         else:
-            self._visual_data = _VisualData() if general_methods._GRAPHICS_AVAILABLE else None
+            self._visual_data = _VisualData() if general_methods._graphics_available() else None
             feature_pos_info = self.get(key="axis_system")
             feature_camera_pos = np.array(feature_pos_info[:3])
             feature_camera_x_dir = np.array(feature_pos_info[3:6])
@@ -2229,6 +2294,7 @@ class SensorCamera(BaseSensor):
                     self._visual_data.add_data_polyline(points=trajectory_points)
 
             self._visual_data.updated = True
+            self._visual_data.fingerprint = fingerprint
             return self._visual_data
 
     @property
@@ -2685,6 +2751,13 @@ class SensorIrradiance(BaseSensor):
         elif properties.HasField("layer_type_face"):
             self.set_layer_type_face()
 
+    def _visual_fingerprint(self) -> str:
+        """Fingerprint of the data the irradiance sensor visualization is built from."""
+        return _fingerprint(
+            *self._visual_values("axis_system", "x_start", "x_end", "y_start", "y_end"),
+            list(self._sensor_instance.irradiance_properties.integration_direction),
+        )
+
     @property
     def visual_data(self) -> _VisualData:
         """Property containing irradiance sensor visualization data.
@@ -2695,10 +2768,11 @@ class SensorIrradiance(BaseSensor):
             Instance of VisualData Class for pyvista.PolyData of feature faces, coordinate_systems.
 
         """
-        if self._visual_data.updated is True:
+        fingerprint = self._visual_fingerprint()
+        if self._visual_data.updated and self._visual_data.fingerprint == fingerprint:
             return self._visual_data
         else:
-            self._visual_data = _VisualData() if general_methods._GRAPHICS_AVAILABLE else None
+            self._visual_data = _VisualData() if general_methods._graphics_available() else None
             feature_pos_info = self.get(key="axis_system")
             feature_irradiance_pos = np.array(feature_pos_info[:3])
             feature_irradiance_x_dir = np.array(feature_pos_info[3:6])
@@ -2739,6 +2813,7 @@ class SensorIrradiance(BaseSensor):
             self._visual_data.coordinates.z_axis = feature_irradiance_z_dir
 
             self._visual_data.updated = True
+            self._visual_data.fingerprint = fingerprint
             return self._visual_data
 
     @property
@@ -3452,6 +3527,12 @@ class SensorRadiance(BaseSensor):
         elif properties.HasField("layer_type_face"):
             self.set_layer_type_face()
 
+    def _visual_fingerprint(self) -> str:
+        """Fingerprint of the data the radiance sensor visualization is built from."""
+        return _fingerprint(
+            *self._visual_values("axis_system", "x_start", "x_end", "y_start", "y_end", "focal")
+        )
+
     @property
     def visual_data(self) -> _VisualData:
         """Property containing radiance sensor visualization data.
@@ -3462,10 +3543,11 @@ class SensorRadiance(BaseSensor):
             Instance of VisualData Class for pyvista.PolyData of feature faces, coordinate_systems.
 
         """
-        if self._visual_data.updated:
+        fingerprint = self._visual_fingerprint()
+        if self._visual_data.updated and self._visual_data.fingerprint == fingerprint:
             return self._visual_data
         else:
-            self._visual_data = _VisualData() if general_methods._GRAPHICS_AVAILABLE else None
+            self._visual_data = _VisualData() if general_methods._graphics_available() else None
             feature_pos_info = self.get(key="axis_system")
             feature_radiance_pos = np.array(feature_pos_info[:3])
             feature_radiance_x_dir = np.array(feature_pos_info[3:6])
@@ -3512,6 +3594,7 @@ class SensorRadiance(BaseSensor):
             self._visual_data.coordinates.y_axis = feature_radiance_y_dir
 
             self._visual_data.updated = True
+            self._visual_data.fingerprint = fingerprint
             return self._visual_data
 
     @property
@@ -4401,6 +4484,44 @@ class Sensor3DIrradiance(BaseSensor):
         """
         return self._layer_type
 
+    def _geometry_faces(
+        self, mesh_geo_paths: List[str]
+    ) -> List[tuple[List[face.Face], List[List[float]]]]:
+        """Get the faces of the sensor geometries, with the axis systems placing them."""
+        geometry_faces = []
+        for mesh_geo_path in mesh_geo_paths:
+            found = self._project.find(name=mesh_geo_path, feature_type=core.face.Face)
+            if len(found) != 0:
+                # the geometry is a face
+                mesh_faces, parent_part = found[:1], found[0]._parent_body._parent_part
+            else:
+                found = self._project.find(name=mesh_geo_path, feature_type=core.body.Body)
+                if len(found) == 0:
+                    raise ValueError(
+                        "{} linked to Sensor 3D irradiance {} is not "
+                        "a valid geometry Face or Body".format(mesh_geo_path, self._name)
+                    )
+                mesh_faces, parent_part = found[0]._geom_features, found[0]._parent_part
+            part_axis_systems = []
+            if isinstance(parent_part, core.part.Part.SubPart):
+                # the geometry has a local coordinate
+                part_axis_systems = parent_part._instance_axis_systems()
+            geometry_faces.append((mesh_faces, part_axis_systems))
+        return geometry_faces
+
+    def _visual_fingerprint(self) -> str:
+        """Fingerprint of the data the 3d irradiance sensor visualization is built from."""
+        (mesh_geo_paths,) = self._visual_values("geo_paths")
+        return _fingerprint(
+            *(
+                (
+                    [(id(mesh_face), mesh_face._revision) for mesh_face in mesh_faces],
+                    [list(axis_system) for axis_system in part_axis_systems],
+                )
+                for mesh_faces, part_axis_systems in self._geometry_faces(mesh_geo_paths)
+            )
+        )
+
     @property
     def visual_data(self) -> _VisualData:
         """Property containing 3d irradiance sensor visualization data.
@@ -4411,59 +4532,25 @@ class Sensor3DIrradiance(BaseSensor):
             Instance of VisualData Class for pyvista.PolyData of feature faces, coordinate_systems.
 
         """
-        if self._visual_data.updated:
+        fingerprint = self._visual_fingerprint()
+        if self._visual_data.updated and self._visual_data.fingerprint == fingerprint:
             return self._visual_data
         else:
-            self._visual_data = _VisualData() if general_methods._GRAPHICS_AVAILABLE else None
-            mesh_geo_paths = self.get(key="geo_paths")
-            for mesh_geo_path in mesh_geo_paths:
-                if len(self._project.find(name=mesh_geo_path, feature_type=core.face.Face)) != 0:
-                    # the geometry is a face
-                    mesh_geo = self._project.find(name=mesh_geo_path, feature_type=core.face.Face)[
-                        0
-                    ]
-                    face_data = mesh_geo._face
+            self._visual_data = _VisualData() if general_methods._graphics_available() else None
+            for mesh_faces, part_axis_systems in self._geometry_faces(self.get(key="geo_paths")):
+                for mesh_face in mesh_faces:
+                    face_data = mesh_face._face
                     vertices = np.array(face_data.vertices).reshape(-1, 3)
-                    if isinstance(mesh_geo._parent_body._parent_part, core.part.Part.SubPart):
-                        # the geometry has a local coordinate
-                        part_coordinate_info = (
-                            mesh_geo._parent_body._parent_part._part_instance.axis_system
-                        )
-                        vertices = np.array(
-                            [local2absolute(vertice, part_coordinate_info) for vertice in vertices]
-                        )
+                    if part_axis_systems:
+                        transform_points(vertices, *part_axis_systems, out=vertices)
                     facets = np.array(face_data.facets).reshape(-1, 3)
                     temp = np.full(facets.shape[0], 3)
                     temp = np.vstack(temp)
                     facets = np.hstack((temp, facets))
                     self._visual_data.add_data_mesh(vertices=vertices, facets=facets)
-                elif len(self._project.find(name=mesh_geo_path, feature_type=core.body.Body)) != 0:
-                    mesh_geo = self._project.find(name=mesh_geo_path, feature_type=core.body.Body)[
-                        0
-                    ]
-                    for mesh_geo_face in mesh_geo._geom_features:
-                        face_data = mesh_geo_face._face
-                        vertices = np.array(face_data.vertices).reshape(-1, 3)
-                        if isinstance(mesh_geo._parent_part, core.part.Part.SubPart):
-                            part_coordinate_info = mesh_geo._parent_part._part_instance.axis_system
-                            vertices = np.array(
-                                [
-                                    local2absolute(vertice, part_coordinate_info)
-                                    for vertice in vertices
-                                ]
-                            )
-                        facets = np.array(face_data.facets).reshape(-1, 3)
-                        temp = np.full(facets.shape[0], 3)
-                        temp = np.vstack(temp)
-                        facets = np.hstack((temp, facets))
-                        self._visual_data.add_data_mesh(vertices=vertices, facets=facets)
-                else:
-                    raise ValueError(
-                        "{} linked to Sensor 3D irradiance {} is not "
-                        "a valid geometry Face or Body".format(mesh_geo_path, self._name)
-                    )
 
             self._visual_data.updated = True
+            self._visual_data.fingerprint = fingerprint
             return self._visual_data
 
     def set_type_photometric(self) -> Sensor3DIrradiance.Photometric:
@@ -4828,6 +4915,19 @@ class SensorXMPIntensity(BaseSensor):
         elif properties.HasField("layer_type_face"):
             self.set_layer_type_face()
 
+    def _visual_fingerprint(self) -> str:
+        """Fingerprint of the data the intensity sensor visualization is built from."""
+        intensity_template = self._sensor_template.intensity_sensor_template
+        if intensity_template.HasField("intensity_orientation_conoscopic"):
+            keys = ("axis_system", "theta_max")
+        else:
+            keys = ("axis_system", "x_start", "x_end", "y_start", "y_end")
+        return _fingerprint(
+            *self._visual_values(*keys),
+            intensity_template.WhichOneof("orientation"),
+            self._vis_radius,
+        )
+
     @property
     def visual_data(self) -> _VisualData:
         """Property containing intensity sensor visualization data.
@@ -4855,9 +4955,11 @@ class SensorXMPIntensity(BaseSensor):
             r33 = np.cos(theta) + uz * uz * (1 - np.cos(theta))
             return np.array([[r11, r12, r13], [r21, r22, r23], [r31, r32, r33]])
 
-        if self._visual_data.updated:
+        fingerprint = self._visual_fingerprint()
+        if self._visual_data.updated and self._visual_data.fingerprint == fingerprint:
             return self._visual_data
 
+        self._visual_data = _VisualData() if general_methods._graphics_available() else None
         feature_pos_info = self.get(key="axis_system")
         feature_pos = np.array(feature_pos_info[:3])
         feature_x_dir = np.array(feature_pos_info[3:6])
@@ -4962,6 +5064,7 @@ class SensorXMPIntensity(BaseSensor):
         self._visual_data.coordinates.y_axis = feature_y_dir
 
         self._visual_data.updated = True
+        self._visual_data.fingerprint = fingerprint
         return self._visual_data
 
     @property
@@ -27,7 +27,7 @@ from __future__ import annotations
 from difflib import SequenceMatcher
 from pathlib import Path
 import time
-from typing import List, Mapping, Optional, Union
+from typing import TYPE_CHECKING, List, Mapping, Optional, Union
 import uuid
 import warnings
 
@@ -51,11 +51,13 @@ from ansys.speos.core.kernel.proto_message_utils import protobuf_message_to_str
 from ansys.speos.core.kernel.scene import ProtoScene
 from ansys.speos.core.kernel.simulation_template import ProtoSimulationTemplate
 from ansys.speos.core.logger import LOG
-import ansys.speos.core.project as project
 import ansys.speos.core.proto_message_utils as proto_message_utils
 from ansys.speos.core.sensor import BaseSensor
 from ansys.speos.core.source import BaseSource
 
+if TYPE_CHECKING:  # pragma: no cover
+    import ansys.speos.core.project as project
+
 MIN_SOURCE_GROUPS_VERSION = (26, 1, 2)
 
 
@@ -1081,6 +1083,44 @@ class BaseSimulation:
 
         return out_dict
 
+    def _field_path_roots(self) -> Optional[List[proto_message_utils._FieldPathRoot]]:
+        """Messages read by get(key), in the same way as _to_dict, without expanding them."""
+        sim_inst = self._simulation_instance
+        if self._project.scene_link and self._unique_id is not None:
+            scene_data = self._project.scene_link.get()
+            sim_inst = next(
+                (x for x in scene_data.simulations if x.metadata["UniqueId"] == self._unique_id),
+                self._simulation_instance,
+            )
+
+        if sim_inst.simulation_guid != "":
+            if (
+                self.simulation_template_link is None
+                or self.simulation_template_link.key != sim_inst.simulation_guid
+            ):
+                return None
+            template_loader = self.simulation_template_link.get
+        elif self.simulation_template_link is None:
+            template_loader = self._simulation_template
+        else:
+            template_loader = self.simulation_template_link.get
+
+        return [
+            proto_message_utils._FieldPathRoot(
+                descriptor=sim_inst.DESCRIPTOR,
+                loader=sim_inst,
+                ignored_guids=("simulation_guid",),
+            ),
+            proto_message_utils._FieldPathRoot(
+                descriptor=ProtoSimulationTemplate.DESCRIPTOR, loader=template_loader
+            ),
+            proto_message_utils._FieldPathRoot(
+                descriptor=ProtoJob.DESCRIPTOR,
+                loader=self._job if self.job_link is None else self.job_link.get,
+                ignored_guids=("scene_guid",),
+            ),
+        ]
+
     def get(self, key: str = "") -> str | dict:
         """Get dictionary corresponding to the project - read only.
 
@@ -1095,6 +1135,11 @@ class BaseSimulation:
         """
         if key == "":
             return self._to_dict()
+        roots = self._field_path_roots()
+        if roots is not None:
+            resolved, value = proto_message_utils._resolve_field_path(roots=roots, key=key)
+            if resolved:
+                return value
         info = proto_message_utils._value_finder_key_startswith(dict_var=self._to_dict(), key=key)
         content = list(info)
         if len(content) != 0:
@@ -26,17 +26,14 @@ from __future__ import annotations
 
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import List, Mapping, Optional, Union
+from typing import TYPE_CHECKING, List, Mapping, Optional, Union
 import uuid
 
 from ansys.api.speos.scene.v2 import scene_pb2
 from ansys.api.speos.source.v1 import source_pb2
 import numpy as np
 
-from ansys.speos.core import (
-    project as project,
-    proto_message_utils as proto_message_utils,
-)
+from ansys.speos.core import proto_message_utils as proto_message_utils
 import ansys.speos.core.body as body
 import ansys.speos.core.face as face
 import ansys.speos.core.generic.general_methods as general_methods
@@ -69,15 +66,19 @@ from ansys.speos.core.generic.parameters import (
     VariableExitanceParameters,
     WhitePointType,
 )
-from ansys.speos.core.generic.visualization_methods import _VisualArrow, _VisualData
+from ansys.speos.core.generic.visualization_methods import _fingerprint, _VisualData
 from ansys.speos.core.geo_ref import GeoRef
 import ansys.speos.core.intensity as intensity
 from ansys.speos.core.intensity import Intensity
+from ansys.speos.core.kernel import bundle
 from ansys.speos.core.kernel.client import SpeosClient
 from ansys.speos.core.kernel.scene import ProtoScene
 from ansys.speos.core.kernel.source_template import ProtoSourceTemplate
 from ansys.speos.core.spectrum import Spectrum
 
+if TYPE_CHECKING:  # pragma: no cover
+    import ansys.speos.core.project as project
+
 
 class BaseSource:
     """
@@ -544,7 +545,7 @@ class BaseSource:
         self._name = name
         self._source_path = self._name
         self._unique_id = None
-        self._visual_data = _VisualData(ray=True) if general_methods._GRAPHICS_AVAILABLE else None
+        self._visual_data = _VisualData(ray=True) if general_methods._graphics_available() else None
         self.source_template_link = None
         """Link object for the source template in database."""
 
@@ -806,6 +807,39 @@ class BaseSource:
 
         return out_dict
 
+    def _field_path_roots(self) -> Optional[List[proto_message_utils._FieldPathRoot]]:
+        """Messages read by get(key), in the same way as _to_dict, without expanding them."""
+        src_inst = self._source_instance
+        if self._project.scene_link and self._unique_id is not None:
+            scene_data = self._project.scene_link.get()
+            src_inst = next(
+                (x for x in scene_data.sources if x.metadata["UniqueId"] == self._unique_id),
+                self._source_instance,
+            )
+
+        if src_inst.source_guid != "":
+            if (
+                self.source_template_link is None
+                or self.source_template_link.key != src_inst.source_guid
+            ):
+                return None
+            template_loader = self.source_template_link.get
+        elif self.source_template_link is None:
+            template_loader = self._source_template
+        else:
+            template_loader = self.source_template_link.get
+
+        return [
+            proto_message_utils._FieldPathRoot(
+                descriptor=src_inst.DESCRIPTOR,
+                loader=src_inst,
+                ignored_guids=("source_guid",),
+            ),
+            proto_message_utils._FieldPathRoot(
+                descriptor=ProtoSourceTemplate.DESCRIPTOR, loader=template_loader
+            ),
+        ]
+
     def get(self, key: str = "") -> List[tuple[str, dict]]:
         """Get dictionary corresponding to the project - read only.
 
@@ -819,6 +853,11 @@ class BaseSource:
         """
         if key == "":
             return self._to_dict()
+        roots = self._field_path_roots()
+        if roots is not None:
+            resolved, value = proto_message_utils._resolve_field_path(roots=roots, key=key)
+            if resolved:
+                return value
         info = proto_message_utils._value_finder_key_startswith(dict_var=self._to_dict(), key=key)
         content = list(info)
         if len(content) != 0:
@@ -830,6 +869,27 @@ class BaseSource:
         info = proto_message_utils._flatten_dict(dict_var=self._to_dict())
         print("Used key: {} not found in key list: {}.".format(key, info.keys()))
 
+    def _visual_fingerprint(self) -> Optional[str]:
+        """Fingerprint of the data the source rays are computed from by the server.
+
+        ``None`` if the source data cannot be resolved.
+        """
+        roots = self._field_path_roots()
+        if roots is None:
+            return None
+        source_instance, source_template = (root.message for root in roots)
+        # Items used by the template, like spectrums, can change without changing their key
+        referenced = bundle.item_links(
+            self._project.client,
+            {key: (kind, None) for kind, key in bundle._referenced_keys(source_template)},
+        )
+        return _fingerprint(
+            self._name,
+            source_instance,
+            source_template,
+            *(link.get() for link in referenced.values()),
+        )
+
     def __str__(self) -> str:
         """Return the string representation of the source."""
         out_str = ""
@@ -974,8 +1034,6 @@ class BaseSource:
         if hasattr(self, "_spectrum"):
             self._spectrum._commit()
         self._commit()
-        if general_methods._GRAPHICS_AVAILABLE:
-            self._visual_data.updated = False
         return self
 
     def reset(self) -> BaseSource:
@@ -1126,22 +1184,22 @@ class SourceLuminaire(BaseSource):
             feature rays, coordinate_systems.
 
         """
-        if self._visual_data.updated:
+        fingerprint = self._visual_fingerprint()
+        if (
+            self._visual_data.updated
+            and fingerprint is not None
+            and self._visual_data.fingerprint == fingerprint
+        ):
             return self._visual_data
         else:
             self._visual_data = (
-                _VisualData(ray=True) if general_methods._GRAPHICS_AVAILABLE else None
+                _VisualData(ray=True) if general_methods._graphics_available() else None
             )
-            for ray_path in self._project.scene_link.get_source_ray_paths(
-                self._name, rays_nb=100, raw_data=True, display_data=True
-            ):
-                self._visual_data.add_data_line(
-                    _VisualArrow(
-                        line_vertices=[ray_path.impacts_coordinates, ray_path.last_direction],
-                        color=tuple(ray_path.colors.values),
-                        arrow=False,
-                    )
+            self._visual_data.add_data_rays(
+                self._project.scene_link.get_source_ray_path_arrays(
+                    self._name, rays_nb=100, raw_data=True, display_data=True
                 )
+            )
             feature_pos_info = self.get(key="axis_system")
             feature_luminaire_pos = np.array(feature_pos_info[:3])
             feature_luminaire_x_dir = np.array(feature_pos_info[3:6])
@@ -1152,6 +1210,7 @@ class SourceLuminaire(BaseSource):
             self._visual_data.coordinates.y_axis = feature_luminaire_y_dir
             self._visual_data.coordinates.z_axis = feature_luminaire_z_dir
             self._visual_data.updated = True
+            self._visual_data.fingerprint = fingerprint
             return self._visual_data
 
     def set_flux_from_intensity_file(self) -> SourceLuminaire:
@@ -1439,22 +1498,22 @@ class SourceRayFile(BaseSource):
             Instance of VisualData Class for pyvista.PolyData of feature rays, coordinate_systems.
 
         """
-        if self._visual_data.updated:
+        fingerprint = self._visual_fingerprint()
+        if (
+            self._visual_data.updated
+            and fingerprint is not None
+            and self._visual_data.fingerprint == fingerprint
+        ):
             return self._visual_data
         else:
             self._visual_data = (
-                _VisualData(ray=True) if general_methods._GRAPHICS_AVAILABLE else None
+                _VisualData(ray=True) if general_methods._graphics_available() else None
             )
-            for ray_path in self._project.scene_link.get_source_ray_paths(
-                self._name, rays_nb=100, raw_data=True, display_data=True
-            ):
-                self._visual_data.add_data_line(
-                    _VisualArrow(
-                        line_vertices=[ray_path.impacts_coordinates, ray_path.last_direction],
-                        color=tuple(ray_path.colors.values),
-                        arrow=False,
-                    )
+            self._visual_data.add_data_rays(
+                self._project.scene_link.get_source_ray_path_arrays(
+                    self._name, rays_nb=100, raw_data=True, display_data=True
                 )
+            )
             feature_pos_info = self.get(key="axis_system")
             feature_rayfile_pos = np.array(feature_pos_info[:3])
             feature_rayfile_x_dir = np.array(feature_pos_info[3:6])
@@ -1465,6 +1524,7 @@ class SourceRayFile(BaseSource):
             self._visual_data.coordinates.y_axis = feature_rayfile_y_dir
             self._visual_data.coordinates.z_axis = feature_rayfile_z_dir
             self._visual_data.updated = True
+            self._visual_data.fingerprint = fingerprint
             return self._visual_data
 
     @property
@@ -2053,7 +2113,12 @@ class SourceSurface(BaseSource):
             Instance of VisualData Class for pyvista.PolyData of feature rays, coordinate_systems.
 
         """
-        if self._visual_data.updated:
+        fingerprint = self._visual_fingerprint()
+        if (
+            self._visual_data.updated
+            and fingerprint is not None
+            and self._visual_data.fingerprint == fingerprint
+        ):
             return self._visual_data
         else:
             self._visual_data = (
@@ -2063,19 +2128,14 @@ class SourceSurface(BaseSource):
                     if isinstance(self._exitance_type, SourceSurface.ExitanceVariable)
                     else False,
                 )
-                if general_methods._GRAPHICS_AVAILABLE
+                if general_methods._graphics_available()
                 else None
             )
-            for ray_path in self._project.scene_link.get_source_ray_paths(
-                self._name, rays_nb=100, raw_data=True, display_data=True
-            ):
-                self._visual_data.add_data_line(
-                    _VisualArrow(
-                        line_vertices=[ray_path.impacts_coordinates, ray_path.last_direction],
-                        color=tuple(ray_path.colors.values),
-                        arrow=False,
-                    )
+            self._visual_data.add_data_rays(
+                self._project.scene_link.get_source_ray_path_arrays(
+                    self._name, rays_nb=100, raw_data=True, display_data=True
                 )
+            )
             if self._visual_data.coordinates is not None:
                 feature_pos_info = self.get(key="axis_plane")
                 feature_surface_pos = np.array(feature_pos_info[:3])
@@ -2085,6 +2145,7 @@ class SourceSurface(BaseSource):
                 self._visual_data.coordinates.x_axis = feature_surface_x_dir
                 self._visual_data.coordinates.y_axis = feature_surface_y_dir
             self._visual_data.updated = True
+            self._visual_data.fingerprint = fingerprint
             return self._visual_data
 
     def set_flux_from_intensity_file(self) -> SourceSurface:
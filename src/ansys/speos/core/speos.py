@@ -24,7 +24,7 @@
 
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from grpc import Channel
 
@@ -63,6 +63,19 @@ class Speos:
         By default, ``INFO``.
     logging_file : Optional[str, Path]
         The file to output the log, if requested. By default, ``None``.
+    channel_factory : Callable[[], grpc.Channel], optional
+        Function creating additional channels to the same server as ``channel``.
+        By default, ``None``.
+    bulk_channels : int, optional
+        Number of additional channels dedicated to face and file transfers.
+        By default, ``0``.
+    control_channel : bool, optional
+        Whether job control requests get their own channel.
+        By default, ``False``.
+    collect_stats : bool, optional
+        Whether to record statistics of every gRPC call, see
+        :meth:`SpeosClient.stats <ansys.speos.core.kernel.client.SpeosClient.stats>`.
+        By default, ``False``.
 
     Examples
     --------
@@ -99,6 +112,10 @@ class Speos:
         logging_level: Optional[int] = logging.INFO,
         logging_file: Optional[Union[Path, str]] = None,
         speos_install_path: Optional[Union[Path, str]] = None,
+        channel_factory: Optional[Callable[[], Channel]] = None,
+        bulk_channels: int = 0,
+        control_channel: bool = False,
+        collect_stats: bool = False,
     ):
         self._client = SpeosClient(
             version=version,
@@ -108,6 +125,10 @@ class Speos:
             logging_level=logging_level,
             logging_file=logging_file,
             speos_install_path=speos_install_path,
+            channel_factory=channel_factory,
+            bulk_channels=bulk_channels,
+            control_channel=control_channel,
+            collect_stats=collect_stats,
         )
 
     @property
@@ -22,10 +22,15 @@
 
 """Import geometries and materials from several SPEOS files to a project."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
+from ansys.speos.core import part
+from ansys.speos.core.kernel import bundle
+from ansys.speos.core.kernel.client import SpeosClient
 from ansys.speos.core.kernel.part import PartLink, ProtoPart
+from ansys.speos.core.kernel.scene import SceneLink
 from ansys.speos.core.project import Project
 from ansys.speos.core.speos import Speos
 
@@ -72,12 +77,21 @@ class SpeosFileInstance:
             self.name = Path(speos_file).stem
 
 
-def insert_speos(project: Project, speos_to_insert: List[SpeosFileInstance]) -> None:
+def insert_speos(
+    project: Project,
+    speos_to_insert: List[SpeosFileInstance],
+    max_workers: Optional[int] = None,
+) -> None:
     """Import geometries and materials from the selected SPEOS files to the existing project.
 
     Geometries and materials are placed in the root part, and orientated thanks to the
     SpeosFileInstance object.
 
+    Each distinct SPEOS file is loaded once, the files being loaded concurrently. Instances of the
+    same file share the loaded geometry: they are several placements of one part, so editing the
+    geometry of one instance changes every instance of that file. Materials are copied for each
+    instance.
+
     Notes
     -----
     Sources, Sensors and Simulations are not imported to the project.
@@ -88,6 +102,9 @@ def insert_speos(project: Project, speos_to_insert: List[SpeosFileInstance]) ->
         Project in which to import geometries and materials from SPEOS files.
     speos_to_combine : List[ansys.speos.core.workflow.combine_speos.SpeosFileInstance]
         List of SPEOS files, location and orientation of geometries to be imported to the project.
+    max_workers : Optional[int]
+        Number of files loaded at the same time.
+        By default, ``None``, which lets ``concurrent.futures.ThreadPoolExecutor`` decide.
     """
     # Part link : either create it empty if none is present in the project's scene
     # or just retrieve it from project's scene
@@ -98,15 +115,29 @@ def insert_speos(project: Project, speos_to_insert: List[SpeosFileInstance]) ->
         part_link = project.client[project.scene_link.get().part_guid]
 
     # Combine all speos_to_insert into the project
-    _combine(project=project, part_link=part_link, speos_to_combine=speos_to_insert)
+    _combine(
+        project=project,
+        part_link=part_link,
+        speos_to_combine=speos_to_insert,
+        max_workers=max_workers,
+    )
 
 
-def combine_speos(speos: Speos, speos_to_combine: List[SpeosFileInstance]) -> Project:
+def combine_speos(
+    speos: Speos,
+    speos_to_combine: List[SpeosFileInstance],
+    max_workers: Optional[int] = None,
+) -> Project:
     """Create a project by combining geometries and materials from the selected SPEOS files.
 
     Geometries and materials are placed in the root part,
     and orientated thanks to the SpeosFileInstance object.
 
+    Each distinct SPEOS file is loaded once, the files being loaded concurrently. Instances of the
+    same file share the loaded geometry: they are several placements of one part, so editing the
+    geometry of one instance changes every instance of that file. Materials are copied for each
+    instance.
+
     Notes
     -----
         Sources, Sensors and Simulations are not imported to the project.
@@ -117,6 +148,9 @@ def combine_speos(speos: Speos, speos_to_combine: List[SpeosFileInstance]) -> Pr
         Speos session (connected to gRPC server).
     speos_to_combine : List[ansys.speos.core.workflow.combine_speos.SpeosFileInstance]
         List of SPEOS files, location and orientation of geometries to be imported to the project.
+    max_workers : Optional[int]
+        Number of files loaded at the same time.
+        By default, ``None``, which lets ``concurrent.futures.ThreadPoolExecutor`` decide.
 
     Returns
     -------
@@ -128,23 +162,45 @@ def combine_speos(speos: Speos, speos_to_combine: List[SpeosFileInstance]) -> Pr
     part_link = speos.client.parts().create(message=ProtoPart())
 
     # Combine all speos_to_combine into the project
-    _combine(project=p, part_link=part_link, speos_to_combine=speos_to_combine)
+    _combine(
+        project=p, part_link=part_link, speos_to_combine=speos_to_combine, max_workers=max_workers
+    )
 
     return p
 
 
+def _load_scene(speos_client: SpeosClient, speos_file: str) -> SceneLink:
+    """Load a SPEOS file in a new scene."""
+    scene_link = speos_client.scenes().create()
+    scene_link.load_file(file_uri=speos_file)
+    return scene_link
+
+
 def _combine(
     project: Project,
     part_link: PartLink,
     speos_to_combine: List[SpeosFileInstance],
+    max_workers: Optional[int] = None,
 ):
     scene_data = project.scene_link.get()
     part_data = part_link.get()
+    nb_parts = len(part_data.parts)
+    nb_materials = len(scene_data.materials)
+
+    # Load each distinct file once, several files at the same time
+    speos_files = list(dict.fromkeys(spc.speos_file for spc in speos_to_combine))
+    project.client.scenes()  # open the database access before sharing the client between threads
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        scene_links = list(
+            executor.map(lambda speos_file: _load_scene(project.client, speos_file), speos_files)
+        )
+    loaded = {}
+    for speos_file, scene_link in zip(speos_files, scene_links):
+        loaded[speos_file] = bundle.collect_items(project.client, scene_link)
 
     for spc in speos_to_combine:
-        scene_tmp = project.client.scenes().create()
-        scene_tmp.load_file(file_uri=spc.speos_file)
-        scene_tmp_data = scene_tmp.get()
+        items = loaded[spc.speos_file]
+        scene_tmp_data = next(iter(items.values()))[1]
 
         part_inst = ProtoPart.PartInstance(name=spc.name)
         part_inst.axis_system[:] = spc.axis_system
@@ -153,12 +209,33 @@ def _combine(
 
         for mat in scene_tmp_data.materials:
             if mat.HasField("sop_guid") or mat.HasField("texture") or len(mat.sop_guids) > 0:
-                mat.name = spc.name + "." + mat.name
-                mat.geometries.geo_paths[:] = [spc.name + "/" + x for x in mat.geometries.geo_paths]
-                scene_data.materials.append(mat)
-
+                new_mat = scene_data.materials.add()
+                new_mat.CopyFrom(mat)
+                new_mat.name = spc.name + "." + mat.name
+                new_mat.geometries.geo_paths[:] = [
+                    spc.name + "/" + x for x in mat.geometries.geo_paths
+                ]
+
+    root_part_feats = project.find(name="", feature_type=part.Part)
+    if not root_part_feats:
+        part_data.name = "RootPart"
+    Project._set_unique_ids(scene_data, part_data)
     part_link.set(data=part_data)
     scene_data.part_guid = part_link.key
     project.scene_link.set(data=scene_data)
 
-    project._fill_features()
+    # Build the features of the inserted geometries from the items read after loading
+    responses = {}
+    for items in loaded.values():
+        responses.update(bundle.read_responses(items, bundle.item_links(project.client, items)))
+    with project.client._preloaded(responses):
+        if not root_part_feats:
+            project._fill_features()
+            return
+        root_part_feat = root_part_feats[0]
+        root_part_feat.part_link = part_link
+        root_part_feat._part = part_data
+        project._fill_subparts(sub_parts=part_data.parts[nb_parts:], feat_host=root_part_feat)
+        for mat_inst in scene_data.materials[nb_materials:]:
+            op_feature = project.create_optical_property(name=mat_inst.name)
+            op_feature._fill(mat_inst=mat_inst)
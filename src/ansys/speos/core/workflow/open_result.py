@@ -40,8 +40,6 @@ if os.name == "nt":
     from comtypes.client import CreateObject
 
 
-import matplotlib.image as mpimg
-import matplotlib.pyplot as plt
 import numpy
 
 from ansys.speos.core.simulation import (
@@ -105,7 +103,11 @@ def _find_correct_result(
     return file_path
 
 
-def _display_image(img: numpy.ndarray):
+def _display_image(image_path: Union[str, Path]):
+    import matplotlib.image as mpimg
+    import matplotlib.pyplot as plt
+
+    img = mpimg.imread(str(image_path))
     if img is not None:
         plt.imshow(img)
         plt.axis("off")  # turns off axes
@@ -156,7 +158,7 @@ def open_result_image(
                 result_name=result_name,
             )
             if res.HasField("path"):
-                _display_image(mpimg.imread(res.path))
+                _display_image(res.path)
                 return Path(res.path)
             elif res.HasField("upload_response"):
                 file_transfer = FileTransfer(simulation_feature._project.client)
@@ -167,14 +169,14 @@ def open_result_image(
                 downloaded_file_path = (
                     Path(tempfile.gettempdir()) / res.upload_response.info.file_name
                 )
-                _display_image(mpimg.imread(str(downloaded_file_path)))
+                _display_image(str(downloaded_file_path))
                 return downloaded_file_path
         elif os.name == "nt":  # Are we running on Windows OS?
             dpf_instance = CreateObject("XMPViewer.Application")
             dpf_instance.OpenFile(file_path)
             res = dpf_instance.ExportXMPImage(file_path + ".png", 1)
             if res:
-                _display_image(mpimg.imread(file_path + ".png"))
+                _display_image(file_path + ".png")
                 return Path(file_path + ".png")
         else:
             raise NotImplementedError(
@@ -182,7 +184,7 @@ def open_result_image(
                     Or on Windows OS with older Speos versions."
             )
     elif result_name.lower().endswith("png"):
-        _display_image(mpimg.imread(file_path))
+        _display_image(file_path)
         return Path(file_path)
 
     return Path()
@@ -0,0 +1,141 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark Configuration Module.
+
+Benchmarks run against the in-process fake server of :mod:`tests.fake_server`, so they measure the
+client side cost of PySpeos only. They need ``pytest-benchmark`` and are ignored without it.
+
+The sizes exercised are read from the ``PYSPEOS_BENCHMARK_SCALES`` environment variable, a comma
+separated list of integers, ``1000`` by default. Typical usage to track regressions between two
+revisions::
+
+    PYSPEOS_BENCHMARK_SCALES=1000,10000,100000,1000000 pytest tests/benchmarks --no-cov \
+        --benchmark-only --benchmark-autosave
+    pytest tests/benchmarks --no-cov --benchmark-only --benchmark-compare \
+        --benchmark-compare-fail=mean:10%
+"""
+
+import importlib.util
+import logging
+import os
+from typing import List
+
+from ansys.api.speos.lpf.v2 import lpf_file_reader_pb2 as lpf_messages
+import numpy as np
+import pytest
+
+from ansys.speos.core.kernel.body import ProtoBody
+from ansys.speos.core.kernel.client import SpeosClient
+from ansys.speos.core.kernel.face import ProtoFace
+from ansys.speos.core.kernel.part import PartLink, ProtoPart
+from ansys.speos.core.kernel.scene import ProtoScene
+from tests.fake_server import FakeSpeosServer, FakeStore
+
+if importlib.util.find_spec("pytest_benchmark") is None:
+    collect_ignore_glob = ["test_*.py"]
+
+SCALES = [int(s) for s in os.environ.get("PYSPEOS_BENCHMARK_SCALES", "1000").split(",")]
+"""Sizes used to parametrize the benchmarks."""
+
+FACES_PER_BODY = 10
+"""Number of faces of each body in generated parts."""
+
+
+@pytest.fixture(scope="session")
+def fake_server():
+    """Start the fake server once for all benchmarks."""
+    with FakeSpeosServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def fake_speos(fake_server):
+    """Create a session on the fake server."""
+    return fake_server.speos(logging_level=logging.WARNING)
+
+
+@pytest.fixture(autouse=True)
+def clean_store(fake_server):
+    """Start every benchmark from an empty fake server."""
+    yield
+    fake_server.store.clear()
+
+
+def triangle_face(name: str, offset: float = 0.0) -> ProtoFace:
+    """Create a face made of one triangle."""
+    return ProtoFace(
+        name=name,
+        vertices=[offset, 0.0, 0.0, offset + 1.0, 0.0, 0.0, offset, 1.0, 0.0],
+        facets=[0, 1, 2],
+        normals=[0.0, 0.0, 1.0] * 3,
+    )
+
+
+def build_part(client: SpeosClient, nb_faces: int) -> PartLink:
+    """Create a part with ``nb_faces`` triangles, grouped by bodies of ``FACES_PER_BODY``."""
+    face_links = client.faces().create_batch(
+        message_list=[triangle_face(f"Face.{i}", offset=float(i)) for i in range(nb_faces)]
+    )
+    body_guids = []
+    for i in range(0, nb_faces, FACES_PER_BODY):
+        body_link = client.bodies().create(
+            message=ProtoBody(
+                name=f"Body.{i // FACES_PER_BODY}",
+                face_guids=[f.key for f in face_links[i : i + FACES_PER_BODY]],
+            )
+        )
+        body_guids.append(body_link.key)
+    return client.parts().create(message=ProtoPart(name="Part", body_guids=body_guids))
+
+
+def register_scene_file(store: FakeStore, client: SpeosClient, nb_faces: int, uri: str) -> None:
+    """Make a scene with a part of ``nb_faces`` triangles loadable from ``uri``."""
+    part_link = build_part(client, nb_faces)
+    store.register_scene_file(uri, ProtoScene(name="Scene", part_guid=part_link.key))
+
+
+def lpf_ray_paths(nb_rays: int, nb_impacts: int = 4, seed: int = 0) -> List:
+    """Create reproducible LPF ray paths, one in hundred ending in error."""
+    rng = np.random.default_rng(seed)
+    impacts = rng.random((nb_rays, nb_impacts, 3), dtype=np.float32) * 100.0
+    wavelengths = rng.uniform(400.0, 700.0, nb_rays)
+    face_ids = rng.integers(0, 1000, (nb_rays, nb_impacts))
+    status_ok = lpf_messages.RayPath.StatusAbsorbed
+    status_error = lpf_messages.RayPath.StatusError
+    ray_paths = []
+    for i in range(nb_rays):
+        ray_path = lpf_messages.RayPath(
+            impacts=[lpf_messages.TripletFloat(x=x, y=y, z=z) for x, y, z in impacts[i].tolist()],
+            wavelengths=[wavelengths[i]] * nb_impacts,
+            body_context_ids=[int(f) // 10 for f in face_ids[i]],
+            unique_face_ids=face_ids[i].tolist(),
+            interaction_statuses=[lpf_messages.RayPath.StatusSpecularTransmitted] * (nb_impacts - 1)
+            + [status_error if i % 100 == 0 else status_ok],
+            lastDirection=lpf_messages.TripletFloat(x=0.0, y=0.0, z=1.0),
+        )
+        if i % 2 == 0:
+            ray_path.sensor_contributions.add(
+                sensor_id=i % 3, coordinates=lpf_messages.DoubletDouble(x=0.5, y=0.5)
+            )
+        ray_paths.append(ray_path)
+    return ray_paths
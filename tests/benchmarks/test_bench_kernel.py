@@ -0,0 +1,89 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark kernel and protobuf processing hot paths."""
+
+from ansys.api.speos.results.v1.ray_path_pb2 import RayPath
+import pytest
+
+from ansys.speos.core.kernel.job import ProtoJob
+from ansys.speos.core.proto_message_utils import _replace_guids
+from tests.benchmarks.conftest import SCALES, build_part, triangle_face
+
+
+@pytest.mark.parametrize("nb_faces", SCALES)
+def test_bench_face_create_batch(benchmark, fake_speos, nb_faces):
+    """Benchmark FaceStub.create_batch with one triangle per face."""
+    faces = [triangle_face(f"Face.{i}", offset=float(i)) for i in range(nb_faces)]
+    face_db = fake_speos.client.faces()
+
+    face_links = benchmark.pedantic(
+        face_db.create_batch, kwargs={"message_list": faces}, rounds=3, iterations=1
+    )
+    assert len(face_links) == nb_faces
+
+
+@pytest.mark.parametrize("nb_faces", SCALES)
+def test_bench_face_read_batch(benchmark, fake_speos, nb_faces):
+    """Benchmark FaceStub.read_batch with one triangle per face."""
+    face_db = fake_speos.client.faces()
+    face_links = face_db.create_batch(
+        message_list=[triangle_face(f"Face.{i}", offset=float(i)) for i in range(nb_faces)]
+    )
+
+    faces = benchmark.pedantic(
+        face_db.read_batch, kwargs={"refs": face_links}, rounds=3, iterations=1
+    )
+    assert len(faces) == nb_faces
+
+
+@pytest.mark.parametrize("nb_faces", SCALES)
+def test_bench_replace_guids(benchmark, fake_speos, nb_faces):
+    """Benchmark the resolution of the guids of a part into nested dictionaries."""
+    part_link = build_part(fake_speos.client, nb_faces)
+    part = part_link.get()
+
+    part_dict = benchmark.pedantic(
+        _replace_guids,
+        kwargs={"speos_client": fake_speos.client, "message": part},
+        rounds=1,
+        iterations=1,
+    )
+    assert len(part_dict["bodys"]) == len(part.body_guids)
+
+
+@pytest.mark.parametrize("nb_rays", SCALES)
+def test_bench_ray_path_arrays(benchmark, fake_server, fake_speos, nb_rays):
+    """Benchmark gathering ``nb_rays`` interactive simulation ray paths in arrays."""
+    fake_server.store.ray_paths.extend(
+        RayPath(
+            impacts_coordinates=[float(i), 0.0, 0.0, float(i), 1.0, 0.0],
+            last_direction=[0.0, 0.0, 1.0],
+            wavelengths=[550.0],
+            colors={"values": bytes([255, 128, 0])},
+        )
+        for i in range(nb_rays)
+    )
+    job_link = fake_speos.client.jobs().create(message=ProtoJob(name="Job"))
+
+    ray_paths = benchmark.pedantic(job_link.get_ray_path_arrays, rounds=3, iterations=1)
+    assert len(ray_paths) == nb_rays
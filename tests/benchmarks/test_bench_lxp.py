@@ -0,0 +1,192 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark light path finder parsing and filtering."""
+
+import gc
+import tracemalloc
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from ansys.speos.core import Project
+from ansys.speos.core.lxp import (
+    LightPathFinder,
+    SensorContributions,
+    _RayPathColumns,
+    _sample_rays,
+)
+from tests.benchmarks.conftest import SCALES, lpf_ray_paths
+from tests.benchmarks.test_bench_mesh import _grid
+
+
+def _allocated(function, *args):
+    """Call ``function``, and measure the memory still allocated by the call in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function(*args)
+        gc.collect()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def _legacy_ray_paths(rays):
+    """Store ray paths as before typed arrays, with an instance dict and nested lists per ray."""
+    return [
+        SimpleNamespace(
+            _nb_impacts=ray.nb_impacts,
+            _impacts=ray.impacts,
+            _wl=ray.wl,
+            _body_ids=ray.body_ids,
+            _face_ids=ray.face_ids,
+            _last_direction=ray.last_direction,
+            _intersection_type=ray.intersection_type,
+            _sensor_contribution=ray.sensor_contribution,
+        )
+        for ray in rays
+    ]
+
+
+def _sensor_contributions(nb_contributions: int, nb_impacts: int = 4) -> SensorContributions:
+    """Create one contribution per ray to three sensors, directly in columns."""
+    rng = np.random.default_rng(0)
+    columns = _RayPathColumns(sensor_contribution=True)
+    columns.wavelengths = np.full(nb_contributions, 555.0)
+    columns.offsets = np.arange(nb_contributions + 1) * nb_impacts
+    columns.face_offsets = columns.offsets
+    columns.face_ids = rng.integers(0, 1000, nb_contributions * nb_impacts, dtype=np.uint32)
+    columns.contribution_offsets = np.arange(nb_contributions + 1)
+    columns.contribution_sensor_ids = rng.integers(0, 3, nb_contributions, dtype=np.uint32)
+    columns.contribution_positions = rng.random((nb_contributions, 2))
+    return SensorContributions(columns, ["S0", "S1", "S2"])
+
+
+@pytest.fixture
+def lpf_uri(request, fake_server):
+    """Register ``request.param`` ray paths as an LPF file."""
+    fake_server.store.register_lpf_file(
+        "fake://bench.lpf", lpf_ray_paths(request.param), sensor_names=["S0", "S1", "S2"]
+    )
+    return "fake://bench.lpf"
+
+
+@pytest.mark.parametrize("lpf_uri", SCALES, indirect=True)
+def test_bench_lpf_parse(benchmark, fake_speos, lpf_uri):
+    """Benchmark reading all ray paths of an LPF file."""
+    lpf = benchmark.pedantic(LightPathFinder, args=(fake_speos, lpf_uri), rounds=3, iterations=1)
+    assert lpf.nb_traces == len(lpf.rays)
+
+
+@pytest.mark.parametrize("lpf_uri", SCALES, indirect=True)
+def test_bench_lpf_memory(benchmark, fake_speos, lpf_uri):
+    """Benchmark the memory held by the ray paths of an LPF file, against the legacy storage."""
+    lpf, nb_bytes = benchmark.pedantic(
+        _allocated, args=(LightPathFinder, fake_speos, lpf_uri), rounds=1, iterations=1
+    )
+    _, nb_legacy_bytes = _allocated(_legacy_ray_paths, lpf.rays)
+
+    benchmark.extra_info["bytes_per_ray"] = nb_bytes / lpf.nb_traces
+    benchmark.extra_info["legacy_bytes_per_ray"] = nb_legacy_bytes / lpf.nb_traces
+    assert nb_legacy_bytes >= 5 * nb_bytes
+
+
+@pytest.mark.parametrize("lpf_uri", SCALES, indirect=True)
+def test_bench_lpf_filter_face_ids(benchmark, fake_speos, lpf_uri):
+    """Benchmark the filtering of ray paths by face ids."""
+    lpf = LightPathFinder(fake_speos, lpf_uri)
+
+    benchmark(lpf.filter_by_face_ids, list(range(0, 1000, 7)))
+    assert 0 < len(lpf.filtered_rays) <= lpf.nb_traces
+
+
+@pytest.mark.parametrize("lpf_uri", SCALES, indirect=True)
+def test_bench_lpf_filter_error_rays(benchmark, fake_speos, lpf_uri):
+    """Benchmark the filtering of ray paths ending in error."""
+    lpf = LightPathFinder(fake_speos, lpf_uri)
+
+    benchmark(lpf.filter_error_rays)
+    assert len(lpf.filtered_rays) == (lpf.nb_traces + 99) // 100
+
+
+@pytest.mark.parametrize("lpf_uri", SCALES, indirect=True)
+def test_bench_lpf_preview_sampling(benchmark, fake_speos, lpf_uri):
+    """Benchmark the stratified selection of preview rays under a segment budget."""
+    lpf = LightPathFinder(fake_speos, lpf_uri)
+
+    selected = benchmark(
+        _sample_rays, lpf.rays, lpf.nb_traces, sampling="status", max_primitives=4000, seed=0
+    )
+    assert 0 < len(selected) <= min(lpf.nb_traces, 4000 // 3)
+
+
+@pytest.mark.parametrize("nb_rays", SCALES)
+def test_bench_lpf_locate_impacts(benchmark, fake_server, fake_speos, nb_rays):
+    """Benchmark the annotation of ray impacts with the project faces they lie on."""
+    # First impact of each ray on a grid face covering [0, 100] x [0, 100] at z = 0
+    ray_paths = lpf_ray_paths(nb_rays)
+    for ray_path in ray_paths:
+        ray_path.impacts[0].z = 0.0
+    fake_server.store.register_lpf_file("fake://bench.lpf", ray_paths)
+    lpf = LightPathFinder(fake_speos, "fake://bench.lpf")
+
+    vertices, facets = _grid(max(nb_rays, 1000))
+    project = Project(speos=fake_speos)
+    root_part = project.create_root_part()
+    grid_face = root_part.create_body(name="Body").create_face(name="Face")
+    grid_face.vertices = (vertices * 100.0 / vertices.max()).ravel().tolist()
+    grid_face.facets = facets.ravel().tolist()
+    root_part.commit()
+    index = project.geometry_index
+
+    located = benchmark(lpf.locate_impacts, index)
+    assert all(geo_paths[0] == "Body/Face" for geo_paths in located)
+    assert all(geo_paths[1:] == [None] * 3 for geo_paths in located)
+
+
+@pytest.mark.parametrize("query", ["histogram", "face_sensor_matrix", "select_rays"])
+@pytest.mark.parametrize("nb_contributions", SCALES)
+def test_bench_sensor_contribution_queries(benchmark, nb_contributions, query):
+    """Benchmark the group-by queries on sensor contributions."""
+    contributions = _sensor_contributions(nb_contributions)
+    if query == "histogram":
+        counts = benchmark(contributions.histogram, 1, bins=(100, 100), bounds=[(0, 1), (0, 1)])[0]
+        assert counts.sum() == contributions.counts()[1]
+    elif query == "face_sensor_matrix":
+        faces, matrix = benchmark(contributions.face_sensor_matrix)
+        assert matrix.sum() == nb_contributions
+    else:
+        ray_indices = benchmark(contributions.select_rays, 2, (0.25, 0.5), (0.0, 0.1))
+        assert np.all(contributions.sensor_ids[ray_indices] == 2)
+
+
+@pytest.mark.parametrize("lpf_uri", SCALES, indirect=True)
+def test_bench_lpf_filter_sensor_region(benchmark, fake_speos, lpf_uri):
+    """Benchmark the filtering of ray paths by the sensor region they contribute to."""
+    lpf = LightPathFinder(fake_speos, lpf_uri)
+
+    benchmark(lpf.filter_by_sensor_region, 0, (0.0, 1.0), (0.0, 1.0))
+    # Every sixth ray contributes to the sensor 0
+    assert len(lpf.filtered_rays) == (lpf.nb_traces + 5) // 6
+    assert len(lpf.filtered_rays) == len(lpf.sensor_contributions.select_rays(0, (0, 1), (0, 1)))
@@ -0,0 +1,65 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark the analysis of triangle meshes."""
+
+import numpy as np
+import pytest
+
+from ansys.speos.core.generic import mesh_methods
+from tests.benchmarks.conftest import SCALES
+
+
+def _grid(nb_triangles):
+    """Create a flat grid mesh of about ``nb_triangles`` triangles."""
+    side = max(2, int(np.sqrt(nb_triangles / 2)) + 1)
+    xs, ys = np.meshgrid(np.arange(side, dtype=float), np.arange(side, dtype=float))
+    vertices = np.stack((xs.ravel(), ys.ravel(), np.zeros(side * side)), axis=1)
+    corners = np.arange(side * side).reshape(side, side)[:-1, :-1].ravel()
+    facets = np.concatenate(
+        (
+            np.stack((corners, corners + 1, corners + side), axis=1),
+            np.stack((corners + 1, corners + side + 1, corners + side), axis=1),
+        )
+    )
+    return vertices, facets
+
+
+@pytest.mark.parametrize("nb_triangles", SCALES)
+def test_bench_check_mesh(benchmark, nb_triangles):
+    """Benchmark the check of a mesh of about ``nb_triangles`` triangles."""
+    vertices, facets = _grid(nb_triangles)
+    normals = mesh_methods.vertex_normals(vertices, facets)
+
+    report = benchmark(mesh_methods.check_mesh, vertices, facets, normals)
+    assert report.valid
+    assert not report.closed
+
+
+@pytest.mark.parametrize("nb_triangles", SCALES)
+def test_bench_decimate(benchmark, nb_triangles):
+    """Benchmark the simplification of a mesh of about ``nb_triangles`` triangles."""
+    vertices, facets = _grid(nb_triangles)
+    vertices[:, 2] = np.sin(vertices[:, 0] / 10.0)
+
+    _, simplified_facets = benchmark(mesh_methods.decimate, vertices, facets, len(facets) // 16)
+    assert 0 < len(simplified_facets) <= len(facets) // 16
@@ -0,0 +1,148 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark project loading and feature commits."""
+
+import pytest
+
+from ansys.speos.core import Project
+from ansys.speos.core.part import Part
+from ansys.speos.core.sensor import SensorIrradiance
+from ansys.speos.core.workflow.combine_speos import SpeosFileInstance, combine_speos
+from tests.benchmarks.conftest import SCALES, register_scene_file
+
+
+@pytest.mark.parametrize("nb_faces", SCALES)
+def test_bench_project_load(benchmark, fake_server, fake_speos, nb_faces):
+    """Benchmark the loading of a project whose root part has ``nb_faces`` faces."""
+    register_scene_file(fake_server.store, fake_speos.client, nb_faces, "fake://bench.speos")
+
+    project = benchmark.pedantic(
+        Project, kwargs={"speos": fake_speos, "path": "fake://bench.speos"}, rounds=3, iterations=1
+    )
+    root_part = project.find(name="", feature_type=type(project.create_root_part()))
+    assert root_part
+
+
+@pytest.mark.parametrize("nb_faces", SCALES)
+def test_bench_project_restore(benchmark, fake_server, fake_speos, nb_faces, tmp_path):
+    """Benchmark the restoration of a project snapshot whose root part has ``nb_faces`` faces."""
+    register_scene_file(fake_server.store, fake_speos.client, nb_faces, "fake://bench.speos")
+    path = tmp_path / "bench.bundle"
+    Project(speos=fake_speos, path="fake://bench.speos").snapshot(path)
+
+    project = benchmark.pedantic(
+        lambda: Project(speos=fake_speos).restore(path), rounds=3, iterations=1
+    )
+    assert len(project.scene_link.get().part_guid) > 0
+
+
+@pytest.mark.parametrize("nb_faces", SCALES)
+def test_bench_combine_speos(benchmark, fake_server, fake_speos, nb_faces):
+    """Benchmark the combination of ten placements of two files with ``nb_faces`` faces each."""
+    for name in ("a", "b"):
+        register_scene_file(fake_server.store, fake_speos.client, nb_faces, f"fake://{name}.speos")
+    speos_files = [
+        SpeosFileInstance(
+            speos_file=f"fake://{name}.speos",
+            axis_system=[float(i), 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1],
+            name=f"{name}.{i}",
+        )
+        for i in range(5)
+        for name in ("a", "b")
+    ]
+
+    project = benchmark.pedantic(
+        combine_speos, args=(fake_speos, speos_files), rounds=3, iterations=1
+    )
+    sub_parts = project.find(name="", feature_type=Part)[0]._geom_features
+    assert len(sub_parts) == 10
+    assert len({sp.part_link.key for sp in sub_parts}) == 2
+
+
+def _project_with_body(speos, nb_faces):
+    project = Project(speos=speos)
+    body = project.create_root_part().create_body(name="Body")
+    for i in range(nb_faces):
+        face = body.create_face(name=f"Face.{i}")
+        face.vertices = [float(i), 0.0, 0.0, i + 1.0, 0.0, 0.0, float(i), 1.0, 0.0]
+        face.facets = [0, 1, 2]
+        face.normals = [0.0, 0.0, 1.0] * 3
+    return (project,), {}
+
+
+@pytest.mark.parametrize("nb_faces", SCALES)
+def test_bench_root_part_commit(benchmark, fake_speos, nb_faces):
+    """Benchmark the first commit of a root part holding one body of ``nb_faces`` faces."""
+    benchmark.pedantic(
+        lambda project: project.find(name="", feature_type=type(project.create_root_part()))[
+            0
+        ].commit(),
+        setup=lambda: _project_with_body(fake_speos, nb_faces),
+        rounds=3,
+        iterations=1,
+    )
+
+
+@pytest.mark.parametrize("nb_sensors", SCALES)
+def test_bench_sensor_commit(benchmark, fake_speos, nb_sensors):
+    """Benchmark the commit of one more sensor in a scene holding ``nb_sensors`` sensors."""
+    project = Project(speos=fake_speos)
+    for i in range(nb_sensors):
+        project.create_sensor(name=f"Sensor.{i}", feature_type=SensorIrradiance).commit()
+    counter = iter(range(nb_sensors, nb_sensors + 1000))
+
+    benchmark.pedantic(
+        lambda: project.create_sensor(
+            name=f"Sensor.{next(counter)}", feature_type=SensorIrradiance
+        ).commit(),
+        rounds=3,
+        iterations=1,
+    )
+    assert len(project.scene_link.get().sensors) > nb_sensors
+
+
+def _project_with_sensors(speos, nb_sensors):
+    project = Project(speos=speos)
+    for i in range(nb_sensors):
+        project.create_sensor(name=f"Sensor.{i}", feature_type=SensorIrradiance).commit()
+    return (project,), {}
+
+
+@pytest.mark.parametrize("nb_sensors", SCALES)
+def test_bench_project_delete(benchmark, fake_speos, nb_sensors):
+    """Benchmark the deletion of a project holding ``nb_sensors`` committed sensors."""
+    benchmark.pedantic(
+        lambda project: project.delete(),
+        setup=lambda: _project_with_sensors(fake_speos, nb_sensors),
+        rounds=3,
+        iterations=1,
+    )
+
+
+def test_bench_sensor_get_key(benchmark, fake_speos):
+    """Benchmark reading the axis system of a committed sensor with ``get(key)``."""
+    sensor = Project(speos=fake_speos).create_sensor(name="Sensor", feature_type=SensorIrradiance)
+    sensor.commit()
+
+    axis_system = benchmark(sensor.get, key="axis_system")
+    assert axis_system == [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
@@ -22,16 +22,22 @@
 
 """Unit tests for PySpeos BSDF module."""
 
+from concurrent import futures
 from copy import deepcopy
 from pathlib import Path
+import time
 
+import ansys.api.speos.bsdf.v1.anisotropic_bsdf_pb2 as anisotropic_bsdf__v1__pb2
+import ansys.api.speos.bsdf.v1.anisotropic_bsdf_pb2_grpc as anisotropic_bsdf__v1__pb2_grpc
 from google.protobuf.empty_pb2 import Empty
+import grpc
 import numpy as np
 import pytest
 
 from ansys.speos.core import Speos, bsdf
 from ansys.speos.core.bsdf import AnisotropicBSDF, BxdfDatapoint, SpectralBRDF
-from tests.conftest import test_path
+from ansys.speos.core.kernel.client import DEDICATED_CONNECTION_OPTION
+from tests.conftest import local_test_path, test_path
 from tests.helper import (
     approx_arrays,
     approx_comparison,
@@ -469,6 +475,20 @@ def test_spectral_brdf_creation(speos: Speos):
     remove_file(str(output_file_1))
     remove_file(str(output_file_2))
 
+    # client side assembly, loaded by the server or parsed locally
+    output_file_3 = bsdf.create_spectral_brdf(
+        speos, Path(test_path) / "Test_brdf_3", wl_list, input_file, max_workers=2
+    )
+    assert does_file_exist(str(output_file_3))
+    assert SpectralBRDF(speos, output_file_3).wavelength == wl_list
+    local_input_file = [local_test_path / "Texture.1.speos" / "aniso_bsdf.anisotropicbsdf"] * 2
+    output_file_4 = bsdf.create_spectral_brdf(
+        speos, Path(test_path) / "Test_brdf_4", wl_list, local_input_file, local_parsing=True
+    )
+    assert does_file_exist(str(output_file_4))
+    remove_file(str(output_file_3))
+    remove_file(str(output_file_4))
+
 
 def test_anisotropic_bsdf_creation(speos: Speos):
     """Unit test for create anisotropic bsdf method."""
@@ -487,6 +507,23 @@ def test_anisotropic_bsdf_creation(speos: Speos):
     remove_file(str(output_file_1))
     remove_file(str(output_file_2))
 
+    # client side assembly, loaded by the server or parsed locally
+    output_file_3 = bsdf.create_anisotropic_bsdf(
+        speos, Path(test_path) / "Test_brdf_3", ani_list, input_file, max_workers=2
+    )
+    assert does_file_exist(str(output_file_3))
+    assert AnisotropicBSDF(speos, output_file_3).anisotropic_angles[0] == ani_list
+    local_input_file = [local_test_path / "Texture.1.speos" / "aniso_bsdf.anisotropicbsdf"] * 3
+    with pytest.raises(ValueError, match="isotropic"):
+        bsdf.create_anisotropic_bsdf(
+            speos, Path(test_path) / "Test_brdf_4", ani_list, local_input_file, local_parsing=True
+        )
+    with pytest.raises(ValueError, match="fix_disparity"):
+        bsdf.create_anisotropic_bsdf(
+            speos, output_file_3, ani_list, input_file, fix_disparity=True, max_workers=2
+        )
+    remove_file(str(output_file_3))
+
 
 def test_bsdf_error_management(speos: Speos):
     """Unit test of most bsdf error."""
@@ -831,3 +868,206 @@ def test_spectral_brdf_error_management(speos: Speos):
         match="The bsdf is missing information's for the for the following incidence angles one",
     ):
         new_bsdf.commit()
+
+
+def test_bxdf_diagram_round_trip():
+    """Test the encoding and decoding of data points to protobuf diagrams."""
+    datapoint = create_bsdf_data_point(True, 30, np.radians(90))
+    bsdf_msg = anisotropic_bsdf__v1__pb2.AnisotropicBsdfData.Bsdf
+    incidence_diag = bsdf_msg.AnisotropicSample.IncidenceSample()
+    bsdf._write_diagram(diagram=incidence_diag, datapoint=datapoint)
+    decoded = bsdf._read_diagram(
+        diagram=incidence_diag,
+        is_brdf=True,
+        incident_angle=datapoint.incident_angle,
+        anisotropy=datapoint.anisotropy,
+    )
+    assert compare_bsdf_data_point(datapoint, decoded)
+    assert decoded.tis == datapoint.tis
+    # writing again replaces the samples
+    bsdf._write_diagram(diagram=incidence_diag, datapoint=datapoint)
+    assert len(incidence_diag.bsdf_cos_theta) == datapoint.bxdf.size
+    assert list(incidence_diag.theta_samples) == datapoint.theta_values
+
+    groups = bsdf._group_by_anisotropy(
+        [create_bsdf_data_point(True, inc, ani) for ani in np.radians([90, 0]) for inc in [0, 45]]
+    )
+    assert list(groups.keys()) == list(np.radians([90, 0]))
+    assert [len(datapoints) for datapoints in groups.values()] == [2, 2]
+
+
+def test_packed_bxdf():
+    """Test packing data points into arrays."""
+    datapoints = [
+        create_bsdf_data_point(True, inc, ani) for ani in np.radians([90, 0]) for inc in [45, 0]
+    ]
+    packed = bsdf.PackedBxdf(datapoints)
+    assert packed.is_regular
+    assert len(packed) == 4
+    assert packed.values.shape == (4, 91, 361)
+
+    tensor = packed.tensor()
+    assert tensor.shape == (2, 2, 91, 361)
+    # sorted by anisotropy then incidence
+    assert approx_arrays(tensor[1, 0], datapoints[1].bxdf)
+
+    unpacked = packed.to_datapoints()
+    assert all(compare_bsdf_data_point(a, b) for a, b in zip(datapoints, unpacked))
+    # unpacked data points are slotted and share the samples of the pack
+    assert not hasattr(unpacked[0], "__dict__")
+    assert unpacked[0]._theta_values is unpacked[3]._theta_values is packed.theta_values
+    assert isinstance(unpacked[0].phi_values, list)
+    assert bsdf.PackedBxdf(unpacked).is_regular
+
+    thetas, phis, bxdf = create_lambertian_bsdf(True)
+    datapoints.append(bsdf.BxdfDatapoint(True, 0, thetas, phis, bxdf))
+    ragged = bsdf.PackedBxdf(datapoints)
+    assert not ragged.is_regular
+    assert ragged.values[-1].shape == (5, 5)
+    with pytest.raises(ValueError):
+        ragged.tensor()
+    assert compare_bsdf_data_point(ragged.to_datapoints()[-1], datapoints[-1])
+
+
+def test_packed_bxdf_evaluate_integrate():
+    """Test the local interpolation and integration of packed data points."""
+    datapoints = [
+        create_bsdf_data_point(True, inc, ani) for ani in np.radians([0, 90]) for inc in [0, 45]
+    ]
+    packed = bsdf.PackedBxdf(datapoints)
+
+    # grid points give back the stored values, in between the lambertian is interpolated
+    assert (
+        packed.evaluate(0.0, packed.theta_values[3], packed.phi_values[5], 0.0)
+        == (datapoints[0].bxdf[3, 5])
+    )
+    thetas = np.linspace(0, np.pi / 2, 1000)
+    values = packed.evaluate(
+        incident_angle=np.radians(20), theta=thetas, phi=np.radians(33), group=np.radians(10)
+    )
+    assert values.shape == (1000,)
+    assert np.allclose(values, np.cos(thetas) / np.pi, atol=1e-4)
+
+    # a lambertian scatters all the energy
+    assert np.allclose(packed.integrate(), 1.0, rtol=1e-3)
+    assert datapoints[0].integrate() == pytest.approx(1.0, rel=1e-3)
+    assert not packed.check_integral().any()
+    packed.tis[:] = packed.integrate()
+    assert packed.check_integral().all()
+
+    # phi is periodic, queries across the seam interpolate the last and first samples
+    phis = np.radians([0.0, 90.0, 270.0])
+    values = np.array([[1.0, 2.0, 3.0]] * 2)
+    seam = bsdf.PackedBxdf([bsdf.BxdfDatapoint(True, 0, np.radians([0, 90]), phis, values)])
+    assert seam.evaluate(0.0, 0.0, np.radians([315.0, -45.0, 405.0, 45.0])) == pytest.approx(
+        [2.0, 2.0, 1.5, 1.5]
+    )
+
+
+def test_packed_bxdf_integral_lambertian():
+    """Test the local integration against the known albedo of lambertian data points."""
+    # bxdf = albedo * |cos(theta)| / pi integrates to the albedo over each hemisphere
+    phis = np.linspace(0, 2 * np.pi, 73)
+    datapoints = []
+    for is_brdf, albedo, nb_thetas in ((True, 0.7, 91), (False, 0.2, 91), (False, 0.4, 46)):
+        offset = 0 if is_brdf else np.pi / 2
+        thetas = np.linspace(offset, offset + np.pi / 2, nb_thetas)
+        bxdf = np.repeat(albedo * np.abs(np.cos(thetas))[:, None] / np.pi, len(phis), axis=1)
+        datapoints.append(bsdf.BxdfDatapoint(is_brdf, 0, thetas, phis, bxdf, tis=albedo))
+
+    for packed in (bsdf.PackedBxdf(datapoints[:2]), bsdf.PackedBxdf(datapoints)):
+        albedos = [0.7, 0.2, 0.4][: len(packed)]
+        assert packed.integrate() == pytest.approx(albedos, rel=1e-3)
+        assert packed.check_integral().all()
+        packed.tis[0] = 1.0
+        assert packed.check_integral().tolist() == [False] + [True] * (len(packed) - 1)
+    assert not bsdf.PackedBxdf(datapoints).is_regular
+    assert datapoints[1].integrate() == pytest.approx(0.2, rel=1e-3)
+
+
+def test_parse_anisotropic_bsdf_file():
+    """Test the local parsing of a text anisotropicbsdf file."""
+    data = bsdf._parse_anisotropic_bsdf_file(
+        local_test_path / "Gaussian Fresnel 10 deg.anisotropicbsdf"
+    )
+    assert (data.anisotropy_vector.x, data.anisotropy_vector.y) == (1, 0)
+    for side in (data.reflection, data.transmission):
+        assert [ani.anisotropic_sample for ani in side.anisotropic_samples] == [0, 2 * np.pi]
+        assert [len(ani.incidence_samples) for ani in side.anisotropic_samples] == [10, 10]
+        assert [pair.wavelength for pair in side.spectrum] == [360, 830]
+    incidence_sample = data.reflection.anisotropic_samples[0].incidence_samples[1]
+    assert incidence_sample.incidence_sample == pytest.approx(np.radians(10))
+    assert len(incidence_sample.theta_samples) == 38
+    assert len(incidence_sample.bsdf_cos_theta) == 38 * len(incidence_sample.phi_samples)
+    # reflection of 4%
+    assert incidence_sample.integral == pytest.approx(0.04, abs=1e-3)
+
+    datapoints = bsdf._read_isotropic_samples(data.transmission, False, wavelength=500)
+    assert len(datapoints) == 10
+    assert all(datapoint.wavelength == 500 for datapoint in datapoints)
+
+    with pytest.raises(ValueError, match="Only text"):
+        bsdf._parse_anisotropic_bsdf_file(local_test_path / "R_test.anisotropicbsdf")
+
+
+class _LoadedAnisotropicBsdf(anisotropic_bsdf__v1__pb2_grpc.AnisotropicBsdfServiceServicer):
+    """Anisotropic bsdf service holding one loaded file for the whole server, as Speos does."""
+
+    def __init__(self):
+        self.file_name = None
+        self.saved = {}
+
+    def Load(self, request, context):  # noqa: N802
+        self.file_name = request.file_name
+        time.sleep(0.005)
+        return Empty()
+
+    def Export(self, request, context):  # noqa: N802
+        time.sleep(0.005)
+        return anisotropic_bsdf__v1__pb2.AnisotropicBsdfData(description=self.file_name)
+
+    def Import(self, request, context):  # noqa: N802
+        self.file_name = request.description
+        time.sleep(0.005)
+        return Empty()
+
+    def Save(self, request, context):  # noqa: N802
+        time.sleep(0.005)
+        self.saved[request.file_name] = self.file_name
+        return Empty()
+
+
+def test_read_anisotropic_bsdf_files_on_server():
+    """Test that bsdf files read and saved from several threads on one server do not interleave."""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
+    servicer = _LoadedAnisotropicBsdf()
+    anisotropic_bsdf__v1__pb2_grpc.add_AnisotropicBsdfServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+
+    def factory():
+        return grpc.insecure_channel(f"localhost:{port}", options=[DEDICATED_CONNECTION_OPTION])
+
+    speos = Speos(channel=factory(), channel_factory=factory, bulk_channels=3)
+    try:
+        files = [str(Path(test_path) / f"bsdf_{i}.anisotropicbsdf") for i in range(12)]
+
+        def read(i):
+            inputs = bsdf._read_anisotropic_bsdf_files(speos, files[i::6], 4, local_parsing=False)
+            assert [data.description for data in inputs] == files[i::6]
+
+        def save(i):
+            ani_bsdf = bsdf.AnisotropicBSDF(speos)
+            ani_bsdf.description = f"saved_{i}"
+            ani_bsdf.save(Path(test_path) / f"saved_{i}.anisotropicbsdf")
+
+        with futures.ThreadPoolExecutor(max_workers=6) as pool:
+            tasks = [pool.submit(task, i) for i in range(6) for task in (read, save)]
+            for task in tasks:
+                task.result()
+        assert servicer.saved == {
+            str(Path(test_path) / f"saved_{i}.anisotropicbsdf"): f"saved_{i}" for i in range(6)
+        }
+    finally:
+        speos.close()
+        server.stop(None)
@@ -24,10 +24,11 @@
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from ansys.speos.core import Project, Speos, part
-from ansys.speos.core.component import LightBox, LightBoxFileInstance
+from ansys.speos.core.component import LightBox, LightBoxFileInstance, _read_body_meshes
 from ansys.speos.core.generic.parameters import ORIGIN
 from ansys.speos.core.opt_prop import OptProp
 from ansys.speos.core.sensor import SensorIrradiance
@@ -210,6 +211,38 @@ def test_create_balck_lightbox(speos: Speos):
     assert len(lightbox.source_paths) == 0
 
 
+def test_read_lightbox_body_meshes(speos: Speos):
+    """Test that LightBox body meshes are read as arrays with one offset per body."""
+    p = Project(speos=speos)
+    lightbox = p.create_lightbox(name="Light Box.1")
+    root_part = lightbox.create_root_part()
+    body1 = root_part.create_body(name="Body.1")
+    face1 = body1.create_face(name="Face.1")
+    face1.vertices = [0, 0, 0, 1, 0, 0, 0, 1, 0]
+    face1.facets = [0, 1, 2]
+    face2 = body1.create_face(name="Face.2")
+    face2.vertices = [0, 0, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1]
+    face2.facets = [0, 1, 2, 1, 3, 2]
+    body2 = root_part.create_body(name="Body.2")
+    face3 = body2.create_face(name="Face.3")
+    face3.vertices = [0, 0, 2, 1, 0, 2, 0, 1, 2]
+    face3.facets = [0, 2, 1]
+    lightbox.commit()
+
+    scene_data = p.client[lightbox._resolved_scene_instance().scene_guid].get()
+    part_data = p.client[scene_data.part_guid].get()
+    vertices, body_meshes = _read_body_meshes(
+        speos_client=p.client, body_guids=part_data.body_guids
+    )
+    assert vertices.shape == (10, 3)
+    assert np.array_equal(vertices[3:7, 2], [1, 1, 1, 1])
+    assert len(body_meshes) == 2
+    assert body_meshes[0][0] == slice(0, 7)
+    assert body_meshes[0][1].tolist() == [[3, 0, 1, 2], [3, 3, 4, 5], [3, 4, 6, 5]]
+    assert body_meshes[1][0] == slice(7, 10)
+    assert body_meshes[1][1].tolist() == [[3, 0, 2, 1]]
+
+
 @pytest.mark.supported_speos_versions(min=261)
 def test_load_lightbox(speos: Speos):
     """Test load a simulation with lightbox inside."""
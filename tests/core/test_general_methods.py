@@ -0,0 +1,96 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the general methods shared by features."""
+
+import numpy as np
+import pytest
+
+from ansys.speos.core.generic.general_methods import (
+    magnitude_vector,
+    normalize_vector,
+    wavelength_to_rgb,
+)
+from ansys.speos.core.generic.visualization_methods import (
+    axis_systems_to_matrix,
+    local2absolute,
+    transform_points,
+)
+
+
+def test_wavelength_to_rgb():
+    """Test conversion of single and multiple wavelengths to colors."""
+    assert wavelength_to_rgb(550) == (162, 255, 0, 255)
+    assert wavelength_to_rgb(800.0) == (0, 0, 0, 255)
+
+    wavelengths = np.round(np.linspace(370.0, 760.0, 3901), 1)
+    colors = wavelength_to_rgb(wavelengths)
+    assert colors.shape == (3901, 4)
+    assert colors.dtype == np.uint8
+    assert colors.tolist() == [list(wavelength_to_rgb(float(wl))) for wl in wavelengths]
+    assert wavelength_to_rgb([400.0, 700.0], gamma=1.0).tolist() == [
+        list(wavelength_to_rgb(400.0, gamma=1.0)),
+        list(wavelength_to_rgb(700.0, gamma=1.0)),
+    ]
+
+
+def test_vectors():
+    """Test magnitude and normalization of single and multiple vectors."""
+    assert magnitude_vector([3.0, 4.0]) == 5.0
+    assert normalize_vector([0.0, 0.0, 2.0]) == [0.0, 0.0, 1.0]
+
+    vectors = np.array([[3.0, 4.0, 0.0], [0.0, 0.0, 2.0]])
+    assert magnitude_vector(vectors).tolist() == [5.0, 2.0]
+    assert normalize_vector(vectors).tolist() == [[0.6, 0.8, 0.0], [0.0, 0.0, 1.0]]
+
+    with pytest.raises(ValueError):
+        magnitude_vector(np.zeros((2, 4)))
+    with pytest.raises(ValueError):
+        normalize_vector(np.zeros((2, 3)))
+
+
+def test_transform_points():
+    """Test transformation of points through one or several nested axis systems."""
+    shifted = [1.0, 2.0, 3.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+    rotated = [0.0, 0.0, 10.0, 0.0, 1.0, 0.0, -1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+    points = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+
+    assert transform_points(points, shifted).tolist() == (points + [1.0, 2.0, 3.0]).tolist()
+    assert transform_points(points, rotated).tolist() == [
+        [0.0, 0.0, 10.0],
+        [0.0, 1.0, 10.0],
+        [-1.0, 0.0, 10.0],
+    ]
+    # Nested instances: shifted inside rotated
+    nested = transform_points(points, shifted, rotated)
+    assert nested.tolist() == transform_points(transform_points(points, shifted), rotated).tolist()
+    assert nested[0].tolist() == [-2.0, 1.0, 13.0]
+    assert [local2absolute(p, rotated).tolist() for p in points] == transform_points(
+        points, rotated
+    ).tolist()
+    assert axis_systems_to_matrix().tolist() == np.identity(4).tolist()
+
+    # In place, keeping the array type
+    in_place = points.astype(np.float32)
+    assert transform_points(in_place, shifted, out=in_place) is in_place
+    assert in_place.dtype == np.float32
+    assert in_place.tolist() == (points + [1.0, 2.0, 3.0]).tolist()
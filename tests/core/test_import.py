@@ -0,0 +1,119 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the import of the package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import ansys.speos.core
+
+HEAVY_MODULES = [
+    "ansys.speos.core.bsdf",
+    "ansys.speos.core.lxp",
+    "ansys.speos.core.project",
+    "ansys.speos.core.sensor",
+    "ansys.speos.core.simulation",
+    "ansys.speos.core.source",
+    "ansys.tools.visualization_interface",
+    "matplotlib",
+    "pyvista",
+]
+"""Modules that ``import ansys.speos.core`` must not load."""
+
+
+def imported_modules(statement: str) -> dict:
+    """Run a statement in a fresh interpreter and report the modules it imported.
+
+    Parameters
+    ----------
+    statement : str
+        Python statement to run.
+
+    Returns
+    -------
+    dict
+        Cumulative import time in microseconds, by module name.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_import_is_lazy():
+    """Test that importing the package does not load features nor graphics."""
+    modules = imported_modules("import ansys.speos.core")
+    assert "ansys.speos.core" in modules
+    assert "ansys.speos.core.logger" in modules
+    loaded = [name for name in HEAVY_MODULES if name in modules]
+    assert loaded == []
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "ansys.speos.core.body",
+        "ansys.speos.core.component",
+        "ansys.speos.core.ground_plane",
+        "ansys.speos.core.intensity",
+        "ansys.speos.core.lxp",
+        "ansys.speos.core.opt_prop",
+        "ansys.speos.core.part",
+        "ansys.speos.core.project",
+        "ansys.speos.core.sensor",
+        "ansys.speos.core.simulation",
+        "ansys.speos.core.source",
+        "ansys.speos.core.workflow.combine_speos",
+        "ansys.speos.core.workflow.open_result",
+    ],
+)
+def test_import_submodule_first(module: str):
+    """Test that every feature module can be the first one imported."""
+    modules = imported_modules(f"import {module}")
+    assert module in modules
+    assert "matplotlib" not in modules
+
+
+def test_lazy_attributes():
+    """Test that public attributes are loaded on access."""
+    from ansys.speos.core import Project, bsdf, sensor
+    from ansys.speos.core.project import Project as ProjectClass
+
+    assert Project is ProjectClass
+    assert sensor.SensorCamera is not None
+    assert bsdf.AnisotropicBSDF is not None
+    assert "LightPathFinder" in dir(ansys.speos.core)
+    with pytest.raises(AttributeError):
+        ansys.speos.core.NotAFeature
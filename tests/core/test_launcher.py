@@ -33,8 +33,14 @@ from ansys.speos.core.kernel.grpc.transport_options import (
     TransportOptions,
     UDSOptions,
     WNUAOptions,
+    aio_channel_target,
+)
+from ansys.speos.core.kernel.spectrum import ProtoSpectrum
+from ansys.speos.core.launcher import (
+    SpeosServerPool,
+    launch_local_speos_rpc_server,
+    retrieve_speos_install_dir,
 )
-from ansys.speos.core.launcher import launch_local_speos_rpc_server, retrieve_speos_install_dir
 from tests.conftest import IS_WINDOWS, SERVER_PORT
 
 # Check local installation
@@ -69,6 +75,51 @@ def test_local_session(*args):
     assert running is not closed
 
 
+@pytest.mark.skipif(
+    not HAS_LOCAL_SPEOS_SERVER, reason="requires Speos server to be installed locally"
+)
+def test_server_pool(*args):
+    """Test lease, reset and recycling of pooled servers."""
+    with SpeosServerPool(size=2, start_port=SERVER_PORT + 2) as pool:
+        assert pool.ports == [SERVER_PORT + 2, SERVER_PORT + 3]
+        metrics = pool.metrics()
+        assert metrics["startup"]["count"] == 2
+        assert metrics["idle"] == 2
+
+        with pool.session() as speos:
+            assert speos.client.healthy is True
+            speos.client.spectrums().create(message=ProtoSpectrum(name="Spectrum.1"))
+            assert len(speos.client.spectrums().list()) == 1
+        assert pool.metrics()["reset"]["count"] == 1
+
+        speos_1 = pool.lease()
+        speos_2 = pool.lease()
+        with pytest.raises(TimeoutError):
+            pool.lease(timeout=0.1)
+        for speos in (speos_1, speos_2):
+            assert speos.client.spectrums().list() == []
+        pool._servers[0].process.kill()
+        pool._servers[0].process.wait()
+        pool.release(speos_1)
+        pool.release(speos_2)
+
+        for _ in range(2):
+            with pool.session() as speos:
+                assert speos.client.healthy is True
+        metrics = pool.metrics()
+        assert metrics["recycled"] == 1
+        assert metrics["lease_wait"]["count"] == 5
+    assert all(server.process is None for server in pool._servers)
+
+
+def test_server_pool_size():
+    """Test server pool size validation."""
+    with pytest.raises(ValueError):
+        SpeosServerPool(size=0)
+    with pytest.raises(ValueError):
+        SpeosServerPool(size=1, start_port="port")
+
+
 def test_transport_options():
     """Test transport options."""
     to = TransportOptions()
@@ -92,3 +143,135 @@ def test_transport_options():
     kwargs_wnua = to_wnua._to_cyberchannel_kwargs()
     assert kwargs_wnua["host"] == "localhost"
     assert kwargs_wnua["port"] == 50051
+
+
+def _record_channels(monkeypatch):
+    """Replace the sync and asyncio channel constructors with recorders."""
+    import grpc
+    import grpc.aio
+
+    calls = {"sync": [], "aio": []}
+
+    class _Channel:
+        def __init__(self, kind):
+            self.kind = kind
+
+    def recorder(kind, secure):
+        def create(target, *args, options=None, **kwargs):
+            credentials = args[0] if secure else kwargs.get("credentials")
+            calls[kind].append((target, credentials, list(options or [])))
+            return _Channel(kind)
+
+        return create
+
+    monkeypatch.setattr(grpc, "insecure_channel", recorder("sync", False))
+    monkeypatch.setattr(grpc, "secure_channel", recorder("sync", True))
+    monkeypatch.setattr(grpc.aio, "insecure_channel", recorder("aio", False))
+    monkeypatch.setattr(grpc.aio, "secure_channel", recorder("aio", True))
+    monkeypatch.setattr(grpc, "ssl_channel_credentials", lambda **kwargs: tuple(sorted(kwargs)))
+    return calls
+
+
+def _assert_same_channel(transport, calls):
+    """Create both channels and check they share target, credentials and options."""
+    options = [("grpc.max_receive_message_length", 1024)]
+    assert transport.create_channel(options).kind == "sync"
+    aio_channel = transport.create_aio_channel(options)
+    assert aio_channel.kind == "aio"
+    assert len(calls["sync"]) == len(calls["aio"]) == 1
+    assert calls["aio"][0] == calls["sync"][0]
+    assert aio_channel_target(aio_channel) == calls["aio"][0][0]
+    return calls["sync"][0]
+
+
+def test_transport_options_aio_channel(monkeypatch, tmp_path):
+    """Test that asyncio channels are built like the sync ones for every transport mode."""
+    from ansys.tools.common import cyberchannel
+
+    from ansys.speos.core.kernel.grpc import transport_options
+
+    calls = _record_channels(monkeypatch)
+    transport = TransportOptions(mode="insecure", options=InsecureOptions(port=50051))
+    target, credentials, _ = _assert_same_channel(transport, calls)
+    assert target == "localhost:50051"
+    assert credentials is None
+
+    calls = _record_channels(monkeypatch)
+    uds_dir = tmp_path / "uds"
+    transport = TransportOptions(
+        mode="uds", options=UDSOptions(uds_service="speos", uds_dir=uds_dir, uds_id="1")
+    )
+    target, _, options = _assert_same_channel(transport, calls)
+    assert target == f"unix:{uds_dir / 'speos-1.sock'}"
+    assert ("grpc.default_authority", "localhost") in options
+    assert uds_dir.is_dir()
+
+    calls = _record_channels(monkeypatch)
+    for name in ("ca.crt", "client.crt", "client.key"):
+        (tmp_path / name).write_bytes(name.encode())
+    transport = TransportOptions(
+        mode="mtls", options=MTLSOptions(certs_dir=tmp_path, host="127.0.0.1", port=50051)
+    )
+    target, credentials, _ = _assert_same_channel(transport, calls)
+    assert target == "127.0.0.1:50051"
+    assert credentials is not None
+
+    monkeypatch.setattr(cyberchannel, "_IS_WINDOWS", True)
+    monkeypatch.setattr(transport_options, "_IS_WINDOWS", True)
+    calls = _record_channels(monkeypatch)
+    transport = TransportOptions(mode="wnua", options=WNUAOptions(port=50051))
+    target, _, _ = _assert_same_channel(transport, calls)
+    assert target == "localhost:50051"
+    transport = TransportOptions(mode="wnua", options=WNUAOptions(host="10.0.0.1", port=50051))
+    with pytest.raises(ValueError):
+        transport.create_channel(None)
+    with pytest.raises(ValueError):
+        transport.create_aio_channel(None)
+
+    monkeypatch.setattr(cyberchannel, "_IS_WINDOWS", False)
+    monkeypatch.setattr(transport_options, "_IS_WINDOWS", False)
+    transport = TransportOptions(mode="wnua", options=WNUAOptions(port=50051))
+    with pytest.raises(ValueError):
+        transport.create_channel(None)
+    with pytest.raises(ValueError):
+        transport.create_aio_channel(None)
+
+
+def test_server_pool_release_closed_session(monkeypatch):
+    """Test that a session closed by its user is cleared before going back to the pool."""
+    from ansys.speos.core import launcher
+    from tests.fake_server import FakeSpeosServer
+
+    class _Process:
+        def poll(self):
+            return None
+
+        def terminate(self):
+            pass
+
+        def wait(self, timeout=None):
+            return 0
+
+    with FakeSpeosServer() as server:
+        monkeypatch.setattr(launcher, "_resolve_speos_rpc_version_path", lambda *args: None)
+        monkeypatch.setattr(
+            launcher,
+            "_start_local_speos_rpc_server",
+            lambda **kwargs: (_Process(), None, None),
+        )
+        with SpeosServerPool(size=1, start_port=server.port, use_insecure=True) as pool:
+            speos = pool.lease()
+            speos.client.spectrums().create(message=ProtoSpectrum(name="Spectrum.1"))
+            speos.close()
+            pool.release(speos)
+            assert not any(server.store.tables.values())
+
+            with pool.session() as speos:
+                assert speos.client.spectrums().list() == []
+            metrics = pool.metrics()
+            assert metrics["startup"]["count"] == 1
+            assert metrics["reset"]["count"] == 2
+
+        # Closing the pool closes the pooled session, the server itself is left to the process
+        assert repr(speos.client).endswith("Connection: Closed")
+        assert server.speos().client.healthy
@@ -24,6 +24,8 @@
 
 from pathlib import Path
 
+from ansys.api.speos.lpf.v2 import lpf_file_reader_pb2 as lpf_messages
+import numpy as np
 import pytest
 
 import ansys.speos.core.lxp as lxp
@@ -163,3 +165,138 @@ def test_lpf_preview_without_project(speos: Speos):
     lpf1.preview(ray_filter=True, screenshot=screenshot)
     assert screenshot.exists()
     assert screenshot.stat().st_size > 0
+
+
+def test_lpf_preview_sampling():
+    """Test the selection of the rays shown by the preview."""
+    rays = [
+        lxp.RayPath(
+            lpf_messages.RayPath(
+                impacts=[lpf_messages.TripletFloat(x=i, y=j, z=0) for j in range(1 + i % 3)],
+                wavelengths=[400.0 + 10 * (i % 30)],
+                unique_face_ids=[i % 7] * (1 + i % 3),
+                interaction_statuses=[lpf_messages.RayPath.StatusAbsorbed] * (i % 3)
+                + [
+                    lpf_messages.RayPath.StatusError
+                    if i % 50 == 0
+                    else lpf_messages.RayPath.StatusAbsorbed
+                ],
+                lastDirection=lpf_messages.TripletFloat(x=0, y=0, z=1),
+            )
+        )
+        for i in range(1000)
+    ]
+
+    assert lxp._sample_rays(rays, 5) == [0, 1, 2, 3, 4]
+    assert lxp._sample_rays(rays, 5000) == list(range(1000))
+    assert lxp._sample_rays(rays, 10, sampling="random", seed=1) == lxp._sample_rays(
+        rays, 10, sampling="random", seed=1
+    )
+
+    # Every stratum is represented before any is drawn twice.
+    selected = lxp._sample_rays(rays, 20, sampling="status", seed=0)
+    assert sum(rays[i].intersection_type[-1] == lpf_messages.RayPath.StatusError for i in selected)
+    assert len({rays[i].face_ids[-1] for i in lxp._sample_rays(rays, 7, "face", seed=0)}) == 7
+    assert len({rays[i].wl for i in lxp._sample_rays(rays, 30, "wavelength", seed=0)}) == 30
+
+    # Ray i has i % 3 segments between impacts, plus its last direction when not in error.
+    selected = lxp._sample_rays(rays, 1000, max_primitives=10)
+    assert selected == [0, 1, 2, 3, 4]
+    with pytest.raises(ValueError):
+        lxp._sample_rays(rays, 10, sampling="unknown")
+
+    order = lxp._stratified_order(np.array([0, 0, 0, 0, 1, 2]), np.random.default_rng(0))
+    assert {4, 5} <= set(order[:3].tolist())
+    assert sorted(order.tolist()) == list(range(6))
+
+
+def test_ray_path_storage():
+    """Test the typed array storage shared by ray paths."""
+    messages = [
+        lpf_messages.RayPath(
+            impacts=[lpf_messages.TripletFloat(x=0.1 * i, y=j, z=0) for j in range(1 + i % 3)],
+            wavelengths=[400.0 + i],
+            body_context_ids=[4000000000 + i] * (1 + i % 3),
+            unique_face_ids=[i] * (1 + i % 3),
+            interaction_statuses=[lpf_messages.RayPath.StatusSpecularReflected] * (1 + i % 3),
+            lastDirection=lpf_messages.TripletFloat(x=0, y=0.6, z=0.8),
+            sensor_contributions=[
+                lpf_messages.RayPath.SensorContribution(
+                    sensor_id=i % 2, coordinates=lpf_messages.DoubletDouble(x=0.5, y=i)
+                )
+            ]
+            * (i % 2),
+        )
+        for i in range(5000)
+    ]
+    columns = lxp._RayPathColumns.from_stream(messages, sensor_contribution=True)
+    rays = [lxp.RayPath._from_columns(columns, i) for i in range(len(columns))]
+    assert len(columns) == 5000
+    assert columns.impacts.dtype == np.float32
+    assert columns.face_offsets is columns.offsets
+
+    # Same values as the ray paths read one by one
+    for i in (0, 1, 4095, 4096, 4999):
+        ray = lxp.RayPath(messages[i], sensor_contribution=True)
+        assert not hasattr(ray, "__dict__")
+        assert rays[i].get() == ray.get()
+        assert ray.impacts == [[impact.x, impact.y, impact.z] for impact in messages[i].impacts]
+        assert ray.body_ids == [4000000000 + i] * (1 + i % 3)
+        assert ray.last_direction == pytest.approx([0, 0.6, 0.8])
+        assert ray.intersection_type[-1] == -1
+    assert rays[3].sensor_contribution == [{"sensor_id": 1, "position": [0.5, 3.0]}]
+    assert rays[4].sensor_contribution == []
+    assert lxp.RayPath(messages[0]).sensor_contribution is None
+
+    # Ray paths of different columns are gathered when used together
+    mixed = rays[:2] + [lxp.RayPath(messages[2], sensor_contribution=True)]
+    gathered, indices = lxp._ray_columns(mixed)
+    assert indices.tolist() == [0, 1, 2]
+    assert gathered.contribution_positions.tolist() == [[0.5, 1.0]]
+    assert [ray.get() for ray in mixed] == [
+        lxp.RayPath._from_columns(gathered, i).get() for i in range(3)
+    ]
+
+
+def test_sensor_contributions():
+    """Test the vectorized queries on sensor contributions."""
+    messages = [
+        lpf_messages.RayPath(
+            impacts=[lpf_messages.TripletFloat(x=0, y=0, z=j) for j in range(2)],
+            wavelengths=[555.0],
+            unique_face_ids=[10 + i % 2, 20 + i % 3],
+            interaction_statuses=[lpf_messages.RayPath.StatusJustEmitted] * 2,
+            lastDirection=lpf_messages.TripletFloat(x=0, y=0, z=1),
+            sensor_contributions=[
+                lpf_messages.RayPath.SensorContribution(
+                    sensor_id=sensor_id, coordinates=lpf_messages.DoubletDouble(x=i, y=-i)
+                )
+                for sensor_id in range(i % 3)
+            ],
+        )
+        for i in range(6)
+    ]
+    columns = lxp._RayPathColumns.from_stream(messages, sensor_contribution=True)
+    contributions = lxp.SensorContributions(columns, ["S0", "S1", "S2"])
+    # rays 1 and 4 reach sensor 0, rays 2 and 5 reach sensors 0 and 1
+    assert len(contributions) == 6
+    assert contributions.ray_indices.tolist() == [1, 2, 2, 4, 5, 5]
+    assert contributions.sensor_ids.tolist() == [0, 0, 1, 0, 0, 1]
+    assert contributions.counts().tolist() == [4, 2, 0]
+
+    counts, x_edges, y_edges = contributions.histogram(0, bins=2, bounds=[(0, 6), (-6, 0)])
+    assert counts.tolist() == [[0, 2], [2, 0]]
+    assert x_edges.tolist() == [0, 3, 6]
+
+    in_region = contributions.in_region(0, (1.5, 6), (-6, 0))
+    assert in_region.tolist() == [False, True, False, True, True, False]
+    assert contributions.select_rays(0, (1.5, 6), (-6, 0)).tolist() == [2, 4, 5]
+    assert contributions.select_rays(1, (0, 6), (-6, 0)).tolist() == [2, 5]
+
+    faces, matrix = contributions.face_sensor_matrix()
+    assert faces.tolist() == [21, 22]
+    assert matrix.tolist() == [[2, 0, 0], [2, 2, 0]]
+    faces, matrix = contributions.face_sensor_matrix(impact=0, contributions=in_region)
+    assert faces.tolist() == [10, 11]
+    assert matrix.tolist() == [[2, 0, 0], [1, 0, 0]]
+    assert contributions.face_sensor_matrix(impact=2)[1].shape == (0, 3)
@@ -0,0 +1,186 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the analysis of triangle meshes."""
+
+import numpy as np
+import pytest
+
+from ansys.speos.core.generic import mesh_methods
+from ansys.speos.core.generic.spatial_index import AABBTree
+
+# Unit cube: 8 corners, 12 triangles oriented outwards
+CUBE_VERTICES = np.array([[x, y, z] for x in (0.0, 1.0) for y in (0.0, 1.0) for z in (0.0, 1.0)])
+CUBE_FACETS = np.array(
+    [
+        [0, 1, 3], [0, 3, 2], [4, 6, 7], [4, 7, 5],
+        [0, 4, 5], [0, 5, 1], [2, 3, 7], [2, 7, 6],
+        [0, 2, 6], [0, 6, 4], [1, 5, 7], [1, 7, 3],
+    ]
+)  # fmt: skip
+
+
+def test_normals_bounds_area():
+    """Test normals, bounding box and area of a cube."""
+    normals = mesh_methods.triangle_normals(CUBE_VERTICES, CUBE_FACETS)
+    assert normals[0].tolist() == [-1.0, 0.0, 0.0]
+    assert np.allclose(np.linalg.norm(normals, axis=1), 1.0)
+
+    vertex_normals = mesh_methods.vertex_normals(CUBE_VERTICES, CUBE_FACETS)
+    # Corners point away from the cube center
+    assert np.all(np.sum(vertex_normals * (CUBE_VERTICES - 0.5), axis=1) > 0)
+    assert np.allclose(np.linalg.norm(vertex_normals, axis=1), 1.0)
+
+    assert mesh_methods.bounding_box(CUBE_VERTICES).tolist() == [[0, 0, 0], [1, 1, 1]]
+    assert mesh_methods.surface_area(CUBE_VERTICES, CUBE_FACETS) == 6.0
+
+
+def test_degenerate_and_duplicate_triangles():
+    """Test detection of degenerate and duplicate triangles."""
+    vertices = np.vstack((CUBE_VERTICES, [[2.0, 2.0, 2.0]]))
+    facets = np.vstack((CUBE_FACETS, [[0, 0, 1], [0, 7, 8], [3, 1, 0], [1, 3, 0]]))
+    assert mesh_methods.degenerate_triangles(vertices, facets).tolist() == [12, 13]
+    assert mesh_methods.degenerate_triangles(vertices, facets, tolerance=0.5).tolist() == list(
+        range(16)
+    )
+    assert mesh_methods.duplicate_triangles(facets).tolist() == [14, 15]
+    assert mesh_methods.duplicate_triangles(CUBE_FACETS).tolist() == []
+
+    # Vertex indices too large to give each triangle an exact 64 bits key
+    large = CUBE_FACETS + 3_000_000
+    assert mesh_methods.duplicate_triangles(np.vstack((large, large[[4, 1]]))).tolist() == [12, 13]
+
+
+def test_closed_mesh():
+    """Test closed mesh detection with edge incidences."""
+    report = mesh_methods.check_mesh(CUBE_VERTICES, CUBE_FACETS, CUBE_VERTICES - 0.5)
+    assert report.closed
+    assert report.valid
+    assert report.nb_triangles == 12
+    assert report.area == 6.0
+
+    report = mesh_methods.check_mesh(CUBE_VERTICES, CUBE_FACETS[1:], np.empty((0, 3)))
+    assert not report.closed
+    assert not report.valid
+    assert report.missing_normals
+    assert report.nb_open_edges == 3
+    edges, counts = mesh_methods.edge_incidences(CUBE_FACETS[1:])
+    assert edges[counts == 1].tolist() == [[0, 1], [0, 3], [1, 3]]
+
+    report = mesh_methods.check_mesh(CUBE_VERTICES, np.vstack((CUBE_FACETS, [[0, 1, 4]])), [])
+    assert report.nb_non_manifold_edges == 2
+    assert report.nb_open_edges == 1
+    assert not report.closed
+
+
+def test_merge_meshes():
+    """Test that faces sharing vertex coordinates form one closed mesh once merged."""
+    # Each face of the cube with its own vertices
+    meshes = []
+    for i in range(0, 12, 2):
+        used, facets = np.unique(CUBE_FACETS[i : i + 2], return_inverse=True)
+        vertices = CUBE_VERTICES[used]
+        meshes.append((vertices, facets.reshape(-1, 3), vertices - 0.5))
+    vertices, facets, normals = mesh_methods.merge_meshes(meshes)
+    assert len(vertices) == 8
+    assert len(facets) == 12
+    assert np.allclose(normals, vertices - 0.5)
+    assert mesh_methods.check_mesh(vertices, facets, normals).closed
+
+    assert not mesh_methods.check_mesh(*mesh_methods.merge_meshes(meshes[1:])).closed
+    assert len(mesh_methods.merge_meshes([])[0]) == 0
+
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+def test_ray_and_point_queries():
+    """Test ray intersections and point distances on pairs of points and triangles."""
+    triangles = np.repeat(CUBE_VERTICES[CUBE_FACETS[:1]], 4, axis=0)  # Triangle on x = 0
+    origins = np.array([[-1.0, 0.2, 0.2], [-1.0, 0.8, 0.2], [1.0, 0.2, 0.2], [-1.0, 0.2, 0.2]])
+    directions = np.array([[1.0, 0, 0], [1.0, 0, 0], [1.0, 0, 0], [0, 1.0, 0]])
+    t = mesh_methods.ray_triangle_intersections(origins, directions, triangles)
+    assert t.tolist() == [1.0, np.inf, np.inf, np.inf]
+
+    points = np.array([[0.5, 0.2, 0.2], [0.0, 0.0, -1.0], [0.0, 2.0, 2.0], [0.0, 0.0, 0.5]])
+    distances = mesh_methods.point_triangle_distances(points, triangles)
+    assert np.allclose(distances, [0.5, 1.0, np.sqrt(2.0), 0.0])
+
+
+def test_aabb_tree():
+    """Test box and ray queries of the bounding volume hierarchy against brute force."""
+    rng = np.random.default_rng(0)
+    centers = rng.random((1000, 3)) * 10.0
+    lower, upper = centers - 0.2, centers + 0.2
+    tree = AABBTree(lower, upper, leaf_size=4)
+    assert len(tree) == 1000
+    assert np.allclose(tree.bounds, [lower.min(axis=0), upper.max(axis=0)])
+
+    query_lower = rng.random((20, 3)) * 8.0
+    query_upper = query_lower + 2.0
+    query_ids, box_ids = tree.query_boxes(query_lower, query_upper)
+    for i in range(20):
+        expected = np.all((query_lower[i] <= upper) & (lower <= query_upper[i]), axis=1)
+        assert sorted(box_ids[query_ids == i]) == np.flatnonzero(expected).tolist()
+
+    origins = rng.random((20, 3)) * 10.0
+    directions = rng.normal(size=(20, 3))
+    directions[0] = [1.0, 0.0, 0.0]
+    ray_ids, box_ids = tree.query_rays(origins, directions)
+    for i in range(20):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_lower = (lower - origins[i]) / directions[i]
+            t_upper = (upper - origins[i]) / directions[i]
+        t_near = np.fmin(t_lower, t_upper).max(axis=1)
+        t_far = np.fmax(t_lower, t_upper).min(axis=1)
+        expected = (t_near <= t_far) & (t_far >= 0)
+        assert sorted(box_ids[ray_ids == i]) == np.flatnonzero(expected).tolist()
+
+    empty_tree = AABBTree(np.empty((0, 3)), np.empty((0, 3)))
+    assert len(empty_tree.query_boxes(query_lower, query_upper)[0]) == 0
+
+
+def test_decimate():
+    """Test the simplification of a mesh by vertex clustering and the selection of levels."""
+    side = 101
+    xs, ys = np.meshgrid(np.arange(side, dtype=float), np.arange(side, dtype=float))
+    vertices = np.stack((xs.ravel(), ys.ravel(), np.sin(xs.ravel() / 10.0)), axis=1)
+    corners = np.arange(side * side).reshape(side, side)[:-1, :-1].ravel()
+    facets = np.concatenate(
+        (
+            np.stack((corners, corners + 1, corners + side), axis=1),
+            np.stack((corners + 1, corners + side + 1, corners + side), axis=1),
+        )
+    )
+
+    assert mesh_methods.decimate(vertices, facets, len(facets))[1] is facets
+    simplified_vertices, simplified_facets = mesh_methods.decimate(vertices, facets, 1000)
+    assert 100 < len(simplified_facets) <= 1000
+    assert len(simplified_vertices) == len(np.unique(simplified_facets))
+    assert len(mesh_methods.degenerate_triangles(simplified_vertices, simplified_facets)) == 0
+    assert np.allclose(
+        mesh_methods.bounding_box(simplified_vertices)[:, :2],
+        mesh_methods.bounding_box(vertices)[:, :2],
+        atol=10.0,
+    )
+
+    levels = mesh_methods.select_lod_levels([10**6, 10**5, 10**3], [10.0, 1.0, 0.1], 10**5)
+    assert levels.tolist() == [2, 4, 4]
+    assert mesh_methods.select_lod_levels([10, 20], [1.0, 1.0], 100).tolist() == [0, 0]
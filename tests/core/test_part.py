@@ -22,15 +22,22 @@
 
 """Test basic using part/body/face."""
 
+import logging
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from ansys.speos.core import Body, Face, Part, Project, Speos
 from ansys.speos.core.generic.parameters import MeshData
 from ansys.speos.core.kernel import ProtoFace
+from ansys.speos.core.kernel.body import ProtoBody
+from ansys.speos.core.kernel.part import ProtoPart
+from ansys.speos.core.kernel.scene import ProtoScene
+from ansys.speos.core.workflow.combine_speos import SpeosFileInstance, combine_speos
 from tests.conftest import test_path
 from tests.core.test_opt_prop import create_rect_face
+from tests.fake_server import FakeSpeosServer
 
 
 def test_create_root_part(speos: Speos):
@@ -351,6 +358,41 @@ def test_commit_part(speos: Speos):
     root_part.delete()
 
 
+def test_commit_part_tree(speos: Speos):
+    """Test commit of a part tree with several bodies and faces per level."""
+    p = Project(speos=speos)
+    root_part = p.create_root_part()
+    bodies = [root_part.create_body(name=f"Body.{i}") for i in range(3)]
+    faces = [create_rect_face(b, f"Face.{j}", [j, 0, 0], 1, 1) for b in bodies for j in range(4)]
+    sp1 = root_part.create_sub_part(name="SubPart.1")
+    sp11 = sp1.create_sub_part(name="SubPart.11")
+    create_rect_face(sp11.create_body(name="SubBody.11"), "SubFace.11", [0, 0, 0], 1, 1)
+    root_part.commit()
+
+    root_data = root_part.part_link.get()
+    assert list(root_data.body_guids) == [b.body_link.key for b in bodies]
+    assert list(bodies[1].body_link.get().face_guids) == [f.face_link.key for f in faces[4:8]]
+    assert [x.part_guid for x in root_data.parts] == [sp1.part_link.key]
+    assert [x.part_guid for x in sp1.part_link.get().parts] == [sp11.part_link.key]
+    assert len(sp11.part_link.get().body_guids) == 1
+
+    # Only changed faces are updated, new faces are added to their committed body
+    faces[0].vertices = [5, 0, 0, 5, 1, 0, 6, 0, 0, 6, 1, 0]
+    new_face = create_rect_face(bodies[2], "Face.new", [0, 0, 0], 2, 2)
+    root_part.commit()
+    assert faces[0].face_link.get().vertices[0] == 5
+    assert bodies[2].body_link.get().face_guids[-1] == new_face.face_link.key
+    assert len(root_part.part_link.get().body_guids) == 3
+
+    # Sub part commit keeps its instance in the parent part
+    sp2 = root_part.create_sub_part(name="SubPart.2")
+    create_rect_face(sp2.create_body(name="SubBody.2"), "SubFace.2", [0, 0, 0], 1, 1)
+    sp2.commit()
+    assert [x.name for x in root_part.part_link.get().parts] == ["SubPart.1", "SubPart.2"]
+
+    root_part.delete()
+
+
 def test_reset_part(speos: Speos):
     """Test reset of part."""
     p = Project(speos=speos)
@@ -508,6 +550,161 @@ def test_face_invalid_normals_raises(speos: Speos):
         f.normals = [0, 0, 1, 0, 0, 1]  # length mismatch with vertices
 
 
+def test_check_body_mesh(speos: Speos):
+    """Test mesh checks of faces and of a body made of several faces."""
+    p = Project(speos=speos)
+    body1 = p.create_root_part().create_body(name="Body.1")
+    corners = [[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)]
+    sides = [[0, 1, 3, 2], [4, 6, 7, 5], [0, 4, 5, 1], [2, 3, 7, 6], [0, 2, 6, 4], [1, 5, 7, 3]]
+    for i, side in enumerate(sides):
+        face = body1.create_face(name=f"Face.{i}")
+        face.vertices = [float(c) for corner in side for c in corners[corner]]
+        face.facets = [0, 1, 2, 0, 2, 3]
+
+    report = body1.faces[0].check_mesh()
+    assert report.missing_normals
+    assert report.nb_open_edges == 4
+    assert body1.faces[0].compute_normals().normals == [-1.0, 0.0, 0.0] * 4
+    assert body1.faces[0].check_mesh().valid
+
+    report = body1.check_mesh()
+    assert report.closed
+    assert report.nb_vertices == 8
+    assert report.area == 6.0
+    assert report.missing_normals
+    for face in body1.faces:
+        face.compute_normals()
+    assert body1.check_mesh().valid
+
+    body1.faces[5].facets = [0, 1, 2, 0, 1, 2]
+    report = body1.check_mesh()
+    assert not report.closed
+    assert report.duplicate_triangles.tolist() == [11]
+
+
+def test_geometry_index(speos: Speos):
+    """Test box, ray and point queries of the project geometry index and its updates."""
+    p = Project(speos=speos)
+    root_part = p.create_root_part()
+    body1 = root_part.create_body(name="Body.1")
+    face0 = create_rect_face(body1, "Face.0", [0, 0, 0], 1, 1)
+    face1 = create_rect_face(body1, "Face.1", [0, 0, 2], 1, 1)
+    sp1 = root_part.create_sub_part(name="SubPart.1")
+    sp1.axis_system = [10, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1]
+    face2 = create_rect_face(sp1.create_body(name="Body.2"), "Face.2", [0, 0, 0], 1, 1)
+    assert len(p.geometry_index) == 0  # Only committed faces are indexed
+
+    root_part.commit()
+    index = p.geometry_index
+    assert len(index) == 3
+    assert [index.face(i) for i in range(3)] == [face0, face1, face2]
+    assert index.geo_path(2) == "SubPart.1/Body.2/Face.2"
+    assert index.query_box([9, -1, -1], [12, 2, 1]) == [2]
+    assert index.query_box([-1, -1, -1], [2, 2, 3]) == [0, 1]
+
+    face_ids, t = index.intersect_rays(
+        [[0.5, 0.5, -1], [10.5, 0.5, 5], [5, 5, 5]], [[0, 0, 1], [0, 0, -1], [0, 0, 1]]
+    )
+    assert face_ids.tolist() == [0, 2, -1]
+    assert t.tolist() == [1.0, 5.0, np.inf]
+    points = [[0.2, 0.3, 2], [10.2, 0.3, 0], [0.2, 0.3, 1]]
+    assert index.locate_points(points).tolist() == [1, 2, -1]
+
+    # Only the saved face is indexed again
+    entry0 = index._faces[0]
+    face1.vertices = [0, 0, 3, 0, 1, 3, 1, 0, 3, 1, 1, 3]
+    assert index.locate_points([[0.2, 0.3, 3]]).tolist() == [-1]
+    face1.commit()
+    assert p.geometry_index is index
+    assert index._faces[0] is entry0
+    assert index.locate_points([[0.2, 0.3, 3], [0.2, 0.3, 2]]).tolist() == [1, -1]
+
+    # Moved sub part and deleted face
+    sp1.axis_system = [20, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1]
+    face0.delete()
+    p.geometry_index
+    assert len(index) == 2
+    assert index.locate_points([[20.2, 0.3, 0], [10.2, 0.3, 0]]).tolist() == [2, -1]
+    with pytest.raises(KeyError):
+        index.face(0)
+
+
+def test_geometry_index_shared_part():
+    """Test that every placement of a part shared by several sub parts is indexed."""
+    with FakeSpeosServer() as server:
+        speos = server.speos(logging_level=logging.WARNING)
+        face_links = speos.client.faces().create_batch(
+            message_list=[
+                ProtoFace(
+                    name=f"Face.{i}",
+                    vertices=[0, 0, i, 1, 0, i, 0, 1, i, 1, 1, i],
+                    facets=[0, 1, 2, 2, 1, 3],
+                    normals=[0, 0, 1] * 4,
+                )
+                for i in range(2)
+            ]
+        )
+        body_link = speos.client.bodies().create(
+            message=ProtoBody(name="Body", face_guids=[f.key for f in face_links])
+        )
+        part_link = speos.client.parts().create(
+            message=ProtoPart(name="Part", body_guids=[body_link.key])
+        )
+        server.store.register_scene_file(
+            "fake://shared.speos", ProtoScene(name="Scene", part_guid=part_link.key)
+        )
+
+        p = combine_speos(
+            speos=speos,
+            speos_to_combine=[
+                SpeosFileInstance("fake://shared.speos", name="Instance.0"),
+                SpeosFileInstance(
+                    "fake://shared.speos",
+                    axis_system=[10, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1],
+                    name="Instance.1",
+                ),
+            ],
+        )
+        index = p.geometry_index
+        assert len(index) == 4
+        points = [[0.2, 0.3, 0], [0.2, 0.3, 1], [10.2, 0.3, 0], [10.2, 0.3, 1]]
+        face_ids = index.locate_points(points).tolist()
+        assert -1 not in face_ids
+        assert len(set(face_ids)) == 4
+        assert [index.geo_path(i) for i in face_ids] == [
+            "Instance.0/Body/Face.0",
+            "Instance.0/Body/Face.1",
+            "Instance.1/Body/Face.0",
+            "Instance.1/Body/Face.1",
+        ]
+
+        # Nothing is rebuilt when nothing changed
+        entries = list(index._faces)
+        tree = index._tree
+        assert p.geometry_index is index
+        assert all(a is b for a, b in zip(index._faces, entries))
+        assert index._tree is tree
+
+
+def test_body_lod_mesh(speos: Speos):
+    """Test the cache of simplified body meshes."""
+    p = Project(speos=speos)
+    body1 = p.create_root_part().create_body(name="Body.1")
+    for i in range(64):
+        create_rect_face(body1, f"Face.{i}", [i % 8, i // 8, 0], 1, 1)
+
+    vertices, facets = body1._lod_mesh()
+    assert vertices.shape == (256, 3)
+    assert facets.shape == (128, 3)
+    lod_vertices, lod_facets = body1._lod_mesh(1)
+    assert len(lod_facets) <= 32
+    assert body1._lod_mesh(1)[1] is lod_facets  # Cached
+
+    body1.faces[0].vertices = [0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 1]
+    assert body1._lod_mesh(1)[1] is not lod_facets
+    assert body1._lod_mesh()[0][2].tolist() == [1.0, 0.0, 1.0]
+
+
 @pytest.mark.supported_speos_versions(min=252)
 def test_vertices_data(speos: Speos):
     """Test vertices data implementation."""
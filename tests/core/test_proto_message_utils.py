@@ -31,6 +31,7 @@ from ansys.speos.core.generic.parameters import SurfaceSourceParameters
 from ansys.speos.core.generic.version_checker import check_version
 from ansys.speos.core.kernel import scene
 from ansys.speos.core.kernel.proto_message_utils import protobuf_message_to_dict
+from ansys.speos.core.kernel.sensor_template import ProtoSensorTemplate
 from ansys.speos.core.sensor import SensorIrradiance
 from ansys.speos.core.source import SourceSurface
 from tests.conftest import test_path
@@ -493,3 +494,34 @@ def test_flatten_dict(speos: Speos):
     if check_version(ansys_api_speos_version, 0, 16, 0):
         expected_keys.append("sub_scene_anchor_axis_system")
     assert all(True if key in expected_keys else False for key in res.keys())
+
+
+def test_resolve_field_path():
+    """Test _resolve_field_path against the expanded dictionary lookup."""
+    ssr_inst = scene.ProtoScene.SensorInstance(name="Camera.1")
+    ssr_inst.metadata["UniqueId"] = "id"
+    ssr_inst.camera_properties.axis_system[:] = [0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1]
+    ssr_t = ProtoSensorTemplate(name="Camera.1")
+    ssr_t.camera_sensor_template.focal_length = 5
+    ssr_t.camera_sensor_template.width = 6
+
+    roots = [
+        proto_message_utils._FieldPathRoot(
+            descriptor=ssr_inst.DESCRIPTOR, loader=lambda: ssr_inst, ignored_guids=("sensor_guid",)
+        ),
+        proto_message_utils._FieldPathRoot(descriptor=ssr_t.DESCRIPTOR, loader=lambda: ssr_t),
+    ]
+    out_dict = proto_message_utils._replace_guids(speos_client=None, message=ssr_inst)
+    out_dict["sensor"] = proto_message_utils._replace_guids(speos_client=None, message=ssr_t)
+    proto_message_utils._replace_properties(json_dict=out_dict)
+    flat_dict = proto_message_utils._flatten_dict(dict_var=out_dict)
+
+    for key in ["axis_system", "focal_length", "width", "height", "sensor_guid"]:
+        assert proto_message_utils._resolve_field_path(roots=roots, key=key) == (
+            True,
+            flat_dict[key],
+        )
+
+    # Ambiguous, message valued or unknown keys are left to the dictionary lookup
+    for key in ["name", "camera_sensor_template", "camera_properties", "UniqueId", "axis"]:
+        assert proto_message_utils._resolve_field_path(roots=roots, key=key) == (False, None)
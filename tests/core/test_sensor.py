@@ -1873,6 +1873,41 @@ def test_commit_sensor(speos: Speos):
     sensor1.delete()
 
 
+def test_sensor_visual_fingerprint(speos: Speos):
+    """Test that the visual fingerprint of sensors only follows their committed geometry."""
+    p = Project(speos=speos)
+    sensor1 = p.create_sensor(name="Irradiance.1", feature_type=SensorIrradiance)
+    fingerprint = sensor1._visual_fingerprint()
+    sensor1.commit()
+    assert sensor1._visual_fingerprint() == fingerprint
+
+    # Not geometric
+    sensor1.set_type_colorimetric()
+    sensor1.commit()
+    assert sensor1._visual_fingerprint() == fingerprint
+
+    # Geometric, only taken into account once committed
+    sensor1.axis_system = [10, 10, 10, 1, 0, 0, 0, 1, 0, 0, 0, 1]
+    assert sensor1._visual_fingerprint() == fingerprint
+    sensor1.commit()
+    moved_fingerprint = sensor1._visual_fingerprint()
+    assert moved_fingerprint != fingerprint
+    sensor1.dimensions.x_start = -60
+    sensor1.commit()
+    assert sensor1._visual_fingerprint() != moved_fingerprint
+
+    sensor2 = p.create_sensor(name="Intensity.1", feature_type=SensorXMPIntensity)
+    sensor2.commit()
+    fingerprint = sensor2._visual_fingerprint()
+    sensor2.set_orientation_conoscopic()
+    sensor2.commit()
+    assert sensor2._visual_fingerprint() != fingerprint
+
+    with p._preloaded_feature_reads():
+        assert sensor2._visual_fingerprint() != fingerprint
+        assert p.client.sensor_templates()._read_cache
+
+
 def test_reset_sensor(speos: Speos):
     """Test reset of sensor."""
     p = Project(speos=speos)
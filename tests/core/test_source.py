@@ -2915,3 +2915,22 @@ def test_source_timeline(speos: Speos):
         j = j + 1
 
     remove_file(str(path_for_export))
+
+
+def test_source_visual_fingerprint(speos: Speos):
+    """Test that the visual fingerprint of sources follows the items referenced by the template."""
+    p = Project(speos=speos)
+    source1 = SourceLuminaire(
+        project=p, name="Luminaire.1", default_parameters=LuminaireSourceParameters()
+    )
+    source1.commit()
+    fingerprint = source1._visual_fingerprint()
+    source1.commit()
+    assert source1._visual_fingerprint() == fingerprint
+
+    # The spectrum keeps its guid, only its content changes
+    source1.spectrum.set_halogen()
+    source1.commit()
+    assert source1._visual_fingerprint() != fingerprint
+
+    source1.delete()
@@ -0,0 +1,508 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""In-process fake Speos RPC server.
+
+This module implements the database, face transfer, scene file, job, file transfer, LPF reader and
+server information services of ``ansys.api.speos`` over an in-memory store. It lets client side
+code be exercised and benchmarked without a licensed SpeosRPC_Server: nothing is simulated, scene
+files and LPF files only exist if they were saved or registered in the store beforehand.
+"""
+
+from collections import defaultdict
+from concurrent import futures
+import threading
+from typing import Dict, List, Optional
+import uuid
+
+from ansys.api.speos.file.v1 import (
+    file_transfer_pb2 as file_messages,
+    file_transfer_pb2_grpc as file_service,
+)
+from ansys.api.speos.intensity.v1 import (
+    intensity_pb2 as intensity_messages,
+    intensity_pb2_grpc as intensity_service,
+)
+from ansys.api.speos.job.v2 import job_pb2 as job_messages, job_pb2_grpc as job_service
+from ansys.api.speos.lpf.v2 import (
+    lpf_file_reader_pb2 as lpf_messages,
+    lpf_file_reader_pb2_grpc as lpf_service,
+)
+from ansys.api.speos.part.v1 import (
+    body_pb2 as body_messages,
+    body_pb2_grpc as body_service,
+    face_pb2 as face_messages,
+    face_pb2_grpc as face_service,
+    part_pb2 as part_messages,
+    part_pb2_grpc as part_service,
+)
+from ansys.api.speos.results.v1 import ray_path_pb2
+from ansys.api.speos.scene.v2 import scene_pb2 as scene_messages, scene_pb2_grpc as scene_service
+from ansys.api.speos.sensor.v1 import (
+    sensor_pb2 as sensor_messages,
+    sensor_pb2_grpc as sensor_service,
+)
+from ansys.api.speos.server_info.v1 import server_info_pb2, server_info_pb2_grpc
+from ansys.api.speos.simulation.v1 import (
+    simulation_template_pb2 as simulation_messages,
+    simulation_template_pb2_grpc as simulation_service,
+)
+from ansys.api.speos.sop.v1 import sop_pb2 as sop_messages, sop_pb2_grpc as sop_service
+from ansys.api.speos.source.v1 import (
+    source_pb2 as source_messages,
+    source_pb2_grpc as source_service,
+)
+from ansys.api.speos.spectrum.v1 import (
+    spectrum_pb2 as spectrum_messages,
+    spectrum_pb2_grpc as spectrum_service,
+)
+from ansys.api.speos.vop.v1 import vop_pb2 as vop_messages, vop_pb2_grpc as vop_service
+import grpc
+
+from ansys.speos.core.generic.constants import MAX_CLIENT_MESSAGE_SIZE
+from ansys.speos.core.kernel.client import default_docker_channel
+from ansys.speos.core.kernel.face import FaceStub, ProtoFace
+from ansys.speos.core.speos import Speos
+
+FAKE_SERVER_VERSION = "2026.1.0"
+"""Version reported by the fake server."""
+
+_DATABASES = [
+    # (table, messages module, services module, manager servicer name)
+    ("faces", face_messages, face_service, "FacesManagerServicer"),
+    ("bodies", body_messages, body_service, "BodiesManagerServicer"),
+    ("parts", part_messages, part_service, "PartsManagerServicer"),
+    ("sop_templates", sop_messages, sop_service, "SOPTemplatesManagerServicer"),
+    ("vop_templates", vop_messages, vop_service, "VOPTemplatesManagerServicer"),
+    ("spectrums", spectrum_messages, spectrum_service, "SpectrumsManagerServicer"),
+    (
+        "intensity_templates",
+        intensity_messages,
+        intensity_service,
+        "IntensityTemplatesManagerServicer",
+    ),
+    ("source_templates", source_messages, source_service, "SourceTemplatesManagerServicer"),
+    ("sensor_templates", sensor_messages, sensor_service, "SensorTemplatesManagerServicer"),
+    (
+        "simulation_templates",
+        simulation_messages,
+        simulation_service,
+        "SimulationTemplatesManagerServicer",
+    ),
+    ("scenes", scene_messages, scene_service, "ScenesManagerServicer"),
+    ("jobs", job_messages, job_service, "JobsManagerServicer"),
+]
+
+
+class FakeStore:
+    """In-memory content of a fake Speos server."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.tables: Dict[str, Dict[str, object]] = defaultdict(dict)
+        self.job_states: Dict[str, int] = {}
+        self.files: Dict[str, tuple] = {}
+        self.dependencies: Dict[str, List[str]] = defaultdict(list)
+        self.scene_files: Dict[str, scene_messages.Scene] = {}
+        self.lpf_files: Dict[str, tuple] = {}
+        self.ray_paths: List[ray_path_pb2.RayPath] = []
+        self.job_results: List[job_messages.Result] = []
+
+    @staticmethod
+    def new_guid() -> str:
+        """Create a new unique identifier."""
+        return str(uuid.uuid4())
+
+    def clear(self) -> None:
+        """Remove all database items, files and registered data."""
+        with self.lock:
+            for table in self.tables.values():
+                table.clear()
+            for registry in (
+                self.job_states,
+                self.files,
+                self.dependencies,
+                self.scene_files,
+                self.lpf_files,
+            ):
+                registry.clear()
+            self.ray_paths.clear()
+            self.job_results.clear()
+
+    def register_scene_file(self, file_uri: str, scene: scene_messages.Scene) -> None:
+        """Make a scene loadable from ``file_uri`` with SceneActions.LoadFile."""
+        with self.lock:
+            self.scene_files[file_uri] = scene
+
+    def register_lpf_file(
+        self,
+        file_uri: str,
+        ray_paths: List[lpf_messages.RayPath],
+        sensor_names: Optional[List[str]] = None,
+    ) -> None:
+        """Make ray paths readable from ``file_uri`` with the LPF file reader."""
+        with self.lock:
+            self.lpf_files[file_uri] = (list(ray_paths), list(sensor_names or []))
+
+
+def _not_found(context, kind: str, key: str):
+    context.abort(grpc.StatusCode.NOT_FOUND, f"{kind} {key} does not exist")
+
+
+def _make_manager(store: FakeStore, table: str, messages, base):
+    """Create the servicer of a database with Create/Read/Update/Delete/List (and ReadAll)."""
+    field = messages.Read_Response.DESCRIPTOR.fields[0].name
+    items = store.tables[table]
+
+    class _Manager(base):
+        def Create(self, request, context):  # noqa: N802
+            guid = request.guid or store.new_guid()
+            item = type(getattr(request, field))()
+            item.CopyFrom(getattr(request, field))
+            with store.lock:
+                items[guid] = item
+                if table == "jobs":
+                    store.job_states[guid] = job_messages.Job.State.QUEUED
+            return messages.Create_Response(guid=guid)
+
+        def Read(self, request, context):  # noqa: N802
+            item = items.get(request.guid)
+            if item is None:
+                _not_found(context, table, request.guid)
+            return messages.Read_Response(**{field: item})
+
+        def Update(self, request, context):  # noqa: N802
+            with store.lock:
+                if request.guid not in items:
+                    _not_found(context, table, request.guid)
+                item = type(getattr(request, field))()
+                item.CopyFrom(getattr(request, field))
+                items[request.guid] = item
+            return messages.Update_Response()
+
+        def Delete(self, request, context):  # noqa: N802
+            with store.lock:
+                if items.pop(request.guid, None) is None:
+                    _not_found(context, table, request.guid)
+                store.job_states.pop(request.guid, None)
+            return messages.Delete_Response()
+
+        def List(self, request, context):  # noqa: N802
+            return messages.List_Response(guids=list(items))
+
+        def ReadAll(self, request, context):  # noqa: N802
+            all_field = messages.ReadAll_Response.DESCRIPTOR.fields[0].name
+            response = messages.ReadAll_Response()
+            for guid, item in list(items.items()):
+                getattr(response, all_field)[guid].CopyFrom(item)
+            return response
+
+    return _Manager()
+
+
+class _FaceActions(face_service.FaceActionsServicer):
+    def __init__(self, store: FakeStore):
+        self._store = store
+        self._faces = store.tables["faces"]
+
+    def ReserveFaces(self, request_iterator, context):  # noqa: N802
+        for request in request_iterator:
+            guids = [self._store.new_guid() for _ in request.faces]
+            with self._store.lock:
+                for guid, face in zip(guids, request.faces):
+                    self._faces[guid] = ProtoFace(name=face.name)
+            yield face_messages.ReserveFace_Response(guids=guids)
+
+    def Upload(self, request_iterator, context):  # noqa: N802
+        guid, face = None, None
+        for chunk in request_iterator:
+            if chunk.HasField("face_header"):
+                if guid is not None:
+                    self._faces[guid] = face
+                header = chunk.face_header
+                if header.guid not in self._faces:
+                    _not_found(context, "faces", header.guid)
+                guid = header.guid
+                face = ProtoFace(name=header.name, description=header.description)
+                face.metadata.update(header.metadata)
+            elif chunk.HasField("vertices"):
+                face.vertices.extend(chunk.vertices.data)
+            elif chunk.HasField("facets"):
+                face.facets.extend(chunk.facets.data)
+            elif chunk.HasField("normals"):
+                face.normals.extend(chunk.normals.data)
+            elif chunk.HasField("vertices_data"):
+                if chunk.vertices_data.new_layer:
+                    face.vertices_data.append(ProtoFace.MeshData(name=chunk.vertices_data.name))
+                face.vertices_data[-1].data.extend(chunk.vertices_data.data)
+        if guid is not None:
+            self._faces[guid] = face
+        return face_messages.Upload_Response()
+
+    def Download(self, request, context):  # noqa: N802
+        guids = list(request.guids) or [request.guid]
+        faces = []
+        for guid in guids:
+            face = self._faces.get(guid)
+            if face is None:
+                _not_found(context, "faces", guid)
+            if request.only_face_header:
+                face = ProtoFace(
+                    name=face.name, description=face.description, metadata=face.metadata
+                )
+            faces.append(face)
+        yield from FaceStub._faces_to_chunks(guids=guids, message_list=faces, nb_items=128 * 1024)
+
+
+class _SceneActions(scene_service.SceneActionsServicer):
+    def __init__(self, store: FakeStore):
+        self._store = store
+
+    def LoadFile(self, request, context):  # noqa: N802
+        scene = self._store.scene_files.get(request.file_uri)
+        if scene is None:
+            _not_found(context, "file", request.file_uri)
+        with self._store.lock:
+            if request.guid not in self._store.tables["scenes"]:
+                _not_found(context, "scenes", request.guid)
+            self._store.tables["scenes"][request.guid] = scene_messages.Scene()
+            self._store.tables["scenes"][request.guid].CopyFrom(scene)
+        return scene_messages.LoadFile_Response()
+
+    def SaveFile(self, request, context):  # noqa: N802
+        scene = self._store.tables["scenes"].get(request.guid)
+        if scene is None:
+            _not_found(context, "scenes", request.guid)
+        saved = scene_messages.Scene()
+        saved.CopyFrom(scene)
+        self._store.register_scene_file(request.file_uri, saved)
+        return scene_messages.SaveFile_Response()
+
+    def GetSourceRayPaths(self, request, context):  # noqa: N802
+        yield from self._store.ray_paths[: request.rays_nb or None]
+
+
+class _JobActions(job_service.JobActionsServicer):
+    def __init__(self, store: FakeStore):
+        self._store = store
+
+    def _state(self, context, guid: str) -> int:
+        state = self._store.job_states.get(guid)
+        if state is None:
+            _not_found(context, "jobs", guid)
+        return state
+
+    def GetState(self, request, context):  # noqa: N802
+        return job_messages.GetState_Response(state=self._state(context, request.guid))
+
+    def Start(self, request, context):  # noqa: N802
+        self._state(context, request.guid)
+        self._store.job_states[request.guid] = job_messages.Job.State.FINISHED
+        return job_messages.Start_Response()
+
+    def Stop(self, request, context):  # noqa: N802
+        self._state(context, request.guid)
+        self._store.job_states[request.guid] = job_messages.Job.State.STOPPED
+        return job_messages.Stop_Response()
+
+    def GetError(self, request, context):  # noqa: N802
+        self._state(context, request.guid)
+        return job_messages.GetError_Response()
+
+    def GetResults(self, request, context):  # noqa: N802
+        self._state(context, request.guid)
+        return job_messages.GetResults_Response(results=self._store.job_results)
+
+    def GetInformation(self, request, context):  # noqa: N802
+        self._state(context, request.guid)
+        return job_messages.GetInformation_Response(progress=1.0)
+
+    def GetProgressStatus(self, request, context):  # noqa: N802
+        self._state(context, request.guid)
+        return job_messages.GetProgressStatus_Response(progress=1.0)
+
+    def GetRayPaths(self, request, context):  # noqa: N802
+        self._state(context, request.guid)
+        yield from self._store.ray_paths
+
+    def SaveFile(self, request, context):  # noqa: N802
+        self._state(context, request.guid)
+        return job_messages.SaveFile_Response()
+
+
+class _FileTransfer(file_service.FileTransferServiceServicer):
+    def __init__(self, store: FakeStore):
+        self._store = store
+
+    def Reserve(self, request, context):  # noqa: N802
+        uri = f"fake://{self._store.new_guid()}/{request.file_name}"
+        self._store.files[uri] = (request.file_name, b"")
+        return file_messages.Reserve_Response(uri=uri)
+
+    def Upload(self, request_iterator, context):  # noqa: N802
+        metadata = dict(context.invocation_metadata())
+        file_name = metadata.get("file-name", "")
+        data = bytearray()
+        for chunk in request_iterator:
+            file_name = chunk.file_name or file_name
+            data.extend(chunk.binary)
+        uri = metadata.get("reserved-file-uri") or f"fake://{self._store.new_guid()}/{file_name}"
+        self._store.files[uri] = (file_name, bytes(data))
+        response = file_messages.Upload_Response()
+        response.info.uri = uri
+        response.info.file_name = file_name
+        response.info.file_size = len(data)
+        return response
+
+    def Download(self, request, context):  # noqa: N802
+        if request.uri not in self._store.files:
+            _not_found(context, "file", request.uri)
+        file_name, data = self._store.files[request.uri]
+        context.send_initial_metadata((("file-name", file_name), ("file-size", str(len(data)))))
+        chunk_size = 4000000
+        for i in range(0, max(len(data), 1), chunk_size):
+            yield file_messages.Chunk(
+                binary=data[i : i + chunk_size],
+                size=len(data[i : i + chunk_size]),
+                file_name=file_name if i == 0 else "",
+            )
+
+    def Delete(self, request, context):  # noqa: N802
+        self._store.files.pop(request.uri, None)
+        return file_messages.Delete_Response()
+
+    def AddDependencies(self, request, context):  # noqa: N802
+        self._store.dependencies[request.uri].extend(request.dependency_uris)
+        return file_messages.AddDependencies_Response()
+
+    def ListDependencies(self, request, context):  # noqa: N802
+        response = file_messages.ListDependencies_Response()
+        for uri in self._store.dependencies.get(request.uri, []):
+            file_name, data = self._store.files.get(uri, ("", b""))
+            response.dependency_infos.add(uri=uri, file_name=file_name, file_size=len(data))
+        return response
+
+
+class _LpfFileReader(lpf_service.LpfFileReader_MonoServicer):
+    def __init__(self, store: FakeStore):
+        self._store = store
+        self._current = None
+
+    def InitLpfFileName(self, request, context):  # noqa: N802
+        self._current = self._store.lpf_files.get(request.lpf_file_uri)
+        if self._current is None:
+            _not_found(context, "file", request.lpf_file_uri)
+        return lpf_messages.InitLpfFileName_Response()
+
+    def GetInformation(self, request, context):  # noqa: N802
+        ray_paths, sensor_names = self._current or ([], [])
+        return lpf_messages.GetInformation_Response(
+            nb_of_traces=len(ray_paths),
+            nb_of_xmps=len(sensor_names),
+            has_sensor_contributions=any(len(rp.sensor_contributions) for rp in ray_paths),
+            sensor_names=sensor_names,
+        )
+
+    def CloseLpfFileName(self, request, context):  # noqa: N802
+        self._current = None
+        return lpf_messages.CloseLpfFileName_Response()
+
+    def Read(self, request, context):  # noqa: N802
+        yield from (self._current or ([], []))[0]
+
+    def ComputeUniqueFaceId(self, request, context):  # noqa: N802
+        return lpf_messages.ComputeUniqueFaceId_Response(
+            unique_face_id=(request.body_context_id << 16) + request.face_id
+        )
+
+
+class _ServerInfo(server_info_pb2_grpc.ServerInfoServicer):
+    def GetVersion(self, request, context):  # noqa: N802
+        return server_info_pb2.GetVersion_Response(version=FAKE_SERVER_VERSION)
+
+
+class FakeSpeosServer:
+    """In-process gRPC server answering like a SpeosRPC_Server from a :class:`FakeStore`.
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of threads serving the requests.
+        By default, ``4``.
+
+    Examples
+    --------
+    >>> with FakeSpeosServer() as server:
+    ...     speos = server.speos()
+    ...     face_link = speos.client.faces().create(message=ProtoFace(name="Face.1"))
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.store = FakeStore()
+        options = [
+            ("grpc.max_receive_message_length", MAX_CLIENT_MESSAGE_SIZE * 128),
+            ("grpc.max_send_message_length", MAX_CLIENT_MESSAGE_SIZE * 128),
+        ]
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers), options=options)
+        for table, messages, service, servicer in _DATABASES:
+            manager = _make_manager(self.store, table, messages, getattr(service, servicer))
+            getattr(service, f"add_{servicer}_to_server")(manager, self._server)
+        face_service.add_FaceActionsServicer_to_server(_FaceActions(self.store), self._server)
+        scene_service.add_SceneActionsServicer_to_server(_SceneActions(self.store), self._server)
+        job_service.add_JobActionsServicer_to_server(_JobActions(self.store), self._server)
+        file_service.add_FileTransferServiceServicer_to_server(
+            _FileTransfer(self.store), self._server
+        )
+        lpf_service.add_LpfFileReader_MonoServicer_to_server(
+            _LpfFileReader(self.store), self._server
+        )
+        server_info_pb2_grpc.add_ServerInfoServicer_to_server(_ServerInfo(), self._server)
+        self.port = self._server.add_insecure_port("localhost:0")
+        self._server.start()
+
+    def speos(self, **kwargs) -> Speos:
+        """Create a session connected to the fake server.
+
+        Parameters
+        ----------
+        **kwargs
+            Additional arguments of :class:`ansys.speos.core.speos.Speos`.
+
+        Returns
+        -------
+        ansys.speos.core.speos.Speos
+            Session on the fake server.
+        """
+        channel = default_docker_channel(port=self.port, message_size=MAX_CLIENT_MESSAGE_SIZE * 128)
+        return Speos(channel=channel, **kwargs)
+
+    def stop(self) -> None:
+        """Stop serving."""
+        self._server.stop(grace=None)
+
+    def __enter__(self) -> "FakeSpeosServer":
+        """Enter the server context."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop the server when leaving the context."""
+        self.stop()
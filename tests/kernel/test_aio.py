@@ -0,0 +1,121 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the asyncio client and stubs."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from ansys.speos.core import Project
+from ansys.speos.core.aio import (
+    AsyncSpeosClient,
+    compute_CPU,
+    default_docker_aio_channel,
+    default_local_aio_channel,
+    open_project,
+)
+from ansys.speos.core.kernel.face import ProtoFace
+from ansys.speos.core.simulation import SimulationDirect
+from ansys.speos.core.speos import Speos
+from tests.conftest import IS_DOCKER, SERVER_PORT, test_path
+
+
+def _aio_client() -> AsyncSpeosClient:
+    if IS_DOCKER:
+        return AsyncSpeosClient(channel=default_docker_aio_channel(port=SERVER_PORT))
+    return AsyncSpeosClient(channel=default_local_aio_channel(port=SERVER_PORT))
+
+
+def test_aio_client_connect(speos: Speos):
+    """Test the connection of an asyncio client and its closing."""
+
+    async def run():
+        client = await _aio_client().connect()
+        assert "Target" in repr(client)
+        # the sync channel target is the one canonicalized by grpc, with the resolver scheme
+        assert speos.client.target().endswith(client.target())
+        assert await client.close()
+        with pytest.raises(ConnectionAbortedError):
+            client.faces()
+
+    asyncio.run(run())
+
+
+def test_aio_client_timeout():
+    """Test that the health check timeout reports the channel target."""
+
+    async def run():
+        client = AsyncSpeosClient(channel=default_docker_aio_channel(port=1))
+        assert client.target() == "localhost:1"
+        with pytest.raises(TimeoutError, match="localhost:1"):
+            await client.connect(timeout=0.1)
+        await client.close()
+
+    asyncio.run(run())
+
+
+@pytest.mark.supported_speos_versions(min=252)
+def test_aio_faces_concurrent(speos: Speos):
+    """Test concurrent face creation and batch read through the asyncio stubs."""
+
+    async def run():
+        async with await _aio_client().connect() as client:
+            face_db = client.faces()
+            messages = [
+                ProtoFace(
+                    name=f"Face.{i}",
+                    vertices=[0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0],
+                    facets=[0, 1, 2],
+                    normals=[0.0, 0.0, 1.0] * 3,
+                )
+                for i in range(4)
+            ]
+            links = await asyncio.gather(*(face_db.create(message=m) for m in messages))
+            links.extend(await face_db.create_batch(message_list=messages))
+            faces = await face_db.read_batch(refs=links)
+            assert [f.name for f in faces] == [m.name for m in messages] * 2
+            assert faces[-1].facets == [0, 1, 2]
+            await asyncio.gather(*(link.delete() for link in links))
+
+    asyncio.run(run())
+
+
+def test_aio_open_project_and_compute(speos: Speos):
+    """Test asyncio project loading and cpu computation."""
+    speos_file = str(
+        Path(test_path) / "LG_50M_Colorimetric_short.sv5" / "LG_50M_Colorimetric_short.sv5"
+    )
+
+    async def run():
+        async with await _aio_client().connect() as client:
+            p = await open_project(speos=speos, client=client, path=speos_file)
+            assert isinstance(p, Project)
+            sim = p.find(name=".*", name_regex=True, feature_type=SimulationDirect)[0]
+            sim.stop_condition_rays_number = 100
+            results = await compute_CPU(sim, client, polling_interval=0.5)
+            assert len(results) > 0
+            assert sim.result_list == results
+            p.delete()
+
+    asyncio.run(run())
@@ -0,0 +1,128 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test project snapshots and their restoration from bundle files."""
+
+import logging
+
+import pytest
+
+from ansys.speos.core import Body, Project
+from ansys.speos.core.kernel import bundle
+from ansys.speos.core.sensor import SensorIrradiance
+from ansys.speos.core.simulation import SimulationDirect
+from ansys.speos.core.source import SourceSurface
+from tests.fake_server import FakeSpeosServer
+
+
+@pytest.fixture(scope="module")
+def fake_server():
+    """Start a fake server for the module."""
+    with FakeSpeosServer() as server:
+        yield server
+
+
+def _add_face(body, name):
+    face = body.create_face(name=name)
+    face.vertices = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+    face.facets = [0, 1, 2]
+    face.normals = [0.0, 0.0, 1.0] * 3
+
+
+def _without_guids(value):
+    if isinstance(value, dict):
+        return {k: _without_guids(v) for k, v in value.items() if not k.endswith("_guid")}
+    if isinstance(value, list):
+        return [_without_guids(v) for v in value]
+    return value
+
+
+def _project(speos):
+    project = Project(speos=speos)
+    root_part = project.create_root_part()
+    body = root_part.create_body(name="Body")
+    for i in range(3):
+        _add_face(body, f"Face.{i}")
+    _add_face(root_part.create_sub_part(name="SubPart").create_body(name="SubBody"), "SubFace")
+    root_part.commit()
+    opt_prop = project.create_optical_property(name="Material")
+    opt_prop.set_volume_none()
+    opt_prop.set_surface_mirror()
+    opt_prop.commit()
+    project.create_sensor(name="Sensor", feature_type=SensorIrradiance).commit()
+    project.create_source(name="Source", feature_type=SourceSurface).commit()
+    project.create_simulation(name="Simulation", feature_type=SimulationDirect).commit()
+    return project
+
+
+def test_project_snapshot_restore(fake_server, tmp_path):
+    """Test that a restored project matches the snapshot one, without reading the server."""
+    project = _project(fake_server.speos(logging_level=logging.WARNING))
+    digest = project.snapshot(tmp_path / "project.bundle")
+    assert len(digest) == 64
+
+    speos = fake_server.speos(logging_level=logging.WARNING, collect_stats=True)
+    restored = Project(speos=speos)
+    speos.client._stats.reset()
+    assert restored.restore(tmp_path / "project.bundle") is restored
+    methods = speos.client.stats()
+    assert not [m for m in methods if m.rsplit("/", 1)[1] in ("Read", "List", "Download")]
+    assert methods["/ansys.api.speos.face.v1.FaceActions/Upload"]["calls"] == 1
+
+    assert sorted(type(f).__name__ for f in restored._features) == sorted(
+        type(f).__name__ for f in project._features
+    )
+    assert restored.scene_link.key != project.scene_link.key
+    expected, actual = _without_guids(project.get()), _without_guids(restored.get())
+    for key in ("sources", "sensors", "materials"):
+        assert actual[key] == expected[key]
+    assert actual["simulations"][0]["name"] == "Simulation"
+    sub_body = restored.find(name="SubPart/SubBody", feature_type=Body)[0]
+    assert [f._face.name for f in sub_body._geom_features] == ["SubFace"]
+
+    # Restored features are linked to the new server items
+    sensor = restored.find(name="Sensor")[0]
+    sensor.set_type_radiometric().commit()
+    assert sensor.get(key="sensor_type_radiometric") == {}
+    assert project.find(name="Sensor")[0].get(key="sensor_type_radiometric") is None
+
+    with pytest.raises(ValueError, match="empty project"):
+        restored.restore(tmp_path / "project.bundle")
+
+
+def test_bundle_digest(fake_server, tmp_path):
+    """Test that bundle content is checked against its digest."""
+    project = _project(fake_server.speos(logging_level=logging.WARNING))
+    path = tmp_path / "project.bundle"
+    project.snapshot(path)
+    items = bundle.read_bundle(path)
+    assert next(iter(items.values()))[0] == "scene"
+    assert sum(kind == "face" for kind, _ in items.values()) == 4
+
+    data = bytearray(path.read_bytes())
+    data[len(bundle.BUNDLE_MAGIC) + 10] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="does not match its digest"):
+        bundle.read_bundle(path)
+    path.write_bytes(b"not a bundle" * 10)
+    with pytest.raises(ValueError, match="is not a bundle file"):
+        bundle.read_bundle(path)
@@ -24,11 +24,16 @@
 
 import platform
 
+import grpc
+import pytest
+
 from ansys.speos.core.kernel.client import (
+    DEDICATED_CONNECTION_OPTION,
     SpeosClient,
     default_docker_channel,
     default_local_channel,
 )
+from ansys.speos.core.kernel.face import ProtoFace
 from ansys.speos.core.speos import Speos
 from tests.conftest import IS_DOCKER, SERVER_PORT
 
@@ -57,3 +62,64 @@ def test_client_through_channel():
     assert client.channel
     assert client.close()
     assert client.healthy is False
+
+
+def test_client_channel_pool(speos: Speos):
+    """Test the dedicated bulk and control channels of a client."""
+    if IS_DOCKER:
+
+        def factory():
+            return default_docker_channel(
+                port=SERVER_PORT, grpc_options=[DEDICATED_CONNECTION_OPTION]
+            )
+    else:
+
+        def factory():
+            return default_local_channel(
+                port=SERVER_PORT, grpc_options=[DEDICATED_CONNECTION_OPTION]
+            )
+
+    client = SpeosClient(
+        channel=factory(), channel_factory=factory, bulk_channels=2, control_channel=True
+    )
+    assert len(client.channels) == 4
+    assert client.control_channel is not client.channel
+    assert client.jobs() is client.jobs()
+    assert client.faces() is client.faces()
+    assert client.bulk_channel() is not client.bulk_channel()
+
+    face_db = client.faces()
+    assert len(face_db._transfer_stubs) == 2
+    face_link = face_db.create(message=ProtoFace(name="Face.1"))
+    assert face_db.read(face_link).name == "Face.1"
+    assert face_db.read(face_link).name == "Face.1"
+    face_link.delete()
+    assert client.close()
+    assert client.healthy is False
+
+
+def test_client_channel_pool_requires_factory():
+    """Test that additional channels cannot be opened without a channel factory."""
+    with pytest.raises(ValueError):
+        SpeosClient(channel=grpc.insecure_channel("localhost:1"), bulk_channels=1)
+
+
+def test_client_stats(speos: Speos):
+    """Test the gRPC statistics of a client."""
+    with pytest.raises(RuntimeError):
+        speos.client.stats()
+    if IS_DOCKER:
+        channel = default_docker_channel(port=SERVER_PORT)
+    else:
+        channel = default_local_channel(port=SERVER_PORT)
+    client = SpeosClient(channel=channel, collect_stats=True)
+    face_link = client.faces().create(message=ProtoFace(name="Face.1"))
+    face_link.delete()
+    stats = client.stats()
+    assert stats["/ansys.api.speos.face.v1.FacesManager/Create"]["calls"] == 1
+    assert stats["/ansys.api.speos.face.v1.FaceActions/Upload"]["request_chunks"] >= 1
+    assert client.stats("openmetrics").endswith("# EOF\n")
+    assert "traceEvents" in client.stats("chrome_trace")
+    with pytest.raises(ValueError):
+        client.stats("csv")
+    assert client.close()
@@ -0,0 +1,98 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the in-process fake server used by the benchmarks."""
+
+from pathlib import Path
+
+from ansys.api.speos.lpf.v2 import lpf_file_reader_pb2 as lpf_messages
+import pytest
+
+from ansys.speos.core import Project
+from ansys.speos.core.generic.file_transfer import FileTransfer
+from ansys.speos.core.kernel.face import ProtoFace
+from ansys.speos.core.kernel.job import ProtoJob
+from ansys.speos.core.lxp import LightPathFinder
+from tests.fake_server import FakeSpeosServer
+
+
+@pytest.fixture(scope="module")
+def fake_server():
+    """Start a fake server for the module."""
+    with FakeSpeosServer() as server:
+        yield server
+
+
+def test_fake_server_databases(fake_server):
+    """Test database and face transfer services of the fake server."""
+    client = fake_server.speos().client
+    face_db = client.faces()
+    face = ProtoFace(name="Face.1", vertices=[0, 0, 0, 1, 0, 0, 0, 1, 0], facets=[0, 1, 2])
+    face.vertices_data.add(name="uv", data=[0.0, 1.0] * 3)
+    links = face_db.create_batch(message_list=[face, face]) + [face_db.create(message=face)]
+    assert [f.name for f in face_db.read_batch(refs=links)] == ["Face.1"] * 3
+    assert links[2].get() == face
+    links[0].delete()
+    assert len(face_db.list()) == 2
+
+    p = Project(speos=fake_server.speos())
+    p.create_root_part().commit()
+    p.scene_link.save_file(file_uri="fake://project.speos")
+    loaded = Project(speos=fake_server.speos(), path="fake://project.speos")
+    assert loaded.scene_link.get().part_guid == p.scene_link.get().part_guid
+
+    job_link = client.jobs().create(message=ProtoJob(name="Job"))
+    assert job_link.get_state().state == ProtoJob.State.QUEUED
+    job_link.start()
+    assert job_link.get_state().state == ProtoJob.State.FINISHED
+
+
+def test_fake_server_files(fake_server, tmp_path):
+    """Test file transfer and LPF reader services of the fake server."""
+    speos = fake_server.speos()
+    source = tmp_path / "source" / "file.txt"
+    source.parent.mkdir()
+    source.write_text("fake content")
+    file_transfer = FileTransfer(speos.client)
+    upload_response = file_transfer.upload_file(file_path=source)
+    assert upload_response.info.file_size == len("fake content")
+    download_response = file_transfer.download_file(
+        file_uri=upload_response.info.uri, download_location=tmp_path
+    )
+    assert Path(tmp_path / download_response.info.file_name).read_text() == "fake content"
+
+    fake_server.store.register_lpf_file(
+        "fake://rays.lpf",
+        [
+            lpf_messages.RayPath(
+                impacts=[lpf_messages.TripletFloat(x=0, y=0, z=0)],
+                wavelengths=[550.0],
+                body_context_ids=[1],
+                unique_face_ids=[2],
+                interaction_statuses=[lpf_messages.RayPath.StatusError],
+                lastDirection=lpf_messages.TripletFloat(x=0, y=0, z=1),
+            )
+        ],
+    )
+    lpf = LightPathFinder(speos, "fake://rays.lpf")
+    assert lpf.nb_traces == 1
+    assert len(lpf.filter_error_rays().filtered_rays) == 1
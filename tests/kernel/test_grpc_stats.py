@@ -0,0 +1,154 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the gRPC statistics interceptor."""
+
+from concurrent import futures
+import gc
+import json
+
+from ansys.api.speos.part.v1 import face_pb2 as messages, face_pb2_grpc as service
+import grpc
+import pytest
+
+from ansys.speos.core.kernel.grpc.stats import GrpcStats, channel_target, intercept_channel
+
+
+class _FaceActions(service.FaceActionsServicer):
+    def ReserveFaces(self, request_iterator, context):  # noqa: N802
+        for request in request_iterator:
+            yield messages.ReserveFace_Response(guids=["guid"] * len(request.faces))
+
+    def Upload(self, request_iterator, context):  # noqa: N802
+        for _ in request_iterator:
+            pass
+        return messages.Upload_Response()
+
+    def Download(self, request, context):  # noqa: N802
+        for _ in range(3):
+            yield messages.Chunk()
+        if request.guid == "bad":
+            context.abort(grpc.StatusCode.INTERNAL, "broken stream")
+
+
+@pytest.fixture
+def stats_channel():
+    """Create an intercepted channel to an in-process face actions server."""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    service.add_FaceActionsServicer_to_server(_FaceActions(), server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    stats = GrpcStats()
+    channel = intercept_channel(grpc.insecure_channel(f"localhost:{port}"), stats)
+    yield stats, channel
+    channel.close()
+    server.stop(None)
+
+
+def test_stats_interceptor(stats_channel):
+    """Test the recording of unary and streaming calls."""
+    stats, channel = stats_channel
+    assert channel_target(channel).startswith("dns:///localhost:")
+    stub = service.FaceActionsStub(channel)
+
+    stub.Upload(iter([messages.Chunk(), messages.Chunk()]))
+    assert len(list(stub.Download(messages.Download_Request(guid="good")))) == 3
+    responses = list(
+        stub.ReserveFaces(
+            iter(
+                [
+                    messages.ReserveFace_Request(faces=[messages.Face(), messages.Face()])
+                    for _ in range(4)
+                ]
+            )
+        )
+    )
+    assert len(responses) == 4
+    with pytest.raises(grpc.RpcError):
+        list(stub.Download(messages.Download_Request(guid="bad")))
+
+    result = stats.to_dict()
+    upload = result["/ansys.api.speos.face.v1.FaceActions/Upload"]
+    assert upload["calls"] == 1
+    assert upload["request_chunks"] == 2
+    assert upload["response_chunks"] == 1
+    download = result["/ansys.api.speos.face.v1.FaceActions/Download"]
+    assert download["calls"] == 2
+    assert download["errors"] == 1
+    assert download["response_chunks"] == 6
+    assert download["request_bytes"] > 0
+    assert sum(download["latency_histogram"].values()) == 2
+    reserve = result["/ansys.api.speos.face.v1.FaceActions/ReserveFaces"]
+    assert reserve["request_chunks"] == 4
+    assert reserve["response_chunks"] == 4
+    assert reserve["response_bytes"] > reserve["request_bytes"]
+
+    metrics = stats.to_openmetrics()
+    assert metrics.endswith("# EOF\n")
+    assert 'speos_grpc_calls_total{method="/ansys.api.speos.face.v1.FaceActions/Download"} 2' in (
+        metrics
+    )
+    assert (
+        'speos_grpc_latency_seconds_count{method="/ansys.api.speos.face.v1.FaceActions/Upload"}'
+        in (metrics)
+    )
+
+    trace = json.loads(stats.to_chrome_trace())["traceEvents"]
+    assert len(trace) == 4
+    assert {event["name"] for event in trace} == {"Upload", "Download", "ReserveFaces"}
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in trace)
+
+    stats.reset()
+    assert stats.to_dict() == {}
+
+
+def test_stats_partial_stream(stats_channel):
+    """Test the recording of streams which are not exhausted."""
+    stats, channel = stats_channel
+    stub = service.FaceActionsStub(channel)
+    method = "/ansys.api.speos.face.v1.FaceActions/Download"
+
+    responses = stub.Download(messages.Download_Request(guid="good"))
+    next(responses)
+    assert stats.to_dict() == {}
+    responses.cancel()
+    download = stats.to_dict()[method]
+    assert download["calls"] == 1
+    assert download["errors"] == 1
+    assert download["response_chunks"] == 1
+
+    responses = stub.Download(messages.Download_Request(guid="good"))
+    next(responses)
+    next(responses)
+    del responses
+    gc.collect()
+    download = stats.to_dict()[method]
+    assert download["calls"] == 2
+    assert download["response_chunks"] == 3
+    assert sum(download["latency_histogram"].values()) == 2
+
+
+def test_stats_disabled():
+    """Test that no interceptor is installed without statistics store."""
+    channel = grpc.insecure_channel("localhost:1")
+    assert intercept_channel(channel, None) is channel
+    assert channel_target(channel) == "dns:///localhost:1"
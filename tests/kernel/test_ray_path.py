@@ -0,0 +1,112 @@
+# Copyright (C) 2021 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test columnar gathering of streamed ray paths."""
+
+from ansys.api.speos.results.v1.ray_path_pb2 import RayPath
+import numpy as np
+import pytest
+
+from ansys.speos.core import Project
+from ansys.speos.core.generic.visualization_methods import _ray_line_set_arrays
+from ansys.speos.core.kernel.job import ProtoJob
+from ansys.speos.core.kernel.ray_path import RayPathArrays
+from tests.fake_server import FakeSpeosServer
+
+
+def _ray_paths(nb_rays):
+    return [
+        RayPath(
+            impacts_coordinates=[float(i), 0.0, 0.0, float(i), 1.0, 0.0][: 3 * (1 + i % 2)],
+            last_direction=[0.0, 0.0, 1.0],
+            wavelengths=[400.0 + i],
+            colors={"values": bytes([i % 256, 128, 255])},
+        )
+        for i in range(nb_rays)
+    ]
+
+
+def test_ray_path_arrays():
+    """Test gathering ray paths in CSR arrays."""
+    ray_paths = _ray_paths(10000)
+    arrays = RayPathArrays.from_stream(iter(ray_paths), capacity=10)
+
+    assert len(arrays) == 10000
+    assert arrays.offsets[:5].tolist() == [0, 1, 3, 4, 6]
+    assert arrays.impacts.shape == (15000, 3)
+    assert arrays.nb_impacts.sum() == 15000
+    for i in (0, 1, 4095, 4096, 9999):
+        assert arrays.ray_impacts(i).ravel().tolist() == list(ray_paths[i].impacts_coordinates)
+    assert arrays.last_directions.tolist() == [[0.0, 0.0, 1.0]] * 10000
+    assert arrays.wavelengths[[0, 9999]].tolist() == [400.0, 10399.0]
+    assert arrays.colors.dtype == np.uint8
+    assert arrays.colors[257].tolist() == [1, 128, 255]
+
+    partial = RayPathArrays()
+    partial.append(RayPath(impacts_coordinates=[0.0, 0.0, 0.0], last_direction=[1.0, 0.0, 0.0]))
+    assert len(partial) == 1
+    assert partial.colors is None
+    assert np.isnan(partial.wavelengths[0])
+    with pytest.raises(ValueError):
+        partial.append(RayPath(impacts_coordinates=[0.0, 0.0]))
+
+
+def test_ray_line_set_arrays():
+    """Test the single line set drawing gathered rays."""
+    arrays = RayPathArrays.from_stream(
+        [
+            RayPath(impacts_coordinates=[0.0, 0.0, 0.0, 1.0, 0.0, 0.0], last_direction=[0, 0, 1]),
+            RayPath(last_direction=[1.0, 0.0, 0.0]),
+            RayPath(impacts_coordinates=[5.0, 5.0, 5.0], last_direction=[0.0, 1.0, 0.0]),
+        ]
+    )
+    points, lines, kept = _ray_line_set_arrays(
+        arrays.impacts, arrays.offsets, arrays.last_directions, direction_length=2.0
+    )
+    assert points.tolist() == [[0, 0, 0], [1, 0, 0], [1, 0, 2], [5, 5, 5], [5, 7, 5]]
+    assert lines.tolist() == [3, 0, 1, 2, 2, 3, 4]
+    assert kept.tolist() == [True, False, True]
+
+    points, lines, kept = _ray_line_set_arrays(
+        arrays.impacts, arrays.offsets, arrays.last_directions, direction_length=[0.0, 1.0, 0.0]
+    )
+    assert points.tolist() == [[0, 0, 0], [1, 0, 0]]
+    assert lines.tolist() == [2, 0, 1]
+    assert kept.tolist() == [True, False, False]
+
+
+def test_ray_path_arrays_streaming():
+    """Test gathering ray paths streamed by job and scene actions."""
+    with FakeSpeosServer() as server:
+        server.store.ray_paths.extend(_ray_paths(300))
+        speos = server.speos()
+
+        job_link = speos.client.jobs().create(message=ProtoJob(name="Job"))
+        arrays = job_link.get_ray_path_arrays()
+        assert len(arrays) == 300
+        assert arrays.offsets[-1] == len(arrays.impacts) == 450
+
+        p = Project(speos=speos)
+        p.create_root_part().commit()
+        arrays = p.scene_link.get_source_ray_path_arrays("Source.1", rays_nb=100)
+        assert len(arrays) == 100
+        assert arrays.colors[99].tolist() == [99, 128, 255]
@@ -32,6 +32,7 @@ import pytest
 
 from ansys.speos.core.generic.version_checker import server_version_checker
 from ansys.speos.core.kernel.body import ProtoBody
+from ansys.speos.core.kernel.client import default_docker_channel, default_local_channel
 from ansys.speos.core.kernel.face import FaceStub, ProtoFace
 from ansys.speos.core.kernel.intensity_template import ProtoIntensityTemplate
 from ansys.speos.core.kernel.part import ProtoPart
@@ -43,7 +44,7 @@ from ansys.speos.core.kernel.source_template import ProtoSourceTemplate
 from ansys.speos.core.kernel.spectrum import ProtoSpectrum
 from ansys.speos.core.kernel.vop_template import ProtoVOPTemplate
 from ansys.speos.core.speos import Speos
-from tests.conftest import test_path
+from tests.conftest import IS_DOCKER, SERVER_PORT, test_path
 from tests.helper import clean_all_dbs
 
 
@@ -701,3 +702,66 @@ def test_scene_actions_get_source_ray_paths(speos: Speos):
         assert ray_path.impacts_coordinates == [0, 0, 20]
 
     clean_all_dbs(speos.client)
+
+
+def test_scene_coalesce_updates(speos: Speos, monkeypatch):
+    """Test that coalesced changes are sent once, and not at all when the scene is unchanged."""
+    assert speos.client.healthy is True
+    scene_db = speos.client.scenes()
+    updates = []
+    update = scene_db._stubMngr.Update
+    monkeypatch.setattr(
+        scene_db._stubMngr, "Update", lambda request: updates.append(request) or update(request)
+    )
+
+    # Outside of a context, other clients may have changed the scene, so it is always sent
+    scene = scene_db.create(message=ProtoScene(name="Scene"))
+    scene.set(scene.get())
+    assert len(updates) == 1
+
+    with scene.coalesce_updates():
+        for i in range(3):
+            scene_dm = scene.get()
+            scene_dm.description = f"Description.{i}"
+            scene.set(scene_dm)
+        assert scene.get().description == "Description.2"
+        assert len(updates) == 1
+    assert len(updates) == 2
+    assert scene.get().description == "Description.2"
+
+    # Leaving the context without change sends nothing
+    with scene.coalesce_updates():
+        scene.set(scene.get())
+    assert len(updates) == 2
+
+    clean_all_dbs(speos.client)
+
+
+def test_scene_updates_two_clients(speos: Speos):
+    """Test that a scene changed by another client is updated again."""
+    if IS_DOCKER:
+        other = Speos(channel=default_docker_channel(port=SERVER_PORT))
+    else:
+        other = Speos(channel=default_local_channel(port=SERVER_PORT))
+    scene = speos.client.scenes().create(message=ProtoScene(name="Scene"))
+    other_scene = SceneLink(other.client.scenes(), scene.key)
+
+    with scene.coalesce_updates():
+        scene_dm = scene.get()
+        scene_dm.description = "First client"
+        scene.set(scene_dm)
+    other_dm = other_scene.get()
+    other_dm.description = "Second client"
+    other_scene.set(other_dm)
+    assert scene.get().description == "Second client"
+
+    # Same datamodel as last sent by the first client, but not as held by the database
+    scene.set(scene_dm)
+    assert other_scene.get().description == "First client"
+    with scene.coalesce_updates():
+        other_scene.set(other_dm)
+        scene.set(scene_dm)
+    assert other_scene.get().description == "First client"
+
+    other.close()
+    clean_all_dbs(speos.client)
@@ -22,11 +22,15 @@
 
 """Test using combine_speos module in workflow layer."""
 
+import logging
 from pathlib import Path
 
 import pytest
 
-from ansys.speos.core import OptProp, Part, Project, Speos
+from ansys.speos.core import Face, OptProp, Part, Project, Speos
+from ansys.speos.core.kernel import ProtoFace, ProtoScene, ProtoSOPTemplate
+from ansys.speos.core.kernel.body import ProtoBody
+from ansys.speos.core.kernel.part import ProtoPart
 from ansys.speos.core.sensor import SensorIrradiance
 from ansys.speos.core.workflow.combine_speos import (
     SpeosFileInstance,
@@ -34,6 +38,47 @@ from ansys.speos.core.workflow.combine_speos import (
     insert_speos,
 )
 from tests.conftest import test_path
+from tests.fake_server import FakeSpeosServer
+
+SHIFTED_AXIS_SYSTEM = [10, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1]
+"""Axis system of the second instance of a file in fake server tests."""
+
+
+@pytest.fixture(scope="module")
+def fake_server():
+    """Start a fake server for the module."""
+    with FakeSpeosServer() as server:
+        yield server
+
+
+def _register_speos_file(server: FakeSpeosServer, speos: Speos, name: str, nb_faces: int) -> str:
+    """Make a scene with one body of ``nb_faces`` faces and one material loadable by name."""
+    face_links = speos.client.faces().create_batch(
+        message_list=[
+            ProtoFace(
+                name=f"Face.{i}",
+                vertices=[0, 0, i, 1, 0, i, 0, 1, i],
+                facets=[0, 1, 2],
+                normals=[0, 0, 1] * 3,
+            )
+            for i in range(nb_faces)
+        ]
+    )
+    body_link = speos.client.bodies().create(
+        message=ProtoBody(name="Body", face_guids=[f.key for f in face_links])
+    )
+    part_link = speos.client.parts().create(
+        message=ProtoPart(name="Part", body_guids=[body_link.key])
+    )
+    sop_link = speos.client.sop_templates().create(
+        message=ProtoSOPTemplate(name="Mirror", mirror=ProtoSOPTemplate.Mirror(reflectance=100))
+    )
+    scene = ProtoScene(name=name, part_guid=part_link.key)
+    geometries = ProtoScene.GeoPaths(geo_paths=["Body"])
+    scene.materials.add(name="Material", sop_guids=[sop_link.key], geometries=geometries)
+    uri = f"fake://{name}.speos"
+    server.store.register_scene_file(uri, scene)
+    return uri
 
 
 def test_combine_speos(speos: Speos):
@@ -280,3 +325,92 @@ def test_insert_speos(speos: Speos):
 
     ssr = p.find(name=".*", name_regex=True, feature_type=SensorIrradiance)
     assert len(ssr) == 1
+
+
+def test_combine_speos_shared_file(fake_server):
+    """Test that repeated files are loaded once and placed as instances of a shared part."""
+    speos = fake_server.speos(logging_level=logging.WARNING)
+    file_a = _register_speos_file(fake_server, speos, "FileA", nb_faces=2)
+    file_b = _register_speos_file(fake_server, speos, "FileB", nb_faces=1)
+
+    scenes = fake_server.store.tables["scenes"]
+    nb_scenes = len(scenes)
+    p = combine_speos(
+        speos=speos,
+        speos_to_combine=[
+            SpeosFileInstance(file_a, name="A.0"),
+            SpeosFileInstance(file_b, name="B.0"),
+            SpeosFileInstance(file_a, axis_system=SHIFTED_AXIS_SYSTEM, name="A.1"),
+        ],
+    )
+    # One scene for the project, one per distinct file
+    assert sorted(scene.name for scene in list(scenes.values())[nb_scenes:]) == [
+        "",
+        "FileA",
+        "FileB",
+    ]
+
+    instances = speos.client[p.scene_link.get().part_guid].get()
+    assert [inst.name for inst in instances.parts] == ["A.0", "B.0", "A.1"]
+    part_guids = [inst.part_guid for inst in instances.parts]
+    assert part_guids[0] == part_guids[2] != part_guids[1]
+    assert instances.parts[2].axis_system[:3] == [10, 0, 0]
+
+    # Each instance has its own copy of the materials of its file
+    materials = p.scene_link.get().materials
+    assert [(m.name, list(m.geometries.geo_paths)) for m in materials] == [
+        ("A.0.Material", ["A.0/Body"]),
+        ("B.0.Material", ["B.0/Body"]),
+        ("A.1.Material", ["A.1/Body"]),
+    ]
+    assert len(p.find(name=".*Material", name_regex=True, feature_type=OptProp)) == 3
+
+    # Features are built for every instance
+    for name, nb_faces in (("A.0", 2), ("B.0", 1), ("A.1", 2)):
+        faces = p.find(name=f"{name}/Body/Face.*", name_regex=True, feature_type=Face)
+        assert len(faces) == nb_faces
+    assert len(p.geometry_index) == 5
+
+
+def test_insert_speos_in_populated_project(fake_server):
+    """Test inserting files in a project that already has geometries and materials."""
+    speos = fake_server.speos(logging_level=logging.WARNING)
+    file_a = _register_speos_file(fake_server, speos, "FileA", nb_faces=2)
+
+    p = Project(speos=speos)
+    root_part = p.create_root_part()
+    root_face = root_part.create_body(name="RootBody").create_face(name="RootFace")
+    root_face.vertices = [0, 0, -1, 1, 0, -1, 0, 1, -1]
+    root_face.facets = [0, 1, 2]
+    root_face.normals = [0, 0, 1] * 3
+    root_part.commit()
+    opt_prop = p.create_optical_property(name="RootMaterial")
+    opt_prop.set_volume_none()
+    opt_prop.set_surface_mirror()
+    opt_prop.geometries = [root_face]
+    opt_prop.commit()
+    root_part_guid = p.scene_link.get().part_guid
+
+    insert_speos(
+        project=p,
+        speos_to_insert=[
+            SpeosFileInstance(file_a, name="A.0"),
+            SpeosFileInstance(file_a, axis_system=SHIFTED_AXIS_SYSTEM, name="A.1"),
+        ],
+    )
+
+    # The existing root part is kept and extended with the instances
+    assert p.scene_link.get().part_guid == root_part_guid
+    assert p.find(name="", feature_type=Part) == [root_part]
+    assert [sp._name for sp in root_part._geom_features if isinstance(sp, Part.SubPart)] == [
+        "A.0",
+        "A.1",
+    ]
+    assert p.find(name="RootBody/RootFace", feature_type=Face) == [root_face]
+    assert len(p.find(name="A.1/Body/Face.*", name_regex=True, feature_type=Face)) == 2
+
+    materials = p.scene_link.get().materials
+    assert [m.name for m in materials] == ["RootMaterial", "A.0.Material", "A.1.Material"]
+    assert p.find(name="RootMaterial", feature_type=OptProp) == [opt_prop]
+    assert len(p.find(name="A.*Material", name_regex=True, feature_type=OptProp)) == 2
+    assert len(p.geometry_index) == 5